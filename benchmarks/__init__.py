@@ -0,0 +1,10 @@
+"""
+Gateway Benchmarks - WBS-PERF10
+
+In-process benchmarks measuring the latency and CPU the gateway adds on
+top of the upstream provider, using FakeProvider in place of real LLMs.
+
+Usage:
+    python -m benchmarks.gateway --scenario all --concurrency 16 --requests 500 \
+        --output bench.json [--baseline previous.json]
+"""
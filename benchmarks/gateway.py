@@ -0,0 +1,455 @@
+"""
+Gateway Overhead Benchmark - WBS-PERF10
+
+Boots the FastAPI app in process with a FakeProvider-backed ChatService
+and measures what the gateway adds on top of the upstream provider:
+
+- requests/sec at a fixed concurrency
+- p50/p95/p99 end-to-end latency and gateway-added latency
+- TTFT overhead for streaming
+- process CPU per request and tracemalloc peak per request
+
+Upstream time is measured inside the provider (per ``complete()`` call and
+per streamed chunk), so "overhead" excludes the provider even when it
+simulates latency. Requests go straight into the ASGI app: middleware,
+validation, routing and serialization are included; sockets are not.
+
+Scenarios:
+    non_streaming  POST /v1/chat/completions
+    streaming      POST /v1/chat/completions with stream=true
+    tool_loop      One server-side tool round trip per request
+    session        Session history load/save (in-memory fakeredis)
+
+Usage:
+    python -m benchmarks.gateway --scenario all --concurrency 16 --requests 500 \
+        --output bench/results.json --baseline bench/previous.json
+
+    # Production-like upstream (WBS-PERF11 simulation profile)
+    python -m benchmarks.gateway --profile typical --seed 7
+
+Reference Documents:
+- GUIDELINES pp. 157: FakeRepository pattern (FakeProvider)
+- GUIDELINES pp. 2309-2319: Latency percentiles and throughput metrics
+"""
+
+import argparse
+import asyncio
+import contextvars
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+import yaml
+
+from benchmarks.harness import (
+    DEFAULT_REGRESSION_THRESHOLD,
+    RequestSample,
+    ScenarioResult,
+    asgi_request,
+    build_report,
+    compare_reports,
+    load_report,
+    measure_allocations,
+    run_load,
+    save_report,
+)
+from src.models.domain import RegisteredTool, ToolDefinition
+from src.models.requests import ChatCompletionRequest
+from src.models.responses import (
+    ChatCompletionChunk,
+    ChatCompletionResponse,
+    Choice,
+    ChoiceMessage,
+    Usage,
+)
+from src.providers.fake import FakeProvider, SimulationProfile, named_simulation_profiles
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+BENCH_MODEL = "bench-model"
+"""Model registered to the fake provider for benchmarks."""
+
+BENCH_TOOL = "bench_echo"
+"""Server-side tool used by the tool_loop scenario."""
+
+SCENARIOS: tuple[str, ...] = ("non_streaming", "streaming", "tool_loop", "session")
+
+CHAT_PATH = "/v1/chat/completions"
+
+REGISTRY_PATH = Path(__file__).parent.parent / "config" / "model_registry.yaml"
+"""Registry holding the ``simulation`` profiles used by --profile."""
+
+BENCH_RESPONSE = "The quick brown fox jumps over the lazy dog"
+"""Provider output (streamed as one chunk per word)."""
+
+BENCH_REGISTRY = f"""
+providers:
+  fake:
+    category: local
+    models:
+      - {BENCH_MODEL}
+routing_default: null
+aliases: {{}}
+"""
+
+_upstream: contextvars.ContextVar[Optional[list[Optional[float]]]] = contextvars.ContextVar(
+    "bench_upstream", default=None
+)
+"""Per-request [upstream seconds, upstream TTFT] filled in by BenchmarkProvider."""
+
+
+# =============================================================================
+# Benchmark Provider
+# =============================================================================
+
+
+class BenchmarkProvider(FakeProvider):
+    """
+    FakeProvider that times itself and can request one tool call.
+
+    Time spent inside complete() and inside each streamed chunk's
+    production is added to the current request's upstream timer.
+    """
+
+    def __init__(
+        self,
+        response_content: str = BENCH_RESPONSE,
+        profile: Optional[SimulationProfile] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        super().__init__(
+            name="fake",
+            supported_models=[BENCH_MODEL],
+            response_content=response_content,
+            default_profile=profile,
+            seed=seed,
+        )
+
+    async def complete(self, request: ChatCompletionRequest) -> ChatCompletionResponse:
+        start = time.perf_counter()
+        try:
+            if request.tools and not any(m.role == "tool" for m in request.messages):
+                return _tool_call_response(request)
+            return await super().complete(request)
+        finally:
+            _add_upstream(time.perf_counter() - start)
+
+    async def stream(self, request: ChatCompletionRequest) -> AsyncIterator[ChatCompletionChunk]:
+        start = time.perf_counter()
+        chunks = super().stream(request)
+        while True:
+            step = time.perf_counter()
+            try:
+                chunk = await chunks.__anext__()
+            except StopAsyncIteration:
+                _add_upstream(time.perf_counter() - step)
+                return
+            _add_upstream(time.perf_counter() - step)
+            if chunk.choices and chunk.choices[0].delta.content:
+                _mark_upstream_ttft(time.perf_counter() - start)
+            yield chunk
+
+    def reset_calls(self) -> None:
+        """Drop recorded calls so long runs don't accumulate memory."""
+        self.complete_calls.clear()
+        self.stream_calls.clear()
+
+
+def _add_upstream(seconds: float) -> None:
+    timer = _upstream.get()
+    if timer is not None:
+        timer[0] = (timer[0] or 0.0) + seconds
+
+
+def _mark_upstream_ttft(seconds: float) -> None:
+    timer = _upstream.get()
+    if timer is not None and timer[1] is None:
+        timer[1] = seconds
+
+
+def _tool_call_response(request: ChatCompletionRequest) -> ChatCompletionResponse:
+    return ChatCompletionResponse(
+        id="chatcmpl-bench-tool",
+        created=int(time.time()),
+        model=request.model,
+        choices=[
+            Choice(
+                index=0,
+                message=ChoiceMessage(
+                    role="assistant",
+                    content=None,
+                    tool_calls=[
+                        {
+                            "id": "call_bench",
+                            "type": "function",
+                            "function": {"name": BENCH_TOOL, "arguments": '{"text": "ping"}'},
+                        }
+                    ],
+                ),
+                finish_reason="tool_calls",
+            )
+        ],
+        usage=Usage(prompt_tokens=8, completion_tokens=4, total_tokens=12),
+    )
+
+
+# =============================================================================
+# App Setup
+# =============================================================================
+
+
+class GatewayBench:
+    """
+    In-process gateway with a FakeProvider-backed ChatService.
+
+    Example:
+        >>> bench = GatewayBench()
+        >>> result = await bench.run("streaming", total=200, concurrency=8)
+    """
+
+    def __init__(
+        self,
+        profile: Optional[SimulationProfile] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Build the in-process gateway.
+
+        Args:
+            profile: Upstream simulation profile (None = instant upstream)
+            seed: Seed for simulated latency/error draws
+        """
+        # Import here to avoid paying app import cost for --help
+        from src.api.routes.chat import get_chat_service
+        from src.main import app
+        from src.providers.router import ProviderRouter
+        from src.services.chat import ChatService
+        from src.tools.executor import ToolExecutor
+        from src.tools.registry import ToolRegistry
+
+        self._registry_dir = tempfile.TemporaryDirectory(prefix="llm-gateway-bench-")
+        registry_path = Path(self._registry_dir.name) / "model_registry.yaml"
+        registry_path.write_text(BENCH_REGISTRY)
+
+        self.provider = BenchmarkProvider(profile=profile, seed=seed)
+        tools = ToolRegistry()
+        tools.register(BENCH_TOOL, _bench_tool())
+        self.session_manager = _session_manager()
+        self.chat_service = ChatService(
+            router=ProviderRouter(providers={"fake": self.provider}, registry_path=registry_path),
+            executor=ToolExecutor(registry=tools),
+            session_manager=self.session_manager,
+        )
+        self.app = app
+        self._dependency = get_chat_service
+        self.app.dependency_overrides[get_chat_service] = lambda: self.chat_service
+        self._session_ids: list[str] = []
+
+    def close(self) -> None:
+        """Remove the dependency override and temp files."""
+        self.app.dependency_overrides.pop(self._dependency, None)
+        self._registry_dir.cleanup()
+
+    def available(self, scenario: str) -> bool:
+        """Whether a scenario can run in this environment."""
+        return scenario != "session" or self.session_manager is not None
+
+    async def prepare(self, scenario: str, sessions: int) -> None:
+        """Create sessions used by the session scenario."""
+        if scenario == "session" and self.session_manager is not None and not self._session_ids:
+            for _ in range(sessions):
+                session = await self.session_manager.create()
+                self._session_ids.append(session.id)
+
+    def sender(self, scenario: str) -> Callable[[int], Awaitable[RequestSample]]:
+        """Build the per-request coroutine for a scenario."""
+
+        async def send_one(i: int) -> RequestSample:
+            payload = self._payload(scenario, i)
+            timer: list[Optional[float]] = [0.0, None]
+            token = _upstream.set(timer)
+            try:
+                start = time.perf_counter()
+                response = await asgi_request(self.app, "POST", CHAT_PATH, payload)
+            finally:
+                _upstream.reset(token)
+            ttft = None
+            if payload.get("stream") and response.first_byte_at is not None:
+                ttft = response.first_byte_at - start
+            return RequestSample(
+                latency=response.finished_at - start,
+                upstream=timer[0] or 0.0,
+                ttft=ttft,
+                upstream_ttft=timer[1],
+                ok=200 <= response.status < 300,
+            )
+
+        return send_one
+
+    async def run(
+        self,
+        scenario: str,
+        total: int,
+        concurrency: int,
+        warmup: int = 20,
+        alloc_samples: int = 20,
+    ) -> ScenarioResult:
+        """Run one scenario and return its aggregated result."""
+        await self.prepare(scenario, sessions=max(concurrency, 1))
+        send_one = self.sender(scenario)
+        result = await run_load(scenario, send_one, total, concurrency, warmup=warmup)
+        if alloc_samples:
+            result.alloc_peak_kib = await measure_allocations(send_one, alloc_samples)
+        self.provider.reset_calls()
+        return result
+
+    def _payload(self, scenario: str, i: int) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "model": BENCH_MODEL,
+            "messages": [{"role": "user", "content": f"Benchmark request {i}: summarize the plan"}],
+        }
+        if scenario == "streaming":
+            payload["stream"] = True
+        elif scenario == "tool_loop":
+            payload["tools"] = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": BENCH_TOOL,
+                        "description": "Echo text back",
+                        "parameters": {
+                            "type": "object",
+                            "properties": {"text": {"type": "string"}},
+                        },
+                    },
+                }
+            ]
+        elif scenario == "session" and self._session_ids:
+            payload["session_id"] = self._session_ids[i % len(self._session_ids)]
+        return payload
+
+
+def _bench_tool() -> RegisteredTool:
+    async def echo(arguments: dict[str, Any]) -> str:
+        return str(arguments.get("text", ""))
+
+    return RegisteredTool(
+        definition=ToolDefinition(
+            name=BENCH_TOOL,
+            description="Echo text back",
+            parameters={"type": "object", "properties": {"text": {"type": "string"}}},
+        ),
+        handler=echo,
+    )
+
+
+def _session_manager() -> Optional[Any]:
+    """In-memory SessionManager, or None if fakeredis isn't installed."""
+    try:
+        import fakeredis.aioredis
+    except ImportError:
+        return None
+    from src.sessions.manager import SessionManager
+    from src.sessions.store import SessionStore
+
+    return SessionManager(SessionStore(fakeredis.aioredis.FakeRedis(decode_responses=True)))
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def _parse_args(argv: Optional[list[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure gateway overhead with FakeProvider")
+    parser.add_argument("--scenario", choices=(*SCENARIOS, "all"), default="all")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--alloc-samples", type=int, default=20, help="0 disables tracemalloc")
+    parser.add_argument("--output", type=Path, help="Write JSON results here")
+    parser.add_argument("--baseline", type=Path, help="Compare against an earlier results file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD)
+    parser.add_argument(
+        "--profile", help="Simulate the upstream with a profile from model_registry.yaml"
+    )
+    parser.add_argument("--seed", type=int, help="Seed for simulated latency/error draws")
+    return parser.parse_args(argv)
+
+
+def _load_profile(name: Optional[str]) -> Optional[SimulationProfile]:
+    """Look up a named profile in the registry's ``simulation`` section."""
+    if name is None:
+        return None
+    registry = yaml.safe_load(REGISTRY_PATH.read_text()) or {}
+    profiles = named_simulation_profiles(registry.get("simulation"))
+    if name not in profiles:
+        raise SystemExit(f"Unknown simulation profile: {name} (have: {', '.join(profiles)})")
+    return profiles[name]
+
+
+def _print_result(result: ScenarioResult) -> None:
+    print(
+        f"{result.scenario:<14} {result.requests_per_second:>9.1f} req/s  "
+        f"overhead p50={result.overhead_ms.get('p50', 0):.3f}ms "
+        f"p95={result.overhead_ms.get('p95', 0):.3f}ms "
+        f"p99={result.overhead_ms.get('p99', 0):.3f}ms  "
+        f"cpu={result.cpu_ms_per_request:.3f}ms/req  "
+        f"alloc={result.alloc_peak_kib}KiB  errors={result.errors}"
+    )
+
+
+async def _run(args: argparse.Namespace) -> int:
+    scenarios = SCENARIOS if args.scenario == "all" else (args.scenario,)
+    bench = GatewayBench(profile=_load_profile(args.profile), seed=args.seed)
+    results: list[ScenarioResult] = []
+    try:
+        for scenario in scenarios:
+            if not bench.available(scenario):
+                print(f"{scenario:<14} skipped (fakeredis not installed)")
+                continue
+            result = await bench.run(
+                scenario, args.requests, args.concurrency, args.warmup, args.alloc_samples
+            )
+            _print_result(result)
+            results.append(result)
+    finally:
+        bench.close()
+
+    config = {
+        "profile": args.profile,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "warmup": args.warmup,
+        "alloc_samples": args.alloc_samples,
+    }
+    report = build_report(results, config)
+    if args.output:
+        save_report(report, args.output)
+        print(f"Results written to {args.output}")
+    if args.baseline:
+        regressions = compare_reports(load_report(args.baseline), report, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Entry point for ``python -m benchmarks.gateway``."""
+    args = _parse_args(argv)
+    logging.disable(logging.WARNING)
+    try:
+        return asyncio.run(_run(args))
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
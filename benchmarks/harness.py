@@ -0,0 +1,388 @@
+"""
+Benchmark Harness - WBS-PERF10 Load Generation and Reporting
+
+Scenario-agnostic pieces of the gateway benchmark suite:
+
+- ASGI driver that calls the app directly (no sockets, no client
+  buffering) and timestamps the first response body byte
+- Concurrent closed-loop load generator
+- Percentile summaries and JSON result files
+- Baseline comparison for regression checks between commits
+
+Reference Documents:
+- GUIDELINES pp. 2309-2319: Latency percentiles and throughput metrics
+- GUIDELINES p. 2149: Token generation and streaming patterns
+
+Pattern: Closed-loop load generator (fixed concurrency)
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+"""
+
+import asyncio
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+RESULTS_SCHEMA_VERSION = 1
+"""Bumped when the JSON result layout changes."""
+
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+"""Relative slowdown (10%) reported as a regression by compare_results()."""
+
+PERCENTILES: tuple[int, ...] = (50, 95, 99)
+
+
+# =============================================================================
+# ASGI Driver
+# =============================================================================
+
+
+@dataclass
+class AsgiResponse:
+    """
+    Outcome of one in-process ASGI request.
+
+    Attributes:
+        status: HTTP status code
+        body: Full response body
+        first_byte_at: perf_counter() when the first non-empty body chunk arrived
+        finished_at: perf_counter() when the response completed
+    """
+
+    status: int
+    body: bytes
+    first_byte_at: Optional[float]
+    finished_at: float
+
+
+async def asgi_request(
+    app: Callable[..., Awaitable[None]],
+    method: str,
+    path: str,
+    payload: Optional[dict[str, Any]] = None,
+    headers: Optional[dict[str, str]] = None,
+) -> AsgiResponse:
+    """
+    Send one HTTP request straight into an ASGI app.
+
+    Args:
+        app: ASGI application
+        method: HTTP method
+        path: Request path
+        payload: JSON body
+        headers: Extra request headers
+
+    Returns:
+        AsgiResponse with timing of first byte and completion
+    """
+    body = json.dumps(payload).encode() if payload is not None else b""
+    raw_headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    raw_headers += [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("benchmark", 80),
+    }
+    done = asyncio.Event()
+    sent_body = False
+    status = 0
+    chunks: list[bytes] = []
+    first_byte_at: Optional[float] = None
+
+    async def receive() -> dict[str, Any]:
+        nonlocal sent_body
+        if not sent_body:
+            sent_body = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status, first_byte_at
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunk = message.get("body", b"")
+            if chunk:
+                if first_byte_at is None:
+                    first_byte_at = time.perf_counter()
+                chunks.append(chunk)
+            if not message.get("more_body", False):
+                done.set()
+
+    try:
+        await app(scope, receive, send)
+    finally:
+        done.set()
+    return AsgiResponse(status, b"".join(chunks), first_byte_at, time.perf_counter())
+
+
+# =============================================================================
+# Samples and Summaries
+# =============================================================================
+
+
+@dataclass
+class RequestSample:
+    """
+    Timing for one benchmark request (seconds).
+
+    Attributes:
+        latency: End-to-end latency seen by the client
+        upstream: Time spent inside the provider
+        ttft: Client time to first body byte (streaming only)
+        upstream_ttft: Provider time to first chunk (streaming only)
+        ok: Whether the response status was 2xx
+    """
+
+    latency: float
+    upstream: float = 0.0
+    ttft: Optional[float] = None
+    upstream_ttft: Optional[float] = None
+    ok: bool = True
+
+    @property
+    def overhead(self) -> float:
+        """Latency added by the gateway."""
+        return max(self.latency - self.upstream, 0.0)
+
+    @property
+    def ttft_overhead(self) -> Optional[float]:
+        """TTFT added by the gateway (streaming only)."""
+        if self.ttft is None or self.upstream_ttft is None:
+            return None
+        return max(self.ttft - self.upstream_ttft, 0.0)
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    """
+    Nearest-rank percentiles in milliseconds.
+
+    Args:
+        values: Samples in seconds
+
+    Returns:
+        {"p50": ..., "p95": ..., "p99": ..., "mean": ...} (empty if no samples)
+    """
+    if not values:
+        return {}
+    ordered = sorted(values)
+    summary = {
+        f"p{p}": ordered[min(len(ordered) - 1, max(0, -(-p * len(ordered) // 100) - 1))] * 1000
+        for p in PERCENTILES
+    }
+    summary["mean"] = sum(ordered) / len(ordered) * 1000
+    return {k: round(v, 4) for k, v in summary.items()}
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Aggregated results for one scenario run.
+
+    Attributes:
+        scenario: Scenario name
+        concurrency: Concurrent in-flight requests
+        requests: Requests completed
+        errors: Non-2xx responses or exceptions
+        duration_s: Wall-clock run time
+        requests_per_second: Throughput
+        cpu_ms_per_request: Process CPU time per request
+        latency_ms: End-to-end latency percentiles
+        overhead_ms: Gateway-added latency percentiles
+        ttft_overhead_ms: Gateway-added TTFT percentiles (streaming)
+        alloc_peak_kib: Median tracemalloc peak per request
+    """
+
+    scenario: str
+    concurrency: int
+    requests: int
+    errors: int
+    duration_s: float
+    requests_per_second: float
+    cpu_ms_per_request: float
+    latency_ms: dict[str, float] = field(default_factory=dict)
+    overhead_ms: dict[str, float] = field(default_factory=dict)
+    ttft_overhead_ms: dict[str, float] = field(default_factory=dict)
+    alloc_peak_kib: Optional[float] = None
+
+
+# =============================================================================
+# Load Generator
+# =============================================================================
+
+
+async def run_load(
+    scenario: str,
+    send_one: Callable[[int], Awaitable[RequestSample]],
+    total: int,
+    concurrency: int,
+    warmup: int = 0,
+) -> ScenarioResult:
+    """
+    Drive ``send_one`` with a fixed number of concurrent workers.
+
+    Args:
+        scenario: Scenario name for the result
+        send_one: Coroutine issuing request ``i`` and returning its sample
+        total: Number of measured requests
+        concurrency: Concurrent workers
+        warmup: Unmeasured requests issued first
+
+    Returns:
+        ScenarioResult (allocations are filled by measure_allocations())
+    """
+    for i in range(warmup):
+        await send_one(-1 - i)
+
+    samples: list[RequestSample] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in counter:
+            try:
+                sample = await send_one(i)
+            except Exception:
+                errors += 1
+                continue
+            samples.append(sample)
+            if not sample.ok:
+                errors += 1
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    ttft_overheads = [s.ttft_overhead for s in samples if s.ttft_overhead is not None]
+    return ScenarioResult(
+        scenario=scenario,
+        concurrency=concurrency,
+        requests=len(samples),
+        errors=errors,
+        duration_s=round(duration, 4),
+        requests_per_second=round(len(samples) / duration, 2) if duration else 0.0,
+        cpu_ms_per_request=round(cpu / max(len(samples), 1) * 1000, 4),
+        latency_ms=percentiles([s.latency for s in samples]),
+        overhead_ms=percentiles([s.overhead for s in samples]),
+        ttft_overhead_ms=percentiles(ttft_overheads),
+    )
+
+
+async def measure_allocations(
+    send_one: Callable[[int], Awaitable[RequestSample]], samples: int
+) -> float:
+    """
+    Median tracemalloc peak (KiB) of sequential requests.
+
+    Run separately from run_load() because tracing slows every allocation.
+    """
+    peaks: list[float] = []
+    tracemalloc.start()
+    try:
+        for i in range(samples):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            await send_one(i)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append((peak - baseline) / 1024)
+    finally:
+        tracemalloc.stop()
+    peaks.sort()
+    return round(peaks[len(peaks) // 2], 2) if peaks else 0.0
+
+
+# =============================================================================
+# Result Files
+# =============================================================================
+
+
+def _git_commit() -> Optional[str]:
+    """Current git commit, if available."""
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def build_report(results: list[ScenarioResult], config: dict[str, Any]) -> dict[str, Any]:
+    """Assemble the JSON document written by save_report()."""
+    return {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "commit": _git_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config,
+        "scenarios": {r.scenario: asdict(r) for r in results},
+    }
+
+
+def save_report(report: dict[str, Any], path: Path) -> None:
+    """Write a report as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    """Read a report written by save_report()."""
+    return json.loads(path.read_text())
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[str]:
+    """
+    Find scenarios whose p95 overhead, throughput or CPU regressed.
+
+    Args:
+        baseline: Earlier report
+        current: New report
+        threshold: Relative change treated as a regression
+
+    Returns:
+        Human-readable regression descriptions (empty if none)
+    """
+    regressions: list[str] = []
+    for name, now in current.get("scenarios", {}).items():
+        before = baseline.get("scenarios", {}).get(name)
+        if before is None:
+            continue
+        checks = (
+            ("p95 overhead ms", before["overhead_ms"].get("p95"), now["overhead_ms"].get("p95"), 1),
+            ("cpu ms/request", before["cpu_ms_per_request"], now["cpu_ms_per_request"], 1),
+            ("requests/s", before["requests_per_second"], now["requests_per_second"], -1),
+        )
+        for label, old, new, direction in checks:
+            if not old or new is None:
+                continue
+            change = (new - old) / old * direction
+            if change > threshold:
+                regressions.append(f"{name}: {label} {old} -> {new} ({change:+.0%})")
+    return regressions
@@ -0,0 +1,179 @@
+"""
+Tool Argument Validation Benchmark - WBS-PERF18
+
+Measures the per-call cost of validating tool arguments against each
+builtin tool's parameter schema:
+
+- legacy     The previous shallow check (required + top-level type map
+             rebuilt on every call)
+- compiled   ArgumentValidator compiled once, reused per call
+- recompile  ArgumentValidator compiled on every call (what caching avoids)
+
+Arguments are generated from each schema so every tool is validated with
+a realistic, valid payload (all properties present, nested arrays filled).
+
+Usage:
+    python -m benchmarks.tool_validation --iterations 20000
+    python -m benchmarks.tool_validation --tool enrich_metadata --output bench/validation.json
+
+Reference Documents:
+- GUIDELINES pp. 2309-2319: Latency percentiles and throughput metrics
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from benchmarks.harness import percentiles
+from src.api.routes.tools import BUILTIN_TOOLS
+from src.tools.validation import ArgumentValidator
+
+MODES = ("legacy", "compiled", "recompile")
+"""Validation strategies compared by the benchmark."""
+
+_SAMPLE_VALUES: dict[str, Any] = {
+    "string": "sample",
+    "integer": 3,
+    "number": 0.5,
+    "boolean": True,
+    "null": None,
+}
+
+_LEGACY_TYPES: dict[str, Any] = {
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def sample_arguments(schema: dict[str, Any], array_length: int = 3) -> Any:
+    """Build a valid value for a schema node (all properties populated)."""
+    if "enum" in schema:
+        return schema["enum"][0]
+    if "default" in schema:
+        return schema["default"]
+    expected = schema.get("type")
+    if isinstance(expected, list):
+        expected = expected[0]
+    if expected == "object" or "properties" in schema:
+        return {
+            name: sample_arguments(sub, array_length)
+            for name, sub in (schema.get("properties") or {}).items()
+        }
+    if expected == "array":
+        item = schema.get("items") or {}
+        return [sample_arguments(item, array_length) for _ in range(array_length)]
+    return _SAMPLE_VALUES.get(expected, "sample")
+
+
+def legacy_validate(schema: dict[str, Any], arguments: dict[str, Any]) -> bool:
+    """The shallow check used before WBS-PERF18."""
+    for field in schema.get("required", []):
+        if field not in arguments:
+            return False
+    properties = schema.get("properties", {})
+    for name, value in arguments.items():
+        if name not in properties:
+            return False
+        expected_type = properties[name].get("type")
+        if expected_type and not isinstance(value, _LEGACY_TYPES.get(expected_type, object)):
+            return False
+    return True
+
+
+def _validator_for(mode: str, schema: dict[str, Any]) -> Callable[[dict[str, Any]], Any]:
+    if mode == "legacy":
+        return lambda arguments: legacy_validate(schema, arguments)
+    if mode == "compiled":
+        return ArgumentValidator(schema, reject_unknown=True).validate
+    return lambda arguments: ArgumentValidator(schema, reject_unknown=True).validate(arguments)
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+def measure(
+    schema: dict[str, Any], mode: str, iterations: int, batch: int = 100
+) -> dict[str, float]:
+    """
+    Time validation of one schema in one mode.
+
+    Args:
+        schema: Tool parameter schema
+        mode: One of MODES
+        iterations: Calls to time (rounded up to a whole batch)
+        batch: Calls per timed sample, to keep timer overhead out
+
+    Returns:
+        Percentiles of per-call time in microseconds, plus ns_per_call
+    """
+    validate = _validator_for(mode, schema)
+    arguments = sample_arguments(schema)
+    validate(arguments)
+    samples: list[float] = []
+    for _ in range(max(1, -(-iterations // batch))):
+        start = time.perf_counter()
+        for _ in range(batch):
+            validate(arguments)
+        samples.append((time.perf_counter() - start) / batch)
+    # percentiles() reports milliseconds; scale seconds so values read as µs
+    summary = percentiles([s * 1000 for s in samples])
+    summary["ns_per_call"] = round(sum(samples) / len(samples) * 1e9, 1)
+    return summary
+
+
+def run(tools: list[str], iterations: int) -> dict[str, dict[str, dict[str, float]]]:
+    """Measure every mode for the given builtin tools."""
+    return {
+        name: {
+            mode: measure(BUILTIN_TOOLS[name][0].parameters, mode, iterations) for mode in MODES
+        }
+        for name in tools
+    }
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def _parse_args(argv: Optional[list[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure per-call tool argument validation cost")
+    parser.add_argument("--tool", choices=(*BUILTIN_TOOLS, "all"), default="all")
+    parser.add_argument("--iterations", type=int, default=20000, help="Calls per tool and mode")
+    parser.add_argument("--output", type=Path, help="Write JSON results here")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Entry point for ``python -m benchmarks.tool_validation``."""
+    args = _parse_args(argv)
+    tools = list(BUILTIN_TOOLS) if args.tool == "all" else [args.tool]
+    results = run(tools, args.iterations)
+    for name, modes in results.items():
+        print(
+            f"{name:<24} "
+            + "  ".join(f"{mode}={modes[mode]['ns_per_call']:>8.1f}ns" for mode in MODES)
+        )
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Client Disconnect Propagation - WBS-PERF2
+
+This module propagates client disconnects from the ASGI layer into the
+service layer so that upstream provider streams, tool batches and HTTP
+calls are cancelled as soon as nobody is left to read the result.
+
+Two entry points are provided:
+- DisconnectWatcher.run(): races a coroutine (e.g. ChatService.complete())
+  against request.is_disconnected() and cancels it on disconnect. The
+  cancellation propagates through asyncio.gather() in execute_batch() and
+  closes in-flight httpx connections.
+- DisconnectWatcher.guard_stream(): checks request.is_disconnected() between
+  streamed chunks and closes the upstream async generator (aclose), which
+  exits the provider's ``async with`` stream context and releases the
+  upstream connection.
+
+Reference Documents:
+- GUIDELINES pp. 2145: Graceful degradation, timeouts prevent cascading failures
+- GUIDELINES p. 2149: Token generation and streaming patterns
+- Newman (Building Microservices pp. 273-275): Resource isolation
+
+Pattern: Cooperative cancellation (asyncio Task.cancel)
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+Anti-Pattern §3.1 Avoided: No bare except clauses
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Optional, TypeVar
+
+from starlette.requests import Request
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_DISCONNECT_POLL_INTERVAL_SECONDS: float = 0.25
+"""How often a non-streaming request checks whether the client is still there."""
+
+
+# =============================================================================
+# Custom Exceptions
+# =============================================================================
+
+
+class ClientDisconnectedError(Exception):
+    """Raised when a request is cancelled because the client disconnected."""
+
+
+# =============================================================================
+# WBS-PERF2: DisconnectWatcher
+# =============================================================================
+
+
+class DisconnectWatcher:
+    """
+    Cancel upstream work when the HTTP client goes away.
+
+    WBS-PERF2: Propagate client disconnects to providers and tools.
+
+    Attributes:
+        disconnected: True once a disconnect has been observed.
+
+    Example:
+        >>> watcher = DisconnectWatcher(http_request)
+        >>> response = await watcher.run(chat_service.complete(request))
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        poll_interval: float = DEFAULT_DISCONNECT_POLL_INTERVAL_SECONDS,
+    ) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            request: Incoming Starlette/FastAPI request.
+            poll_interval: Seconds between disconnect checks in run().
+        """
+        self._request = request
+        self._poll_interval = poll_interval
+        self.disconnected = False
+
+    async def is_disconnected(self) -> bool:
+        """Check (and remember) whether the client has disconnected."""
+        if not self.disconnected and await self._request.is_disconnected():
+            self.disconnected = True
+        return self.disconnected
+
+    async def run(self, awaitable: Awaitable[T]) -> T:
+        """
+        Await ``awaitable`` unless the client disconnects first.
+
+        Args:
+            awaitable: Work to run (wrapped in a task).
+
+        Returns:
+            The awaitable's result.
+
+        Raises:
+            ClientDisconnectedError: If the client disconnected; the task has
+                been cancelled and awaited before this is raised.
+        """
+        task: asyncio.Future[T] = asyncio.ensure_future(awaitable)
+        try:
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=self._poll_interval)
+                if done:
+                    return task.result()
+                if await self.is_disconnected():
+                    await _cancel_and_wait(task)
+                    raise ClientDisconnectedError("Client disconnected")
+        finally:
+            if not task.done():
+                await _cancel_and_wait(task)
+
+    async def guard_stream(self, stream: AsyncIterator[T]) -> AsyncIterator[T]:
+        """
+        Forward ``stream`` until the client disconnects, then close it.
+
+        Args:
+            stream: Upstream async generator (e.g. provider.stream()).
+
+        Yields:
+            Items from ``stream`` while the client is connected.
+        """
+        try:
+            async for item in stream:
+                if await self.is_disconnected():
+                    return
+                yield item
+        finally:
+            await _aclose(stream)
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+async def _cancel_and_wait(task: "asyncio.Future[Any]") -> None:
+    """Cancel a task and wait for it to unwind."""
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        logger.debug("Cancelled task raised during unwind: %s", e)
+
+
+async def _aclose(stream: Any) -> None:
+    """Close an async generator if it supports aclose()."""
+    aclose: Optional[Any] = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
@@ -8,24 +8,39 @@ This module implements OOM prevention through:
 
 Reference: PLATFORM_STABILITY_WBS.md - WBS-PS5: OOM Prevention for llm-gateway
 
+WBS-PERF25: Request slots are granted by the AdmissionController
+(priority classes, weighted fair queuing per API key, queue deadlines)
+instead of a fixed semaphore with a 5-second timeout.
+
 Acceptance Criteria:
 - llm-gateway memory usage stays below threshold
 - Backpressure prevents request pileup
 """
 
-import asyncio
 import gc
 import logging
+import math
 import os
 import resource
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from src.api.middleware.admission import (
+    PRIORITY_CLASSES,
+    PRIORITY_INTERACTIVE,
+    AdmissionController,
+    AdmissionRejectedError,
+    classify_request,
+)
+from src.services.cost_aggregator import ANONYMOUS_API_KEY_ID
+from src.observability.metrics import record_admission_rejection
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +96,7 @@ class MemoryTracker:
     
     Provides:
     - Real-time memory usage monitoring
-    - Request concurrency tracking (semaphore-based)
+    - Request concurrency tracking (WBS-PERF25: fair-queued admission)
     - Memory pressure detection
     - Metrics for /health endpoint
     """
@@ -100,11 +115,9 @@ class MemoryTracker:
         
         self._initialized = True
         self._peak_mb: float = 0.0
-        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
-        self._active_requests: int = 0
+        self._admission = AdmissionController(MAX_CONCURRENT_REQUESTS)
         self._total_requests: int = 0
         self._rejected_requests: int = 0
-        self._lock = asyncio.Lock()
         
         logger.info(
             f"MemoryTracker initialized: threshold={MEMORY_THRESHOLD_MB}MB, "
@@ -112,6 +125,22 @@ class MemoryTracker:
             f"max_concurrent={MAX_CONCURRENT_REQUESTS}"
         )
     
+    @property
+    def admission(self) -> AdmissionController:
+        """The admission controller granting request slots."""
+        return self._admission
+
+    def set_admission_controller(self, controller: AdmissionController) -> None:
+        """
+        Replace the admission controller (called from the application lifespan
+        with settings-derived weights and deadlines, before serving requests).
+        """
+        self._admission = controller
+
+    @property
+    def _active_requests(self) -> int:
+        return self._admission.active
+
     def get_memory_usage(self) -> tuple[float, float]:
         """
         Get current memory usage in MB.
@@ -173,7 +202,8 @@ class MemoryTracker:
             accepting = True
         
         # Queue utilization
-        queue_util = self._active_requests / MAX_CONCURRENT_REQUESTS if MAX_CONCURRENT_REQUESTS > 0 else 0.0
+        max_concurrent = self._admission.max_concurrent
+        queue_util = self._active_requests / max_concurrent
         
         return MemoryMetrics(
             rss_mb=round(rss_mb, 2),
@@ -185,21 +215,35 @@ class MemoryTracker:
             gc_count=gc.get_count(),
             timestamp=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
             active_requests=self._active_requests,
-            max_concurrent=MAX_CONCURRENT_REQUESTS,
+            max_concurrent=max_concurrent,
             queue_utilization=round(queue_util * 100, 1),
             memory_pressure=pressure,
             accepting_requests=accepting,
         )
     
-    async def acquire_request_slot(self) -> bool:
+    async def admit(
+        self,
+        priority: str = PRIORITY_INTERACTIVE,
+        tenant: str = ANONYMOUS_API_KEY_ID,
+        timeout_seconds: Optional[float] = None,
+    ) -> float:
         """
-        Acquire a request slot (backpressure mechanism).
-        
-        Uses semaphore to limit concurrent requests. If memory is critical,
-        rejects immediately without waiting.
-            
+        Wait for a request slot (backpressure mechanism).
+
+        WBS-PERF25: Slots are granted in weighted-fair order across priority
+        classes and API keys. If memory is critical, rejects immediately.
+
+        Args:
+            priority: Priority class (interactive, batch, background)
+            tenant: API key id
+            timeout_seconds: Client timeout, capping the queue deadline
+
         Returns:
-            True if slot acquired, False if rejected (timeout or memory critical)
+            Grant time, to be passed to release_request_slot()
+
+        Raises:
+            AdmissionRejectedError: Memory critical, queue full, or deadline
+                exceeded (projected or actual)
         """
         # Check memory pressure first
         rss_mb, _ = self.get_memory_usage()
@@ -208,40 +252,49 @@ class MemoryTracker:
                 f"Request rejected: memory critical ({rss_mb:.1f}MB >= {MEMORY_THRESHOLD_MB}MB)"
             )
             self._rejected_requests += 1
-            return False
-        
-        # Try to acquire semaphore with timeout using context manager
+            record_admission_rejection(priority, "memory")
+            raise AdmissionRejectedError(priority, "memory", 5.0)
+
         try:
-            async with asyncio.timeout(5.0):
-                acquired = await self._request_semaphore.acquire()
-                if acquired:
-                    async with self._lock:
-                        self._active_requests += 1
-                        self._total_requests += 1
-                        
-                        # Log warning if queue is getting full
-                        if self._active_requests >= QUEUE_WARNING_THRESHOLD:
-                            logger.warning(
-                                f"High request load: {self._active_requests}/{MAX_CONCURRENT_REQUESTS} active"
-                            )
-                    return True
-        except asyncio.TimeoutError:
+            granted_at = await self._admission.acquire(priority, tenant, timeout_seconds)
+        except AdmissionRejectedError:
+            self._rejected_requests += 1
+            raise
+
+        self._total_requests += 1
+        # Log warning if queue is getting full
+        if self._active_requests >= QUEUE_WARNING_THRESHOLD:
             logger.warning(
-                f"Request rejected: timeout waiting for slot "
-                f"({self._active_requests}/{MAX_CONCURRENT_REQUESTS} active)"
+                f"High request load: {self._active_requests}/{self._admission.max_concurrent} "
+                f"active, {self._admission.queued} queued"
             )
-            self._rejected_requests += 1
+        return granted_at
+
+    async def acquire_request_slot(
+        self,
+        priority: str = PRIORITY_INTERACTIVE,
+        tenant: str = ANONYMOUS_API_KEY_ID,
+        timeout_seconds: Optional[float] = None,
+    ) -> bool:
+        """
+        Acquire a request slot (backpressure mechanism).
+
+        Boolean form of admit() for callers that do not need the rejection
+        reason.
+
+        Returns:
+            True if slot acquired, False if rejected
+        """
+        try:
+            await self.admit(priority, tenant, timeout_seconds)
+        except AdmissionRejectedError:
             return False
-        
-        return False
-        return False
-    
-    async def release_request_slot(self) -> None:
+        return True
+
+    async def release_request_slot(self, granted_at: Optional[float] = None) -> None:
         """Release a request slot after completion."""
-        async with self._lock:
-            self._active_requests = max(0, self._active_requests - 1)
-        self._request_semaphore.release()
-    
+        self._admission.release(granted_at)
+
     def force_gc(self) -> dict:
         """
         Force garbage collection and return stats.
@@ -275,9 +328,14 @@ class MemoryMiddleware(BaseHTTPMiddleware):
     
     For each request:
     1. Check memory usage - reject if critical
-    2. Acquire request slot (semaphore) - reject if queue full
+    2. Acquire request slot (WBS-PERF25 admission queue) - reject if the
+       queue is full or the request's queue deadline cannot be met
     3. Process request
-    4. Release request slot
+    4. Release request slot once the response body has been sent, so
+       SSE/NDJSON streams hold their slot (and count toward the mean
+       service time) until the stream ends. The slot is released at most
+       once, and always by the time the response call returns, even if the
+       body is never iterated (e.g. the client disconnected first)
     
     Adds X-Memory-* headers to responses for observability.
     """
@@ -285,6 +343,15 @@ class MemoryMiddleware(BaseHTTPMiddleware):
     # Paths that bypass backpressure (health checks, metrics)
     BYPASS_PATHS = {"/health", "/ready", "/live", "/metrics", "/", "/docs", "/redoc", "/openapi.json"}
     
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request, then release any slot its response body did not."""
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            slot: Optional[_RequestSlot] = scope.get(_SLOT_SCOPE_KEY)
+            if slot is not None:
+                await slot.release()
+    
     async def dispatch(self, request: Request, call_next) -> Response:
         """Process request with memory/backpressure checks."""
         
@@ -292,42 +359,81 @@ class MemoryMiddleware(BaseHTTPMiddleware):
         if request.url.path in self.BYPASS_PATHS:
             return await call_next(request)
         
-        # Try to acquire a request slot
-        if not await memory_tracker.acquire_request_slot():
+        # WBS-PERF25: Wait for a slot in priority/tenant fair-queued order
+        priority, tenant, timeout = classify_request(request.url.path, request.headers)
+        try:
+            granted_at = await memory_tracker.admit(priority, tenant, timeout)
+        except AdmissionRejectedError as e:
             metrics = memory_tracker.get_metrics()
+            retry_after = max(1, math.ceil(e.retry_after_seconds))
             return JSONResponse(
                 status_code=503,
                 content={
                     "error": "Service Unavailable",
                     "reason": "backpressure",
+                    "admission_reason": e.reason,
+                    "priority": priority,
                     "message": "Server under memory pressure or at capacity",
                     "memory_mb": metrics.rss_mb,
                     "threshold_mb": metrics.threshold_mb,
                     "active_requests": metrics.active_requests,
+                    "queued_requests": memory_tracker.admission.queued,
                     "max_concurrent": metrics.max_concurrent,
-                    "retry_after_seconds": 5,
+                    "retry_after_seconds": retry_after,
                 },
                 headers={
-                    "Retry-After": "5",
+                    "Retry-After": str(retry_after),
                     "X-Memory-Pressure": metrics.memory_pressure,
                 }
             )
         
-        try:
-            # Process the request
-            response = await call_next(request)
-            
-            # Add memory headers for observability
-            metrics = memory_tracker.get_metrics()
-            response.headers["X-Memory-RSS-MB"] = str(metrics.rss_mb)
-            response.headers["X-Memory-Pressure"] = metrics.memory_pressure
-            response.headers["X-Active-Requests"] = str(metrics.active_requests)
-            
-            return response
+        # Released by the body wrapper, or at the latest by __call__
+        slot = _RequestSlot(granted_at)
+        request.scope[_SLOT_SCOPE_KEY] = slot
         
-        finally:
-            # Always release the request slot
-            await memory_tracker.release_request_slot()
+        # Process the request
+        response = await call_next(request)
+        
+        # Add memory headers for observability
+        metrics = memory_tracker.get_metrics()
+        response.headers["X-Memory-RSS-MB"] = str(metrics.rss_mb)
+        response.headers["X-Memory-Pressure"] = metrics.memory_pressure
+        response.headers["X-Active-Requests"] = str(metrics.active_requests)
+        
+        # call_next() returns a streaming response (body_iterator) in practice
+        if hasattr(response, "body_iterator"):
+            response.body_iterator = _release_after_body(response.body_iterator, slot)
+        return response
+
+
+_SLOT_SCOPE_KEY = "llm_gateway.request_slot"
+"""ASGI scope key under which MemoryMiddleware keeps the request's slot."""
+
+
+class _RequestSlot:
+    """An admitted request's slot, released at most once."""
+    
+    def __init__(self, granted_at: float) -> None:
+        self.granted_at = granted_at
+        self.released = False
+    
+    async def release(self) -> None:
+        """Return the slot to the admission controller (no-op if already released)."""
+        if self.released:
+            return
+        self.released = True
+        await memory_tracker.release_request_slot(self.granted_at)
+
+
+async def _release_after_body(
+    body: AsyncIterator[bytes], slot: _RequestSlot
+) -> AsyncIterator[bytes]:
+    """Send the response body, then release the request slot (also on disconnect)."""
+    try:
+        async for chunk in body:
+            yield chunk
+    finally:
+        await slot.release()
 
 
 # =============================================================================
@@ -362,6 +468,10 @@ def get_memory_health() -> dict:
             "active_requests": metrics.active_requests,
             "max_concurrent": metrics.max_concurrent,
             "queue_utilization_percent": metrics.queue_utilization,
+            "queued": {
+                priority: memory_tracker.admission.depth(priority)
+                for priority in PRIORITY_CLASSES
+            },
             "accepting_requests": metrics.accepting_requests,
         },
         "status": "healthy" if metrics.accepting_requests else "degraded",
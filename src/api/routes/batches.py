@@ -0,0 +1,171 @@
+"""
+Batches Router - WBS-PERF24 Offline Batch Jobs
+
+This module exposes ``/v1/batches`` for nightly bulk completions. A job
+is created by POSTing a JSONL file (OpenAI batch format) as the request
+body; it runs in the background and its results are read from
+``/v1/batches/{id}/output`` as they are written.
+
+Jobs belong to the API key that created them: other keys cannot list,
+read or cancel them (unknown and foreign ids both answer 404).
+
+Reference Documents:
+- OpenAI Batch API: https://platform.openai.com/docs/api-reference/batch
+- GUIDELINES: REST constraints (Buelta pp. 92-93)
+"""
+
+import logging
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import FileResponse, JSONResponse, Response
+
+from src.services.batches import (
+    BatchError,
+    BatchManager,
+    BatchNotFoundError,
+    BatchTooLargeError,
+    get_batch_manager,
+)
+from src.services.cost_aggregator import api_key_id_from_headers, set_api_key_id
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Router - WBS-PERF24
+# =============================================================================
+
+
+async def identify_caller(request: Request) -> None:
+    """Scope batch jobs to the caller's API key for the rest of the request."""
+    set_api_key_id(api_key_id_from_headers(request.headers))
+
+
+router = APIRouter(prefix="/v1", tags=["Batches"], dependencies=[Depends(identify_caller)])
+
+JSONL_MEDIA_TYPE = "application/jsonl"
+
+
+# =============================================================================
+# Dependencies
+# =============================================================================
+
+
+def require_batch_manager() -> BatchManager:
+    """Get the batch manager created in the application lifespan.
+
+    Raises:
+        HTTPException: 503 if batch jobs are disabled.
+    """
+    manager = get_batch_manager()
+    if manager is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Batch jobs are disabled",
+        )
+    return manager
+
+
+def _error(status_code: int, message: str, code: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"error": {"message": message, "type": "invalid_request_error", "code": code}},
+    )
+
+
+# =============================================================================
+# Endpoints
+# =============================================================================
+
+
+@router.post("/batches")
+async def create_batch(
+    request: Request,
+    completion_window: Literal["24h", "immediate"] = Query("24h"),
+    concurrency: Optional[int] = Query(None, ge=1),
+    manager: BatchManager = Depends(require_batch_manager),
+) -> JSONResponse:
+    """
+    Create a batch job from a JSONL request body.
+
+    Each line is ``{"custom_id", "method": "POST", "url":
+    "/v1/chat/completions", "body": {...}}``. The body is streamed to disk
+    and validated line by line.
+
+    Args:
+        request: Raw request (body is the JSONL file)
+        completion_window: ``24h`` lets lines use provider batch APIs;
+            ``immediate`` runs every line through the gateway
+        concurrency: Concurrent gateway requests for this job
+        manager: Injected batch manager
+
+    Returns:
+        The batch object
+
+    Raises:
+        HTTPException 400: Invalid input file
+        HTTPException 413: Input file over batch_max_input_bytes or batch_max_requests
+    """
+    try:
+        job = await manager.create_job(
+            request.stream(), completion_window=completion_window, concurrency=concurrency
+        )
+    except BatchTooLargeError as e:
+        return _error(413, str(e), "batch_too_large")
+    except BatchError as e:
+        return _error(400, str(e), "invalid_batch")
+    return JSONResponse(content=job.to_api())
+
+
+@router.get("/batches")
+async def list_batches(
+    limit: int = Query(20, ge=1, le=100),
+    manager: BatchManager = Depends(require_batch_manager),
+) -> dict:
+    """List batch jobs, newest first."""
+    return {"object": "list", "data": [job.to_api() for job in manager.list_jobs(limit)]}
+
+
+@router.get("/batches/{batch_id}")
+async def get_batch(
+    batch_id: str,
+    manager: BatchManager = Depends(require_batch_manager),
+) -> JSONResponse:
+    """Get a batch job, with live request counts while it runs."""
+    try:
+        return JSONResponse(content=manager.get_job(batch_id).to_api())
+    except BatchNotFoundError as e:
+        return _error(404, str(e), "batch_not_found")
+
+
+@router.get("/batches/{batch_id}/output")
+async def get_batch_output(
+    batch_id: str,
+    manager: BatchManager = Depends(require_batch_manager),
+) -> Response:
+    """
+    Download the results written so far as JSONL.
+
+    Lines are in completion order; match them to requests by custom_id.
+    """
+    try:
+        path = manager.output_path(batch_id)
+    except BatchNotFoundError as e:
+        return _error(404, str(e), "batch_not_found")
+    if not path.exists():
+        return Response(content=b"", media_type=JSONL_MEDIA_TYPE)
+    return FileResponse(path, media_type=JSONL_MEDIA_TYPE, filename=f"{batch_id}_output.jsonl")
+
+
+@router.post("/batches/{batch_id}/cancel")
+async def cancel_batch(
+    batch_id: str,
+    manager: BatchManager = Depends(require_batch_manager),
+) -> JSONResponse:
+    """Cancel a batch job; results written so far are kept."""
+    try:
+        job = await manager.cancel_job(batch_id)
+    except BatchNotFoundError as e:
+        return _error(404, str(e), "batch_not_found")
+    return JSONResponse(content=job.to_api())
@@ -25,16 +25,26 @@ WBS-MCE0: CMS Integration
 - Adds X-CMS-* response headers for observability
 """
 
+import asyncio
 import os
 import logging
 from typing import Optional, AsyncGenerator
 
-from fastapi import APIRouter, Depends, Header
+from fastapi import APIRouter, Depends, Header, Request
 from fastapi.responses import StreamingResponse, JSONResponse, Response
 
-from src.core.exceptions import ProviderError
+from src.api.disconnect import ClientDisconnectedError, DisconnectWatcher
+from src.core.config import get_settings
+from src.core.exceptions import ProviderError, RateLimitError
 from src.models.requests import ChatCompletionRequest
 from src.models.responses import ChatCompletionResponse
+from src.observability.metrics import (
+    record_cancelled_tokens_saved,
+    record_client_disconnect,
+)
+from src.observability.profiling import profile_phase, record_elapsed_phase
+from src.services.cost_aggregator import api_key_id_from_headers, set_api_key_id
+from src.services.streaming import StreamCoalescer
 
 # WBS-MCE0: CMS routing integration
 from src.api.routes.cms_routing import (
@@ -57,6 +67,12 @@ logger = logging.getLogger(__name__)
 # Environment configuration
 DEFAULT_MODEL = os.getenv("LLM_GATEWAY_DEFAULT_MODEL", "gpt-5.2")
 
+# WBS-PERF2: Endpoint label for disconnect metrics
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+
+# Non-standard status used by nginx for "client closed request"
+CLIENT_CLOSED_REQUEST_STATUS = 499
+
 
 # =============================================================================
 # Dependency Injection - FastAPI Pattern (Sinha p. 90)
@@ -90,7 +106,6 @@ def get_chat_service() -> "RealChatService":
         from src.providers.router import create_provider_router
         from src.tools.executor import ToolExecutor
         from src.tools.registry import get_tool_registry
-        from src.core.config import get_settings
         
         settings = get_settings()
         router = create_provider_router(settings)
@@ -170,6 +185,7 @@ def _check_responses_api_model(model: str) -> JSONResponse | None:
 @router.post("/completions", response_model=None)
 async def create_chat_completion(
     request: ChatCompletionRequest,
+    http_request: Request,
     chat_service: RealChatService = Depends(get_chat_service),
     x_cms_mode: Optional[str] = Header(None, alias="X-CMS-Mode"),
 ) -> ChatCompletionResponse | StreamingResponse | JSONResponse | Response:
@@ -181,6 +197,9 @@ async def create_chat_completion(
     WBS 2.2.2.3.9: Provider errors return 502 Bad Gateway
     WBS 2.2.3.2.1: Supports streaming with stream=true
     WBS-MCE0: CMS integration with tier-based routing
+    WBS-PERF2: Client disconnects cancel upstream provider/tool work
+    WBS-PERF8: Usage is attributed to a hash of the caller's API key
+    WBS-PERF12: Parsing, token estimation and serialization are profiled
 
     Pattern: Dependency injection for service layer (Sinha p. 90)
     Pattern: Pydantic request validation (Sinha pp. 193-195)
@@ -189,6 +208,7 @@ async def create_chat_completion(
 
     Args:
         request: Chat completion request with messages and parameters
+        http_request: Raw HTTP request (used to detect client disconnects)
         chat_service: Injected chat service dependency
         x_cms_mode: Optional CMS mode header (none, validate, optimize, plan, auto)
 
@@ -196,13 +216,17 @@ async def create_chat_completion(
         ChatCompletionResponse: Full response (non-streaming)
         StreamingResponse: SSE stream (streaming)
         JSONResponse: Error response with 502 status
+        Response: 499 when the client disconnected before completion
 
     Raises:
         HTTPException 422: Request validation failed
         HTTPException 503: CMS unavailable for Tier 3+ requests
         JSONResponse 502: Provider error (upstream failure)
+        JSONResponse 429: Upstream rate limit (with Retry-After)
     """
+    record_elapsed_phase("request_parsing")
     logger.debug(f"Chat completion request: model={request.model}, stream={request.stream}")
+    set_api_key_id(api_key_id_from_headers(http_request.headers))
     
     # Check for Responses API models first
     if error_response := _check_responses_api_model(request.model):
@@ -219,7 +243,8 @@ async def create_chat_completion(
     ]
     
     # Calculate token tier
-    token_count = estimate_tokens_from_messages(messages_dicts, request.model)
+    with profile_phase("cms_token_estimate"):
+        token_count = estimate_tokens_from_messages(messages_dicts, request.model)
     context_limit = get_context_limit(request.model)
     tier = calculate_tier(token_count, context_limit)
     
@@ -248,19 +273,28 @@ async def create_chat_completion(
         if request.stream:
             # For streaming, add CMS headers to the StreamingResponse
             return StreamingResponse(
-                _stream_sse_generator(chat_service, request),
+                _stream_sse_generator(chat_service, request, DisconnectWatcher(http_request)),
                 media_type="text/event-stream",
                 headers=cms_headers,
             )
 
         # Issue 27: Real ChatService uses complete(), not create_completion()
-        response = await chat_service.complete(request)
+        # WBS-PERF2: Cancel provider calls and tool batches on disconnect
+        try:
+            response = await DisconnectWatcher(http_request).run(
+                chat_service.complete(request)
+            )
+        except ClientDisconnectedError:
+            logger.info(f"Client disconnected, cancelled completion: model={request.model}")
+            record_client_disconnect(CHAT_COMPLETIONS_ENDPOINT, "complete")
+            return Response(status_code=CLIENT_CLOSED_REQUEST_STATUS)
         
         # Wrap response in JSONResponse to add CMS headers
-        return JSONResponse(
-            content=response.model_dump(),
-            headers=cms_headers,
-        )
+        with profile_phase("serialize"):
+            return JSONResponse(
+                content=response.model_dump(),
+                headers=cms_headers,
+            )
 
     except ProviderError as e:
         # WBS 2.2.2.3.9: Translate provider errors to 502 Bad Gateway
@@ -282,15 +316,51 @@ async def create_chat_completion(
             },
         )
 
+    except RateLimitError as e:
+        # WBS-PERF11: Surface upstream 429s with Retry-After instead of a 500
+        logger.warning(f"Upstream rate limited chat completion: {e.message}")
+        headers = {"Retry-After": str(e.retry_after)} if e.retry_after is not None else None
+        return JSONResponse(
+            status_code=429,
+            content={
+                "error": {
+                    "message": e.message,
+                    "code": e.error_code,
+                    "type": "rate_limit_error",
+                }
+            },
+            headers=headers,
+        )
+
+
+def _get_stream_coalescer() -> StreamCoalescer:
+    """
+    Build the SSE frame coalescer from settings.
+
+    WBS-PERF1: Coalescing window and byte threshold are configured via
+    LLM_GATEWAY_SSE_COALESCE_WINDOW_MS / LLM_GATEWAY_SSE_COALESCE_MAX_BYTES.
+
+    Returns:
+        StreamCoalescer: Coalescer (disabled when the window is 0).
+    """
+    settings = get_settings()
+    return StreamCoalescer(
+        window_ms=settings.sse_coalesce_window_ms,
+        max_bytes=settings.sse_coalesce_max_bytes,
+    )
+
 
 async def _stream_sse_generator(
-    chat_service: RealChatService, request: ChatCompletionRequest
+    chat_service: RealChatService,
+    request: ChatCompletionRequest,
+    watcher: Optional[DisconnectWatcher] = None,
 ) -> AsyncGenerator[str, None]:
     """
     Generate SSE-formatted stream from chat service.
 
     WBS 2.2.3.2.3: Format chunks as SSE 'data: ' lines.
     WBS 2.2.3.3.1: End stream with 'data: [DONE]' marker.
+    WBS-PERF2: Stop and close the provider stream when the client disconnects.
 
     Pattern: Server-Sent Events (SSE) format
     Pattern: Observable patterns (Sinha)
@@ -298,12 +368,47 @@ async def _stream_sse_generator(
     Args:
         chat_service: The chat service instance
         request: The chat completion request
+        watcher: Optional disconnect watcher for the client connection
 
     Yields:
         str: SSE-formatted data lines
     """
-    async for chunk in chat_service.stream_completion(request):
-        yield f"data: {chunk.model_dump_json()}\n\n"
+    # WBS-PERF1: Optional frame coalescing (window 0 = pass-through)
+    coalescer = _get_stream_coalescer()
+    stream = chat_service.stream_completion(request)
+    if watcher is not None:
+        stream = watcher.guard_stream(stream)
+
+    streamed_chunks = 0
+    try:
+        async for chunk in coalescer.coalesce(stream):
+            streamed_chunks += 1
+            yield f"data: {chunk.model_dump_json()}\n\n"
+    except asyncio.CancelledError:
+        # Server cancelled the response task after detecting the disconnect
+        _record_stream_disconnect(request, streamed_chunks)
+        raise
+
+    if watcher is not None and watcher.disconnected:
+        _record_stream_disconnect(request, streamed_chunks)
+        return
 
     # End marker - WBS 2.2.3.3.1
     yield "data: [DONE]\n\n"
+
+
+def _record_stream_disconnect(request: ChatCompletionRequest, streamed_chunks: int) -> None:
+    """
+    Record metrics for a stream cut short by a client disconnect.
+
+    WBS-PERF2: Tokens saved are estimated as the unused max_tokens budget,
+    counting each streamed chunk as roughly one token.
+
+    Args:
+        request: The chat completion request
+        streamed_chunks: Number of chunks already sent to the client
+    """
+    logger.info(f"Client disconnected, closed provider stream: model={request.model}")
+    record_client_disconnect(CHAT_COMPLETIONS_ENDPOINT, "stream")
+    if request.max_tokens:
+        record_cancelled_tokens_saved(request.model, request.max_tokens - streamed_chunks)
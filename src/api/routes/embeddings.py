@@ -0,0 +1,109 @@
+"""
+Embeddings Router - WBS-PERF23 OpenAI-Compatible Embeddings Endpoint
+
+This module exposes ``POST /v1/embeddings`` so services embed through the
+gateway (routing, pooling, caching, metrics) instead of calling
+unified-search-service directly.
+
+Reference Documents:
+- OpenAI Embeddings API: https://platform.openai.com/docs/api-reference/embeddings
+- config/model_registry.yaml: ``embeddings:`` section (model -> backend)
+- GUIDELINES: REST constraints (Buelta pp. 92-93)
+"""
+
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from src.core.config import get_settings
+from src.core.exceptions import GatewayValidationError, ProviderError
+from src.models.requests import EmbeddingRequest
+from src.models.responses import EmbeddingResponse
+from src.observability.profiling import profile_phase
+from src.providers.router import NoProviderError
+from src.services.embeddings import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Dependencies
+# =============================================================================
+
+# Global service instance (can be overridden in tests)
+_embedding_service: Optional[EmbeddingService] = None
+
+
+def get_embedding_service() -> EmbeddingService:
+    """
+    Dependency injection factory for EmbeddingService.
+
+    Returns:
+        EmbeddingService routing models per model_registry.yaml
+    """
+    global _embedding_service
+    if _embedding_service is None:
+        # Import here to avoid circular imports
+        from src.providers.embeddings import create_embedding_router
+
+        settings = get_settings()
+        _embedding_service = EmbeddingService(
+            create_embedding_router(settings),
+            max_inputs=settings.embeddings_max_inputs,
+            max_concurrent_batches=settings.embeddings_max_concurrent_batches,
+        )
+    return _embedding_service
+
+
+# =============================================================================
+# Router - WBS-PERF23
+# =============================================================================
+
+router = APIRouter(prefix="/v1", tags=["Embeddings"])
+
+
+def _error(status_code: int, message: str, error_type: str, **extra: object) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"error": {"message": message, "type": error_type, **extra}},
+    )
+
+
+@router.post("/embeddings", response_model=EmbeddingResponse)
+async def create_embeddings(
+    request: EmbeddingRequest,
+    service: EmbeddingService = Depends(get_embedding_service),
+) -> JSONResponse:
+    """
+    Create embeddings for one or more texts.
+
+    Args:
+        request: OpenAI-compatible embeddings request
+        service: Injected embedding service
+
+    Returns:
+        EmbeddingResponse as JSON
+
+    Raises:
+        HTTPException 400: Too many inputs
+        HTTPException 404: Model not registered or its provider not configured
+        HTTPException 502: Provider error
+    """
+    try:
+        response = await service.create(request)
+    except NoProviderError as e:
+        return _error(404, str(e), "invalid_request_error", code="model_not_found")
+    except GatewayValidationError as e:
+        return _error(400, e.message, "invalid_request_error", code=e.error_code)
+    except ProviderError as e:
+        logger.error(
+            f"Provider error during embeddings: provider={e.provider}, "
+            f"message={e.message}, status_code={e.status_code}"
+        )
+        return _error(502, e.message, "provider_error", code=e.error_code, provider=e.provider)
+
+    # Already validated; skip response_model re-validation of large vectors
+    with profile_phase("serialize"):
+        return JSONResponse(content=response.model_dump())
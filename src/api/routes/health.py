@@ -196,9 +196,13 @@ class HealthService:
         try:
             import httpx
 
+            from src.clients.http import create_traced_transport
+
             # Use async context manager for proper connection pooling
             # Anti-pattern §67: Don't create new client per request
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with httpx.AsyncClient(
+                timeout=5.0, transport=create_traced_transport("semantic-search")
+            ) as client:
                 response = await client.get(f"{self._semantic_search_url}/health")
 
                 if response.status_code == 200:
@@ -246,9 +250,13 @@ class HealthService:
         try:
             import httpx
 
+            from src.clients.http import create_traced_transport
+
             # Use async context manager for proper connection pooling
             # Anti-pattern §67: Don't create new client per request
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with httpx.AsyncClient(
+                timeout=5.0, transport=create_traced_transport("ai-agents")
+            ) as client:
                 response = await client.get(f"{self._ai_agents_url}/health")
 
                 if response.status_code == 200:
@@ -0,0 +1,100 @@
+"""
+Profiles Router - WBS-PERF12 Request Profile Retrieval
+
+This module serves request profiles collected by ProfilingMiddleware.
+Profiles contain internal timings and function names, so the endpoint is
+only enabled when LLM_GATEWAY_PROFILING_ADMIN_TOKEN is set and requires
+that token in the X-Admin-Token header.
+
+Reference Documents:
+- GUIDELINES pp. 2309-2319: Latency breakdown and observability
+- GUIDELINES: REST constraints (Buelta pp. 92-93)
+"""
+
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+
+from src.core.config import get_settings
+from src.observability.profiling import ProfileStore, get_profile_store, is_admin_token
+
+
+# =============================================================================
+# Router - WBS-PERF12
+# =============================================================================
+
+router = APIRouter(prefix="/v1/admin", tags=["Admin"])
+
+
+# =============================================================================
+# Dependencies
+# =============================================================================
+
+
+def require_admin_token(
+    x_admin_token: Optional[str] = Header(None, alias="X-Admin-Token"),
+) -> None:
+    """Require the admin token (shared by the profile and usage endpoints).
+
+    Raises:
+        HTTPException: 404 if no admin token is configured, 403 if the
+            supplied token does not match.
+    """
+    admin_token = get_settings().profiling_admin_token.get_secret_value()
+    if not admin_token:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Admin endpoint disabled",
+        )
+    if not is_admin_token(x_admin_token, admin_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
+
+
+# =============================================================================
+# Profile Endpoints
+# =============================================================================
+
+
+@router.get("/profiles", dependencies=[Depends(require_admin_token)])
+async def list_profiles(
+    limit: int = Query(50, ge=1, le=1000),
+    store: ProfileStore = Depends(get_profile_store),
+) -> dict[str, Any]:
+    """
+    List recent request profiles, newest first.
+
+    Args:
+        limit: Maximum profiles returned
+        store: Injected profile store
+
+    Returns:
+        {"profiles": [...]} with one summary per profile
+    """
+    return {"profiles": [p.summary() for p in store.list()[:limit]]}
+
+
+@router.get("/profiles/{profile_id}", dependencies=[Depends(require_admin_token)])
+async def get_profile(
+    profile_id: str,
+    store: ProfileStore = Depends(get_profile_store),
+) -> dict[str, Any]:
+    """
+    Get one request profile with its phase timeline.
+
+    Args:
+        profile_id: Id from the X-Gateway-Profile-Id response header
+        store: Injected profile store
+
+    Returns:
+        Profile with phases (by start offset) and cProfile summary
+
+    Raises:
+        HTTPException 404: Unknown or evicted profile
+    """
+    profile = store.get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile not found: {profile_id}",
+        )
+    return profile.to_dict()
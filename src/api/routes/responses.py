@@ -9,17 +9,26 @@ responses, supporting stateful interactions and built-in tools.
 
 Reference Documents:
 - OpenAI Responses API: https://platform.openai.com/docs/api-reference/responses
+- OpenAI Responses streaming events: response.created ... response.completed
+
+WBS-PERF16: Upstream calls use the pooled per-provider clients shared with
+the provider layer (no client per request), and ``stream=true`` returns
+Responses API server-sent events as they arrive.
 """
 
+import json
 import logging
 import time
 import uuid
-from typing import Any, AsyncGenerator, Optional, Union
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException
+import httpx
+from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse, JSONResponse
 from pydantic import BaseModel, Field
 
+from src.clients.http import get_shared_client
 from src.core.exceptions import ProviderError
 
 
@@ -28,6 +37,10 @@ logger = logging.getLogger(__name__)
 
 # Constants
 CONTENT_TYPE_JSON = "application/json"
+OPENAI_RESPONSES_URL = "https://api.openai.com/v1/responses"
+ANTHROPIC_MESSAGES_URL = "https://api.anthropic.com/v1/messages"
+DEEPSEEK_CHAT_URL = "https://api.deepseek.com/chat/completions"
+ANTHROPIC_API_VERSION = "2023-06-01"
 
 
 # =============================================================================
@@ -164,6 +177,254 @@ class ResponsesResponse(BaseModel):
     metadata: dict[str, str] = Field(default_factory=dict)
 
 
+# =============================================================================
+# WBS-PERF16: Responses API Streaming
+# =============================================================================
+
+
+SSE_DONE = "[DONE]"
+
+
+@dataclass
+class _UpstreamCall:
+    """A prepared upstream request for one /v1/responses call."""
+
+    provider: str
+    url: str
+    headers: dict[str, str]
+    payload: dict[str, Any]
+    model: str
+    error_label: str
+
+
+async def _iter_sse_data(lines: AsyncIterator[str]) -> AsyncIterator[dict[str, Any]]:
+    """
+    Yield the JSON payload of each SSE ``data:`` line.
+
+    ``event:`` lines are ignored (Anthropic repeats the event type in the
+    payload) and the OpenAI-style ``[DONE]`` sentinel ends the stream.
+    """
+    async for line in lines:
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == SSE_DONE:
+            return
+        if data:
+            yield json.loads(data)
+
+
+class ResponsesStreamTranslator:
+    """
+    Build Responses API stream events for providers without a native one.
+
+    Emits the event sequence OpenAI clients expect for a single text output:
+    response.created, response.output_item.added, response.content_part.added,
+    response.output_text.delta (repeated), response.output_text.done,
+    response.content_part.done, response.output_item.done and
+    response.completed (or response.failed).
+
+    Example:
+        >>> translator = ResponsesStreamTranslator("claude-sonnet-4")
+        >>> frames = translator.start() + translator.delta("Hi") + translator.finish()
+    """
+
+    def __init__(self, model: str) -> None:
+        """
+        Initialize the translator.
+
+        Args:
+            model: Model name reported in response objects
+        """
+        self._model = model
+        self._response_id = f"resp_{uuid.uuid4().hex[:24]}"
+        self._item_id = f"msg_{uuid.uuid4().hex[:24]}"
+        self._created_at = int(time.time())
+        self._sequence = 0
+        self._text: list[str] = []
+        self._usage = {"input_tokens": 0, "output_tokens": 0, "cached_tokens": 0}
+        self._started = False
+        self._finished = False
+
+    # =========================================================================
+    # Events
+    # =========================================================================
+
+    def start(self) -> list[bytes]:
+        """Open the response and its single output message (idempotent)."""
+        if self._started:
+            return []
+        self._started = True
+        return [
+            self._event("response.created", response=self._response("in_progress")),
+            self._event(
+                "response.output_item.added",
+                output_index=0,
+                item=self._message("in_progress", ""),
+            ),
+            self._event(
+                "response.content_part.added",
+                item_id=self._item_id,
+                output_index=0,
+                content_index=0,
+                part=self._part(""),
+            ),
+        ]
+
+    def delta(self, text: str) -> list[bytes]:
+        """Emit a text delta."""
+        if not text:
+            return []
+        self._text.append(text)
+        return self.start() + [
+            self._event(
+                "response.output_text.delta",
+                item_id=self._item_id,
+                output_index=0,
+                content_index=0,
+                delta=text,
+            )
+        ]
+
+    def finish(self) -> list[bytes]:
+        """Close the message and complete the response (idempotent)."""
+        if self._finished:
+            return []
+        frames = self.start()
+        self._finished = True
+        text = "".join(self._text)
+        return frames + [
+            self._event(
+                "response.output_text.done",
+                item_id=self._item_id,
+                output_index=0,
+                content_index=0,
+                text=text,
+            ),
+            self._event(
+                "response.content_part.done",
+                item_id=self._item_id,
+                output_index=0,
+                content_index=0,
+                part=self._part(text),
+            ),
+            self._event(
+                "response.output_item.done",
+                output_index=0,
+                item=self._message("completed", text),
+            ),
+            self._event("response.completed", response=self._response("completed")),
+        ]
+
+    def fail(self, message: str) -> list[bytes]:
+        """Report an upstream failure after the stream has started."""
+        if self._finished:
+            return []
+        frames = self.start()
+        self._finished = True
+        failed = self._response("failed")
+        failed["error"] = {"code": "server_error", "message": message}
+        return frames + [self._event("response.failed", response=failed)]
+
+    def add_usage(
+        self,
+        input_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None,
+        cached_tokens: Optional[int] = None,
+    ) -> None:
+        """Record token usage reported by the provider stream."""
+        for key, value in (
+            ("input_tokens", input_tokens),
+            ("output_tokens", output_tokens),
+            ("cached_tokens", cached_tokens),
+        ):
+            if value is not None:
+                self._usage[key] = value
+
+    # =========================================================================
+    # Provider Stream Mapping
+    # =========================================================================
+
+    def feed_anthropic(self, event: dict[str, Any]) -> list[bytes]:
+        """Translate one Anthropic Messages stream event."""
+        event_type = event.get("type")
+        if event_type == "message_start":
+            usage = event.get("message", {}).get("usage", {})
+            self.add_usage(
+                input_tokens=usage.get("input_tokens"),
+                output_tokens=usage.get("output_tokens"),
+                cached_tokens=usage.get("cache_read_input_tokens"),
+            )
+        elif event_type == "content_block_delta":
+            delta = event.get("delta", {})
+            if delta.get("type") == "text_delta":
+                return self.delta(delta.get("text", ""))
+        elif event_type == "message_delta":
+            self.add_usage(output_tokens=event.get("usage", {}).get("output_tokens"))
+        elif event_type == "message_stop":
+            return self.finish()
+        elif event_type == "error":
+            return self.fail(event.get("error", {}).get("message", "Upstream stream error"))
+        return []
+
+    def feed_chat_chunk(self, chunk: dict[str, Any]) -> list[bytes]:
+        """Translate one Chat Completions stream chunk (DeepSeek)."""
+        usage = chunk.get("usage")
+        if usage:
+            self.add_usage(
+                input_tokens=usage.get("prompt_tokens"),
+                output_tokens=usage.get("completion_tokens"),
+                cached_tokens=usage.get("prompt_cache_hit_tokens"),
+            )
+        choices = chunk.get("choices") or []
+        if not choices:
+            return []
+        return self.delta(choices[0].get("delta", {}).get("content") or "")
+
+    # =========================================================================
+    # Payload Builders
+    # =========================================================================
+
+    def _event(self, event_type: str, **fields: Any) -> bytes:
+        """Encode one SSE frame."""
+        body = {"type": event_type, "sequence_number": self._sequence, **fields}
+        self._sequence += 1
+        return f"event: {event_type}\ndata: {json.dumps(body)}\n\n".encode("utf-8")
+
+    def _part(self, text: str) -> dict[str, Any]:
+        return OutputTextContent(text=text).model_dump()
+
+    def _message(self, status: str, text: str) -> dict[str, Any]:
+        content = [OutputTextContent(text=text)] if status == "completed" else []
+        return OutputMessage(id=self._item_id, status=status, content=content).model_dump()
+
+    def _response(self, status: str) -> dict[str, Any]:
+        """Build the response object carried by lifecycle events."""
+        completed = status == "completed"
+        usage = self._usage
+        return ResponsesResponse(
+            id=self._response_id,
+            created_at=self._created_at,
+            status=status,
+            completed_at=int(time.time()) if completed else None,
+            model=self._model,
+            output=(
+                [OutputMessage(
+                    id=self._item_id,
+                    content=[OutputTextContent(text="".join(self._text))],
+                )]
+                if completed
+                else []
+            ),
+            usage=ResponsesUsage(
+                input_tokens=usage["input_tokens"],
+                input_tokens_details={"cached_tokens": usage["cached_tokens"]},
+                output_tokens=usage["output_tokens"],
+                total_tokens=usage["input_tokens"] + usage["output_tokens"],
+            ),
+        ).model_dump()
+
+
 # =============================================================================
 # Responses Service
 # =============================================================================
@@ -171,17 +432,21 @@ class ResponsesResponse(BaseModel):
 
 class ResponsesService:
     """Service for handling Responses API requests.
-    
+
     Routes requests to the appropriate provider:
     - OpenAI models (gpt-*) -> OpenAI Responses API
     - Anthropic models (claude-*) -> Anthropic Messages API (transformed)
     - DeepSeek models (deepseek-*) -> DeepSeek Chat API (transformed)
+
+    WBS-PERF16: Requests go through the long-lived pooled clients shared
+    with the provider layer, and ``stream=true`` relays OpenAI's Responses
+    events as-is or translates Anthropic/DeepSeek streams into them.
     """
-    
+
     # Models that use the native OpenAI Responses API
     OPENAI_RESPONSES_MODELS = {
         "gpt-5.2-pro",
-        "gpt-5.1-pro", 
+        "gpt-5.1-pro",
         "gpt-5-pro",
         "o3",
         "o3-mini",
@@ -189,12 +454,16 @@ class ResponsesService:
         "o1-mini",
         "o1-preview",
     }
-    
+
+    def __init__(self) -> None:
+        """Initialize the service (model aliases load on first use)."""
+        self._aliases: Optional[dict[str, str]] = None
+
     @classmethod
     def is_responses_api_model(cls, model: str) -> bool:
         """Check if a model uses the native OpenAI Responses API."""
         return model in cls.OPENAI_RESPONSES_MODELS or model.endswith("-pro")
-    
+
     @classmethod
     def get_provider_type(cls, model: str) -> str:
         """Determine which provider to use for a model."""
@@ -206,45 +475,95 @@ class ResponsesService:
         if model_lower.startswith("gemini"):
             return "google"
         return "openai"
-    
+
     async def create_response(self, request: ResponsesRequest) -> ResponsesResponse:
         """
         Create a response, routing to the appropriate provider.
         """
         provider_type = self.get_provider_type(request.model)
-        
+
         if provider_type == "anthropic":
             return await self._create_anthropic_response(request)
         elif provider_type == "deepseek":
             return await self._create_deepseek_response(request)
         else:
             return await self._create_openai_response(request)
-    
+
+    async def stream_response(self, request: ResponsesRequest) -> AsyncIterator[bytes]:
+        """
+        Open a streaming response, routing to the appropriate provider.
+
+        WBS-PERF16: The upstream request is sent (and its status checked)
+        before this returns, so provider errors surface as ProviderError
+        rather than inside an already-started event stream.
+
+        Args:
+            request: Responses API request
+
+        Returns:
+            Async iterator of SSE frames in Responses API event format
+
+        Raises:
+            ProviderError: Missing API key or non-200 upstream status
+        """
+        call = self._build_call(request, stream=True)
+        response = await self._open_stream(call)
+        if call.provider == "openai":
+            return self._relay_stream(response)
+        return self._translate_stream(call, response)
+
+    def _model_aliases(self) -> dict[str, str]:
+        """Alias → default model from config/model_registry.yaml (loaded once)."""
+        if self._aliases is None:
+            # Import here to avoid circular import
+            from src.providers.router import load_registry_snapshot
+
+            try:
+                self._aliases = load_registry_snapshot().aliases
+            except Exception as e:
+                logger.warning(f"Model aliases unavailable for /v1/responses: {e}")
+                self._aliases = {}
+        return self._aliases
+
+    def _build_call(self, request: ResponsesRequest, stream: bool = False) -> _UpstreamCall:
+        """Prepare the upstream request for the request's provider."""
+        provider_type = self.get_provider_type(request.model)
+        if provider_type == "anthropic":
+            return self._anthropic_call(request, stream)
+        if provider_type == "deepseek":
+            return self._deepseek_call(request, stream)
+        return self._openai_call(request, stream)
+
     async def _create_openai_response(self, request: ResponsesRequest) -> ResponsesResponse:
         """
         Create a response using the OpenAI Responses API.
-        
+
         This method calls the actual OpenAI /v1/responses endpoint.
         """
+        data = await self._post(self._openai_call(request))
+
+        # Transform to our response model
+        return self._transform_response(data)
+
+    def _openai_call(self, request: ResponsesRequest, stream: bool = False) -> _UpstreamCall:
+        """Build an OpenAI /v1/responses request."""
         from src.core.config import get_settings
-        from src.providers.router import ProviderRouter
-        import httpx
-        
+
         settings = get_settings()
         api_key = settings.openai_api_key.get_secret_value() if settings.openai_api_key else ""
-        
+
         if not api_key:
             raise ProviderError("OpenAI API key not configured", provider="openai")
-        
+
         # Resolve model aliases (e.g., "openai" -> "gpt-5.2")
-        model = ProviderRouter.PROVIDER_DEFAULTS.get(request.model.lower(), request.model)
-        
+        model = self._model_aliases().get(request.model.lower(), request.model)
+
         # Build the request payload
         payload: dict[str, Any] = {
             "model": model,
             "input": request.input,
         }
-        
+
         # Add optional parameters
         if request.instructions:
             payload["instructions"] = request.instructions
@@ -266,32 +585,21 @@ class ResponsesService:
             payload["metadata"] = request.metadata
         if request.reasoning:
             payload["reasoning"] = request.reasoning
-        
-        # Call OpenAI Responses API
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                "https://api.openai.com/v1/responses",
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": CONTENT_TYPE_JSON,
-                },
-            )
-            
-            if response.status_code != 200:
-                error_body = response.json() if response.content else {}
-                error_msg = error_body.get("error", {}).get("message", response.text)
-                raise ProviderError(
-                    f"OpenAI Responses API error: {error_msg}",
-                    provider="openai",
-                    status_code=response.status_code,
-                )
-            
-            data = response.json()
-        
-        # Transform to our response model
-        return self._transform_response(data)
-    
+        if stream:
+            payload["stream"] = True
+
+        return _UpstreamCall(
+            provider="openai",
+            url=OPENAI_RESPONSES_URL,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": CONTENT_TYPE_JSON,
+            },
+            payload=payload,
+            model=model,
+            error_label="OpenAI Responses API error",
+        )
+
     def _extract_content_text(self, content: list[Any]) -> str:
         """Extract text from content array format."""
         text_parts = []
@@ -337,19 +645,26 @@ class ResponsesService:
     async def _create_anthropic_response(self, request: ResponsesRequest) -> ResponsesResponse:
         """
         Create a response using the Anthropic Messages API.
-        
+
         This method calls Anthropic's /v1/messages endpoint and transforms
         the response to the Responses API format.
         """
+        call = self._anthropic_call(request)
+        data = await self._post(call)
+
+        # Transform Anthropic response to Responses API format
+        return self._transform_anthropic_response(data, call.model)
+
+    def _anthropic_call(self, request: ResponsesRequest, stream: bool = False) -> _UpstreamCall:
+        """Build an Anthropic /v1/messages request."""
         from src.core.config import get_settings
-        import httpx
-        
+
         settings = get_settings()
         api_key = settings.anthropic_api_key.get_secret_value() if settings.anthropic_api_key else ""
-        
+
         if not api_key:
             raise ProviderError("Anthropic API key not configured", provider="anthropic")
-        
+
         # Model alias mapping
         MODEL_ALIASES = {
             "claude-opus-4-5-20250514": "claude-opus-4-20250514",
@@ -357,50 +672,195 @@ class ResponsesService:
             "claude-4-opus": "claude-opus-4-20250514",
         }
         model = MODEL_ALIASES.get(request.model, request.model)
-        
+
         # Convert input to messages format
         messages = self._convert_input_to_messages(request.input)
-        
+
         # Build the request payload
         payload: dict[str, Any] = {
             "model": model,
             "messages": messages,
             "max_tokens": request.max_output_tokens or 4096,
         }
-        
+
         # Add system message from instructions
         if request.instructions:
             payload["system"] = request.instructions
-        
+
         # Add optional parameters
         self._add_optional_params(payload, request)
-        
-        # Call Anthropic Messages API
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                "https://api.anthropic.com/v1/messages",
-                json=payload,
-                headers={
-                    "x-api-key": api_key,
-                    "anthropic-version": "2023-06-01",
-                    "Content-Type": CONTENT_TYPE_JSON,
-                },
-            )
-            
-            if response.status_code != 200:
-                error_body = response.json() if response.content else {}
-                error_msg = error_body.get("error", {}).get("message", response.text)
-                raise ProviderError(
-                    f"Anthropic API error: {error_msg}",
-                    provider="anthropic",
-                    status_code=response.status_code,
-                )
-            
-            data = response.json()
-        
-        # Transform Anthropic response to Responses API format
-        return self._transform_anthropic_response(data, model)
-    
+        if stream:
+            payload["stream"] = True
+
+        return _UpstreamCall(
+            provider="anthropic",
+            url=ANTHROPIC_MESSAGES_URL,
+            headers={
+                "x-api-key": api_key,
+                "anthropic-version": ANTHROPIC_API_VERSION,
+                "Content-Type": CONTENT_TYPE_JSON,
+            },
+            payload=payload,
+            model=model,
+            error_label="Anthropic API error",
+        )
+
+    async def _create_deepseek_response(self, request: ResponsesRequest) -> ResponsesResponse:
+        """
+        Create a response using the DeepSeek Chat API.
+
+        This method calls DeepSeek's /chat/completions endpoint and transforms
+        the response to the Responses API format.
+        """
+        call = self._deepseek_call(request)
+        data = await self._post(call)
+
+        # Transform DeepSeek response to Responses API format
+        return self._transform_deepseek_response(data, call.model)
+
+    def _deepseek_call(self, request: ResponsesRequest, stream: bool = False) -> _UpstreamCall:
+        """Build a DeepSeek /chat/completions request."""
+        from src.core.config import get_settings
+
+        settings = get_settings()
+        api_key = settings.deepseek_api_key.get_secret_value() if settings.deepseek_api_key else ""
+
+        if not api_key:
+            raise ProviderError("DeepSeek API key not configured", provider="deepseek")
+
+        # Model alias mapping
+        MODEL_ALIASES = {
+            "deepseek-api/deepseek-chat": "deepseek-chat",
+            "deepseek": "deepseek-chat",
+        }
+        model = MODEL_ALIASES.get(request.model, request.model)
+
+        # Convert input to OpenAI-compatible messages format
+        messages = []
+
+        # Add system message from instructions
+        if request.instructions:
+            messages.append({"role": "system", "content": request.instructions})
+
+        # Add user/assistant messages
+        messages.extend(self._convert_input_to_messages(request.input))
+
+        # Build the request payload
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+        }
+
+        # Add optional parameters
+        if request.max_output_tokens:
+            payload["max_tokens"] = request.max_output_tokens
+        self._add_optional_params(payload, request)
+        if stream:
+            payload["stream"] = True
+            payload["stream_options"] = {"include_usage": True}
+
+        return _UpstreamCall(
+            provider="deepseek",
+            url=DEEPSEEK_CHAT_URL,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": CONTENT_TYPE_JSON,
+            },
+            payload=payload,
+            model=model,
+            error_label="DeepSeek API error",
+        )
+
+    # =========================================================================
+    # WBS-PERF16: Upstream I/O on Shared Pooled Clients
+    # =========================================================================
+
+    def _client(self, provider: str) -> httpx.AsyncClient:
+        """Get the long-lived client for a provider (never closed per request)."""
+        from src.core.config import get_settings
+
+        settings = get_settings()
+        return get_shared_client(
+            provider,
+            timeout=httpx.Timeout(
+                settings.responses_read_timeout_seconds,
+                connect=settings.responses_connect_timeout_seconds,
+            ),
+        )
+
+    async def _post(self, call: _UpstreamCall) -> dict[str, Any]:
+        """Send a non-streaming request and return the JSON body."""
+        response = await self._client(call.provider).post(
+            call.url, json=call.payload, headers=call.headers
+        )
+        if response.status_code != 200:
+            raise self._provider_error(call, response)
+        return response.json()
+
+    async def _open_stream(self, call: _UpstreamCall) -> httpx.Response:
+        """Send a streaming request; raise before streaming on non-200."""
+        client = self._client(call.provider)
+        response = await client.send(
+            client.build_request("POST", call.url, json=call.payload, headers=call.headers),
+            stream=True,
+        )
+        if response.status_code != 200:
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            raise self._provider_error(call, response)
+        return response
+
+    def _provider_error(self, call: _UpstreamCall, response: httpx.Response) -> ProviderError:
+        """Build a ProviderError from an upstream error response."""
+        try:
+            error_body = response.json() if response.content else {}
+        except ValueError:
+            error_body = {}
+        error = error_body.get("error") if isinstance(error_body, dict) else None
+        error_msg = error.get("message", response.text) if isinstance(error, dict) else response.text
+        return ProviderError(
+            f"{call.error_label}: {error_msg}",
+            provider=call.provider,
+            status_code=response.status_code,
+        )
+
+    async def _relay_stream(self, response: httpx.Response) -> AsyncIterator[bytes]:
+        """Relay OpenAI's Responses API SSE bytes unchanged."""
+        try:
+            async for chunk in response.aiter_bytes():
+                yield chunk
+        except httpx.HTTPError as e:
+            logger.warning(f"Responses stream from openai ended early: {e}")
+        finally:
+            await response.aclose()
+
+    async def _translate_stream(
+        self, call: _UpstreamCall, response: httpx.Response
+    ) -> AsyncIterator[bytes]:
+        """Translate an Anthropic/DeepSeek stream into Responses API events."""
+        translator = ResponsesStreamTranslator(call.model)
+        feed = (
+            translator.feed_anthropic
+            if call.provider == "anthropic"
+            else translator.feed_chat_chunk
+        )
+        try:
+            for frame in translator.start():
+                yield frame
+            async for event in _iter_sse_data(response.aiter_lines()):
+                for frame in feed(event):
+                    yield frame
+            frames = translator.finish()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Responses stream from {call.provider} failed: {e}")
+            frames = translator.fail(str(e))
+        finally:
+            await response.aclose()
+        for frame in frames:
+            yield frame
+
     def _transform_anthropic_response(self, data: dict[str, Any], model: str) -> ResponsesResponse:
         """Transform Anthropic Messages response to Responses API format."""
         # Extract text from content blocks
@@ -462,75 +922,6 @@ class ResponsesService:
             metadata={},
         )
     
-    async def _create_deepseek_response(self, request: ResponsesRequest) -> ResponsesResponse:
-        """
-        Create a response using the DeepSeek Chat API.
-        
-        This method calls DeepSeek's /chat/completions endpoint and transforms
-        the response to the Responses API format.
-        """
-        from src.core.config import get_settings
-        import httpx
-        
-        settings = get_settings()
-        api_key = settings.deepseek_api_key.get_secret_value() if settings.deepseek_api_key else ""
-        
-        if not api_key:
-            raise ProviderError("DeepSeek API key not configured", provider="deepseek")
-        
-        # Model alias mapping
-        MODEL_ALIASES = {
-            "deepseek-api/deepseek-chat": "deepseek-chat",
-            "deepseek": "deepseek-chat",
-        }
-        model = MODEL_ALIASES.get(request.model, request.model)
-        
-        # Convert input to OpenAI-compatible messages format
-        messages = []
-        
-        # Add system message from instructions
-        if request.instructions:
-            messages.append({"role": "system", "content": request.instructions})
-        
-        # Add user/assistant messages
-        messages.extend(self._convert_input_to_messages(request.input))
-        
-        # Build the request payload
-        payload: dict[str, Any] = {
-            "model": model,
-            "messages": messages,
-        }
-        
-        # Add optional parameters
-        if request.max_output_tokens:
-            payload["max_tokens"] = request.max_output_tokens
-        self._add_optional_params(payload, request)
-        
-        # Call DeepSeek Chat API
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                "https://api.deepseek.com/chat/completions",
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": CONTENT_TYPE_JSON,
-                },
-            )
-            
-            if response.status_code != 200:
-                error_body = response.json() if response.content else {}
-                error_msg = error_body.get("error", {}).get("message", response.text)
-                raise ProviderError(
-                    f"DeepSeek API error: {error_msg}",
-                    provider="deepseek",
-                    status_code=response.status_code,
-                )
-            
-            data = response.json()
-        
-        # Transform DeepSeek response to Responses API format
-        return self._transform_deepseek_response(data, model)
-    
     def _transform_deepseek_response(self, data: dict[str, Any], model: str) -> ResponsesResponse:
         """Transform DeepSeek Chat Completions response to Responses API format."""
         # Extract message from choices
@@ -684,7 +1075,7 @@ router = APIRouter(prefix="/v1", tags=["Responses"])
 async def create_response(
     request: ResponsesRequest,
     service: ResponsesService = Depends(get_responses_service),
-) -> ResponsesResponse | JSONResponse:
+) -> ResponsesResponse | StreamingResponse | JSONResponse:
     """
     Create a model response using the OpenAI Responses API.
     
@@ -696,17 +1087,27 @@ async def create_response(
     - Built-in tools (web search, file search, etc.)
     - Different response format optimized for agents
     
+    WBS-PERF16: With ``stream=true`` the response is a text/event-stream of
+    Responses API events (response.output_text.delta, response.completed).
+    
     Args:
         request: Responses API request
         service: Injected responses service
         
     Returns:
         ResponsesResponse: The model response
+        StreamingResponse: SSE event stream when request.stream is true
         JSONResponse: Error response with appropriate status code
     """
     logger.info(f"Responses API request: model={request.model}")
     
     try:
+        if request.stream:
+            return StreamingResponse(
+                await service.stream_response(request),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
         return await service.create_response(request)
     except ProviderError as e:
         logger.error(f"Provider error: {e.message}")
@@ -17,36 +17,57 @@ Anti-Patterns Avoided:
 WBS 3.2.2: Search Tool Integration
 - 3.2.2.1: search_corpus tool registered and wired to unified-search-service
 - 3.2.2.2: get_chunk tool registered and wired to unified-search-service
+
+WBS-PERF17: Batch Execution
+- POST /v1/tools/execute:batch runs N calls concurrently and streams each
+  result (NDJSON, or SSE with Accept: text/event-stream) as it completes
+- Every call has a deadline; sync tools run on a bounded thread pool
+- Calls are limited per downstream service so one batch cannot saturate it
 """
 
 import asyncio
+import functools
 import inspect
+import json
 import logging
-from collections.abc import Awaitable, Callable
-from typing import Any
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 
+from src.core.config import get_settings
 from src.models.tools import (
+    ToolBatchCall,
+    ToolBatchRequest,
+    ToolBatchResult,
     ToolDefinition,
     ToolExecuteRequest,
     ToolExecuteResponse,
 )
 
 # WBS 3.2.2: Import semantic search tool functions (not definitions)
-from src.tools.builtin.chunk_retrieval import get_chunk
-from src.tools.builtin.semantic_search import search_corpus
+from src.tools.builtin.chunk_retrieval import GET_CHUNK_DEFINITION, get_chunk
+from src.tools.builtin.semantic_search import SEARCH_CORPUS_DEFINITION, search_corpus
 
 # WBS 3.3.2: Import AI agent tool functions
-from src.tools.builtin.code_review import review_code
-from src.tools.builtin.architecture import analyze_architecture
-from src.tools.builtin.doc_generate import generate_documentation
+from src.tools.builtin.code_review import REVIEW_CODE_DEFINITION, review_code
+from src.tools.builtin.architecture import ANALYZE_ARCHITECTURE_DEFINITION, analyze_architecture
+from src.tools.builtin.doc_generate import GENERATE_DOCUMENTATION_DEFINITION, generate_documentation
 
 # WBS 2.4.3.2: Import cross-reference tool (ai-agents proxy)
-from src.tools.builtin.cross_reference import cross_reference
+from src.tools.builtin.cross_reference import CROSS_REFERENCE_DEFINITION, cross_reference
 
 # WBS MSE-6: Import enrich-metadata tool (ai-agents MSEP proxy)
-from src.tools.builtin.enrich_metadata import enrich_metadata
+from src.tools.builtin.enrich_metadata import ENRICH_METADATA_DEFINITION, enrich_metadata
+
+# WBS-PERF19: Per-downstream bulkheads shared with ToolExecutor
+from src.tools.bulkhead import LOCAL_DOWNSTREAM, ToolBulkhead, get_tool_bulkhead
+
+# WBS-PERF18: Compiled argument validation shared with ToolExecutor
+from src.tools.validation import ArgumentValidator, SchemaValidationError
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -632,6 +653,33 @@ BUILTIN_TOOLS: dict[str, tuple[ToolDefinition, ToolFunction]] = {
 }
 
 
+# =============================================================================
+# WBS-PERF17: Execution Limits
+# =============================================================================
+
+DEFAULT_TOOL_TIMEOUT_SECONDS = 30.0
+DEFAULT_TOOL_MAX_TIMEOUT_SECONDS = 300.0
+DEFAULT_TOOL_SYNC_WORKERS = 8
+
+TOOL_DOWNSTREAMS: dict[str, str] = {
+    definition.name: definition.downstream
+    for definition in (
+        SEARCH_CORPUS_DEFINITION,
+        GET_CHUNK_DEFINITION,
+        REVIEW_CODE_DEFINITION,
+        ANALYZE_ARCHITECTURE_DEFINITION,
+        GENERATE_DOCUMENTATION_DEFINITION,
+        CROSS_REFERENCE_DEFINITION,
+        ENRICH_METADATA_DEFINITION,
+    )
+    if definition.downstream
+}
+"""Downstream service each builtin tool calls (others count as local).
+
+WBS-PERF19: Taken from the registry's tool definitions so both executors
+share bulkhead compartments."""
+
+
 # =============================================================================
 # ToolExecutorService - WBS 2.2.4.3.4
 # Pattern: Service layer extraction (ANTI_PATTERN §4.1)
@@ -652,9 +700,36 @@ class ToolExecutorService:
     3. Tool execution with error handling
     """
 
-    def __init__(self):
-        """Initialize tool executor with builtin tools."""
+    def __init__(
+        self,
+        timeout_seconds: float = DEFAULT_TOOL_TIMEOUT_SECONDS,
+        sync_workers: int = DEFAULT_TOOL_SYNC_WORKERS,
+        bulkhead: Optional[ToolBulkhead] = None,
+        max_timeout_seconds: float = DEFAULT_TOOL_MAX_TIMEOUT_SECONDS,
+    ):
+        """
+        Initialize tool executor with builtin tools.
+
+        WBS-PERF17: Execution limits.
+        WBS-PERF19: Downstream limits come from a ToolBulkhead.
+
+        Args:
+            timeout_seconds: Default deadline per tool call
+            sync_workers: Threads available to sync tool functions
+            bulkhead: Per-downstream limits; defaults to the global
+                bulkhead, so chat tool loops and this endpoint draw on the
+                same compartments. Calls are not limited when neither is set.
+            max_timeout_seconds: Upper bound on caller-supplied deadlines
+        """
         self._tools: dict[str, tuple[ToolDefinition, ToolFunction]] = dict(BUILTIN_TOOLS)
+        self._timeout_seconds = timeout_seconds
+        self._max_timeout_seconds = max_timeout_seconds
+        self._sync_workers = sync_workers
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._bulkhead = bulkhead
+        self._validators: dict[str, ArgumentValidator] = {}
+        for definition, _ in self._tools.values():
+            self._get_validator(definition)
 
     def get_tool(self, name: str) -> tuple[ToolDefinition, ToolFunction] | None:
         """
@@ -686,6 +761,9 @@ class ToolExecutorService:
         Validate arguments against tool schema.
 
         WBS 2.2.4.3.3: Validate tool arguments against schema.
+        WBS-PERF18: Uses a validator compiled once per tool schema (the
+        same ArgumentValidator ToolExecutor uses), rejecting unknown
+        top-level arguments.
 
         Pattern: Schema validation (Sinha pp. 193-195)
 
@@ -696,61 +774,37 @@ class ToolExecutorService:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        schema = definition.parameters
-
-        # Check required fields
-        required = schema.get("required", [])
-        for field in required:
-            if field not in arguments:
-                return False, f"Missing required argument: {field}"
-
-        # Check argument types
-        properties = schema.get("properties", {})
-        for arg_name, arg_value in arguments.items():
-            if arg_name not in properties:
-                return False, f"Unknown argument: {arg_name}"
-
-            expected_type = properties[arg_name].get("type")
-            if expected_type and not self._check_type(arg_value, expected_type):
-                return False, f"Invalid type for '{arg_name}': expected {expected_type}"
-
+        try:
+            self._get_validator(definition).validate(arguments)
+        except SchemaValidationError as e:
+            return False, str(e)
         return True, None
 
-    def _check_type(self, value: Any, expected_type: str) -> bool:
-        """
-        Check if value matches expected JSON Schema type.
-
-        Args:
-            value: Value to check
-            expected_type: JSON Schema type (string, number, boolean, etc.)
-
-        Returns:
-            True if type matches
-        """
-        type_map = {
-            "string": str,
-            "number": (int, float),
-            "integer": int,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
-        expected_class = type_map.get(expected_type)
-        if expected_class is None:
-            return True  # Unknown type, assume valid
-        return isinstance(value, expected_class)  # type: ignore[arg-type]
-
-    async def execute(self, request: ToolExecuteRequest) -> ToolExecuteResponse:
+    def _get_validator(self, definition: ToolDefinition) -> ArgumentValidator:
+        """Get the compiled validator for a tool, recompiling if its schema changed."""
+        validator = self._validators.get(definition.name)
+        if validator is None or validator.schema is not definition.parameters:
+            validator = ArgumentValidator(definition.parameters, reject_unknown=True)
+            self._validators[definition.name] = validator
+        return validator
+
+    async def execute(
+        self, request: ToolExecuteRequest, timeout_seconds: Optional[float] = None
+    ) -> ToolExecuteResponse:
         """
         Execute a tool with given arguments.
 
         WBS 2.2.4.3.4: Execute tool via executor service.
         WBS 2.2.4.3.5: Return tool result or error.
+        WBS-PERF17: Deadline, downstream limit and off-loop sync tools.
 
         Pattern: Command pattern execution (Buelta p. 219)
 
         Args:
             request: Tool execution request
+            timeout_seconds: Deadline including time queued for the
+                downstream limit (None = service default), capped at the
+                service's max_timeout_seconds
 
         Returns:
             ToolExecuteResponse with result or error
@@ -777,18 +831,24 @@ class ToolExecutorService:
             )
 
         # Execute tool
+        timeout = min(timeout_seconds or self._timeout_seconds, self._max_timeout_seconds)
         try:
-            # Handle both sync and async tool functions (Issue 42-43 fix)
-            # Reference: GUIDELINES pp. 466, 618 - async only when awaiting
-            if inspect.iscoroutinefunction(func):
-                result = await func(**request.arguments)
-            else:
-                result = func(**request.arguments)
+            result = await asyncio.wait_for(
+                self._run_limited(request.name, func, request.arguments), timeout
+            )
             return ToolExecuteResponse(
                 name=request.name,
                 result=result,
                 success=True,
             )
+        except asyncio.TimeoutError:
+            logger.warning(f"Tool execution timed out: {request.name} after {timeout}s")
+            return ToolExecuteResponse(
+                name=request.name,
+                result=None,
+                success=False,
+                error=f"Tool execution timed out after {timeout}s",
+            )
         except Exception as e:
             # ANTI_PATTERN §3.1: Log exception with context
             logger.warning(f"Tool execution failed: {request.name} - {e}")
@@ -799,6 +859,99 @@ class ToolExecutorService:
                 error=str(e),
             )
 
+    async def _run_limited(
+        self, name: str, func: ToolFunction, arguments: dict[str, Any]
+    ) -> Any:
+        """
+        Run a tool function within its downstream concurrency limit.
+
+        Handles both sync and async tool functions (Issue 42-43 fix).
+        Sync functions run on the bounded thread pool so they cannot block
+        the event loop (WBS-PERF17).
+        """
+        bulkhead = self._bulkhead or get_tool_bulkhead()
+        if bulkhead is None:
+            return await self._call(func, arguments)
+        async with bulkhead.acquire(TOOL_DOWNSTREAMS.get(name, LOCAL_DOWNSTREAM)):
+            return await self._call(func, arguments)
+
+    async def _call(self, func: ToolFunction, arguments: dict[str, Any]) -> Any:
+        """Await an async tool function, or run a sync one on the thread pool."""
+        if inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+            getattr(func, "__call__", None)
+        ):
+            return await func(**arguments)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_thread_pool(), functools.partial(func, **arguments)
+        )
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        """Create the sync tool thread pool on first use."""
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self._sync_workers, thread_name_prefix="tool-sync"
+            )
+        return self._thread_pool
+
+    # =========================================================================
+    # WBS-PERF17: Batch Execution
+    # =========================================================================
+
+    async def execute_batch(
+        self, calls: list[ToolBatchCall], timeout_seconds: Optional[float] = None
+    ) -> AsyncIterator[ToolBatchResult]:
+        """
+        Run tool calls concurrently, yielding each result as it completes.
+
+        Results arrive in completion order; ``index`` maps them back to
+        the request. If the consumer stops early (client disconnect), the
+        remaining calls are cancelled.
+
+        Args:
+            calls: Tool calls to execute
+            timeout_seconds: Default per-call deadline (None = service default)
+
+        Yields:
+            ToolBatchResult per call
+        """
+        started = time.perf_counter()
+        tasks = [
+            asyncio.ensure_future(self._execute_call(index, call, timeout_seconds, started))
+            for index, call in enumerate(calls)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _execute_call(
+        self,
+        index: int,
+        call: ToolBatchCall,
+        timeout_seconds: Optional[float],
+        started: float,
+    ) -> ToolBatchResult:
+        """Execute one batch call and tag the result with its position."""
+        response = await self.execute(
+            ToolExecuteRequest(name=call.name, arguments=call.arguments),
+            timeout_seconds=call.timeout_seconds or timeout_seconds,
+        )
+        return ToolBatchResult(
+            **response.model_dump(),
+            index=index,
+            id=call.id,
+            duration_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    def close(self) -> None:
+        """Release the sync tool thread pool (running calls are not waited for)."""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+
 
 # =============================================================================
 # Dependency Injection - FastAPI Pattern (Sinha p. 90)
@@ -819,10 +972,23 @@ def get_tool_executor() -> ToolExecutorService:
     """
     global _tool_executor
     if _tool_executor is None:
-        _tool_executor = ToolExecutorService()
+        settings = get_settings()
+        _tool_executor = ToolExecutorService(
+            timeout_seconds=settings.tool_execute_timeout_seconds,
+            sync_workers=settings.tool_sync_workers,
+            max_timeout_seconds=settings.tool_execute_max_timeout_seconds,
+        )
     return _tool_executor
 
 
+def shutdown_tool_executor() -> None:
+    """Close the global tool executor's thread pool (application shutdown)."""
+    global _tool_executor
+    if _tool_executor is not None:
+        _tool_executor.close()
+        _tool_executor = None
+
+
 # =============================================================================
 # Router - WBS 2.2.4.1
 # =============================================================================
@@ -902,3 +1068,67 @@ async def execute_tool(
 
     # Execute tool
     return await tool_executor.execute(request)
+
+
+# =============================================================================
+# Batch Tool Execution Endpoint - WBS-PERF17
+# =============================================================================
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+async def _encode_batch_results(
+    results: AsyncIterator[ToolBatchResult], sse: bool
+) -> AsyncIterator[str]:
+    """Encode batch results as NDJSON lines or SSE ``result`` events."""
+    async for result in results:
+        body = result.model_dump_json()
+        yield f"event: result\ndata: {body}\n\n" if sse else f"{body}\n"
+    if sse:
+        yield f"event: done\ndata: {json.dumps({'done': True})}\n\n"
+
+
+@router.post("/execute:batch")
+async def execute_tool_batch(
+    request: ToolBatchRequest,
+    http_request: Request,
+    tool_executor: ToolExecutorService = Depends(get_tool_executor),
+) -> StreamingResponse:
+    """
+    Execute many tools concurrently and stream results as they complete.
+
+    WBS-PERF17: Agent orchestrators issue dozens of tool calls per step;
+    results are written as soon as each call finishes instead of waiting
+    for the slowest. Unknown tools, invalid arguments, failures and
+    timeouts are reported per call (``success: false``).
+
+    Response format: NDJSON (one ToolBatchResult per line), or SSE
+    ``result`` events followed by ``done`` when the client sends
+    ``Accept: text/event-stream``.
+
+    Args:
+        request: Batch of tool calls
+        http_request: Incoming request (for content negotiation)
+        tool_executor: Injected tool executor service
+
+    Returns:
+        StreamingResponse of ToolBatchResult records
+
+    Raises:
+        HTTPException 422: More calls than tool_batch_max_calls
+    """
+    max_calls = get_settings().tool_batch_max_calls
+    if len(request.calls) > max_calls:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Batch too large: {len(request.calls)} calls (max {max_calls})",
+        )
+
+    sse = SSE_MEDIA_TYPE in http_request.headers.get("accept", "")
+    logger.debug(f"Tool batch request: {len(request.calls)} calls")
+    results = tool_executor.execute_batch(request.calls, request.timeout_seconds)
+    return StreamingResponse(
+        _encode_batch_results(results, sse),
+        media_type=SSE_MEDIA_TYPE if sse else NDJSON_MEDIA_TYPE,
+    )
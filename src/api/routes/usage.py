@@ -0,0 +1,104 @@
+"""
+Usage Router - WBS-PERF9 Usage Analytics Endpoint
+
+This module serves time-bucketed usage rollups for chargeback dashboards.
+Queries read pre-aggregated minute/hour/day buckets, so cost is
+proportional to the number of buckets in the range, not to traffic.
+Usage spans every API key, so the endpoint requires the admin token in
+the X-Admin-Token header (see profiles.require_admin_token).
+
+Reference Documents:
+- GUIDELINES pp. 2309: Cost tracking and token usage
+- GUIDELINES: REST constraints (Buelta pp. 92-93)
+"""
+
+import datetime as dt
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+
+from src.api.routes.profiles import require_admin_token
+from src.services.usage_rollup import (
+    UsageQueryError,
+    UsageQueryResult,
+    UsageRollupError,
+    UsageRollupStore,
+)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_USAGE_WINDOW = dt.timedelta(hours=24)
+"""Range queried when ``from`` is omitted."""
+
+
+# =============================================================================
+# Router - WBS-PERF9
+# =============================================================================
+
+router = APIRouter(prefix="/v1", tags=["Usage"])
+
+
+# =============================================================================
+# Dependencies
+# =============================================================================
+
+
+def get_usage_rollup_store(request: Request) -> UsageRollupStore:
+    """Get the rollup store created in the application lifespan.
+
+    Raises:
+        HTTPException: 503 if Redis or rollups are unavailable.
+    """
+    store: Optional[UsageRollupStore] = getattr(request.app.state, "usage_rollup", None)
+    if store is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Usage analytics unavailable (Redis not configured)",
+        )
+    return store
+
+
+# =============================================================================
+# Usage Endpoint
+# =============================================================================
+
+
+@router.get(
+    "/usage", response_model=UsageQueryResult, dependencies=[Depends(require_admin_token)]
+)
+async def get_usage(
+    group_by: Literal["model", "provider", "api_key", "session"] = Query("model"),
+    from_: Optional[dt.datetime] = Query(None, alias="from"),
+    to: Optional[dt.datetime] = Query(None),
+    granularity: Optional[Literal["minute", "hour", "day"]] = Query(None),
+    store: UsageRollupStore = Depends(get_usage_rollup_store),
+) -> UsageQueryResult:
+    """
+    Query usage grouped by a dimension over a time range.
+
+    Args:
+        group_by: Dimension to group by
+        from_: Range start (defaults to 24h before ``to``)
+        to: Range end (defaults to now)
+        granularity: Bucket size (defaults to the finest that fits)
+        store: Injected rollup store
+
+    Returns:
+        UsageQueryResult with per-bucket and total usage per group
+
+    Raises:
+        HTTPException 400: Invalid range (e.g. too many buckets)
+        HTTPException 403/404: Invalid admin token, or none configured
+        HTTPException 503: Usage analytics unavailable or Redis failed
+    """
+    end = to or dt.datetime.now(dt.timezone.utc)
+    start = from_ or end - DEFAULT_USAGE_WINDOW
+    try:
+        return await store.query(group_by, start, end, granularity=granularity)
+    except UsageQueryError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    except UsageRollupError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)) from e
@@ -15,11 +15,18 @@ WBS Items:
 - 2.7.1.2: Semantic Search Client
 - 2.7.1.3: AI Agents Client
 - 2.7.2.1: Circuit Breaker
+- WBS-PERF21: Embedding Micro-Batcher
+- WBS-PERF22: Content-Addressed Embedding Cache
 """
 
 from src.clients.http import (
     HTTPClientError,
+    TracingTransport,
+    close_shared_clients,
     create_http_client,
+    create_traced_transport,
+    get_shared_client,
+    get_shared_transport,
     DEFAULT_MAX_CONNECTIONS,
     DEFAULT_MAX_KEEPALIVE,
     DEFAULT_RETRY_COUNT,
@@ -46,11 +53,28 @@ from src.clients.circuit_breaker import (
     CircuitOpenError,
     CircuitState,
 )
+from src.clients.embedding_batcher import (
+    EmbeddingBatcher,
+    EmbeddingBatchError,
+)
+from src.clients.embedding_cache import (
+    EmbeddingCache,
+    get_embedding_cache,
+    reset_embedding_cache,
+    set_embedding_cache,
+)
 
 __all__ = [
     # HTTP Client Factory
     "HTTPClientError",
     "create_http_client",
+    # WBS-PERF13: Outbound trace propagation
+    "TracingTransport",
+    "create_traced_transport",
+    # WBS-PERF16: Shared provider connection pools
+    "get_shared_transport",
+    "get_shared_client",
+    "close_shared_clients",
     "DEFAULT_MAX_CONNECTIONS",
     "DEFAULT_MAX_KEEPALIVE",
     "DEFAULT_RETRY_COUNT",
@@ -73,4 +97,12 @@ __all__ = [
     "CircuitBreaker",
     "CircuitOpenError",
     "CircuitState",
+    # WBS-PERF21: Embedding Micro-Batcher
+    "EmbeddingBatcher",
+    "EmbeddingBatchError",
+    # WBS-PERF22: Content-Addressed Embedding Cache
+    "EmbeddingCache",
+    "get_embedding_cache",
+    "set_embedding_cache",
+    "reset_embedding_cache",
 ]
@@ -17,6 +17,8 @@ from typing import Optional
 import httpx
 from pydantic import BaseModel
 
+from src.clients.http import create_traced_transport
+
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +121,7 @@ class CMSClient:
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=httpx.Timeout(self.timeout_seconds),
+            transport=create_traced_transport("cms"),
         )
         return self
     
@@ -138,6 +141,7 @@ class CMSClient:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 timeout=httpx.Timeout(self.timeout_seconds),
+                transport=create_traced_transport("cms"),
             )
         return self._client
     
@@ -0,0 +1,201 @@
+"""
+Embedding Micro-Batcher - WBS-PERF21
+
+Concurrent requests that each embed a handful of texts would otherwise
+send one HTTP request per caller to the embedding service. This module
+coalesces them DataLoader-style: the first call for a model opens a batch,
+calls arriving within a short window (or until the batch is full) join it,
+and a single embeddings request is sent. The returned vectors are sliced
+and handed back to each waiting caller in order.
+
+Behaviour:
+- Batches are keyed by model; calls for different models never mix
+- A batch is sent when it reaches max_batch_size texts or max_wait_ms
+  after its first call, whichever comes first
+- A downstream failure (or a response with the wrong number of vectors)
+  is raised to every caller in the batch
+- A caller that is cancelled while waiting is simply skipped on scatter
+
+Reference Documents:
+- GraphQL DataLoader: per-tick request batching
+- GUIDELINES pp. 2309: Connection pooling per downstream service
+- Designing Data-Intensive Applications (Kleppmann): Batching to amortize round trips
+
+Pattern: Request coalescing (micro-batching)
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+Anti-Pattern §4.1 Avoided: Cognitive complexity < 15 per function
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from src.observability.metrics import record_embed_batch
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_MAX_BATCH_SIZE = 64
+"""Texts per coalesced request before it is sent immediately."""
+
+DEFAULT_MAX_WAIT_MS = 5.0
+"""How long the first call in a batch waits for others to join."""
+
+EmbedSender = Callable[[list[str], Optional[str]], Awaitable[dict[str, Any]]]
+"""Sends one embeddings request: (texts, model) -> response with "embeddings"."""
+
+
+# =============================================================================
+# Exceptions
+# =============================================================================
+
+
+class EmbeddingBatchError(Exception):
+    """Raised when a coalesced response cannot be split back to its callers."""
+
+    pass
+
+
+# =============================================================================
+# Pending Batch
+# =============================================================================
+
+
+class _PendingBatch:
+    """Texts and waiting callers collected for one model."""
+
+    __slots__ = ("model", "texts", "waiters", "timer")
+
+    def __init__(self, model: Optional[str]) -> None:
+        self.model = model
+        self.texts: list[str] = []
+        # (future, start offset, count) per caller
+        self.waiters: list[tuple[asyncio.Future[dict[str, Any]], int, int]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    def add(self, texts: list[str]) -> "asyncio.Future[dict[str, Any]]":
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self.waiters.append((future, len(self.texts), len(texts)))
+        self.texts.extend(texts)
+        return future
+
+
+# =============================================================================
+# EmbeddingBatcher
+# =============================================================================
+
+
+class EmbeddingBatcher:
+    """
+    Coalesce concurrent embedding calls into batched downstream requests.
+
+    Example:
+        >>> batcher = EmbeddingBatcher("semantic-search", send=post_embeddings)
+        >>> result = await batcher.embed(["hello", "world"], model="all-MiniLM-L6-v2")
+        >>> len(result["embeddings"])
+        2
+    """
+
+    def __init__(
+        self,
+        name: str,
+        send: EmbedSender,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            name: Batcher name used in metrics (usually the downstream service)
+            send: Coroutine that performs one embeddings request
+            max_batch_size: Texts per batch before it is sent immediately
+            max_wait_ms: Maximum time the first caller waits for others
+        """
+        self.name = name
+        self._send = send
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max(0.0, max_wait_ms) / 1000.0
+        self._pending: dict[Optional[str], _PendingBatch] = {}
+        self._in_flight: set[asyncio.Task[None]] = set()
+
+    async def embed(self, texts: list[str], model: Optional[str] = None) -> dict[str, Any]:
+        """
+        Embed texts as part of the next coalesced request.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model (batches never mix models)
+
+        Returns:
+            The downstream response with ``embeddings`` narrowed to this
+            caller's texts, in order.
+
+        Raises:
+            EmbeddingBatchError: The response had the wrong number of vectors.
+            Exception: Whatever the downstream request raised.
+        """
+        if not texts:
+            return await self._send([], model)
+
+        batch = self._pending.get(model)
+        if batch is None:
+            batch = self._pending[model] = _PendingBatch(model)
+            batch.timer = asyncio.get_running_loop().call_later(
+                self.max_wait_seconds, self._flush, batch
+            )
+        future = batch.add(list(texts))
+        if len(batch.texts) >= self.max_batch_size:
+            self._flush(batch)
+        return await future
+
+    def _flush(self, batch: _PendingBatch) -> None:
+        """Close a pending batch and send it."""
+        if self._pending.get(batch.model) is not batch:
+            return
+        del self._pending[batch.model]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.create_task(self._run(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _run(self, batch: _PendingBatch) -> None:
+        """Send one batch and scatter the vectors to its callers."""
+        start = time.perf_counter()
+        try:
+            response = await self._send(batch.texts, batch.model)
+            embeddings = response.get("embeddings", [])
+            if len(embeddings) != len(batch.texts):
+                raise EmbeddingBatchError(
+                    f"Embedding response has {len(embeddings)} vectors "
+                    f"for {len(batch.texts)} texts"
+                )
+        except asyncio.CancelledError:
+            for future, _, _ in batch.waiters:
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.warning(f"Embedding batch to {self.name} failed: {e}")
+            for future, _, _ in batch.waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            record_embed_batch(
+                self.name, len(batch.texts), len(batch.waiters), time.perf_counter() - start
+            )
+
+        for future, offset, count in batch.waiters:
+            if not future.done():
+                future.set_result({**response, "embeddings": embeddings[offset : offset + count]})
+
+    @property
+    def pending(self) -> int:
+        """Texts waiting in open batches."""
+        return sum(len(batch.texts) for batch in self._pending.values())
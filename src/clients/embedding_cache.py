@@ -0,0 +1,364 @@
+"""
+Content-Addressed Embedding Cache - WBS-PERF22
+
+Identical texts (chunk contents, repeated queries) are embedded again and
+again. This cache stores one vector per (model, sha256(text)) so a text is
+only sent to the embedding service the first time it is seen.
+
+Vectors are stored compactly as little-endian float16:
+1. In-process LRU bounded by entries and bytes. Each vector is a
+   contiguous NumPy ``float16`` array (NumPy is pinned in requirements;
+   without it the raw bytes are kept and decoded with ``struct``)
+2. Redis (optional, shared across replicas) holding the same raw bytes,
+   fetched with one MGET per call, so a hit is a memcpy rather than a JSON
+   parse of ~1.5k floats
+
+float16 keeps ~3 significant digits, which is well within what cosine
+similarity over normalized sentence embeddings needs, and halves memory
+relative to float32. Freshly embedded vectors are rounded the same way, so
+a text gets the same vector whether it was a hit or a miss.
+
+Responses answered entirely from the cache reuse the non-vector fields
+(e.g. the service's real model name) of the last downstream response for
+that model, with ``processing_time_ms`` set to the lookup time.
+
+Reference Documents:
+- IEEE 754-2008: binary16 interchange format (range and precision)
+- WBS-PERF21: Embedding micro-batching (misses still go through the batcher)
+- WBS-PERF15: Tool result cache (whole calls; the embed tool opts out)
+
+Pattern: Cache-aside with content-addressed keys
+
+Anti-Pattern Compliance:
+- AP-1: Constants for key prefix and defaults
+- AP-2: Methods <15 CC
+"""
+
+import hashlib
+import logging
+import math
+import struct
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from src.observability.metrics import record_embed_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+# WBS-PERF22: NumPy is a pinned dependency; the struct path is only a fallback
+# for environments installed without it (same bytes, slower decode)
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+
+# =============================================================================
+# Constants (AP-1 Compliance)
+# =============================================================================
+
+EMBED_CACHE_KEY_PREFIX = "cache:embed:"
+"""Redis/local key prefix for cached embedding vectors."""
+
+DEFAULT_EMBED_CACHE_MAX_ENTRIES = 100_000
+DEFAULT_EMBED_CACHE_MAX_BYTES = 128 * 1024 * 1024
+DEFAULT_EMBED_CACHE_TTL_SECONDS = 7 * 86400.0
+
+_FLOAT16 = "<e"
+"""struct format of one stored component (little-endian IEEE half)."""
+
+StoredVector = Union[bytes, "np.ndarray"]
+EmbedLoader = Callable[[list[str]], Awaitable[list[list[float]]]]
+"""Embeds texts that missed the cache; returns one vector per text, in order."""
+
+EmbedSender = Callable[[list[str]], Awaitable[dict[str, Any]]]
+"""Sends one embeddings request; returns the response with "embeddings"."""
+
+_PER_CALL_FIELDS = frozenset({"embeddings", "dimensions"})
+"""Response fields rebuilt for every call rather than reused from the last response."""
+
+
+# =============================================================================
+# Keys and Encoding
+# =============================================================================
+
+
+def make_embedding_key(model: str, text: str) -> str:
+    """
+    Build the cache key for one text.
+
+    Returns:
+        Key of the form ``cache:embed:{model}:{sha256(text)}``
+    """
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{EMBED_CACHE_KEY_PREFIX}{model}:{digest}"
+
+
+def encode_vector(vector: list[float]) -> bytes:
+    """Pack a vector as little-endian float16 bytes."""
+    if np is not None:
+        return np.asarray(vector, dtype=_FLOAT16).tobytes()
+    return struct.pack(f"<{len(vector)}e", *vector)
+
+
+def decode_vector(value: StoredVector) -> list[float]:
+    """Unpack a stored vector (array or raw bytes) into Python floats."""
+    if np is not None:
+        if not isinstance(value, np.ndarray):
+            value = np.frombuffer(value, dtype=_FLOAT16)
+        return value.astype(np.float32).tolist()
+    return list(struct.unpack(f"<{len(value) // 2}e", value))
+
+
+def _to_stored(raw: bytes) -> StoredVector:
+    """In-process representation of raw bytes (contiguous array when possible)."""
+    if np is not None:
+        return np.frombuffer(raw, dtype=_FLOAT16)
+    return raw
+
+
+def _nbytes(value: StoredVector) -> int:
+    """Bytes held by a stored vector."""
+    return len(value) if isinstance(value, bytes) else int(value.nbytes)
+
+
+# =============================================================================
+# EmbeddingCache
+# =============================================================================
+
+
+class EmbeddingCache:
+    """
+    Two-tier cache of embedding vectors keyed by (model, sha256(text)).
+
+    Example:
+        >>> cache = EmbeddingCache(redis_client=binary_redis)
+        >>> vectors = await cache.get_or_load("all-MiniLM-L6-v2", texts, loader=embed_missing)
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        max_entries: int = DEFAULT_EMBED_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_EMBED_CACHE_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_EMBED_CACHE_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: Async Redis client returning bytes, i.e. created with
+                decode_responses=False (None = in-process only)
+            max_entries: Maximum in-process vectors
+            max_bytes: Maximum in-process vector bytes
+            ttl_seconds: Lifetime of Redis entries
+        """
+        self._redis = redis_client
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._local: "OrderedDict[str, StoredVector]" = OrderedDict()
+        self._bytes = 0
+        self._response_fields: dict[str, dict[str, Any]] = {}
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes held by in-process vectors."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
+
+    async def get_or_load(
+        self, model: str, texts: list[str], loader: EmbedLoader
+    ) -> list[list[float]]:
+        """
+        Return vectors for texts, embedding only those not cached.
+
+        Duplicate texts within a call are embedded once. Every vector is
+        returned at float16 precision, whether cached or just embedded.
+
+        Args:
+            model: Embedding model (part of the key)
+            texts: Texts to embed
+            loader: Embeds the missing texts
+
+        Returns:
+            One vector per input text, in order
+        """
+        keys = [make_embedding_key(model, text) for text in texts]
+        found = await self.get_many(keys)
+
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                missing.setdefault(key, text)
+        record_embed_cache_lookup("miss", len(missing))
+
+        if missing:
+            vectors = await loader(list(missing.values()))
+            if len(vectors) != len(missing):
+                raise ValueError(
+                    f"Embedding loader returned {len(vectors)} vectors for {len(missing)} texts"
+                )
+            encoded = {key: encode_vector(vector) for key, vector in zip(missing, vectors)}
+            found.update(await self._store(encoded))
+        return [decode_vector(found[key]) for key in keys]
+
+    async def embed_response(
+        self, model: str, texts: list[str], send: EmbedSender
+    ) -> dict[str, Any]:
+        """
+        Build an embeddings response, sending only uncached texts downstream.
+
+        Args:
+            model: Embedding model (part of the key)
+            texts: Texts to embed
+            send: Performs the downstream request for the missing texts
+
+        Returns:
+            The downstream response fields (the last ones seen for ``model``
+            when every text was cached) with ``embeddings``, ``model`` and
+            ``dimensions`` covering all texts
+        """
+        start = time.perf_counter()
+        response: dict[str, Any] = {}
+
+        async def load(missing: list[str]) -> list[list[float]]:
+            response.update(await send(missing))
+            self._response_fields[model] = {
+                k: v for k, v in response.items() if k not in _PER_CALL_FIELDS
+            }
+            return response.get("embeddings", [])
+
+        vectors = await self.get_or_load(model, texts, load)
+        if not response:
+            response = dict(self._response_fields.get(model, {}))
+            if "processing_time_ms" in response:
+                response["processing_time_ms"] = (time.perf_counter() - start) * 1000
+        return {
+            **response,
+            "embeddings": vectors,
+            "model": response.get("model", model),
+            "dimensions": len(vectors[0]) if vectors else response.get("dimensions", 0),
+        }
+
+    async def get_many(self, keys: list[str]) -> dict[str, StoredVector]:
+        """
+        Look up keys in process, then in Redis (one MGET).
+
+        Returns:
+            {key: stored vector} for the keys that were found
+        """
+        found: dict[str, StoredVector] = {}
+        remote: list[str] = []
+        for key in dict.fromkeys(keys):
+            value = self._local.get(key)
+            if value is None:
+                remote.append(key)
+            else:
+                self._local.move_to_end(key)
+                found[key] = value
+        record_embed_cache_lookup("hit_local", len(found))
+
+        if remote:
+            hits = await self._get_redis(remote)
+            for key, raw in hits.items():
+                found[key] = self._set_local(key, raw)
+            record_embed_cache_lookup("hit_redis", len(hits))
+        return found
+
+    async def set_many(self, vectors: dict[str, list[float]]) -> None:
+        """Store vectors in both tiers."""
+        await self._store({key: encode_vector(vector) for key, vector in vectors.items()})
+
+    def clear(self) -> None:
+        """Drop all in-process entries (Redis entries expire on their own)."""
+        self._local.clear()
+        self._bytes = 0
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    async def _store(self, encoded: dict[str, bytes]) -> dict[str, StoredVector]:
+        """Store encoded vectors in both tiers; returns their in-process form."""
+        stored = {key: self._set_local(key, raw) for key, raw in encoded.items()}
+        await self._set_redis(encoded)
+        return stored
+
+    def _set_local(self, key: str, raw: bytes) -> StoredVector:
+        """Store an in-process vector, evicting least-recently-used ones to fit."""
+        value = _to_stored(raw)
+        previous = self._local.pop(key, None)
+        if previous is not None:
+            self._bytes -= _nbytes(previous)
+        if len(raw) <= self._max_bytes:
+            self._local[key] = value
+            self._bytes += len(raw)
+            while len(self._local) > self._max_entries or self._bytes > self._max_bytes:
+                _, evicted = self._local.popitem(last=False)
+                self._bytes -= _nbytes(evicted)
+        return value
+
+    async def _get_redis(self, keys: list[str]) -> dict[str, bytes]:
+        """Fetch shared entries; Redis errors are treated as misses."""
+        if self._redis is None:
+            return {}
+        try:
+            values = await self._redis.mget(keys)
+        except Exception as e:
+            logger.warning(f"Embedding cache Redis read failed: {e}")
+            return {}
+        return {
+            key: value
+            for key, value in zip(keys, values)
+            if isinstance(value, bytes) and value and len(value) % 2 == 0
+        }
+
+    async def _set_redis(self, encoded: dict[str, bytes]) -> None:
+        """Store shared entries; Redis errors are logged and ignored."""
+        if self._redis is None or not encoded:
+            return
+        ttl_ms = max(1, math.ceil(self._ttl * 1000))
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, raw in encoded.items():
+                    pipe.set(key, raw, px=ttl_ms)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Embedding cache Redis write failed: {e}")
+
+
+# =============================================================================
+# Singleton Access
+# =============================================================================
+
+_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Cache used by the embed and generate_embeddings tools (None = off)."""
+    return _cache
+
+
+def set_embedding_cache(cache: Optional[EmbeddingCache]) -> None:
+    """
+    Install the cache shared by the embedding tools.
+
+    Args:
+        cache: Cache to use; its Redis client must return bytes. None
+            sends every text downstream.
+    """
+    global _cache
+    _cache = cache
+
+
+def reset_embedding_cache() -> None:
+    """Drop the embedding cache and its in-process vectors (for testing)."""
+    set_embedding_cache(None)
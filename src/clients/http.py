@@ -4,6 +4,12 @@ HTTP Client Module - WBS 2.7.1.1 Client Factory
 This module provides HTTP client factory functionality with proper
 connection pooling, timeouts, and retry configuration.
 
+WBS-PERF13: Every outbound client uses TracingTransport, which injects
+W3C trace context (traceparent/tracestate) and records a CLIENT span per
+request with connect (incl. DNS), TLS and time-to-first-byte timings from
+httpcore trace events, so downstream latency can be split between network
+setup and service processing.
+
 Reference Documents:
 - ARCHITECTURE.md: Microservice URLs configuration
 - GUIDELINES pp. 2309: Connection pooling per downstream service (Newman)
@@ -11,12 +17,21 @@ Reference Documents:
 - GUIDELINES pp. 2319: Timeout configuration and logging
 
 Pattern: Factory pattern for creating configured HTTP clients
+Pattern: Transport decorator for trace propagation (no per-call-site code)
 Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
 """
 
-from typing import Optional
+import time
+from typing import Any, AsyncIterator, Callable, Optional
+from urllib.parse import urlsplit
 
 import httpx
+from opentelemetry import trace
+from opentelemetry.propagate import inject
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+
+from src.observability.metrics import record_http_client_phase
+from src.observability.tracing import get_tracer
 
 
 # =============================================================================
@@ -63,6 +78,179 @@ Pattern: Retry with exponential backoff
 Reference: GUIDELINES pp. 1224 - retry logic for LLM API calls
 """
 
+PROVIDER_SDK_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=1000,
+    max_keepalive_connections=100,
+)
+"""Pool limits matching the OpenAI/Anthropic SDK defaults.
+
+Passing a transport to the SDK's http client replaces its pool, so the
+SDK defaults are restated for providers using TracingTransport.
+"""
+
+
+# =============================================================================
+# WBS-PERF13: Tracing Transport
+# =============================================================================
+
+# httpcore trace events (prefix minus ".started"/".complete") -> phase name
+_PHASE_EVENTS: dict[str, str] = {
+    "connection.connect_tcp": "connect",
+    "connection.connect_unix_socket": "connect",
+    "connection.start_tls": "tls",
+}
+
+# Events marking the start of sending the request / receipt of headers
+_REQUEST_START_EVENTS = frozenset(
+    {"http11.send_request_headers.started", "http2.send_request_headers.started"}
+)
+_RESPONSE_HEADERS_EVENTS = frozenset(
+    {"http11.receive_response_headers.complete", "http2.receive_response_headers.complete"}
+)
+
+
+class _ConnectionTimings:
+    """Collects phase timings from httpcore's ``trace`` request extension."""
+
+    __slots__ = ("started", "phases", "request_sent_at", "_phase_starts", "_chained")
+
+    def __init__(self, chained: Optional[Callable[..., Any]] = None) -> None:
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.request_sent_at: Optional[float] = None
+        self._phase_starts: dict[str, float] = {}
+        self._chained = chained
+
+    async def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        now = time.perf_counter()
+        prefix, _, stage = event_name.rpartition(".")
+        phase = _PHASE_EVENTS.get(prefix)
+        if phase is not None:
+            if stage == "started":
+                self._phase_starts[phase] = now
+            elif stage == "complete" and phase in self._phase_starts:
+                self.phases[phase] = now - self._phase_starts[phase]
+        elif event_name in _REQUEST_START_EVENTS:
+            self.phases["pool_wait"] = self._phase_starts.get("connect", now) - self.started
+            self.request_sent_at = now
+        elif event_name in _RESPONSE_HEADERS_EVENTS and self.request_sent_at is not None:
+            self.phases["ttfb"] = now - self.request_sent_at
+        if self._chained is not None:
+            result = self._chained(event_name, info)
+            if hasattr(result, "__await__"):
+                await result
+
+    @property
+    def connection_reused(self) -> bool:
+        """True when no new connection was opened for the request."""
+        return "connect" not in self.phases
+
+
+class _TracedResponseStream(httpx.AsyncByteStream):
+    """Response body stream that ends the request span when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._on_close()
+
+
+class TracingTransport(httpx.AsyncHTTPTransport):
+    """
+    AsyncHTTPTransport that propagates trace context and times connections.
+
+    WBS-PERF13: Outbound trace-context propagation and connection spans.
+
+    Each request gets a CLIENT span (``HTTP <METHOD>``) that is the parent
+    of the injected ``traceparent`` header and stays open until the response
+    body is closed, so streamed responses are covered end to end. Connect,
+    TLS, pool-wait and TTFB timings are attached to the span and recorded
+    in llm_gateway_http_client_phase_seconds per downstream.
+
+    Example:
+        >>> client = httpx.AsyncClient(transport=TracingTransport("cms"))
+    """
+
+    def __init__(self, downstream: str, **kwargs: Any) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            downstream: Downstream service name (span attribute, metric label)
+            **kwargs: Passed to httpx.AsyncHTTPTransport (limits, retries, ...)
+        """
+        super().__init__(**kwargs)
+        self.downstream = downstream
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request inside a CLIENT span with trace headers injected."""
+        span = get_tracer(__name__).start_span(
+            f"HTTP {request.method}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "http.method": request.method,
+                "http.url": str(request.url.copy_with(query=None)),
+                "server.address": request.url.host,
+                "peer.service": self.downstream,
+            },
+        )
+        carrier: dict[str, str] = {}
+        inject(carrier, context=trace.set_span_in_context(span))
+        request.headers.update(carrier)
+
+        timings = _ConnectionTimings(chained=request.extensions.get("trace"))
+        request.extensions["trace"] = timings
+
+        try:
+            response = await super().handle_async_request(request)
+        except Exception as e:
+            span.record_exception(e)
+            span.set_status(Status(StatusCode.ERROR, str(e)))
+            self._finish(span, timings)
+            raise
+
+        span.set_attribute("http.status_code", response.status_code)
+        if response.status_code >= 500:
+            span.set_status(Status(StatusCode.ERROR))
+        response.stream = _TracedResponseStream(
+            response.stream, lambda: self._finish(span, timings)
+        )
+        return response
+
+    def _finish(self, span: Span, timings: _ConnectionTimings) -> None:
+        """Attach phase timings to the span, record metrics and end it."""
+        span.set_attribute("http.connection.reused", timings.connection_reused)
+        for phase, seconds in timings.phases.items():
+            span.set_attribute(f"http.client.{phase}_ms", round(seconds * 1000, 3))
+            record_http_client_phase(self.downstream, phase, seconds)
+        span.end()
+
+
+def create_traced_transport(downstream: str, **kwargs: Any) -> TracingTransport:
+    """
+    Create a TracingTransport for a downstream service.
+
+    Use with clients not built by create_http_client(), e.g.
+    ``httpx.AsyncClient(timeout=30.0, transport=create_traced_transport("cms"))``.
+
+    Args:
+        downstream: Downstream service name
+        **kwargs: httpx.AsyncHTTPTransport options (limits, retries, ...)
+
+    Returns:
+        TracingTransport
+    """
+    return TracingTransport(downstream, **kwargs)
+
 
 # =============================================================================
 # WBS 2.7.1.1.3: HTTP Client Factory
@@ -76,6 +264,7 @@ def create_http_client(
     max_keepalive: Optional[int] = None,
     retries: Optional[int] = None,
     headers: Optional[dict[str, str]] = None,
+    downstream: Optional[str] = None,
 ) -> httpx.AsyncClient:
     """
     Create a configured HTTP client with connection pooling and timeouts.
@@ -86,6 +275,7 @@ def create_http_client(
     - Connection pooling (WBS 2.7.1.1.4)
     - Configurable timeouts (WBS 2.7.1.1.5)
     - Retry support (WBS 2.7.1.1.6)
+    - Trace propagation and connection spans (WBS-PERF13)
 
     Pattern: Factory pattern for HTTP client creation
     Reference: GUIDELINES pp. 2309 - connection pools per downstream service
@@ -97,6 +287,7 @@ def create_http_client(
         max_keepalive: Maximum keepalive connections (default: 20)
         retries: Number of retries for failed requests (default: 3)
         headers: Additional headers to include in all requests
+        downstream: Service name for spans/metrics (default: base_url host)
 
     Returns:
         httpx.AsyncClient: Configured async HTTP client
@@ -142,7 +333,9 @@ def create_http_client(
 
     # Configure retry transport (WBS 2.7.1.1.6)
     # Note: httpx transport retries are for connection-level retries
-    transport = httpx.AsyncHTTPTransport(
+    # WBS-PERF13: Tracing transport injects W3C trace context
+    transport = TracingTransport(
+        downstream or urlsplit(base_url or "").hostname or "http",
         retries=retry_count,
         limits=limits,  # Pass limits to transport
     )
@@ -156,3 +349,66 @@ def create_http_client(
     )
 
     return client
+
+
+# =============================================================================
+# WBS-PERF16: Shared Provider Connection Pools
+# =============================================================================
+
+_shared_transports: dict[str, TracingTransport] = {}
+_shared_clients: dict[tuple[str, tuple[Optional[float], ...]], httpx.AsyncClient] = {}
+
+
+def get_shared_transport(downstream: str) -> TracingTransport:
+    """
+    Get the process-wide pooled transport for an upstream provider.
+
+    Provider SDK clients and direct callers (e.g. /v1/responses) use the
+    same transport per provider, so they share one keep-alive pool instead
+    of each opening new TLS connections.
+
+    Args:
+        downstream: Provider name ("openai", "anthropic", ...)
+
+    Returns:
+        TracingTransport with PROVIDER_SDK_CONNECTION_LIMITS
+    """
+    transport = _shared_transports.get(downstream)
+    if transport is None:
+        transport = TracingTransport(downstream, limits=PROVIDER_SDK_CONNECTION_LIMITS)
+        _shared_transports[downstream] = transport
+    return transport
+
+
+def get_shared_client(downstream: str, timeout: httpx.Timeout) -> httpx.AsyncClient:
+    """
+    Get a long-lived client on the provider's shared transport.
+
+    Clients are cached per (provider, timeout): callers with different
+    timeouts get their own client but share the provider's connection
+    pool. Do not close the returned client (or use it as a context
+    manager); shared clients are closed by close_shared_clients() at
+    shutdown.
+
+    Args:
+        downstream: Provider name
+        timeout: Client timeout
+
+    Returns:
+        httpx.AsyncClient
+    """
+    key = (downstream, (timeout.connect, timeout.read, timeout.write, timeout.pool))
+    client = _shared_clients.get(key)
+    if client is None:
+        client = httpx.AsyncClient(timeout=timeout, transport=get_shared_transport(downstream))
+        _shared_clients[key] = client
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close all shared provider transports (application shutdown / tests)."""
+    transports = list(_shared_transports.values())
+    _shared_clients.clear()
+    _shared_transports.clear()
+    for transport in transports:
+        await transport.aclose()
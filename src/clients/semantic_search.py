@@ -8,6 +8,7 @@ Reference Documents:
 - ARCHITECTURE.md: Line 232 - unified-search-service dependency
 - ARCHITECTURE.md: Line 277 - semantic_search_url configuration
 - GUIDELINES pp. 2309: Connection pooling per downstream service
+- WBS-PERF21: Optional micro-batching of concurrent embed calls
 
 Pattern: Client adapter for microservice communication
 Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
@@ -18,6 +19,11 @@ from typing import Any, Optional
 import httpx
 from pydantic import BaseModel, Field
 
+from src.clients.embedding_batcher import (
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_WAIT_MS,
+    EmbeddingBatcher,
+)
 from src.clients.http import create_http_client, HTTPClientError
 
 
@@ -118,6 +124,9 @@ class SemanticSearchClient:
         base_url: Optional[str] = None,
         http_client: Optional[httpx.AsyncClient] = None,
         timeout_seconds: float = 30.0,
+        batch_embeddings: bool = False,
+        embed_batch_max_size: int = DEFAULT_MAX_BATCH_SIZE,
+        embed_batch_max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
     ) -> None:
         """
         Initialize SemanticSearchClient.
@@ -126,7 +135,18 @@ class SemanticSearchClient:
             base_url: Base URL for unified-search-service
             http_client: Optional pre-configured HTTP client (for testing)
             timeout_seconds: Request timeout in seconds
+            batch_embeddings: Coalesce concurrent embed() calls (WBS-PERF21)
+            embed_batch_max_size: Texts per coalesced embed request
+            embed_batch_max_wait_ms: Wait for other callers to join a batch
         """
+        self._embed_batcher: Optional[EmbeddingBatcher] = None
+        if batch_embeddings:
+            self._embed_batcher = EmbeddingBatcher(
+                "semantic-search-client",
+                send=self._post_embed,
+                max_batch_size=embed_batch_max_size,
+                max_wait_ms=embed_batch_max_wait_ms,
+            )
         if http_client is not None:
             self._client = http_client
             self._owns_client = False
@@ -226,12 +246,10 @@ class SemanticSearchClient:
             SemanticSearchError: If the service is unavailable or returns an error
         """
         try:
-            payload = {"texts": texts}
-
-            response = await self._client.post("/embed", json=payload)
-            response.raise_for_status()
-
-            data = response.json()
+            if self._embed_batcher is not None:
+                data = await self._embed_batcher.embed(texts)
+            else:
+                data = await self._post_embed(texts, None)
             return data.get("embeddings", [])
 
         except httpx.ConnectError as e:
@@ -243,6 +261,12 @@ class SemanticSearchClient:
         except Exception as e:
             raise SemanticSearchError(f"Embed failed: {e}") from e
 
+    async def _post_embed(self, texts: list[str], model: Optional[str]) -> dict[str, Any]:
+        """Send one (possibly coalesced) embed request."""
+        response = await self._client.post("/embed", json={"texts": texts})
+        response.raise_for_status()
+        return response.json()
+
     # =========================================================================
     # WBS 2.7.1.2.5: Get Chunk Method
     # =========================================================================
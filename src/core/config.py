@@ -311,6 +311,362 @@ class Settings(BaseSettings):
         description="Queue depth that triggers warning logs",
     )
 
+    # =========================================================================
+    # WBS-PERF1: SSE Frame Coalescing
+    # =========================================================================
+    sse_coalesce_window_ms: int = Field(
+        default=0,
+        ge=0,
+        le=1000,
+        description="Merge streamed deltas arriving within this window (0 = disabled)",
+    )
+    sse_coalesce_max_bytes: int = Field(
+        default=512,
+        ge=1,
+        le=65536,
+        description="Flush a coalesced SSE frame once its content reaches this size",
+    )
+
+    # =========================================================================
+    # WBS-PERF3: Anthropic Prompt Caching
+    # =========================================================================
+    anthropic_prompt_cache_enabled: bool = Field(
+        default=True,
+        description="Insert cache_control breakpoints on stable Anthropic prefixes",
+    )
+    anthropic_prompt_cache_min_tokens: int = Field(
+        default=1024,
+        ge=0,
+        description="Minimum estimated prefix tokens before a cache breakpoint is placed",
+    )
+    anthropic_prompt_cache_min_sightings: int = Field(
+        default=2,
+        ge=1,
+        description="Times a tool/system prefix must be seen within 5 minutes before caching it",
+    )
+
+    # =========================================================================
+    # WBS-PERF6: Model Registry Hot Reload
+    # =========================================================================
+    registry_reload_enabled: bool = Field(
+        default=True,
+        description="Watch config/model_registry.yaml and swap routing tables on change",
+    )
+    registry_poll_interval_seconds: float = Field(
+        default=5.0,
+        ge=0.1,
+        le=3600.0,
+        description="How often the model registry file mtime is checked",
+    )
+
+    # =========================================================================
+    # WBS-PERF8: Batched Cost Tracking
+    # =========================================================================
+    cost_flush_interval_ms: int = Field(
+        default=1000,
+        ge=10,
+        le=60000,
+        description="Maximum time usage is buffered in process before flushing to Redis",
+    )
+    cost_flush_max_records: int = Field(
+        default=500,
+        ge=1,
+        description="Buffered usage records that trigger an early flush",
+    )
+
+    # =========================================================================
+    # WBS-PERF9: Usage Rollups
+    # =========================================================================
+    usage_rollup_enabled: bool = Field(
+        default=True,
+        description="Write per-minute/hour/day usage rollups for /v1/usage",
+    )
+    usage_rollup_minute_retention_hours: int = Field(
+        default=48,
+        ge=1,
+        description="How long per-minute usage buckets are kept",
+    )
+    usage_rollup_hour_retention_days: int = Field(
+        default=31,
+        ge=1,
+        description="How long per-hour usage buckets are kept",
+    )
+    usage_rollup_day_retention_days: int = Field(
+        default=400,
+        ge=1,
+        description="How long per-day usage buckets are kept",
+    )
+
+    # =========================================================================
+    # WBS-PERF11: Upstream Simulation (local load testing)
+    # =========================================================================
+    simulate_upstream: bool = Field(
+        default=False,
+        description="Serve every registry provider with FakeProvider using "
+        "the simulation profiles in model_registry.yaml (no network calls)",
+    )
+    simulation_seed: int | None = Field(
+        default=None,
+        description="Seed for simulated latency/error draws (reproducible load tests)",
+    )
+
+    # =========================================================================
+    # WBS-PERF12: On-Demand Request Profiling
+    # =========================================================================
+    profiling_sample_rate: int = Field(
+        default=0,
+        ge=0,
+        description="Profile one in N requests (0 = only X-Debug-Profile requests)",
+    )
+    profiling_admin_token: SecretStr = Field(
+        default=SecretStr(""),
+        description="Token accepted in X-Debug-Profile and by /v1/admin/profiles and "
+        "/v1/usage (empty disables header-triggered profiling and the admin endpoints)",
+    )
+    profiling_sampled_cprofile: bool = Field(
+        default=False,
+        description="Also collect cProfile statistics for sampled requests",
+    )
+    profiling_store_size: int = Field(
+        default=200,
+        ge=1,
+        description="Completed profiles kept in memory for /v1/admin/profiles",
+    )
+
+    # =========================================================================
+    # WBS-PERF15: Tool Result Cache
+    # =========================================================================
+    tool_cache_enabled: bool = Field(
+        default=True,
+        description="Cache results of tools whose definition is marked cacheable",
+    )
+    tool_cache_default_ttl_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="Result lifetime for cacheable tools that do not set cache_ttl_seconds",
+    )
+    tool_cache_max_entries: int = Field(
+        default=2048,
+        ge=1,
+        description="Maximum tool results held in process (Redis is shared and unbounded)",
+    )
+    tool_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        ge=1,
+        description="Maximum estimated size of tool results held in process",
+    )
+
+    # =========================================================================
+    # WBS-PERF16: /v1/responses Upstream Timeouts
+    # =========================================================================
+    responses_connect_timeout_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        description="Connect timeout for /v1/responses upstream calls",
+    )
+    responses_read_timeout_seconds: float = Field(
+        default=600.0,
+        gt=0,
+        description="Read timeout for /v1/responses upstream calls; when streaming it "
+        "bounds the gap between events (reasoning models can think for minutes)",
+    )
+
+    # =========================================================================
+    # WBS-PERF17: Tool Execution Limits (/v1/tools/execute, execute:batch)
+    # =========================================================================
+    tool_execute_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Default deadline per tool call, including queueing",
+    )
+    tool_execute_max_timeout_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="Longest deadline a caller may request per tool call",
+    )
+    tool_batch_max_calls: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum calls accepted by /v1/tools/execute:batch",
+    )
+    tool_sync_workers: int = Field(
+        default=8,
+        ge=1,
+        description="Threads for running sync tool functions off the event loop",
+    )
+    tool_downstream_concurrency: int = Field(
+        default=16,
+        ge=1,
+        description="Concurrent tool calls allowed per downstream service",
+    )
+
+    # =========================================================================
+    # WBS-PERF19: Tool Bulkheads (per-downstream concurrency limits)
+    # =========================================================================
+    tool_bulkhead_enabled: bool = Field(
+        default=True,
+        description="Limit concurrent tool calls per downstream service",
+    )
+    tool_bulkhead_limits: dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-service overrides of tool_downstream_concurrency, "
+        'e.g. {"ai-agents": 4}',
+    )
+    tool_bulkhead_queue_timeout_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Maximum wait for a bulkhead slot before a tool call is rejected",
+    )
+
+    # =========================================================================
+    # WBS-PERF20: Streaming Tool Loop
+    # =========================================================================
+    stream_tool_loop_enabled: bool = Field(
+        default=False,
+        description="Execute registered tools during streaming (dispatched as soon "
+        "as each call's arguments close) and stream the follow-up turn",
+    )
+
+    # =========================================================================
+    # WBS-PERF21: Embedding Micro-Batching
+    # =========================================================================
+    embed_batch_enabled: bool = Field(
+        default=True,
+        description="Coalesce concurrent embedding calls into one downstream request",
+    )
+    embed_batch_max_size: int = Field(
+        default=64,
+        ge=1,
+        description="Texts per coalesced embedding request before it is sent immediately",
+    )
+    embed_batch_max_wait_ms: float = Field(
+        default=5.0,
+        ge=0,
+        description="How long the first embed call in a batch waits for others to join",
+    )
+
+    # =========================================================================
+    # WBS-PERF22: Content-Addressed Embedding Cache
+    # =========================================================================
+    embed_cache_enabled: bool = Field(
+        default=True,
+        description="Cache embedding vectors by (model, sha256(text))",
+    )
+    embed_cache_max_entries: int = Field(
+        default=100_000,
+        ge=1,
+        description="Maximum vectors held in process",
+    )
+    embed_cache_max_bytes: int = Field(
+        default=128 * 1024 * 1024,
+        ge=1,
+        description="Maximum in-process vector bytes (float16, 2 bytes per dimension)",
+    )
+    embed_cache_ttl_seconds: float = Field(
+        default=7 * 86400.0,
+        gt=0,
+        description="Lifetime of embedding vectors stored in Redis",
+    )
+
+    # =========================================================================
+    # WBS-PERF23: /v1/embeddings
+    # =========================================================================
+    embeddings_max_inputs: int = Field(
+        default=8192,
+        ge=1,
+        description="Most input texts accepted per /v1/embeddings request",
+    )
+    embeddings_max_concurrent_batches: int = Field(
+        default=4,
+        ge=1,
+        description="Provider-sized batches of one request embedded concurrently",
+    )
+
+    # =========================================================================
+    # WBS-PERF24: Offline Batch Jobs (/v1/batches)
+    # =========================================================================
+    batch_enabled: bool = Field(
+        default=True,
+        description="Serve /v1/batches and resume unfinished jobs on startup",
+    )
+    batch_storage_dir: str = Field(
+        default="data/batches",
+        description="Directory holding each job's input, output and checkpoint files",
+    )
+    batch_max_input_bytes: int = Field(
+        default=200 * 1024 * 1024,
+        ge=1,
+        description="Largest accepted batch input file; the upload stops once exceeded",
+    )
+    batch_max_requests: int = Field(
+        default=50_000,
+        ge=1,
+        description="Most requests (non-blank lines) in one batch input file",
+    )
+    batch_default_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Concurrent gateway requests per job when the job does not set one",
+    )
+    batch_max_concurrency: int = Field(
+        default=64,
+        ge=1,
+        description="Upper bound on a job's requested concurrency",
+    )
+    batch_default_rate_per_second: float = Field(
+        default=10.0,
+        ge=0,
+        description="Requests per second all batch jobs together may send to one "
+        "provider (0 = unlimited)",
+    )
+    batch_provider_rate_limits: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-provider overrides of batch_default_rate_per_second, "
+        'e.g. {"openai": 50}',
+    )
+    batch_checkpoint_interval: int = Field(
+        default=100,
+        ge=1,
+        description="Results written between fsyncs of the output file and checkpoint",
+    )
+    batch_native_enabled: bool = Field(
+        default=True,
+        description="Send 24h-window job lines to provider batch APIs where available",
+    )
+    batch_native_min_requests: int = Field(
+        default=100,
+        ge=1,
+        description="Fewest lines per provider worth a native batch; smaller groups "
+        "run through the gateway",
+    )
+    batch_native_poll_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="Interval between status polls of a native batch",
+    )
+
+    # =========================================================================
+    # WBS-PERF25: Admission Queue (priority classes, fair queuing per API key)
+    # =========================================================================
+    admission_class_weights: dict[str, float] = Field(
+        default_factory=lambda: {"interactive": 16.0, "batch": 4.0, "background": 1.0},
+        description="Weighted-fair-queuing share of each priority class",
+    )
+    admission_class_max_wait_seconds: dict[str, float] = Field(
+        default_factory=lambda: {"interactive": 5.0, "batch": 30.0, "background": 120.0},
+        description="Longest queue wait per priority class; X-Request-Timeout can shorten it",
+    )
+    admission_tenant_weights: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-API-key weight multipliers keyed by hashed key id "
+        '(as in /v1/usage), e.g. {"3f2a9c...": 2}',
+    )
+    admission_max_queue_depth: int = Field(
+        default=1000,
+        ge=0,
+        description="Most requests waiting for a slot before new ones are rejected",
+    )
+
     # =========================================================================
     # WBS-OBS7: OpenTelemetry Tracing Configuration
     # =========================================================================
@@ -357,6 +713,25 @@ class Settings(BaseSettings):
             raise ValueError(f"Environment must be one of: {valid_envs}")
         return v
 
+    @field_validator("admission_class_weights", "admission_class_max_wait_seconds")
+    @classmethod
+    def validate_admission_classes(cls, v: dict[str, float]) -> dict[str, float]:
+        """Validate priority class names (WBS-PERF25)."""
+        valid_classes = {"interactive", "batch", "background"}
+        unknown = set(v) - valid_classes
+        if unknown:
+            raise ValueError(f"Unknown priority classes {sorted(unknown)}; use {valid_classes}")
+        return v
+
+    @field_validator("admission_class_weights", "admission_tenant_weights")
+    @classmethod
+    def validate_admission_weights(cls, v: dict[str, float]) -> dict[str, float]:
+        """Validate fair-queuing weights are positive (WBS-PERF25)."""
+        invalid = sorted(key for key, weight in v.items() if weight <= 0)
+        if invalid:
+            raise ValueError(f"Admission weights must be positive: {invalid}")
+        return v
+
 
 # =============================================================================
 # WBS 2.1.2.2: Settings Singleton
@@ -11,7 +11,7 @@ WBS 2.1.1: Application Entry Point
 
 import os
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -26,6 +26,8 @@ from src.observability import (
     MetricsMiddleware,
     get_metrics_app,
     get_logger,
+    shutdown_logging,
+    ProfilingMiddleware,
 )
 from src.core.config import get_settings
 
@@ -36,6 +38,10 @@ from src.api.routes.sessions import router as sessions_router
 from src.api.routes.tools import router as tools_router
 from src.api.routes.models import router as models_router
 from src.api.routes.responses import router as responses_router
+from src.api.routes.usage import router as usage_router
+from src.api.routes.profiles import router as profiles_router
+from src.api.routes.embeddings import router as embeddings_router
+from src.api.routes.batches import router as batches_router
 
 # Application metadata
 APP_NAME = "LLM Gateway"
@@ -128,6 +134,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         f"{len(app.state.provider_registry.REGISTERED_MODELS)} registered models, "
         f"{len(app.state.provider_registry.providers)} active providers"
     )
+
+    # WBS-PERF6: Hot-reload config/model_registry.yaml into live routers
+    from src.providers.registry_watcher import get_registry_watcher
+    registry_watcher = get_registry_watcher()
+    if settings.registry_reload_enabled:
+        await registry_watcher.start(settings.registry_poll_interval_seconds)
     
     # TWR4 (D7): Redis connection pool initialization — WBS 2.1.1.2.2
     # Graceful fallback: Redis is optional; app runs without it.
@@ -143,7 +155,111 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning(f"Redis unavailable, proceeding without caching: {e}")
         app.state.redis_pool = None
-    
+
+    # WBS-PERF8: Buffer usage in process and flush to Redis in batches
+    from src.services.cost_aggregator import CostAggregator, set_cost_aggregator
+    from src.services.cost_tracker import CostTracker
+    from src.services.usage_rollup import create_usage_rollup_store
+    cost_aggregator: Optional[CostAggregator] = None
+    app.state.usage_rollup = None
+    if app.state.redis_pool is not None:
+        # WBS-PERF9: Time-bucketed rollups served by /v1/usage
+        app.state.usage_rollup = (
+            create_usage_rollup_store(app.state.redis_pool, settings)
+            if settings.usage_rollup_enabled
+            else None
+        )
+        cost_aggregator = CostAggregator(
+            CostTracker(app.state.redis_pool),
+            flush_interval_ms=settings.cost_flush_interval_ms,
+            max_pending=settings.cost_flush_max_records,
+            rollup=app.state.usage_rollup,
+        )
+        await cost_aggregator.start()
+    set_cost_aggregator(cost_aggregator)
+
+    # WBS-PERF15: Cache read-only tool results in process and in Redis
+    from src.tools.result_cache import ToolResultCache, set_tool_result_cache
+    set_tool_result_cache(
+        ToolResultCache(
+            redis_client=app.state.redis_pool,
+            default_ttl_seconds=settings.tool_cache_default_ttl_seconds,
+            max_entries=settings.tool_cache_max_entries,
+            max_bytes=settings.tool_cache_max_bytes,
+        )
+        if settings.tool_cache_enabled
+        else None
+    )
+
+    # WBS-PERF22: Embedding vectors cached as raw float16 bytes, so the
+    # Redis tier needs its own client without response decoding
+    from src.clients.embedding_cache import EmbeddingCache, set_embedding_cache
+    app.state.redis_binary = None
+    if settings.embed_cache_enabled and app.state.redis_pool is not None:
+        import redis.asyncio as aioredis
+        app.state.redis_binary = aioredis.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_pool_size,
+            decode_responses=False,
+        )
+    set_embedding_cache(
+        EmbeddingCache(
+            redis_client=app.state.redis_binary,
+            max_entries=settings.embed_cache_max_entries,
+            max_bytes=settings.embed_cache_max_bytes,
+            ttl_seconds=settings.embed_cache_ttl_seconds,
+        )
+        if settings.embed_cache_enabled
+        else None
+    )
+
+    # WBS-PERF19: Per-downstream bulkheads for tool calls
+    from src.tools.bulkhead import ToolBulkhead, set_tool_bulkhead
+    set_tool_bulkhead(
+        ToolBulkhead(
+            default_limit=settings.tool_downstream_concurrency,
+            limits=settings.tool_bulkhead_limits,
+            queue_timeout_seconds=settings.tool_bulkhead_queue_timeout_seconds,
+        )
+        if settings.tool_bulkhead_enabled
+        else None
+    )
+
+    # WBS-PERF25: Priority- and tenant-aware admission queue
+    from src.api.middleware.admission import AdmissionController
+    from src.api.middleware.memory import MAX_CONCURRENT_REQUESTS
+    memory_tracker.set_admission_controller(
+        AdmissionController(
+            MAX_CONCURRENT_REQUESTS,
+            class_weights=settings.admission_class_weights,
+            class_max_wait_seconds=settings.admission_class_max_wait_seconds,
+            tenant_weights=settings.admission_tenant_weights,
+            max_queue_depth=settings.admission_max_queue_depth,
+        )
+    )
+
+    # WBS-PERF24: Offline batch jobs; resume those a previous process left unfinished
+    from src.api.routes.chat import get_chat_service
+    from src.services.batches import BatchManager, BatchStore, set_batch_manager
+    batch_manager: Optional[BatchManager] = None
+    if settings.batch_enabled:
+        batch_manager = BatchManager(
+            BatchStore(settings.batch_storage_dir),
+            get_chat_service,
+            max_input_bytes=settings.batch_max_input_bytes,
+            max_requests=settings.batch_max_requests,
+            default_concurrency=settings.batch_default_concurrency,
+            max_concurrency=settings.batch_max_concurrency,
+            default_rate_per_second=settings.batch_default_rate_per_second,
+            provider_rate_limits=settings.batch_provider_rate_limits,
+            checkpoint_interval=settings.batch_checkpoint_interval,
+            native_enabled=settings.batch_native_enabled,
+            native_min_requests=settings.batch_native_min_requests,
+            native_poll_seconds=settings.batch_native_poll_seconds,
+        )
+        batch_manager.resume()
+    set_batch_manager(batch_manager)
+
     yield
     
     # =========================================================================
@@ -153,7 +269,26 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Clean up resources - WBS 2.1.1.2.8
     app.state.initialized = False
-    
+
+    # WBS-PERF24: Stop batch jobs; they stay in_progress and resume on restart
+    if batch_manager is not None:
+        await batch_manager.stop()
+    set_batch_manager(None)
+
+    # WBS-PERF8: Flush buffered usage while Redis is still open
+    if cost_aggregator is not None:
+        await cost_aggregator.stop()
+    set_cost_aggregator(None)
+    set_tool_result_cache(None)
+    set_tool_bulkhead(None)
+    set_embedding_cache(None)
+    if getattr(app.state, "redis_binary", None) is not None:
+        try:
+            await app.state.redis_binary.aclose()
+        except Exception as e:
+            logger.warning(f"Error closing binary Redis client: {e}")
+    app.state.redis_binary = None
+
     # TWR4 (D7): Redis connection cleanup — WBS 2.1.1.2.5
     if hasattr(app.state, "redis_pool") and app.state.redis_pool is not None:
         try:
@@ -163,11 +298,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             logger.warning(f"Error closing Redis pool: {e}")
     app.state.redis_pool = None
     
+    # WBS-PERF6: Stop watching the model registry
+    await registry_watcher.stop()
+
     # TWR4 (D7): Provider registry cleanup — WBS 2.1.1.2.6
     if hasattr(app.state, "provider_registry"):
         app.state.provider_registry = None
         logger.info("Provider registry released")
 
+    # WBS-PERF16: Close pooled provider connections
+    from src.clients.http import close_shared_clients
+    await close_shared_clients()
+
+    # WBS-PERF17: Release the sync tool thread pool
+    from src.api.routes.tools import shutdown_tool_executor
+    shutdown_tool_executor()
+
+    # WBS-PERF4: Drain the async logging queue before exit
+    shutdown_logging()
+
 
 # Initialize FastAPI application with lifespan - WBS 2.1.1.1.1
 app = FastAPI(
@@ -208,6 +357,11 @@ app.add_middleware(
 # or when concurrent request limit is reached
 app.add_middleware(MemoryMiddleware)
 
+# WBS-PERF12: On-demand request profiling (outermost, so timelines cover
+# all middleware). Passes requests straight through unless profiling is
+# enabled via LLM_GATEWAY_PROFILING_SAMPLE_RATE or _ADMIN_TOKEN.
+app.add_middleware(ProfilingMiddleware)
+
 # Include routers - WBS 2.1.1.1.4
 app.include_router(health_router)
 app.include_router(chat_router)
@@ -215,6 +369,10 @@ app.include_router(sessions_router)
 app.include_router(tools_router)
 app.include_router(models_router)
 app.include_router(responses_router)
+app.include_router(usage_router)
+app.include_router(profiles_router)
+app.include_router(embeddings_router)
+app.include_router(batches_router)
 
 # WBS-OBS4: Mount /metrics endpoint for Prometheus scraping
 # Returns Prometheus text format metrics at http://localhost:8080/metrics
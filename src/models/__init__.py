@@ -19,6 +19,9 @@ from src.models.responses import (
     Usage,
 )
 from src.models.tools import (
+    ToolBatchCall,
+    ToolBatchRequest,
+    ToolBatchResult,
     ToolDefinition,
     ToolExecuteRequest,
     ToolExecuteResponse,
@@ -43,4 +46,7 @@ __all__ = [
     "ToolDefinition",
     "ToolExecuteRequest",
     "ToolExecuteResponse",
+    "ToolBatchCall",
+    "ToolBatchRequest",
+    "ToolBatchResult",
 ]
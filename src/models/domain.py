@@ -24,10 +24,14 @@ executor, and session management.
 
 import json
 from datetime import datetime, timezone
-from typing import Any, Callable, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from src.tools.validation import ArgumentValidator
+
 
 # =============================================================================
 # WBS 2.4.1.2.2-3: ToolDefinition Model
@@ -51,6 +55,12 @@ class ToolDefinition(BaseModel):
         name: Unique tool identifier.
         description: Human-readable description of what the tool does.
         parameters: JSON Schema defining the tool's input parameters.
+        cacheable: Whether results are deterministic for identical arguments
+            and may be served from the tool result cache (WBS-PERF15).
+        cache_ttl_seconds: How long cached results stay valid (None uses
+            the cache default).
+        downstream: Downstream service the handler calls; concurrent calls
+            are limited per service (WBS-PERF19). None means in-process.
 
     Example:
         >>> tool = ToolDefinition(
@@ -73,6 +83,15 @@ class ToolDefinition(BaseModel):
     parameters: dict[str, Any] = Field(
         ..., description="JSON Schema for input parameters"
     )
+    cacheable: bool = Field(
+        default=False, description="Results may be cached (read-only, deterministic)"
+    )
+    cache_ttl_seconds: Optional[float] = Field(
+        default=None, gt=0, description="Cached result lifetime (None = cache default)"
+    )
+    downstream: Optional[str] = Field(
+        default=None, description="Downstream service the tool calls (bulkhead key)"
+    )
 
     model_config = {"frozen": True}  # Value object: immutable
 
@@ -128,6 +147,19 @@ class RegisteredTool(BaseModel):
         """Get tool parameters from definition."""
         return self.definition.parameters
 
+    @cached_property
+    def validator(self) -> "ArgumentValidator":
+        """
+        Argument validator compiled from the parameter schema.
+
+        WBS-PERF18: Compiled on first access (ToolRegistry.register touches
+        it) and reused for every call of this tool.
+        """
+        # Import here to avoid circular import
+        from src.tools.validation import ArgumentValidator
+
+        return ArgumentValidator(self.definition.parameters)
+
 
 # =============================================================================
 # WBS 2.4.1.2.5: ToolCall Model
@@ -13,7 +13,7 @@ Anti-Patterns Avoided:
 - §3.1: Validation errors have clear context messages
 """
 
-from typing import Optional, Literal, Any
+from typing import Optional, Literal, Any, Union
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -182,3 +182,47 @@ class SessionCreateRequest(BaseModel):
         default=None,
         description="Initial context data for the session",
     )
+
+
+# =============================================================================
+# EmbeddingRequest - WBS-PERF23
+# Pattern: OpenAI Embeddings API compatibility
+# =============================================================================
+
+
+class EmbeddingRequest(BaseModel):
+    """
+    Embedding request model for POST /v1/embeddings.
+
+    WBS-PERF23: OpenAI-compatible embeddings request.
+
+    Attributes:
+        model: Embedding model identifier (routes to a provider)
+        input: Text or list of texts to embed
+        encoding_format: "float" (JSON arrays) or "base64" (little-endian float32)
+        dimensions: Optional output dimensions (providers that support it)
+        user: Optional end-user identifier
+    """
+
+    model: str = Field(..., description="Embedding model identifier")
+    input: Union[str, list[str]] = Field(..., description="Text or texts to embed")
+    encoding_format: Literal["float", "base64"] = Field(
+        default="float", description="Vector encoding in the response"
+    )
+    dimensions: Optional[int] = Field(default=None, ge=1, description="Output dimensions")
+    user: Optional[str] = Field(default=None, description="End-user identifier")
+
+    @field_validator("input")
+    @classmethod
+    def validate_input_not_empty(cls, v: Union[str, list[str]]) -> Union[str, list[str]]:
+        """
+        WBS-PERF23: At least one text is required.
+        """
+        if isinstance(v, list) and not v:
+            raise ValueError("input must not be empty")
+        return v
+
+    @property
+    def texts(self) -> list[str]:
+        """Input normalized to a list of texts."""
+        return [self.input] if isinstance(self.input, str) else list(self.input)
@@ -13,7 +13,7 @@ Anti-Patterns Avoided:
 - §1.1: Optional fields use Optional[T] with explicit None default
 """
 
-from typing import Optional, Any
+from typing import Optional, Any, Union
 from pydantic import BaseModel, Field
 
 
@@ -30,11 +30,24 @@ class Usage(BaseModel):
         prompt_tokens: Number of tokens in the prompt
         completion_tokens: Number of tokens in the completion
         total_tokens: Total tokens used
+        cache_read_tokens: Prompt tokens served from the provider's prompt cache
+        cache_write_tokens: Prompt tokens written to the provider's prompt cache
+        estimated: Counts were estimated by the gateway because the provider
+            reported none (never serialized)
     """
 
     prompt_tokens: int = Field(..., description="Tokens in prompt")
     completion_tokens: int = Field(..., description="Tokens in completion")
     total_tokens: int = Field(..., description="Total tokens")
+    cache_read_tokens: Optional[int] = Field(
+        default=None, description="Prompt tokens read from prompt cache"
+    )
+    cache_write_tokens: Optional[int] = Field(
+        default=None, description="Prompt tokens written to prompt cache"
+    )
+    estimated: bool = Field(
+        default=False, exclude=True, description="Gateway estimate, not provider-reported"
+    )
 
 
 # =============================================================================
@@ -184,6 +197,7 @@ class ChatCompletionChunk(BaseModel):
         model: Model used for completion
         choices: List of chunk choices
         system_fingerprint: Optional system fingerprint
+        usage: Token usage (final chunk only, when the provider reports it)
     """
 
     id: str = Field(..., description="Response ID")
@@ -194,6 +208,7 @@ class ChatCompletionChunk(BaseModel):
     system_fingerprint: Optional[str] = Field(
         default=None, description="System fingerprint"
     )
+    usage: Optional[Usage] = Field(default=None, description="Token usage")
 
 
 # =============================================================================
@@ -227,3 +242,54 @@ class SessionResponse(BaseModel):
     )
     created_at: str = Field(..., description="Creation timestamp (ISO format)")
     expires_at: str = Field(..., description="Expiration timestamp (ISO format)")
+
+
+# =============================================================================
+# Embedding Response Models - WBS-PERF23
+# Pattern: OpenAI Embeddings API compatibility
+# =============================================================================
+
+
+class EmbeddingData(BaseModel):
+    """
+    One embedding in an embeddings response.
+
+    Attributes:
+        index: Position of the input text
+        embedding: Float list, or base64 of little-endian float32
+    """
+
+    object: str = Field(default="embedding", description="Object type")
+    index: int = Field(..., description="Input index")
+    embedding: Union[list[float], str] = Field(..., description="Embedding vector")
+
+
+class EmbeddingUsage(BaseModel):
+    """
+    Token usage for an embeddings request.
+
+    Attributes:
+        prompt_tokens: Tokens in the input texts
+        total_tokens: Total tokens used
+    """
+
+    prompt_tokens: int = Field(..., description="Tokens in input")
+    total_tokens: int = Field(..., description="Total tokens")
+
+
+class EmbeddingResponse(BaseModel):
+    """
+    Embeddings response model.
+
+    WBS-PERF23: OpenAI-compatible response for POST /v1/embeddings.
+
+    Attributes:
+        data: One entry per input text, in input order
+        model: Model used
+        usage: Token usage
+    """
+
+    object: str = Field(default="list", description="Object type")
+    data: list[EmbeddingData] = Field(..., description="Embeddings")
+    model: str = Field(..., description="Model used")
+    usage: EmbeddingUsage = Field(..., description="Token usage")
@@ -91,3 +91,59 @@ class ToolExecuteResponse(BaseModel):
     result: Optional[Any] = Field(default=None, description="Execution result")
     success: bool = Field(..., description="Whether execution succeeded")
     error: Optional[str] = Field(default=None, description="Error message if failed")
+
+
+# =============================================================================
+# WBS-PERF17: Batch Tool Execution
+# =============================================================================
+
+
+class ToolBatchCall(BaseModel):
+    """
+    One call in a batch tool execution request.
+
+    Attributes:
+        id: Optional client correlation id, echoed in the result
+        name: Tool name to execute
+        arguments: Tool arguments (validated against tool schema)
+        timeout_seconds: Per-call deadline (overrides the batch default)
+    """
+
+    id: Optional[str] = Field(default=None, description="Client correlation id")
+    name: str = Field(..., description="Tool name to execute")
+    arguments: dict[str, Any] = Field(
+        default_factory=dict, description="Tool arguments"
+    )
+    timeout_seconds: Optional[float] = Field(
+        default=None, gt=0, description="Per-call deadline in seconds"
+    )
+
+
+class ToolBatchRequest(BaseModel):
+    """
+    Batch tool execution request model.
+
+    Attributes:
+        calls: Tool calls to run concurrently
+        timeout_seconds: Default per-call deadline (None = server default)
+    """
+
+    calls: list[ToolBatchCall] = Field(..., min_length=1, description="Tool calls")
+    timeout_seconds: Optional[float] = Field(
+        default=None, gt=0, description="Default per-call deadline in seconds"
+    )
+
+
+class ToolBatchResult(ToolExecuteResponse):
+    """
+    One streamed batch result, emitted as soon as its call completes.
+
+    Attributes:
+        index: Position of the call in the request
+        id: Client correlation id from the request
+        duration_ms: Time from batch start to completion of this call
+    """
+
+    index: int = Field(..., description="Position of the call in the request")
+    id: Optional[str] = Field(default=None, description="Client correlation id")
+    duration_ms: float = Field(..., description="Milliseconds until this call completed")
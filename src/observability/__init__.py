@@ -5,6 +5,7 @@ This package provides observability infrastructure including:
 - Structured JSON logging (WBS 2.8.1)
 - Prometheus metrics (WBS 2.8.2)
 - OpenTelemetry tracing (WBS 2.8.3)
+- On-demand request profiling (WBS-PERF12)
 
 Reference Documents:
 - GUIDELINES pp. 2309-2319: Observability = metrics + logging + cost tracking
@@ -23,6 +24,9 @@ from src.observability.logging import (
     get_correlation_id,
     get_logger,
     set_correlation_id,
+    # WBS-PERF4: Non-blocking logging
+    LogSampler,
+    shutdown_logging,
 )
 
 from src.observability.metrics import (
@@ -36,6 +40,20 @@ from src.observability.metrics import (
     record_provider_request,
     record_provider_error,
     record_provider_latency,
+    # WBS-PERF7: Provider call instrumentation metrics
+    record_provider_ttft,
+    record_inter_token_latency,
+    record_output_tokens_per_second,
+    record_tool_execution,
+    # WBS-PERF2: Client disconnect cancellation metrics
+    record_client_disconnect,
+    record_cancelled_tokens_saved,
+    # WBS-PERF4: Logging pipeline metrics
+    record_log_dropped,
+    # WBS-PERF6: Model registry reload metrics
+    record_registry_reload,
+    # WBS-PERF13: Outbound HTTP connection metrics
+    record_http_client_phase,
 )
 
 # OBS-5: Import resilience metrics for Prometheus registry inclusion
@@ -58,6 +76,12 @@ from src.observability.tracing import (
     traced,
 )
 
+from src.observability.profiling import (
+    ProfilingMiddleware,
+    get_profile_store,
+    profile_phase,
+)
+
 __all__ = [
     # Logging
     "get_logger",
@@ -65,6 +89,8 @@ __all__ = [
     "get_correlation_id",
     "clear_correlation_id",
     "correlation_id_context",
+    "LogSampler",
+    "shutdown_logging",
     # Metrics
     "MetricsMiddleware",
     "get_metrics_app",
@@ -76,6 +102,20 @@ __all__ = [
     "record_provider_request",
     "record_provider_error",
     "record_provider_latency",
+    # WBS-PERF7: Provider call instrumentation metrics
+    "record_provider_ttft",
+    "record_inter_token_latency",
+    "record_output_tokens_per_second",
+    "record_tool_execution",
+    # WBS-PERF2: Client disconnect metrics
+    "record_client_disconnect",
+    "record_cancelled_tokens_saved",
+    # WBS-PERF4: Logging pipeline metrics
+    "record_log_dropped",
+    # WBS-PERF6: Model registry reload metrics
+    "record_registry_reload",
+    # WBS-PERF13: Outbound HTTP connection metrics
+    "record_http_client_phase",
     # OBS-5: Resilience metrics
     "record_circuit_state_transition",
     "record_fallback_attempt",
@@ -90,4 +130,8 @@ __all__ = [
     "extract_trace_context",
     "create_span",
     "traced",
+    # WBS-PERF12: Request profiling
+    "ProfilingMiddleware",
+    "get_profile_store",
+    "profile_phase",
 ]
@@ -21,22 +21,43 @@ WBS Items:
 - 2.8.1.1.7: Export get_logger() function
 - 2.8.1.1.16: Singleton configuration pattern (Issue 16)
 - AC-LOG0.2: RotatingFileHandler for persistent logs
+- WBS-PERF4: Non-blocking logging (QueueHandler + listener thread, bounded
+  queue with drop policy, orjson encoder, sampled hot-path logging)
 """
 
+import atexit
 import contextvars
+import copy
 import json
 import logging
 import os
+import queue
 import sys
 from contextlib import contextmanager
 from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any, Generator, Optional, TextIO
 
 import structlog
 from structlog.types import EventDict, Processor
 
+from src.observability.metrics import record_log_dropped
+
+# WBS-PERF4: orjson is optional - fall back to stdlib json when absent
+try:
+    import orjson
+
+    def _json_dumps(data: dict[str, Any]) -> str:
+        """Serialize a log record dict with orjson."""
+        return orjson.dumps(data, default=str).decode("utf-8")
+
+except ImportError:  # pragma: no cover - exercised only without orjson
+
+    def _json_dumps(data: dict[str, Any]) -> str:
+        """Serialize a log record dict with the stdlib encoder."""
+        return json.dumps(data, ensure_ascii=False, default=str)
+
 
 # =============================================================================
 # WBS 2.8.1.1.16: Configuration State Flag (Issue 16)
@@ -45,6 +66,13 @@ from structlog.types import EventDict, Processor
 _configured: bool = False
 _file_logging_configured: bool = False
 
+# WBS-PERF4: Queue-based logging state
+_queue_handler: Optional["DroppingQueueHandler"] = None
+_queue_listener: Optional[QueueListener] = None
+
+DEFAULT_LOG_QUEUE_SIZE: int = 10_000
+"""Maximum log records buffered between the event loop and the writer thread."""
+
 
 # =============================================================================
 # Correlation ID Context - WBS 2.8.1.1.5
@@ -192,16 +220,24 @@ def _get_default_log_path() -> str:
 
 
 class JSONFormatter(logging.Formatter):
-    """JSON log formatter for file output (AC-LOG0.1)."""
+    """JSON log formatter for file output (AC-LOG0.1).
+
+    WBS-PERF4: Uses orjson when available. Timestamp and correlation ID are
+    taken from the record (captured at call time) so that formatting on the
+    listener thread reports the caller's values.
+    """
     
     def __init__(self, service_name: str = "llm-gateway", **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.service_name = service_name
     
     def format(self, record: logging.LogRecord) -> str:
-        correlation_id = get_correlation_id()
+        if "correlation_id" in record.__dict__:
+            correlation_id = record.__dict__["correlation_id"]
+        else:
+            correlation_id = get_correlation_id()
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "service": self.service_name,
             "correlation_id": correlation_id if correlation_id else "-",
@@ -210,7 +246,176 @@ class JSONFormatter(logging.Formatter):
         }
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_data, ensure_ascii=False)
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
+        return _json_dumps(log_data)
+
+
+# =============================================================================
+# WBS-PERF4: Non-blocking Queue Logging
+# =============================================================================
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler with a bounded queue and a drop policy.
+
+    The event loop thread only snapshots the record and enqueues it; JSON
+    encoding and file/stream I/O (including rotation) happen on the
+    QueueListener thread.
+
+    Drop policy when the queue is full:
+    - Records below WARNING are dropped
+    - WARNING and above evict the oldest queued record to make room
+
+    Dropped records are counted in llm_gateway_log_records_dropped_total.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Snapshot a record so it can be formatted on another thread."""
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+        prepared = copy.copy(record)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        prepared.exc_info = None
+        prepared.correlation_id = get_correlation_id()
+        return prepared
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue without blocking, applying the drop policy when full."""
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if record.levelno >= logging.WARNING:
+            try:
+                evicted = self.queue.get_nowait()
+                record_log_dropped(evicted.levelname)
+                self.queue.put_nowait(record)
+                return
+            except (queue.Empty, queue.Full):
+                pass
+        record_log_dropped(record.levelname)
+
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+def _async_logging_enabled() -> bool:
+    """Whether handlers should run behind a queue (LLM_GATEWAY_ASYNC_LOGGING)."""
+    return os.environ.get("LLM_GATEWAY_ASYNC_LOGGING", "true").lower() in ("true", "1", "yes")
+
+
+def _get_log_queue_size() -> int:
+    """Queue bound from LLM_GATEWAY_LOG_QUEUE_SIZE (default 10000)."""
+    try:
+        return max(int(os.environ.get("LLM_GATEWAY_LOG_QUEUE_SIZE", DEFAULT_LOG_QUEUE_SIZE)), 1)
+    except ValueError:
+        return DEFAULT_LOG_QUEUE_SIZE
+
+
+def _attach_handler(handler: logging.Handler) -> None:
+    """
+    Attach a sink handler to the root logger.
+
+    WBS-PERF4: When async logging is enabled the handler is served by the
+    QueueListener thread and the root logger only holds the queue handler.
+    """
+    global _queue_handler, _queue_listener
+
+    root_logger = logging.getLogger()
+    if not _async_logging_enabled():
+        root_logger.addHandler(handler)
+        return
+
+    if _queue_listener is None:
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=_get_log_queue_size())
+        _queue_handler = DroppingQueueHandler(log_queue)
+        _queue_listener = QueueListener(log_queue, respect_handler_level=True)
+        _queue_listener.start()
+        root_logger.addHandler(_queue_handler)
+
+    # Tuple replacement is atomic; the listener picks it up on the next record
+    _queue_listener.handlers = (*_queue_listener.handlers, handler)
+
+
+def _sink_handlers() -> list[logging.Handler]:
+    """Handlers writing output, whether attached directly or via the listener."""
+    handlers = list(logging.getLogger().handlers)
+    if _queue_listener is not None:
+        handlers.extend(_queue_listener.handlers)
+    return handlers
+
+
+def shutdown_logging() -> None:
+    """
+    Flush queued records and stop the listener thread.
+
+    WBS-PERF4: Called on application shutdown (and at interpreter exit) so
+    that buffered records are written before the process ends. The sink
+    handlers are re-attached to the root logger so late records still land.
+    """
+    global _queue_handler, _queue_listener
+
+    if _queue_listener is None:
+        return
+    _queue_listener.stop()
+    root_logger = logging.getLogger()
+    if _queue_handler is not None:
+        root_logger.removeHandler(_queue_handler)
+    # Fall back to synchronous handlers for any records logged after shutdown
+    for handler in _queue_listener.handlers:
+        handler.flush()
+        root_logger.addHandler(handler)
+    _queue_handler = None
+    _queue_listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+# =============================================================================
+# WBS-PERF4: Sampled Logging for Hot Paths
+# =============================================================================
+
+
+class LogSampler:
+    """
+    Emit only the first and then every Nth occurrence of a log message.
+
+    Messages are keyed by their format string, so hot-path callers should
+    use %-style arguments rather than f-strings.
+
+    Example:
+        >>> _sampler = LogSampler(rate=100)
+        >>> _sampler.log(logger, logging.INFO, "Routing %s to %s", model, name)
+    """
+
+    def __init__(self, rate: int = 100, max_keys: int = 1024) -> None:
+        """
+        Args:
+            rate: Emit one record per ``rate`` occurrences (1 = no sampling).
+            max_keys: Bound on distinct tracked messages.
+        """
+        self.rate = max(rate, 1)
+        self.max_keys = max_keys
+        self._counts: dict[str, int] = {}
+
+    def log(self, logger: logging.Logger, level: int, msg: str, *args: Any) -> None:
+        """Log ``msg`` at ``level`` if this occurrence is sampled."""
+        if not logger.isEnabledFor(level):
+            return
+        count = self._counts.get(msg)
+        if count is None:
+            if len(self._counts) >= self.max_keys:
+                self._counts.clear()
+            count = 0
+        self._counts[msg] = count + 1
+        if count % self.rate == 0:
+            logger.log(level, msg, *args)
 
 
 def _create_file_handler(
@@ -251,10 +456,10 @@ def _setup_file_logging(log_level: int) -> None:
     try:
         file_handler = _create_file_handler(log_file_path, "llm-gateway")
         file_handler.setLevel(log_level)
-        # Add to root logger to capture all logs
+        # Add to root logger to capture all logs (via queue when async)
         root_logger = logging.getLogger()
         root_logger.setLevel(log_level)
-        root_logger.addHandler(file_handler)
+        _attach_handler(file_handler)
         _file_logging_configured = True
     except OSError as e:
         print(f'{{"timestamp": "{datetime.now(timezone.utc).isoformat()}", "level": "WARNING", "service": "llm-gateway", "message": "File logging disabled: {e}"}}', file=sys.stderr)
@@ -305,12 +510,12 @@ def configure_logging(
     root_logger.setLevel(log_level)
     
     # Add console handler if not already present
-    has_console = any(isinstance(h, logging.StreamHandler) and not isinstance(h, RotatingFileHandler) for h in root_logger.handlers)
+    has_console = any(isinstance(h, logging.StreamHandler) and not isinstance(h, RotatingFileHandler) for h in _sink_handlers())
     if not has_console:
         console_handler = logging.StreamHandler(stream or sys.stdout)
         console_handler.setLevel(log_level)
         console_handler.setFormatter(JSONFormatter(service_name="llm-gateway"))
-        root_logger.addHandler(console_handler)
+        _attach_handler(console_handler)
     
     # Configure structlog to use stdlib logging
     processors: list[Processor] = [
@@ -348,6 +553,7 @@ def reset_logging() -> None:
     WARNING: This should only be used in tests.
     """
     global _configured, _file_logging_configured
+    shutdown_logging()
     _configured = False
     _file_logging_configured = False
 
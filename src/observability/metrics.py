@@ -187,6 +187,214 @@ PROVIDER_LATENCY_SECONDS = Histogram(
     buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
 )
 
+# =============================================================================
+# WBS-PERF7: Provider Call Instrumentation Metrics
+# =============================================================================
+
+# Time from request start to the first streamed content token
+PROVIDER_TTFT_SECONDS = Histogram(
+    name="llm_gateway_provider_time_to_first_token_seconds",
+    documentation="Time to first streamed content token by provider and model",
+    labelnames=["provider", "model"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0),
+)
+
+# Gap between consecutive streamed content chunks
+PROVIDER_INTER_TOKEN_SECONDS = Histogram(
+    name="llm_gateway_provider_inter_token_latency_seconds",
+    documentation="Latency between consecutive streamed content chunks",
+    labelnames=["provider", "model"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+# Output throughput of a completed call
+PROVIDER_OUTPUT_TOKENS_PER_SECOND = Histogram(
+    name="llm_gateway_provider_output_tokens_per_second",
+    documentation="Completion tokens per second by provider and model",
+    labelnames=["provider", "model"],
+    buckets=(1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 200.0, 500.0),
+)
+
+# Tool execution latency
+TOOL_EXECUTION_SECONDS = Histogram(
+    name="llm_gateway_tool_execution_seconds",
+    documentation="Tool execution latency by tool and outcome",
+    labelnames=["tool", "status"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+# =============================================================================
+# WBS-PERF2: Client Disconnect Cancellation Metrics
+# =============================================================================
+
+# Requests abandoned by the client and cancelled upstream
+CLIENT_DISCONNECTS_TOTAL = Counter(
+    name="llm_gateway_client_disconnects_total",
+    documentation="Requests cancelled because the client disconnected",
+    labelnames=["endpoint", "mode"],
+)
+
+# Estimated completion tokens not generated thanks to cancellation
+CANCELLED_TOKENS_SAVED_TOTAL = Counter(
+    name="llm_gateway_cancelled_tokens_saved_total",
+    documentation="Estimated completion tokens saved by cancelling upstream after disconnect",
+    labelnames=["model"],
+)
+
+# =============================================================================
+# WBS-PERF4: Logging Pipeline Metrics
+# =============================================================================
+
+LOG_RECORDS_DROPPED_TOTAL = Counter(
+    name="llm_gateway_log_records_dropped_total",
+    documentation="Log records dropped because the async logging queue was full",
+    labelnames=["level"],
+)
+
+
+# =============================================================================
+# WBS-PERF6: Model Registry Reload Metrics
+# =============================================================================
+
+MODEL_REGISTRY_RELOADS_TOTAL = Counter(
+    name="llm_gateway_model_registry_reloads_total",
+    documentation="Model registry hot-reload attempts",
+    labelnames=["result"],
+)
+
+
+# =============================================================================
+# WBS-PERF13: Outbound HTTP Connection Metrics
+# =============================================================================
+
+HTTP_CLIENT_PHASE_SECONDS = Histogram(
+    name="llm_gateway_http_client_phase_seconds",
+    documentation="Outbound HTTP request phases (pool_wait, connect incl. DNS, tls, ttfb) "
+    "by downstream service",
+    labelnames=["downstream", "phase"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+
+# =============================================================================
+# WBS-PERF15: Tool Result Cache Metrics
+# =============================================================================
+
+TOOL_CACHE_LOOKUPS_TOTAL = Counter(
+    name="llm_gateway_tool_cache_lookups_total",
+    documentation="Tool result cache lookups by tool and result "
+    "(hit_local, hit_redis, coalesced, miss)",
+    labelnames=["tool", "result"],
+)
+
+
+# =============================================================================
+# WBS-PERF19: Tool Bulkhead Metrics
+# =============================================================================
+
+TOOL_CALLS_IN_FLIGHT = Gauge(
+    name="llm_gateway_tool_calls_in_flight",
+    documentation="Tool calls currently running, by downstream service",
+    labelnames=["service"],
+)
+
+TOOL_CALLS_QUEUED = Gauge(
+    name="llm_gateway_tool_calls_queued",
+    documentation="Tool calls waiting for a bulkhead slot, by downstream service",
+    labelnames=["service"],
+)
+
+TOOL_QUEUE_WAIT_SECONDS = Histogram(
+    name="llm_gateway_tool_queue_wait_seconds",
+    documentation="Time tool calls waited for a bulkhead slot",
+    labelnames=["service"],
+    buckets=(0.0, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+TOOL_BULKHEAD_REJECTIONS_TOTAL = Counter(
+    name="llm_gateway_tool_bulkhead_rejections_total",
+    documentation="Tool calls rejected after exceeding the bulkhead queue timeout",
+    labelnames=["service"],
+)
+
+
+# =============================================================================
+# WBS-PERF21: Embedding Micro-Batching Metrics
+# =============================================================================
+
+EMBED_BATCH_SIZE = Histogram(
+    name="llm_gateway_embed_batch_size",
+    documentation="Texts sent per coalesced embedding request",
+    labelnames=["batcher"],
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512),
+)
+
+EMBED_BATCH_CALLERS = Histogram(
+    name="llm_gateway_embed_batch_callers",
+    documentation="Embed calls merged into one coalesced embedding request",
+    labelnames=["batcher"],
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+
+EMBED_BATCH_SECONDS = Histogram(
+    name="llm_gateway_embed_batch_seconds",
+    documentation="Latency of coalesced embedding requests",
+    labelnames=["batcher"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+
+# =============================================================================
+# WBS-PERF22: Embedding Cache Metrics
+# =============================================================================
+
+EMBED_CACHE_LOOKUPS_TOTAL = Counter(
+    name="llm_gateway_embed_cache_lookups_total",
+    documentation="Embedding cache lookups per text by result (hit_local, hit_redis, miss)",
+    labelnames=["result"],
+)
+
+
+# =============================================================================
+# WBS-PERF24: Batch Job Metrics
+# =============================================================================
+
+BATCH_REQUESTS_TOTAL = Counter(
+    name="llm_gateway_batch_requests_total",
+    documentation="Batch job lines finished, by execution path (gateway, native) and outcome",
+    labelnames=["path", "outcome"],
+)
+
+BATCH_JOBS_RUNNING = Gauge(
+    name="llm_gateway_batch_jobs_running",
+    documentation="Batch jobs currently executing in this process",
+)
+
+
+# =============================================================================
+# WBS-PERF25: Admission Queue Metrics
+# =============================================================================
+
+ADMISSION_QUEUE_DEPTH = Gauge(
+    name="llm_gateway_admission_queue_depth",
+    documentation="Requests waiting for an admission slot, by priority class",
+    labelnames=["priority"],
+)
+
+ADMISSION_WAIT_SECONDS = Histogram(
+    name="llm_gateway_admission_wait_seconds",
+    documentation="Time admitted requests waited for a slot, by priority class",
+    labelnames=["priority"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 15.0, 30.0, 60.0, 120.0),
+)
+
+ADMISSION_REJECTIONS_TOTAL = Counter(
+    name="llm_gateway_admission_rejections_total",
+    documentation="Requests rejected by admission control, by priority class and reason "
+    "(memory, queue_full, deadline_projected, deadline_expired)",
+    labelnames=["priority", "reason"],
+)
+
 
 # =============================================================================
 # Helper Functions
@@ -281,6 +489,256 @@ def record_provider_latency(provider: str, latency_seconds: float) -> None:
     PROVIDER_LATENCY_SECONDS.labels(provider=provider).observe(latency_seconds)
 
 
+# =============================================================================
+# WBS-PERF7: Provider Call Instrumentation Helper Functions
+# =============================================================================
+
+
+def record_provider_ttft(provider: str, model: str, seconds: float) -> None:
+    """
+    Record time to first token of a streamed provider call.
+
+    Args:
+        provider: LLM provider name
+        model: Model name
+        seconds: Time from call start to first content chunk
+    """
+    PROVIDER_TTFT_SECONDS.labels(provider=provider, model=model).observe(seconds)
+
+
+def record_inter_token_latency(provider: str, model: str, seconds: float) -> None:
+    """
+    Record the gap between two streamed content chunks.
+
+    Args:
+        provider: LLM provider name
+        model: Model name
+        seconds: Time since the previous content chunk
+    """
+    PROVIDER_INTER_TOKEN_SECONDS.labels(provider=provider, model=model).observe(seconds)
+
+
+def record_output_tokens_per_second(provider: str, model: str, tokens_per_second: float) -> None:
+    """
+    Record output throughput of a provider call.
+
+    Args:
+        provider: LLM provider name
+        model: Model name
+        tokens_per_second: Completion tokens divided by generation time
+    """
+    PROVIDER_OUTPUT_TOKENS_PER_SECOND.labels(provider=provider, model=model).observe(
+        tokens_per_second
+    )
+
+
+def record_tool_execution(tool: str, status: str, seconds: float) -> None:
+    """
+    Record a tool execution.
+
+    Args:
+        tool: Tool name
+        status: "success", "error", "timeout", "cache_hit" or "rejected"
+        seconds: Execution time in seconds
+    """
+    TOOL_EXECUTION_SECONDS.labels(tool=tool, status=status).observe(seconds)
+
+
+# =============================================================================
+# WBS-PERF2: Client Disconnect Helper Functions
+# =============================================================================
+
+
+def record_client_disconnect(endpoint: str, mode: str) -> None:
+    """
+    Record a request cancelled because the client went away.
+
+    Args:
+        endpoint: Normalized endpoint (e.g., "/v1/chat/completions")
+        mode: "stream" or "complete"
+    """
+    CLIENT_DISCONNECTS_TOTAL.labels(endpoint=endpoint, mode=mode).inc()
+
+
+def record_cancelled_tokens_saved(model: str, tokens: int) -> None:
+    """
+    Record completion tokens saved by cancelling an upstream request.
+
+    Args:
+        model: Model name
+        tokens: Estimated tokens not generated (ignored when <= 0)
+    """
+    if tokens > 0:
+        CANCELLED_TOKENS_SAVED_TOTAL.labels(model=model).inc(tokens)
+
+
+def record_log_dropped(level: str) -> None:
+    """
+    Record a log record dropped by the async logging queue.
+
+    Args:
+        level: Level name of the dropped record (e.g., "INFO")
+    """
+    LOG_RECORDS_DROPPED_TOTAL.labels(level=level).inc()
+
+
+def record_registry_reload(result: str) -> None:
+    """
+    Record a model registry reload attempt.
+
+    Args:
+        result: "success" or "error"
+    """
+    MODEL_REGISTRY_RELOADS_TOTAL.labels(result=result).inc()
+
+
+def record_http_client_phase(downstream: str, phase: str, seconds: float) -> None:
+    """
+    Record the duration of one outbound HTTP request phase.
+
+    Args:
+        downstream: Downstream service name
+        phase: "pool_wait", "connect", "tls" or "ttfb"
+        seconds: Phase duration
+    """
+    HTTP_CLIENT_PHASE_SECONDS.labels(downstream=downstream, phase=phase).observe(seconds)
+
+
+def record_tool_cache_lookup(tool: str, result: str) -> None:
+    """
+    Record a tool result cache lookup.
+
+    Args:
+        tool: Tool name
+        result: "hit_local", "hit_redis", "coalesced" or "miss"
+    """
+    TOOL_CACHE_LOOKUPS_TOTAL.labels(tool=tool, result=result).inc()
+
+
+# =============================================================================
+# WBS-PERF19: Tool Bulkhead Helper Functions
+# =============================================================================
+
+
+def set_tool_bulkhead_state(service: str, in_flight: int, queued: int) -> None:
+    """
+    Publish a bulkhead compartment's current occupancy.
+
+    Args:
+        service: Downstream service name
+        in_flight: Calls holding a slot
+        queued: Calls waiting for a slot
+    """
+    TOOL_CALLS_IN_FLIGHT.labels(service=service).set(in_flight)
+    TOOL_CALLS_QUEUED.labels(service=service).set(queued)
+
+
+def record_tool_queue_wait(service: str, seconds: float) -> None:
+    """
+    Record how long a tool call waited for a bulkhead slot.
+
+    Args:
+        service: Downstream service name
+        seconds: Wait time in seconds (0 when a slot was free)
+    """
+    TOOL_QUEUE_WAIT_SECONDS.labels(service=service).observe(seconds)
+
+
+def record_tool_bulkhead_rejection(service: str) -> None:
+    """
+    Record a tool call rejected by the bulkhead queue timeout.
+
+    Args:
+        service: Downstream service name
+    """
+    TOOL_BULKHEAD_REJECTIONS_TOTAL.labels(service=service).inc()
+
+
+# =============================================================================
+# WBS-PERF21: Embedding Micro-Batching Helper Functions
+# =============================================================================
+
+
+def record_embed_batch(batcher: str, texts: int, callers: int, seconds: float) -> None:
+    """
+    Record one coalesced embedding request.
+
+    Args:
+        batcher: Batcher name (downstream service)
+        texts: Texts sent in the batch
+        callers: Embed calls merged into the batch
+        seconds: Request latency in seconds
+    """
+    EMBED_BATCH_SIZE.labels(batcher=batcher).observe(texts)
+    EMBED_BATCH_CALLERS.labels(batcher=batcher).observe(callers)
+    EMBED_BATCH_SECONDS.labels(batcher=batcher).observe(seconds)
+
+
+# =============================================================================
+# WBS-PERF22: Embedding Cache Helper Functions
+# =============================================================================
+
+
+def record_embed_cache_lookup(result: str, count: int = 1) -> None:
+    """
+    Record embedding cache lookups.
+
+    Args:
+        result: "hit_local", "hit_redis" or "miss"
+        count: Number of texts with this result
+    """
+    if count:
+        EMBED_CACHE_LOOKUPS_TOTAL.labels(result=result).inc(count)
+
+
+# =============================================================================
+# WBS-PERF24: Batch Job Helper Functions
+# =============================================================================
+
+
+def record_batch_request(path: str, outcome: str) -> None:
+    """
+    Record one finished batch job line.
+
+    Args:
+        path: "gateway" (executed via ChatService) or "native" (provider batch API)
+        outcome: "completed" or "failed"
+    """
+    BATCH_REQUESTS_TOTAL.labels(path=path, outcome=outcome).inc()
+
+
+# =============================================================================
+# WBS-PERF25: Admission Queue Helper Functions
+# =============================================================================
+
+
+def record_admission(priority: str, wait_seconds: float) -> None:
+    """
+    Record a request admitted after waiting ``wait_seconds`` in the queue.
+
+    Args:
+        priority: Priority class
+        wait_seconds: Queue wait (0 when a slot was free)
+    """
+    ADMISSION_WAIT_SECONDS.labels(priority=priority).observe(wait_seconds)
+
+
+def record_admission_rejection(priority: str, reason: str) -> None:
+    """
+    Record a request rejected by admission control.
+
+    Args:
+        priority: Priority class
+        reason: "memory", "queue_full", "deadline_projected" or "deadline_expired"
+    """
+    ADMISSION_REJECTIONS_TOTAL.labels(priority=priority, reason=reason).inc()
+
+
+def set_admission_queue_depth(priority: str, depth: int) -> None:
+    """Set the number of requests of a priority class waiting for a slot."""
+    ADMISSION_QUEUE_DEPTH.labels(priority=priority).set(depth)
+
+
 # =============================================================================
 # WBS 2.8.2.6: MetricsMiddleware ASGI Middleware
 # =============================================================================
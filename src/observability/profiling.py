@@ -0,0 +1,478 @@
+"""
+Request Profiling Module - WBS-PERF12 On-Demand Request Profiling
+
+This module records a per-request phase timeline (history loading, context
+compression, token estimation, provider call, each tool, session save,
+serialization) for requests that opt in, so a slow request can be broken
+down without attaching a profiler to the whole process.
+
+A request is profiled when either:
+- it carries ``X-Debug-Profile: <admin token>`` matching
+  LLM_GATEWAY_PROFILING_ADMIN_TOKEN, or
+- it is the N-th request with LLM_GATEWAY_PROFILING_SAMPLE_RATE=N.
+
+Responses to header-triggered requests carry ``X-Gateway-Profile-Id`` and
+a ``Server-Timing`` header with the phases finished before the headers
+were sent (for streaming responses that is everything up to the first
+chunk). Sampled requests come from arbitrary clients, so their timings
+are only visible through the admin endpoint. Completed profiles,
+optionally with cProfile statistics, are kept in a bounded in-process
+store served by GET /v1/admin/profiles.
+
+Reference Documents:
+- GUIDELINES pp. 2309-2319: Latency breakdown and observability
+- Newman (Building Microservices pp. 273-275): Services expose response times
+
+Pattern: ContextVar-scoped collector (no cost for unprofiled requests)
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+Anti-Pattern §3.1 Avoided: No bare except clauses
+"""
+
+import cProfile
+import contextlib
+import contextvars
+import hmac
+import io
+import itertools
+import logging
+import pstats
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+PROFILE_REQUEST_HEADER = "x-debug-profile"
+"""Request header carrying the admin token that enables profiling."""
+
+PROFILE_MODE_HEADER = "x-debug-profile-mode"
+"""Optional request header; ``cprofile`` adds function-level statistics."""
+
+PROFILE_ID_HEADER = "X-Gateway-Profile-Id"
+"""Response header naming the stored profile."""
+
+DEFAULT_PROFILE_STORE_SIZE = 200
+"""Completed profiles kept for the admin endpoint (oldest evicted first)."""
+
+CPROFILE_TOP_FUNCTIONS = 40
+"""Functions listed in the cProfile summary (sorted by cumulative time)."""
+
+_NULL_PHASE: ContextManager[None] = contextlib.nullcontext()
+
+
+# =============================================================================
+# WBS-PERF12: Profile Data
+# =============================================================================
+
+
+@dataclass
+class ProfilePhase:
+    """
+    One timed phase of a request.
+
+    Attributes:
+        name: Phase name (e.g. "provider_call", "tool:search")
+        start_ms: Offset from the start of the request
+        duration_ms: Phase duration
+        attributes: Extra context (model, tool call id, ...)
+    """
+
+    name: str
+    start_ms: float
+    duration_ms: float
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class RequestProfile:
+    """
+    Phase timeline for one profiled request.
+
+    Attributes:
+        profile_id: Identifier returned in X-Gateway-Profile-Id
+        method: HTTP method
+        path: Request path
+        trigger: "header" or "sampled"
+        created: Wall-clock start (epoch seconds)
+        started: perf_counter() at the start of the request
+        phases: Completed phases in completion order
+        status_code: Response status (set when the response starts)
+        total_ms: End-to-end duration (set when the response completes)
+        cprofile_stats: cProfile summary text, when requested
+    """
+
+    profile_id: str
+    method: str
+    path: str
+    trigger: str
+    created: float = field(default_factory=time.time)
+    started: float = field(default_factory=time.perf_counter)
+    phases: list[ProfilePhase] = field(default_factory=list)
+    status_code: Optional[int] = None
+    total_ms: Optional[float] = None
+    cprofile_stats: Optional[str] = None
+
+    def add_phase(
+        self, name: str, start: float, end: float, attributes: Optional[dict[str, Any]] = None
+    ) -> None:
+        """Record a phase from perf_counter() start/end timestamps."""
+        self.phases.append(
+            ProfilePhase(
+                name=name,
+                start_ms=round((start - self.started) * 1000, 3),
+                duration_ms=round((end - start) * 1000, 3),
+                attributes=attributes or {},
+            )
+        )
+
+    def server_timing(self) -> str:
+        """Render completed phases as a Server-Timing header value."""
+        entries = []
+        for phase in self.phases:
+            token = "".join(c if c.isalnum() or c in "-_" else "_" for c in phase.name)
+            entries.append(f"{token};dur={phase.duration_ms}")
+        return ", ".join(entries)
+
+    def summary(self) -> dict[str, Any]:
+        """Short form used by the profile listing."""
+        return {
+            "profile_id": self.profile_id,
+            "method": self.method,
+            "path": self.path,
+            "trigger": self.trigger,
+            "created": self.created,
+            "status_code": self.status_code,
+            "total_ms": self.total_ms,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Full profile including phases and cProfile statistics."""
+        data = self.summary()
+        data["phases"] = [
+            {
+                "name": p.name,
+                "start_ms": p.start_ms,
+                "duration_ms": p.duration_ms,
+                "attributes": p.attributes,
+            }
+            for p in sorted(self.phases, key=lambda p: p.start_ms)
+        ]
+        data["cprofile"] = self.cprofile_stats
+        return data
+
+
+# =============================================================================
+# WBS-PERF12: Phase Recording
+# =============================================================================
+
+_current_profile: contextvars.ContextVar[Optional[RequestProfile]] = contextvars.ContextVar(
+    "request_profile", default=None
+)
+
+
+def get_current_profile() -> Optional[RequestProfile]:
+    """Get the profile of the current request, if it is being profiled."""
+    return _current_profile.get()
+
+
+class _PhaseTimer:
+    """Context manager timing one phase into a RequestProfile."""
+
+    __slots__ = ("_profile", "_name", "_attributes", "_start")
+
+    def __init__(self, profile: RequestProfile, name: str, attributes: dict[str, Any]) -> None:
+        self._profile = profile
+        self._name = name
+        self._attributes = attributes
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._profile.add_phase(self._name, self._start, time.perf_counter(), self._attributes)
+
+
+def profile_phase(name: str, **attributes: Any) -> ContextManager[None]:
+    """
+    Time a block as a phase of the current request's profile.
+
+    Returns a shared no-op context manager when the request is not being
+    profiled, so instrumented code paths cost one ContextVar lookup.
+
+    Example:
+        >>> with profile_phase("provider_call", model=request.model):
+        ...     response = await provider.complete(request)
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return _NULL_PHASE
+    return _PhaseTimer(profile, name, attributes)
+
+
+def record_elapsed_phase(name: str) -> None:
+    """Record a phase spanning from the start of the request until now."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.add_phase(name, profile.started, time.perf_counter())
+
+
+# =============================================================================
+# WBS-PERF12: Profile Store
+# =============================================================================
+
+
+class ProfileStore:
+    """
+    Bounded in-process store of completed profiles (FIFO eviction).
+
+    Example:
+        >>> store = ProfileStore(max_size=100)
+        >>> store.add(profile)
+        >>> store.get(profile.profile_id)
+    """
+
+    def __init__(self, max_size: int = DEFAULT_PROFILE_STORE_SIZE) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            max_size: Profiles kept before the oldest is evicted.
+        """
+        self._max_size = max_size
+        self._profiles: "OrderedDict[str, RequestProfile]" = OrderedDict()
+
+    def add(self, profile: RequestProfile) -> None:
+        """Store a completed profile."""
+        self._profiles[profile.profile_id] = profile
+        while len(self._profiles) > self._max_size:
+            self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        """Get a profile by id."""
+        return self._profiles.get(profile_id)
+
+    def list(self) -> list[RequestProfile]:
+        """Stored profiles, newest first."""
+        return list(reversed(self._profiles.values()))
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+
+_profile_store: Optional[ProfileStore] = None
+
+
+def get_profile_store() -> ProfileStore:
+    """Get the process-wide profile store (created from settings)."""
+    global _profile_store
+    if _profile_store is None:
+        # Import here to avoid circular import
+        from src.core.config import get_settings
+
+        _profile_store = ProfileStore(max_size=get_settings().profiling_store_size)
+    return _profile_store
+
+
+def reset_profile_store() -> None:
+    """Reset the profile store (for testing)."""
+    global _profile_store
+    _profile_store = None
+
+
+def is_admin_token(candidate: Optional[str], admin_token: str) -> bool:
+    """Constant-time check of a supplied admin token (empty token never matches)."""
+    if not admin_token or not candidate:
+        return False
+    return hmac.compare_digest(candidate.encode(), admin_token.encode())
+
+
+# =============================================================================
+# WBS-PERF12: ProfilingMiddleware
+# =============================================================================
+
+# cProfile hooks the whole thread; only one request can own it at a time.
+_cprofile_active = False
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that profiles opted-in requests.
+
+    WBS-PERF12: Header-triggered (admin token) or sampled 1-in-N profiling.
+
+    cProfile statistics cover everything the event loop ran while the
+    request was in flight, including concurrent requests; they are meant
+    for targeted debugging with little other traffic, not for sampling.
+    """
+
+    def __init__(
+        self,
+        app: Callable[..., Any],
+        sample_rate: Optional[int] = None,
+        admin_token: Optional[str] = None,
+        sampled_cprofile: Optional[bool] = None,
+        store: Optional[ProfileStore] = None,
+    ) -> None:
+        """
+        Initialize ProfilingMiddleware.
+
+        Args:
+            app: ASGI application to wrap
+            sample_rate: Profile one in N requests (0 disables sampling)
+            admin_token: Token enabling X-Debug-Profile (empty disables it)
+            sampled_cprofile: Also run cProfile for sampled requests
+            store: Profile store (default: process-wide store)
+        """
+        # Import here to avoid circular import
+        from src.core.config import get_settings
+
+        settings = get_settings()
+        self.app = app
+        self.sample_rate = (
+            settings.profiling_sample_rate if sample_rate is None else sample_rate
+        )
+        self.admin_token = (
+            settings.profiling_admin_token.get_secret_value()
+            if admin_token is None
+            else admin_token
+        )
+        self.sampled_cprofile = (
+            settings.profiling_sampled_cprofile if sampled_cprofile is None else sampled_cprofile
+        )
+        self._store = store
+        self._counter = itertools.count(1)
+        self.enabled = self.sample_rate > 0 or bool(self.admin_token)
+
+    @property
+    def store(self) -> ProfileStore:
+        """Store receiving completed profiles."""
+        return self._store if self._store is not None else get_profile_store()
+
+    def _trigger(self, scope: dict[str, Any]) -> tuple[Optional[str], bool]:
+        """
+        Decide whether to profile a request.
+
+        Returns:
+            Tuple of (trigger or None, whether to run cProfile).
+        """
+        if self.admin_token:
+            token: Optional[str] = None
+            mode = ""
+            for key, value in scope.get("headers", ()):
+                if key == PROFILE_REQUEST_HEADER.encode():
+                    token = value.decode("latin-1")
+                elif key == PROFILE_MODE_HEADER.encode():
+                    mode = value.decode("latin-1").strip().lower()
+            if token is not None and is_admin_token(token, self.admin_token):
+                return "header", mode == "cprofile"
+        if self.sample_rate > 0 and next(self._counter) % self.sample_rate == 0:
+            return "sampled", self.sampled_cprofile
+        return None, False
+
+    async def __call__(
+        self,
+        scope: dict[str, Any],
+        receive: Callable[..., Any],
+        send: Callable[..., Any],
+    ) -> None:
+        """
+        Process an ASGI request.
+
+        Args:
+            scope: ASGI scope dict
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        trigger, want_cprofile = self._trigger(scope)
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(
+            profile_id=uuid.uuid4().hex[:16],
+            method=scope.get("method", "GET"),
+            path=scope.get("path", "/"),
+            trigger=trigger,
+        )
+
+        async def send_with_profile(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+                if trigger == "header":
+                    message = {**message, "headers": _profile_headers(message, profile)}
+            await send(message)
+
+        profiler = _start_cprofile() if want_cprofile else None
+        token = _current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            _current_profile.reset(token)
+            if profiler is not None:
+                profile.cprofile_stats = _stop_cprofile(profiler)
+            profile.total_ms = round((time.perf_counter() - profile.started) * 1000, 3)
+            self.store.add(profile)
+            logger.info(
+                "Profiled %s %s in %.1fms (%s, id=%s)",
+                profile.method,
+                profile.path,
+                profile.total_ms,
+                profile.trigger,
+                profile.profile_id,
+            )
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _profile_headers(message: dict[str, Any], profile: RequestProfile) -> list[Any]:
+    """Response headers plus the profile id and Server-Timing phases."""
+    headers = list(message.get("headers", []))
+    headers.append((PROFILE_ID_HEADER.encode(), profile.profile_id.encode()))
+    if profile.phases:
+        headers.append((b"server-timing", profile.server_timing().encode()))
+    return headers
+
+
+def _start_cprofile() -> Optional[cProfile.Profile]:
+    """Start cProfile unless another request already owns it."""
+    global _cprofile_active
+    if _cprofile_active:
+        logger.debug("cProfile already active for another request; skipping")
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as e:
+        # Another profiling tool (e.g. a debugger) owns sys.setprofile
+        logger.debug("Could not start cProfile: %s", e)
+        return None
+    _cprofile_active = True
+    return profiler
+
+
+def _stop_cprofile(profiler: cProfile.Profile) -> str:
+    """Stop cProfile and render the top functions by cumulative time."""
+    global _cprofile_active
+    profiler.disable()
+    _cprofile_active = False
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(
+        CPROFILE_TOP_FUNCTIONS
+    )
+    return out.getvalue()
@@ -18,16 +18,25 @@ Format Differences (OpenAI → Anthropic):
 - Tool definition: function.parameters → input_schema
 - Tool use response: tool_calls[] → content blocks type="tool_use"
 - Tool result: role="tool" → role="user" with type="tool_result"
+
+WBS-PERF3: Prompt caching
+- cache_control breakpoints are placed by PromptCachePlanner
+- cache read/write tokens are surfaced in Usage and llm_gateway_tokens_total
+
+WBS-PERF24: Native Batch API
+- /v1/batches lines for Claude models can run through Message Batches,
+  billed at half the synchronous price
 """
 
 import asyncio
 import json
 import time
 from collections.abc import AsyncIterator
-from typing import Any
+from typing import Any, Optional
 
-from anthropic import AsyncAnthropic
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 
+from src.clients.http import get_shared_transport
 from src.core.exceptions import (
     AuthenticationError,
     ProviderError,
@@ -43,7 +52,15 @@ from src.models.responses import (
     ChunkDelta,
     Usage,
 )
+from src.observability.metrics import record_token_usage
 from src.providers.base import LLMProvider
+from src.providers.batch import (
+    NATIVE_BATCH_ENDED,
+    NATIVE_BATCH_IN_PROGRESS,
+    NativeBatchProvider,
+    NativeBatchResult,
+)
+from src.providers.prompt_cache import PromptCachePlanner
 
 # =============================================================================
 # WBS 2.3.2.1.7: Supported Models
@@ -67,6 +84,10 @@ MODEL_ALIASES = {
 }
 
 
+# WBS-PERF24: Message Batches accept up to 100,000 requests per batch
+BATCH_MAX_REQUESTS = 100_000
+
+
 # =============================================================================
 # WBS 2.3.2.2: Anthropic Tool Handler
 # =============================================================================
@@ -335,7 +356,7 @@ class AnthropicToolHandler:
 # =============================================================================
 
 
-class AnthropicProvider(LLMProvider):
+class AnthropicProvider(LLMProvider, NativeBatchProvider):
     """
     Anthropic Claude provider adapter.
 
@@ -353,6 +374,7 @@ class AnthropicProvider(LLMProvider):
         api_key: Anthropic API key.
         max_retries: Maximum retry attempts for transient errors.
         retry_delay: Initial delay between retries (exponential backoff).
+        prompt_cache: Optional planner that inserts cache_control breakpoints.
 
     Example:
         >>> provider = AnthropicProvider(api_key="sk-ant-...")
@@ -365,6 +387,7 @@ class AnthropicProvider(LLMProvider):
         api_key: str,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        prompt_cache: Optional[PromptCachePlanner] = None,
     ) -> None:
         """
         Initialize Anthropic provider.
@@ -375,12 +398,22 @@ class AnthropicProvider(LLMProvider):
             api_key: Anthropic API key.
             max_retries: Maximum retry attempts (default: 3).
             retry_delay: Initial retry delay in seconds (default: 1.0).
+            prompt_cache: Optional prompt-cache planner (WBS-PERF3). None
+                disables automatic cache breakpoints.
         """
         self._api_key = api_key
         self._max_retries = max_retries
         self._retry_delay = retry_delay
         self._tool_handler = AnthropicToolHandler()
-        self._client = AsyncAnthropic(api_key=api_key)
+        self._prompt_cache = prompt_cache
+        # WBS-PERF13: Trace-propagating transport for upstream calls
+        # WBS-PERF16: Pool shared with /v1/responses
+        self._client = AsyncAnthropic(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(
+                transport=get_shared_transport("anthropic")
+            ),
+        )
 
     # =========================================================================
     # WBS 2.3.2.1.7: Model Support Methods
@@ -468,10 +501,12 @@ class AnthropicProvider(LLMProvider):
             async with self._client.messages.stream(**kwargs) as stream:
                 message_id: str | None = None
                 model: str | None = None
+                start_usage: Any = None
 
                 async for event in stream:
                     if event.type == "message_start":
                         message_id, model = self._handle_message_start(event)
+                        start_usage = getattr(event.message, "usage", None)
                     elif event.type == "content_block_delta":
                         if hasattr(event.delta, "text"):
                             yield self._handle_content_delta(
@@ -484,6 +519,7 @@ class AnthropicProvider(LLMProvider):
                             event,
                             message_id or "unknown",
                             model or request.model,
+                            start_usage,
                         )
         except Exception as e:
             self._handle_error(e)
@@ -643,6 +679,73 @@ class AnthropicProvider(LLMProvider):
 
         raise ProviderError(str(e), provider="anthropic") from e
 
+    # =========================================================================
+    # WBS-PERF24: Native Batch API
+    # =========================================================================
+
+    native_batch_max_requests = BATCH_MAX_REQUESTS
+
+    async def submit_batch(self, requests: list[tuple[str, ChatCompletionRequest]]) -> str:
+        """
+        Create a Message Batch from (custom_id, request) pairs.
+
+        Args:
+            requests: (custom_id, request) pairs.
+
+        Returns:
+            The Anthropic message batch id.
+        """
+        batch = await self._execute_with_retry(
+            self._client.messages.batches.create,
+            requests=[
+                {"custom_id": custom_id, "params": self._build_request_kwargs(request)}
+                for custom_id, request in requests
+            ],
+        )
+        return batch.id
+
+    async def get_batch_status(self, batch_id: str) -> str:
+        """Map processing_status onto NativeBatchProvider statuses."""
+        batch = await self._execute_with_retry(
+            self._client.messages.batches.retrieve, message_batch_id=batch_id
+        )
+        if batch.processing_status == "ended":
+            return NATIVE_BATCH_ENDED
+        return NATIVE_BATCH_IN_PROGRESS
+
+    async def iter_batch_results(self, batch_id: str) -> AsyncIterator[NativeBatchResult]:
+        """Stream the results JSONL of an ended Message Batch."""
+        results = await self._execute_with_retry(
+            self._client.messages.batches.results, message_batch_id=batch_id
+        )
+        async for item in results:
+            yield self._transform_batch_result(item)
+
+    async def cancel_batch(self, batch_id: str) -> None:
+        """Cancel a Message Batch."""
+        await self._execute_with_retry(
+            self._client.messages.batches.cancel, message_batch_id=batch_id
+        )
+
+    def _transform_batch_result(self, item: Any) -> NativeBatchResult:
+        """Transform one Message Batch result to a NativeBatchResult."""
+        result = item.result
+        if result.type == "succeeded":
+            return NativeBatchResult(
+                custom_id=item.custom_id, response=self._transform_response(result.message)
+            )
+        if result.type == "errored":
+            error = result.error.error
+            return NativeBatchResult(
+                custom_id=item.custom_id,
+                error={"code": error.type, "message": error.message},
+            )
+        # canceled / expired
+        return NativeBatchResult(
+            custom_id=item.custom_id,
+            error={"code": f"batch_{result.type}", "message": f"Batch request {result.type}"},
+        )
+
     # =========================================================================
     # Helper Methods
     # =========================================================================
@@ -690,6 +793,10 @@ class AnthropicProvider(LLMProvider):
                 [t.model_dump() for t in request.tools]
             )
 
+        # WBS-PERF3: Automatic prompt-cache breakpoints on stable prefixes
+        if self._prompt_cache is not None:
+            kwargs = self._prompt_cache.apply(kwargs)
+
         return kwargs
 
     # =========================================================================
@@ -750,6 +857,7 @@ class AnthropicProvider(LLMProvider):
         event: Any,
         message_id: str,
         model: str,
+        start_usage: Any = None,
     ) -> ChatCompletionChunk:
         """
         Handle message_delta event from Anthropic stream.
@@ -760,10 +868,15 @@ class AnthropicProvider(LLMProvider):
             event: The message_delta event.
             message_id: The message ID from message_start.
             model: The model name.
+            start_usage: Usage reported by message_start (input/cache tokens).
 
         Returns:
-            ChatCompletionChunk with finish_reason.
+            ChatCompletionChunk with finish_reason (and usage when reported).
         """
+        usage = None
+        if start_usage is not None:
+            usage = self._build_usage(model, start_usage, getattr(event, "usage", None))
+
         finish_reason = None
         if hasattr(event.delta, "stop_reason"):
             stop_reason = event.delta.stop_reason
@@ -780,6 +893,7 @@ class AnthropicProvider(LLMProvider):
                     finish_reason=finish_reason,
                 )
             ],
+            usage=usage,
         )
 
     # =========================================================================
@@ -940,9 +1054,54 @@ class AnthropicProvider(LLMProvider):
                     finish_reason=finish_reason,
                 )
             ],
-            usage=Usage(
-                prompt_tokens=response.usage.input_tokens,
-                completion_tokens=response.usage.output_tokens,
-                total_tokens=response.usage.input_tokens + response.usage.output_tokens,
-            ),
+            usage=self._build_usage(response.model, response.usage),
+        )
+
+    def _build_usage(
+        self,
+        model: str,
+        input_usage: Any,
+        output_usage: Any = None,
+    ) -> Usage:
+        """
+        Build Usage including prompt-cache token counts.
+
+        WBS-PERF3: Anthropic reports cached prompt tokens separately from
+        input_tokens; prompt_tokens is their sum (OpenAI semantics) and the
+        cache components are recorded in llm_gateway_tokens_total. Cost
+        calculations must pass cache_read_tokens/cache_write_tokens so the
+        cached part is not priced at the full input rate.
+
+        Args:
+            model: Model name (metric label).
+            input_usage: Usage object carrying input/cache token counts.
+            output_usage: Usage object carrying output_tokens (defaults to
+                input_usage; streams report it on message_delta).
+
+        Returns:
+            Usage model.
+        """
+        input_tokens = _token_count(input_usage, "input_tokens") or 0
+        cache_read = _token_count(input_usage, "cache_read_input_tokens")
+        cache_write = _token_count(input_usage, "cache_creation_input_tokens")
+        completion_tokens = _token_count(output_usage or input_usage, "output_tokens") or 0
+        prompt_tokens = input_tokens + (cache_read or 0) + (cache_write or 0)
+
+        if cache_read:
+            record_token_usage("anthropic", model, "cache_read", cache_read)
+        if cache_write:
+            record_token_usage("anthropic", model, "cache_write", cache_write)
+
+        return Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
         )
+
+
+def _token_count(usage: Any, field: str) -> Optional[int]:
+    """Read an integer token count from an SDK usage object, if present."""
+    value = getattr(usage, field, None)
+    return value if isinstance(value, int) else None
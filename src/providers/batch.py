@@ -0,0 +1,103 @@
+"""
+Native Batch APIs - WBS-PERF24 Provider Batch Interface
+
+Providers whose APIs accept asynchronous batches at a discount (OpenAI
+Batch API, Anthropic Message Batches) implement NativeBatchProvider in
+addition to LLMProvider. The /v1/batches job runner submits eligible job
+lines as one remote batch, polls it, and reads the results back as
+ChatCompletionResponse objects, so output lines have the same shape
+whichever path served them.
+
+Reference Documents:
+- OpenAI Batch API: https://platform.openai.com/docs/api-reference/batch
+- Anthropic Message Batches: https://docs.anthropic.com/en/api/creating-message-batches
+- GUIDELINES pp. 793-795: Repository pattern and ABC patterns
+
+Pattern: Optional capability interface (ABC mixin)
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from src.models.requests import ChatCompletionRequest
+from src.models.responses import ChatCompletionResponse
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+NATIVE_BATCH_IN_PROGRESS = "in_progress"
+"""Remote batch still validating or processing."""
+
+NATIVE_BATCH_ENDED = "ended"
+"""Remote batch finished (completed, expired or cancelled); results readable."""
+
+NATIVE_BATCH_FAILED = "failed"
+"""Remote batch rejected as a whole; no per-request results."""
+
+
+# =============================================================================
+# NativeBatchResult
+# =============================================================================
+
+
+@dataclass
+class NativeBatchResult:
+    """One request's outcome in a remote batch."""
+
+    custom_id: str
+    response: Optional[ChatCompletionResponse] = None
+    error: Optional[dict[str, Any]] = None
+
+
+# =============================================================================
+# NativeBatchProvider
+# =============================================================================
+
+
+class NativeBatchProvider(ABC):
+    """
+    Capability mixin for providers with an asynchronous batch API.
+
+    Remote custom ids are chosen by the caller and must match
+    ``^[a-zA-Z0-9_-]{1,64}$`` (the stricter Anthropic constraint).
+    """
+
+    native_batch_max_requests: int = 50_000
+    """Most requests the provider accepts in one batch."""
+
+    native_batch_price_multiplier: float = 0.5
+    """Price of batch tokens relative to synchronous calls."""
+
+    @abstractmethod
+    async def submit_batch(self, requests: list[tuple[str, ChatCompletionRequest]]) -> str:
+        """
+        Submit (custom_id, request) pairs as one remote batch.
+
+        Returns:
+            The remote batch id.
+
+        Raises:
+            ProviderError: The batch could not be created.
+        """
+
+    @abstractmethod
+    async def get_batch_status(self, batch_id: str) -> str:
+        """
+        Get a remote batch's status.
+
+        Returns:
+            One of NATIVE_BATCH_IN_PROGRESS, NATIVE_BATCH_ENDED, NATIVE_BATCH_FAILED.
+        """
+
+    @abstractmethod
+    def iter_batch_results(self, batch_id: str) -> AsyncIterator[NativeBatchResult]:
+        """Yield the results of an ended remote batch, in any order."""
+
+    @abstractmethod
+    async def cancel_batch(self, batch_id: str) -> None:
+        """Request cancellation of a remote batch."""
@@ -18,8 +18,9 @@ import time
 from collections.abc import AsyncIterator
 from typing import Any
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
+from src.clients.http import get_shared_transport
 from src.core.exceptions import (
     AuthenticationError,
     ProviderError,
@@ -36,6 +37,7 @@ from src.models.responses import (
     Usage,
 )
 from src.providers.base import LLMProvider
+from src.providers.openai import openai_usage
 
 # =============================================================================
 # DeepSeek Configuration
@@ -95,9 +97,13 @@ class DeepSeekProvider(LLMProvider):
         self._retry_delay = retry_delay
 
         # Initialize OpenAI-compatible client pointing to DeepSeek
+        # WBS-PERF16: Pool shared with /v1/responses
         self._client = AsyncOpenAI(
             api_key=api_key,
             base_url=DEEPSEEK_BASE_URL,
+            http_client=DefaultAsyncHttpxClient(
+                transport=get_shared_transport("deepseek")
+            ),
         )
 
     def get_supported_models(self) -> list[str]:
@@ -193,6 +199,8 @@ class DeepSeekProvider(LLMProvider):
         }
         if stream:
             params["stream"] = True
+            # WBS-PERF8: Final chunk carries usage so streamed calls are billed
+            params["stream_options"] = {"include_usage": True}
         if request.temperature is not None:
             params["temperature"] = request.temperature
         if request.max_tokens is not None:
@@ -278,6 +286,15 @@ class DeepSeekProvider(LLMProvider):
 
             async for chunk in stream:
                 if not chunk.choices:
+                    usage = openai_usage(getattr(chunk, "usage", None))
+                    if usage is not None:
+                        yield ChatCompletionChunk(
+                            id=chunk.id,
+                            model=chunk.model,
+                            created=getattr(chunk, "created", None) or int(time.time()),
+                            choices=[],
+                            usage=usage,
+                        )
                     continue
 
                 delta = chunk.choices[0].delta
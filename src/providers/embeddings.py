@@ -0,0 +1,400 @@
+"""
+Embedding Providers - WBS-PERF23
+
+This module routes embedding models to the backends that serve them, for
+the OpenAI-compatible ``POST /v1/embeddings`` endpoint. Routing follows
+the ``embeddings:`` section of config/model_registry.yaml: a model that is
+not listed there is rejected, exactly like chat models.
+
+Backends:
+- OpenAICompatibleEmbeddingBackend: OpenAI and the local inference-service
+  (both speak the OpenAI embeddings API). OpenAI vectors are requested as
+  base64 float32 to avoid parsing large JSON float arrays
+- GeminiEmbeddingBackend: Gemini ``batchEmbedContents``
+- SemanticSearchEmbeddingBackend: unified-search-service through the embed
+  tool path, so it shares the embedding cache and micro-batcher
+
+Each backend declares ``max_batch_size``; callers split larger inputs.
+
+Reference Documents:
+- OpenAI Embeddings API: https://platform.openai.com/docs/api-reference/embeddings
+- Gemini API: models.batchEmbedContents
+- GUIDELINES pp. 793-795: Ports and adapters
+
+Pattern: Ports and Adapters (EmbeddingBackend is the port)
+Pattern: Registry-driven routing (model_registry.yaml is the bouncer list)
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+"""
+
+import base64
+import logging
+import struct
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+import httpx
+
+from src.clients.http import get_shared_client
+from src.core.exceptions import ProviderError
+from src.providers.router import NoProviderError, RegistryValidationError, _load_model_registry
+
+if TYPE_CHECKING:
+    from src.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# WBS-PERF23: NumPy is a pinned dependency; struct is only a fallback for
+# environments installed without it (same encoding, slower per component)
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+OPENAI_API_BASE = "https://api.openai.com/v1"
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+
+DEFAULT_EMBEDDING_BATCH_SIZE = 64
+"""Inputs per upstream request when a backend does not declare batch_size."""
+
+DEFAULT_EMBEDDING_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+SEMANTIC_SEARCH_BACKEND = "semantic-search"
+
+
+# =============================================================================
+# Vector Encoding
+# =============================================================================
+
+
+def encode_float32_base64(vector: list[float]) -> str:
+    """Encode a vector as base64 of little-endian float32 (OpenAI format)."""
+    if np is not None:
+        raw = np.asarray(vector, dtype="<f4").tobytes()
+    else:
+        raw = struct.pack(f"<{len(vector)}f", *vector)
+    return base64.b64encode(raw).decode("ascii")
+
+
+def decode_float32_base64(value: str) -> list[float]:
+    """Decode base64 little-endian float32 into Python floats."""
+    raw = base64.b64decode(value)
+    if np is not None:
+        return np.frombuffer(raw, dtype="<f4").tolist()
+    return list(struct.unpack(f"<{len(raw) // 4}f", raw))
+
+
+# =============================================================================
+# Backend Interface
+# =============================================================================
+
+
+@dataclass
+class EmbeddingBatch:
+    """
+    Vectors for one upstream request.
+
+    Attributes:
+        vectors: One vector per input text, in order
+        prompt_tokens: Input tokens reported by the backend (0 if unknown)
+    """
+
+    vectors: list[list[float]]
+    prompt_tokens: int = 0
+
+
+class EmbeddingBackend(ABC):
+    """
+    Port for services that turn texts into vectors.
+
+    Attributes:
+        name: Backend name (matches model_registry.yaml)
+        max_batch_size: Most texts accepted per embed() call
+    """
+
+    def __init__(self, name: str, max_batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE) -> None:
+        self.name = name
+        self.max_batch_size = max(1, max_batch_size)
+
+    @abstractmethod
+    async def embed(
+        self, texts: list[str], model: str, dimensions: Optional[int] = None
+    ) -> EmbeddingBatch:
+        """
+        Embed up to max_batch_size texts.
+
+        Raises:
+            ProviderError: The backend failed or returned a malformed response.
+        """
+        ...
+
+    def _check_count(self, batch: EmbeddingBatch, texts: list[str]) -> EmbeddingBatch:
+        if len(batch.vectors) != len(texts):
+            raise ProviderError(
+                f"Embedding backend returned {len(batch.vectors)} vectors for {len(texts)} texts",
+                provider=self.name,
+            )
+        return batch
+
+    async def _post(
+        self, url: str, payload: dict[str, Any], headers: Optional[dict[str, str]] = None
+    ) -> dict[str, Any]:
+        """POST on the backend's pooled client, translating failures to ProviderError."""
+        client = get_shared_client(self.name, DEFAULT_EMBEDDING_TIMEOUT)
+        try:
+            response = await client.post(url, json=payload, headers=headers)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            raise ProviderError(
+                f"{self.name} embeddings error: {e.response.text[:500]}",
+                provider=self.name,
+                status_code=e.response.status_code,
+            ) from e
+        except httpx.HTTPError as e:
+            raise ProviderError(
+                f"{self.name} embeddings unavailable: {e}", provider=self.name
+            ) from e
+
+
+# =============================================================================
+# Backends
+# =============================================================================
+
+
+class OpenAICompatibleEmbeddingBackend(EmbeddingBackend):
+    """
+    Backend for the OpenAI embeddings API (OpenAI, inference-service).
+
+    Example:
+        >>> backend = OpenAICompatibleEmbeddingBackend("openai", OPENAI_API_BASE, api_key="sk-...")
+        >>> batch = await backend.embed(["hello"], "text-embedding-3-small")
+    """
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        api_key: Optional[str] = None,
+        max_batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        request_base64: bool = False,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            name: Backend name
+            base_url: API base including the version path (e.g. .../v1)
+            api_key: Bearer token (None for unauthenticated local services)
+            max_batch_size: Most inputs per request
+            request_base64: Ask the upstream for base64 vectors (smaller, faster to parse)
+        """
+        super().__init__(name, max_batch_size)
+        self._url = f"{base_url.rstrip('/')}/embeddings"
+        self._headers = {"Authorization": f"Bearer {api_key}"} if api_key else None
+        self._request_base64 = request_base64
+
+    async def embed(
+        self, texts: list[str], model: str, dimensions: Optional[int] = None
+    ) -> EmbeddingBatch:
+        payload: dict[str, Any] = {"model": model, "input": texts}
+        if self._request_base64:
+            payload["encoding_format"] = "base64"
+        if dimensions is not None:
+            payload["dimensions"] = dimensions
+        data = await self._post(self._url, payload, self._headers)
+
+        items = sorted(data.get("data", []), key=lambda item: item.get("index", 0))
+        vectors = [
+            decode_float32_base64(e) if isinstance(e, str) else e
+            for e in (item.get("embedding", []) for item in items)
+        ]
+        usage = data.get("usage") or {}
+        return self._check_count(EmbeddingBatch(vectors, usage.get("prompt_tokens", 0)), texts)
+
+
+class GeminiEmbeddingBackend(EmbeddingBackend):
+    """Backend for Gemini ``models/{model}:batchEmbedContents``."""
+
+    def __init__(
+        self,
+        api_key: str,
+        max_batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        api_base: str = GEMINI_API_BASE,
+        name: str = "google",
+    ) -> None:
+        super().__init__(name, max_batch_size)
+        self._api_base = api_base
+        self._headers = {"x-goog-api-key": api_key}
+
+    async def embed(
+        self, texts: list[str], model: str, dimensions: Optional[int] = None
+    ) -> EmbeddingBatch:
+        def request(text: str) -> dict[str, Any]:
+            item: dict[str, Any] = {
+                "model": f"models/{model}",
+                "content": {"parts": [{"text": text}]},
+            }
+            if dimensions is not None:
+                item["outputDimensionality"] = dimensions
+            return item
+
+        data = await self._post(
+            f"{self._api_base}/models/{model}:batchEmbedContents",
+            {"requests": [request(text) for text in texts]},
+            self._headers,
+        )
+        vectors = [item.get("values", []) for item in data.get("embeddings", [])]
+        return self._check_count(EmbeddingBatch(vectors), texts)
+
+
+class SemanticSearchEmbeddingBackend(EmbeddingBackend):
+    """
+    Backend for unified-search-service via the embed tool path.
+
+    Shares the embedding cache (WBS-PERF22) and the micro-batcher
+    (WBS-PERF21) with the ``embed`` tool.
+    """
+
+    def __init__(
+        self, max_batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE, name: str = SEMANTIC_SEARCH_BACKEND
+    ) -> None:
+        super().__init__(name, max_batch_size)
+
+    async def embed(
+        self, texts: list[str], model: str, dimensions: Optional[int] = None
+    ) -> EmbeddingBatch:
+        # Import here to avoid circular import
+        from src.tools.builtin.embed import EmbedServiceError, embed
+
+        try:
+            data = await embed({"texts": texts, "model": model})
+        except EmbedServiceError as e:
+            raise ProviderError(str(e), provider=self.name) from e
+        return self._check_count(EmbeddingBatch(data.get("embeddings", [])), texts)
+
+
+# =============================================================================
+# EmbeddingRouter
+# =============================================================================
+
+
+class EmbeddingRouter:
+    """
+    Resolve embedding models to backends.
+
+    Example:
+        >>> router = create_embedding_router(settings)
+        >>> backend = router.resolve("text-embedding-3-small")
+    """
+
+    def __init__(self, backends: dict[str, EmbeddingBackend], models: dict[str, str]) -> None:
+        """
+        Initialize the router.
+
+        Args:
+            backends: Backend name -> backend
+            models: Model name -> backend name
+        """
+        self._backends = backends
+        self._models = models
+
+    def resolve(self, model: str) -> EmbeddingBackend:
+        """
+        Get the backend for a model.
+
+        Raises:
+            NoProviderError: The model is not registered, or its backend is
+                not configured (e.g. missing API key).
+        """
+        backend_name = self._models.get(model)
+        if backend_name is None:
+            raise NoProviderError(f"Embedding model '{model}' is not registered")
+        backend = self._backends.get(backend_name)
+        if backend is None:
+            raise NoProviderError(
+                f"Embedding provider '{backend_name}' for model '{model}' is not configured"
+            )
+        return backend
+
+    def list_models(self) -> list[str]:
+        """Registered models whose backend is configured."""
+        return sorted(m for m, b in self._models.items() if b in self._backends)
+
+
+def parse_embedding_registry(config: dict[str, Any]) -> tuple[dict[str, str], dict[str, int]]:
+    """
+    Read the ``embeddings:`` section of the model registry.
+
+    Returns:
+        (model -> backend name, backend name -> batch size)
+
+    Raises:
+        RegistryValidationError: The section has the wrong shape.
+    """
+    section = config.get("embeddings") or {}
+    if not isinstance(section, dict):
+        raise RegistryValidationError("'embeddings' must be a mapping")
+    providers = section.get("providers") or {}
+    if not isinstance(providers, dict):
+        raise RegistryValidationError("'embeddings.providers' must be a mapping")
+
+    models: dict[str, str] = {}
+    batch_sizes: dict[str, int] = {}
+    for name, provider_config in providers.items():
+        provider_config = provider_config or {}
+        names = provider_config.get("models") or []
+        if not isinstance(names, list) or not all(isinstance(m, str) for m in names):
+            raise RegistryValidationError(
+                f"embeddings.providers.{name}.models must be a list of strings"
+            )
+        batch_sizes[name] = int(provider_config.get("batch_size", DEFAULT_EMBEDDING_BATCH_SIZE))
+        models.update({model: name for model in names})
+    return models, batch_sizes
+
+
+def create_embedding_router(
+    settings: "Settings", config: Optional[dict[str, Any]] = None
+) -> EmbeddingRouter:
+    """
+    Build the embedding router from settings and the model registry.
+
+    Backends that need an API key are only registered when it is set.
+
+    Args:
+        settings: Application settings
+        config: Parsed registry (defaults to config/model_registry.yaml)
+    """
+    models, batch_sizes = parse_embedding_registry(config or _load_model_registry())
+    backends: dict[str, EmbeddingBackend] = {}
+
+    def size(name: str) -> int:
+        return batch_sizes.get(name, DEFAULT_EMBEDDING_BATCH_SIZE)
+
+    openai_key = settings.openai_api_key.get_secret_value()
+    if openai_key:
+        backends["openai"] = OpenAICompatibleEmbeddingBackend(
+            "openai",
+            OPENAI_API_BASE,
+            api_key=openai_key,
+            max_batch_size=size("openai"),
+            request_base64=True,
+        )
+    gemini_key = settings.gemini_api_key.get_secret_value()
+    if gemini_key:
+        backends["google"] = GeminiEmbeddingBackend(gemini_key, max_batch_size=size("google"))
+    backends["inference"] = OpenAICompatibleEmbeddingBackend(
+        "inference",
+        f"{settings.inference_service_url.rstrip('/')}/v1",
+        max_batch_size=size("inference"),
+    )
+    backends[SEMANTIC_SEARCH_BACKEND] = SemanticSearchEmbeddingBackend(
+        max_batch_size=size(SEMANTIC_SEARCH_BACKEND)
+    )
+    logger.info(f"Embedding backends registered: {sorted(backends)}")
+    return EmbeddingRouter(backends, models)
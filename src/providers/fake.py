@@ -14,15 +14,29 @@ The FakeProvider can be used in production for:
 - Integration testing without network calls
 - Demo/sandbox environments
 
+WBS-PERF11: Simulation profiles make FakeProvider behave like a real
+upstream for load tests - latency distributions (fixed, lognormal,
+bimodal), streaming token rates, 5xx/429 error rates with Retry-After,
+tool_call responses and large outputs. Profiles are selected per model
+from the ``simulation:`` section of config/model_registry.yaml and used
+for every provider when LLM_GATEWAY_SIMULATE_UPSTREAM=true.
+
 Reference:
 - GUIDELINES pp. 157: FakeRepository pattern
 - GUIDELINES pp. 793-795: Repository pattern and ABC patterns
+- GUIDELINES pp. 242 (Newman): AI tests require mocks simulating varying response times,
+  occasional failures, and context-dependent outputs
 """
 
+import asyncio
+import math
+import random
 import time
 import uuid
-from typing import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Mapping
 
+from src.core.exceptions import ProviderError, RateLimitError
 from src.models.requests import ChatCompletionRequest
 from src.models.responses import (
     ChatCompletionResponse,
@@ -36,6 +50,166 @@ from src.models.responses import (
 from src.providers.base import LLMProvider
 
 
+# =============================================================================
+# WBS-PERF11: Simulation Profiles
+# =============================================================================
+
+LATENCY_DISTRIBUTIONS = ("fixed", "lognormal", "bimodal")
+"""Supported latency distribution kinds."""
+
+_FILLER_WORDS = (
+    "the", "gateway", "routes", "each", "request", "to", "a", "provider",
+    "and", "streams", "tokens", "back", "while", "tracking", "usage", "cost",
+)
+
+
+class SimulationConfigError(ValueError):
+    """Raised when a simulation profile in the registry is malformed."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """
+    Time-to-first-token distribution.
+
+    Attributes:
+        kind: "fixed", "lognormal" or "bimodal"
+        ms: Fixed latency (fixed)
+        median_ms: Median latency (lognormal)
+        sigma: Log-space standard deviation (lognormal)
+        fast_ms: Typical fast-path latency (bimodal)
+        slow_ms: Typical slow-path latency (bimodal)
+        slow_fraction: Probability of the slow path (bimodal)
+    """
+
+    kind: str = "fixed"
+    ms: float = 0.0
+    median_ms: float = 0.0
+    sigma: float = 0.5
+    fast_ms: float = 0.0
+    slow_ms: float = 0.0
+    slow_fraction: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds."""
+        if self.kind == "lognormal":
+            return rng.lognormvariate(math.log(max(self.median_ms, 1e-3)), self.sigma) / 1000
+        if self.kind == "bimodal":
+            center = self.slow_ms if rng.random() < self.slow_fraction else self.fast_ms
+            return rng.lognormvariate(math.log(max(center, 1e-3)), 0.1) / 1000
+        return self.ms / 1000
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any] | float | int | None) -> "LatencyDistribution":
+        """Parse ``{distribution: ..., ...}`` or a bare number of milliseconds."""
+        if config is None:
+            return cls()
+        if isinstance(config, (int, float)):
+            return cls(kind="fixed", ms=float(config))
+        kind = config.get("distribution", "fixed")
+        if kind not in LATENCY_DISTRIBUTIONS:
+            raise SimulationConfigError(f"Unknown latency distribution: {kind}")
+        fields = {k: float(v) for k, v in config.items() if k != "distribution"}
+        try:
+            return cls(kind=kind, **fields)
+        except TypeError as e:
+            raise SimulationConfigError(f"Invalid latency settings: {e}") from e
+
+
+@dataclass(frozen=True)
+class SimulationProfile:
+    """
+    Upstream behavior simulated by FakeProvider for one model.
+
+    Attributes:
+        latency: Time to first token
+        tokens_per_second: Output rate (0 = instant)
+        response_tokens: Words generated per response (0 = echo content)
+        error_rate: Probability of a 503 ProviderError
+        rate_limit_rate: Probability of a 429 RateLimitError
+        retry_after_seconds: Retry-After reported with 429s
+        tool_call_rate: Probability of answering with a tool call when tools are offered
+    """
+
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    tokens_per_second: float = 0.0
+    response_tokens: int = 0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_seconds: int = 1
+    tool_call_rate: float = 0.0
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "SimulationProfile":
+        """Parse one entry of ``simulation.profiles``."""
+        if not isinstance(config, Mapping):
+            raise SimulationConfigError("Simulation profile must be a mapping")
+        options = dict(config)
+        latency = LatencyDistribution.from_config(options.pop("latency_ms", None))
+        try:
+            profile = cls(latency=latency, **options)
+        except TypeError as e:
+            raise SimulationConfigError(f"Invalid simulation profile: {e}") from e
+        for rate in (profile.error_rate, profile.rate_limit_rate, profile.tool_call_rate):
+            if not 0.0 <= rate <= 1.0:
+                raise SimulationConfigError("Simulation rates must be between 0 and 1")
+        return profile
+
+
+def named_simulation_profiles(config: Mapping[str, Any] | None) -> dict[str, SimulationProfile]:
+    """
+    Parse ``simulation.profiles`` into profiles keyed by name.
+
+    Raises:
+        SimulationConfigError: If a profile is malformed.
+    """
+    specs = (config or {}).get("profiles") or {}
+    return {name: SimulationProfile.from_config(spec) for name, spec in specs.items()}
+
+
+def load_simulation_profiles(
+    config: Mapping[str, Any] | None,
+) -> tuple[dict[str, SimulationProfile], SimulationProfile | None]:
+    """
+    Resolve the registry's ``simulation:`` section into per-model profiles.
+
+    Expected shape::
+
+        simulation:
+          default: <profile name>        # optional
+          profiles: {<name>: {...}}
+          models: {<model>: <profile name>}
+
+    Args:
+        config: The ``simulation`` mapping (None if absent).
+
+    Returns:
+        Tuple of (model -> profile, default profile or None).
+
+    Raises:
+        SimulationConfigError: If a profile is malformed or unknown.
+    """
+    if not config:
+        return {}, None
+    profiles = named_simulation_profiles(config)
+
+    def lookup(name: str) -> SimulationProfile:
+        if name not in profiles:
+            raise SimulationConfigError(f"Unknown simulation profile: {name}")
+        return profiles[name]
+
+    by_model = {model: lookup(name) for model, name in (config.get("models") or {}).items()}
+    default_name = config.get("default")
+    return by_model, lookup(default_name) if default_name else None
+
+
+# =============================================================================
+# FakeProvider
+# =============================================================================
+
+
 class FakeProvider(LLMProvider):
     """
     Fake LLM provider for testing and local development.
@@ -60,6 +234,10 @@ class FakeProvider(LLMProvider):
         >>> from src.core.exceptions import ProviderError
         >>> provider = FakeProvider(error_on_complete=ProviderError(...))
         >>> await provider.complete(request)  # Raises ProviderError
+
+        # Production-like upstream (WBS-PERF11):
+        >>> slow = SimulationProfile(latency=LatencyDistribution("lognormal", median_ms=400))
+        >>> provider = FakeProvider(default_profile=slow, seed=7)
     """
     
     def __init__(
@@ -68,6 +246,9 @@ class FakeProvider(LLMProvider):
         supported_models: list[str] | None = None,
         response_content: str = "Fake response for testing",
         error_on_complete: Exception | None = None,
+        profiles: Mapping[str, SimulationProfile] | None = None,
+        default_profile: SimulationProfile | None = None,
+        seed: int | None = None,
     ) -> None:
         """
         Initialize the fake provider.
@@ -77,6 +258,9 @@ class FakeProvider(LLMProvider):
             supported_models: Models to support (default: common test models)
             response_content: Content to return in responses
             error_on_complete: Exception to raise on complete() calls (for error testing)
+            profiles: Simulation profile per model name (WBS-PERF11)
+            default_profile: Profile for models without one (None = instant)
+            seed: Seed for the simulation RNG (reproducible load tests)
         """
         self.name = name
         self.supported_models = supported_models or [
@@ -88,6 +272,9 @@ class FakeProvider(LLMProvider):
         ]
         self.response_content = response_content
         self.error_on_complete = error_on_complete
+        self.profiles = dict(profiles or {})
+        self.default_profile = default_profile
+        self._rng = random.Random(seed)
         
         # Track calls for test assertions
         self.complete_calls: list[ChatCompletionRequest] = []
@@ -116,12 +303,21 @@ class FakeProvider(LLMProvider):
         # Raise configured error if set (for testing error handling)
         if self.error_on_complete is not None:
             raise self.error_on_complete
-        
+
+        # WBS-PERF11: Simulated upstream latency, failures and tool calls
+        profile = self.profile_for(request.model)
+        if profile is not None:
+            await self._simulate_request(profile)
+            if self._wants_tool_call(profile, request):
+                return self._tool_call_response(request)
+
         # Generate response matching real format
         response_id = f"chatcmpl-fake-{uuid.uuid4().hex[:12]}"
         
         # Build response content based on input
         content = self._generate_response_content(request)
+        if profile is not None and profile.tokens_per_second > 0:
+            await asyncio.sleep(len(content.split()) / profile.tokens_per_second)
         
         # Estimate tokens (rough approximation)
         prompt_tokens = sum(
@@ -167,11 +363,19 @@ class FakeProvider(LLMProvider):
         """
         # Track the call
         self.stream_calls.append(request)
-        
+
+        # WBS-PERF11: Failures and TTFT happen before the first chunk
+        profile = self.profile_for(request.model)
+        token_delay = 0.0
+        tool_call = False
+        if profile is not None:
+            await self._simulate_request(profile)
+            if profile.tokens_per_second > 0:
+                token_delay = 1 / profile.tokens_per_second
+            tool_call = self._wants_tool_call(profile, request)
+
         response_id = f"chatcmpl-fake-{uuid.uuid4().hex[:12]}"
         created = int(time.time())
-        content = self._generate_response_content(request)
-        tokens = content.split()
         
         # First chunk: role
         yield ChatCompletionChunk(
@@ -187,20 +391,23 @@ class FakeProvider(LLMProvider):
             ],
         )
         
-        # Content chunks
-        for i, token in enumerate(tokens):
-            token_content = f" {token}" if i > 0 else token
+        # Content chunks, or tool-call deltas (WBS-PERF11)
+        if tool_call:
+            deltas = [ChunkDelta(tool_calls=[d]) for d in self._tool_call_deltas(request)]
+        else:
+            tokens = self._generate_response_content(request).split()
+            deltas = [
+                ChunkDelta(content=f" {token}" if i > 0 else token)
+                for i, token in enumerate(tokens)
+            ]
+        for i, delta in enumerate(deltas):
+            if token_delay and i > 0:
+                await asyncio.sleep(token_delay)
             yield ChatCompletionChunk(
                 id=response_id,
                 created=created,
                 model=request.model,
-                choices=[
-                    ChunkChoice(
-                        index=0,
-                        delta=ChunkDelta(content=token_content),
-                        finish_reason=None,
-                    )
-                ],
+                choices=[ChunkChoice(index=0, delta=delta, finish_reason=None)],
             )
         
         # Final chunk: finish_reason
@@ -212,7 +419,7 @@ class FakeProvider(LLMProvider):
                 ChunkChoice(
                     index=0,
                     delta=ChunkDelta(),
-                    finish_reason="stop",
+                    finish_reason="tool_calls" if tool_call else "stop",
                 )
             ],
         )
@@ -225,12 +432,92 @@ class FakeProvider(LLMProvider):
         """Return list of supported models."""
         return self.supported_models.copy()
     
+    def profile_for(self, model: str) -> SimulationProfile | None:
+        """Simulation profile for a model (None = respond instantly)."""
+        return self.profiles.get(model, self.default_profile)
+
+    async def _simulate_request(self, profile: SimulationProfile) -> None:
+        """
+        Apply a profile's failure rates and time to first token.
+
+        Raises:
+            RateLimitError: With Retry-After, at ``rate_limit_rate``
+            ProviderError: 503 after the latency, at ``error_rate``
+        """
+        roll = self._rng.random()
+        if roll < profile.rate_limit_rate:
+            raise RateLimitError(
+                f"Simulated rate limit from {self.name}",
+                retry_after=profile.retry_after_seconds,
+            )
+        await asyncio.sleep(profile.latency.sample(self._rng))
+        if roll < profile.rate_limit_rate + profile.error_rate:
+            raise ProviderError(
+                f"Simulated upstream error from {self.name}",
+                provider=self.name,
+                status_code=503,
+            )
+
+    def _wants_tool_call(self, profile: SimulationProfile, request: ChatCompletionRequest) -> bool:
+        """Whether to answer with a tool call instead of text."""
+        if not request.tools or not profile.tool_call_rate:
+            return False
+        if request.messages and request.messages[-1].role == "tool":
+            return False
+        return self._rng.random() < profile.tool_call_rate
+
+    def _tool_call_response(self, request: ChatCompletionRequest) -> ChatCompletionResponse:
+        """Response calling the first offered tool with empty arguments."""
+        name = request.tools[0].function.name
+        return ChatCompletionResponse(
+            id=f"chatcmpl-fake-{uuid.uuid4().hex[:12]}",
+            object="chat.completion",
+            created=int(time.time()),
+            model=request.model,
+            choices=[
+                Choice(
+                    index=0,
+                    message=ChoiceMessage(
+                        role="assistant",
+                        content=None,
+                        tool_calls=[
+                            {
+                                "id": f"call_{uuid.uuid4().hex[:12]}",
+                                "type": "function",
+                                "function": {"name": name, "arguments": "{}"},
+                            }
+                        ],
+                    ),
+                    finish_reason="tool_calls",
+                )
+            ],
+            usage=Usage(prompt_tokens=0, completion_tokens=8, total_tokens=8),
+        )
+
+    def _tool_call_deltas(self, request: ChatCompletionRequest) -> list[dict[str, Any]]:
+        """Streamed form of _tool_call_response: name first, then argument fragments."""
+        deltas: list[dict[str, Any]] = [
+            {
+                "index": 0,
+                "id": f"call_{uuid.uuid4().hex[:12]}",
+                "type": "function",
+                "function": {"name": request.tools[0].function.name, "arguments": ""},
+            }
+        ]
+        for fragment in ("{", "}"):
+            deltas.append({"index": 0, "function": {"arguments": fragment}})
+        return deltas
+
     def _generate_response_content(self, request: ChatCompletionRequest) -> str:
         """
         Generate response content based on the request.
         
         Can be overridden in subclasses for custom behavior.
         """
+        profile = self.profile_for(request.model)
+        if profile is not None and profile.response_tokens:
+            count = profile.response_tokens
+            return " ".join(_FILLER_WORDS[i % len(_FILLER_WORDS)] for i in range(count))
         # Find last user message
         last_user_message = None
         for msg in reversed(request.messages):
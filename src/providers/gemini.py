@@ -25,10 +25,11 @@ import os
 import time
 import uuid
 from collections.abc import AsyncIterator
-from typing import Any
+from typing import Any, Optional
 
 import httpx
 
+from src.clients.http import create_traced_transport
 from src.core.exceptions import (
     AuthenticationError,
     ProviderError,
@@ -263,7 +264,9 @@ class GeminiProvider(LLMProvider):
         self._retry_delay = retry_delay
         self._api_base = api_base or GEMINI_API_BASE
         self._tool_handler = GeminiToolHandler()
-        self._client = httpx.AsyncClient(timeout=120.0)
+        self._client = httpx.AsyncClient(
+            timeout=120.0, transport=create_traced_transport("gemini")
+        )
 
     async def __aenter__(self) -> "GeminiProvider":
         """Async context manager entry."""
@@ -390,27 +393,28 @@ class GeminiProvider(LLMProvider):
                 error_text = await response.aread()
                 self._handle_error_response(response.status_code, error_text.decode())
 
+            # WBS-PERF8: usageMetadata is cumulative; the last one is reported
+            # on the final chunk so streamed calls are billed
+            usage: Optional[Usage] = None
             async for line in response.aiter_lines():
-                chunk = self._process_stream_line(line, response_id, model, created)
-                if chunk is None:
+                chunk_data = self._process_stream_line(line)
+                if chunk_data is None:
                     continue
-                if chunk == "DONE":
-                    yield self._create_final_chunk(response_id, model, created)
+                if chunk_data == "DONE":
                     break
-                yield chunk
+                if "usageMetadata" in chunk_data:
+                    usage = self._transform_usage(chunk_data)
+                text = self._extract_streaming_text(chunk_data)
+                if text:
+                    yield self._create_content_chunk(response_id, model, created, text)
+            yield self._create_final_chunk(response_id, model, created, usage)
 
-    def _process_stream_line(
-        self,
-        line: str,
-        response_id: str,
-        model: str,
-        created: int,
-    ) -> ChatCompletionChunk | str | None:
+    def _process_stream_line(self, line: str) -> dict[str, Any] | str | None:
         """
-        Process a single SSE line from the stream.
+        Parse a single SSE line from the stream.
 
         Returns:
-            ChatCompletionChunk if content found, "DONE" if done, None to skip.
+            Parsed chunk data, "DONE" if done, None to skip.
         """
         if not line or not line.startswith("data: "):
             return None
@@ -420,13 +424,9 @@ class GeminiProvider(LLMProvider):
             return "DONE"
 
         try:
-            chunk_data = json.loads(data_str)
-            text = self._extract_streaming_text(chunk_data)
-            if text:
-                return self._create_content_chunk(response_id, model, created, text)
+            return json.loads(data_str)
         except json.JSONDecodeError:
             logger.warning(f"Failed to parse streaming chunk: {data_str[:100]}")
-
         return None
 
     def _create_content_chunk(
@@ -455,8 +455,9 @@ class GeminiProvider(LLMProvider):
         response_id: str,
         model: str,
         created: int,
+        usage: Optional[Usage] = None,
     ) -> ChatCompletionChunk:
-        """Create the final chunk with finish_reason."""
+        """Create the final chunk with finish_reason and usage."""
         return ChatCompletionChunk(
             id=response_id,
             model=model,
@@ -468,6 +469,7 @@ class GeminiProvider(LLMProvider):
                     finish_reason="stop",
                 )
             ],
+            usage=usage,
         )
 
     # =========================================================================
@@ -723,13 +725,7 @@ class GeminiProvider(LLMProvider):
             )
             finish_reason = "tool_calls"
 
-        # Extract usage metadata
-        usage_metadata = response_data.get("usageMetadata", {})
-        usage = Usage(
-            prompt_tokens=usage_metadata.get("promptTokenCount", 0),
-            completion_tokens=usage_metadata.get("candidatesTokenCount", 0),
-            total_tokens=usage_metadata.get("totalTokenCount", 0),
-        )
+        usage = self._transform_usage(response_data)
 
         return ChatCompletionResponse(
             id=response_id,
@@ -765,6 +761,21 @@ class GeminiProvider(LLMProvider):
         }
         return mapping.get(gemini_reason, "stop")
 
+    def _transform_usage(self, response_data: dict[str, Any]) -> Usage:
+        """
+        Extract usage metadata.
+
+        ``cachedContentTokenCount`` (part of the prompt count) becomes
+        ``cache_read_tokens``.
+        """
+        usage_metadata = response_data.get("usageMetadata", {})
+        return Usage(
+            prompt_tokens=usage_metadata.get("promptTokenCount", 0),
+            completion_tokens=usage_metadata.get("candidatesTokenCount", 0),
+            total_tokens=usage_metadata.get("totalTokenCount", 0),
+            cache_read_tokens=usage_metadata.get("cachedContentTokenCount") or None,
+        )
+
     def _extract_streaming_text(self, chunk_data: dict[str, Any]) -> str:
         """
         Extract text from a streaming chunk.
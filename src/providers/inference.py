@@ -18,6 +18,7 @@ from typing import Any, AsyncIterator
 
 import httpx
 
+from src.clients.http import create_traced_transport
 from src.providers.base import LLMProvider
 from src.models.requests import ChatCompletionRequest
 from src.models.responses import ChatCompletionResponse, ChatCompletionChunk
@@ -123,6 +124,7 @@ class InferenceServiceProvider(LLMProvider):
             self._client = httpx.AsyncClient(
                 base_url=self._base_url,
                 timeout=self._timeout,
+                transport=create_traced_transport("inference-service"),
             )
         return self._client
     
@@ -132,6 +134,7 @@ class InferenceServiceProvider(LLMProvider):
             self._proxy_client = httpx.AsyncClient(
                 base_url=self._cms_url,
                 timeout=self._timeout,
+                transport=create_traced_transport("cms"),
             )
         return self._proxy_client
     
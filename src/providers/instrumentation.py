@@ -0,0 +1,281 @@
+"""
+Provider Call Instrumentation - WBS-PERF7
+
+This module wraps an LLMProvider so that every ``complete()`` and
+``stream()`` call records, per provider and model:
+
+- Total latency and request/error counts
+- Time to first token (TTFT) and inter-token latency for streams
+- Output tokens per second
+- Prompt/completion token counts and estimated cost (prompt-cache reads
+  and writes priced at their own rates)
+- An OpenTelemetry span (child of the request span, and parent of the
+  outbound HTTP spans made during the call)
+- Usage forwarded to an optional ``on_usage`` callback (WBS-PERF8 cost
+  aggregation)
+
+Streams report usage from the provider's final chunk when present
+(OpenAI-compatible adapters request it with ``stream_options``). When a
+provider sends none, prompt and completion tokens are estimated from
+message and output characters and the Usage is flagged ``estimated``.
+
+Reference Documents:
+- GUIDELINES pp. 2309-2319: Prometheus metrics, token usage and cost tracking
+- GUIDELINES p. 2149: Token generation and streaming patterns
+- OpenTelemetry semantic conventions for GenAI (gen_ai.* attributes)
+
+Pattern: Decorator (wraps the provider without changing its interface)
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+Anti-Pattern §4.1 Avoided: Cognitive complexity < 15 per function
+"""
+
+import math
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Optional
+
+from opentelemetry.trace import Span, Status, StatusCode, use_span
+
+from src.models.requests import ChatCompletionRequest
+from src.models.responses import ChatCompletionChunk, ChatCompletionResponse, Usage
+from src.observability.metrics import (
+    record_inter_token_latency,
+    record_output_tokens_per_second,
+    record_provider_error,
+    record_provider_latency,
+    record_provider_request,
+    record_provider_ttft,
+    record_request_cost,
+    record_token_usage,
+)
+from src.observability.tracing import get_tracer
+from src.providers.base import LLMProvider
+
+if TYPE_CHECKING:
+    from src.services.cost_tracker import PricingTable
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+CHARS_PER_TOKEN_ESTIMATE = 4
+"""Characters per token when a stream reports no usage (as ChatService estimates)."""
+
+MESSAGE_OVERHEAD_CHARS = 10
+"""Per-message allowance for role and formatting in the prompt estimate."""
+
+
+# =============================================================================
+# WBS-PERF7: Instrumented Provider
+# =============================================================================
+
+
+class InstrumentedProvider(LLMProvider):
+    """
+    LLMProvider decorator that records latency, throughput, usage and cost.
+
+    Example:
+        >>> provider = InstrumentedProvider(router.provider_for(route), route.provider)
+        >>> response = await provider.complete(request)
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        provider_name: str,
+        pricing: Optional["PricingTable"] = None,
+        on_usage: Optional[Callable[[str, Usage], None]] = None,
+    ) -> None:
+        """
+        Wrap a provider.
+
+        Args:
+            provider: The provider to instrument.
+            provider_name: Registry provider name used as the metric label.
+            pricing: Pricing lookup for cost (defaults to DEFAULT_PRICING_TABLE).
+            on_usage: Called with (model, usage) once per finished call;
+                must not block (e.g. CostAggregator.record).
+        """
+        if pricing is None:
+            # Import here to avoid circular import (services -> chat -> providers)
+            from src.services.cost_tracker import DEFAULT_PRICING_TABLE
+
+            pricing = DEFAULT_PRICING_TABLE
+        self.wrapped = provider
+        self.provider_name = provider_name
+        self._pricing = pricing
+        self._on_usage = on_usage
+        self._tracer = get_tracer(__name__)
+
+    async def complete(self, request: ChatCompletionRequest) -> ChatCompletionResponse:
+        """Call the wrapped provider's complete() with instrumentation."""
+        record_provider_request(self.provider_name)
+        with self._tracer.start_as_current_span(
+            "llm.complete", record_exception=False, set_status_on_exception=False
+        ) as span:
+            self._set_request_attributes(span, request)
+            start = time.perf_counter()
+            try:
+                response = await self.wrapped.complete(request)
+                self._record_usage(span, request.model, response.usage, time.perf_counter() - start)
+                return response
+            except Exception as e:
+                self._record_failure(span, e)
+                raise
+            finally:
+                record_provider_latency(self.provider_name, time.perf_counter() - start)
+
+    async def stream(self, request: ChatCompletionRequest) -> AsyncIterator[ChatCompletionChunk]:
+        """Call the wrapped provider's stream() with instrumentation."""
+        record_provider_request(self.provider_name)
+        span = self._tracer.start_span("llm.stream")
+        self._set_request_attributes(span, request)
+        model = request.model
+        start = time.perf_counter()
+        first_token_at: Optional[float] = None
+        last_token_at = start
+        content_chunks = 0
+        content_chars = 0
+        usage: Optional[Usage] = None
+
+        upstream = self.wrapped.stream(request)
+        try:
+            while True:
+                # Current only while pulling from upstream: a context attached
+                # across ``yield`` would leak into the consumer between chunks.
+                with use_span(
+                    span, end_on_exit=False, record_exception=False, set_status_on_exception=False
+                ):
+                    try:
+                        chunk = await upstream.__anext__()
+                    except StopAsyncIteration:
+                        break
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if _has_content(chunk):
+                    now = time.perf_counter()
+                    if first_token_at is None:
+                        first_token_at = now
+                        record_provider_ttft(self.provider_name, model, now - start)
+                        span.set_attribute("llm.time_to_first_token_ms", (now - start) * 1000)
+                    else:
+                        record_inter_token_latency(self.provider_name, model, now - last_token_at)
+                    last_token_at = now
+                    content_chunks += 1
+                    content_chars += _content_chars(chunk)
+                yield chunk
+        except Exception as e:
+            self._record_failure(span, e)
+            raise
+        finally:
+            aclose = getattr(upstream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            elapsed = time.perf_counter() - start
+            record_provider_latency(self.provider_name, elapsed)
+            if usage is None:
+                usage = _estimate_usage(request, content_chunks, content_chars)
+                span.set_attribute("llm.usage_estimated", True)
+            generation = elapsed - (first_token_at - start) if first_token_at else elapsed
+            self._record_usage(span, model, usage, generation)
+            span.end()
+
+    def supports_model(self, model: str) -> bool:
+        """Delegate to the wrapped provider."""
+        return self.wrapped.supports_model(model)
+
+    def get_supported_models(self) -> list[str]:
+        """Delegate to the wrapped provider."""
+        return self.wrapped.get_supported_models()
+
+    def __getattr__(self, name: str) -> Any:
+        """Expose provider-specific attributes of the wrapped provider."""
+        if name == "wrapped":
+            raise AttributeError(name)
+        return getattr(self.wrapped, name)
+
+    # =========================================================================
+    # Helpers
+    # =========================================================================
+
+    def _set_request_attributes(self, span: Span, request: ChatCompletionRequest) -> None:
+        """Describe the request on a provider call span."""
+        span.set_attribute("gen_ai.system", self.provider_name)
+        span.set_attribute("gen_ai.request.model", request.model)
+        if request.max_tokens is not None:
+            span.set_attribute("gen_ai.request.max_tokens", request.max_tokens)
+
+    def _record_failure(self, span: Span, error: Exception) -> None:
+        """Record a failed provider call."""
+        record_provider_error(self.provider_name, type(error).__name__)
+        span.record_exception(error)
+        span.set_status(Status(StatusCode.ERROR, str(error)))
+
+    def _record_usage(
+        self, span: Span, model: str, usage: Usage, generation_seconds: float
+    ) -> None:
+        """Record token counts, throughput and cost for a finished call."""
+        prompt_tokens = usage.prompt_tokens
+        completion_tokens = usage.completion_tokens
+        if prompt_tokens:
+            record_token_usage(self.provider_name, model, "prompt", prompt_tokens)
+        if completion_tokens:
+            record_token_usage(self.provider_name, model, "completion", completion_tokens)
+            if generation_seconds > 0:
+                record_output_tokens_per_second(
+                    self.provider_name, model, completion_tokens / generation_seconds
+                )
+        cost = self._pricing.calculate_cost(
+            model,
+            prompt_tokens,
+            completion_tokens,
+            usage.cache_read_tokens or 0,
+            usage.cache_write_tokens or 0,
+        )
+        if cost > 0:
+            record_request_cost(self.provider_name, model, cost)
+        span.set_attribute("gen_ai.usage.input_tokens", prompt_tokens)
+        span.set_attribute("gen_ai.usage.output_tokens", completion_tokens)
+        span.set_attribute("llm.cost_usd", cost)
+        if self._on_usage is not None:
+            self._on_usage(model, usage)
+
+
+def _estimate_usage(
+    request: ChatCompletionRequest, content_chunks: int, content_chars: int
+) -> Usage:
+    """
+    Estimate usage for a stream whose provider reported none.
+
+    Completion tokens are at least one per content chunk, which is how
+    most providers stream.
+    """
+    prompt_chars = sum(
+        len(message.content or "") + MESSAGE_OVERHEAD_CHARS for message in request.messages
+    )
+    prompt_tokens = math.ceil(prompt_chars / CHARS_PER_TOKEN_ESTIMATE)
+    completion_tokens = max(content_chunks, math.ceil(content_chars / CHARS_PER_TOKEN_ESTIMATE))
+    return Usage(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+        estimated=True,
+    )
+
+
+def _content_chars(chunk: ChatCompletionChunk) -> int:
+    """Characters of generated text and tool-call arguments in a chunk."""
+    chars = 0
+    for choice in chunk.choices:
+        chars += len(choice.delta.content or "")
+        for tool_call in choice.delta.tool_calls or ():
+            chars += len((tool_call.get("function") or {}).get("arguments") or "")
+    return chars
+
+
+def _has_content(chunk: ChatCompletionChunk) -> bool:
+    """Whether a chunk carries generated text or tool-call deltas."""
+    for choice in chunk.choices:
+        if choice.delta.content or choice.delta.tool_calls:
+            return True
+    return False
@@ -29,6 +29,7 @@ from typing import Any, AsyncIterator, Optional
 
 import httpx
 
+from src.clients.http import create_traced_transport
 from src.models.requests import ChatCompletionRequest
 from src.models.responses import (
     ChatCompletionResponse,
@@ -155,9 +156,12 @@ class OllamaProvider(LLMProvider):
         if self._client is None:
             self._client = httpx.AsyncClient(
                 timeout=self._timeout,
-                limits=httpx.Limits(
-                    max_keepalive_connections=5,
-                    max_connections=10,
+                transport=create_traced_transport(
+                    "ollama",
+                    limits=httpx.Limits(
+                        max_keepalive_connections=5,
+                        max_connections=10,
+                    ),
                 ),
             )
         return self._client
@@ -16,14 +16,21 @@ Design Patterns:
 - Ports and Adapters: OpenAIProvider implements LLMProvider interface
 - Retry with Exponential Backoff: For rate limit and transient errors
 - Adapter Pattern: Transforms OpenAI SDK responses to our response models
+
+WBS-PERF24: Native Batch API
+- /v1/batches lines for OpenAI models can run through the Batch API
+  (Files upload + batches.create), billed at half the synchronous price
 """
 
 import asyncio
+import json
 from collections.abc import AsyncIterator
-from typing import Any
+from typing import Any, Optional
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from openai.types.chat import ChatCompletion
 
+from src.clients.http import get_shared_transport
 from src.core.exceptions import (
     AuthenticationError,
     ProviderError,
@@ -40,12 +47,31 @@ from src.models.responses import (
     Usage,
 )
 from src.providers.base import LLMProvider
+from src.providers.batch import (
+    NATIVE_BATCH_ENDED,
+    NATIVE_BATCH_FAILED,
+    NATIVE_BATCH_IN_PROGRESS,
+    NativeBatchProvider,
+    NativeBatchResult,
+)
 
 # =============================================================================
 # WBS 2.3.3.1.10: Supported Models
 # =============================================================================
 
 
+# WBS-PERF24: Batch API status -> NativeBatchProvider status
+_BATCH_STATUS = {
+    "validating": NATIVE_BATCH_IN_PROGRESS,
+    "in_progress": NATIVE_BATCH_IN_PROGRESS,
+    "finalizing": NATIVE_BATCH_IN_PROGRESS,
+    "cancelling": NATIVE_BATCH_IN_PROGRESS,
+    "completed": NATIVE_BATCH_ENDED,
+    "expired": NATIVE_BATCH_ENDED,
+    "cancelled": NATIVE_BATCH_ENDED,
+    "failed": NATIVE_BATCH_FAILED,
+}
+
 # Registered models only — must match config/model_registry.yaml (external_owned)
 SUPPORTED_MODELS = [
     "gpt-5.2",
@@ -131,7 +157,7 @@ class OpenAIToolHandler:
 # =============================================================================
 
 
-class OpenAIProvider(LLMProvider):
+class OpenAIProvider(LLMProvider, NativeBatchProvider):
     """
     OpenAI GPT provider adapter.
 
@@ -181,7 +207,14 @@ class OpenAIProvider(LLMProvider):
         self._tool_handler = OpenAIToolHandler()
 
         # Initialize client
-        client_kwargs: dict[str, Any] = {"api_key": api_key}
+        # WBS-PERF13: Trace-propagating transport for upstream calls
+        # WBS-PERF16: Pool shared with /v1/responses
+        client_kwargs: dict[str, Any] = {
+            "api_key": api_key,
+            "http_client": DefaultAsyncHttpxClient(
+                transport=get_shared_transport("openai")
+            ),
+        }
         if base_url:
             client_kwargs["base_url"] = base_url
         self._client = AsyncOpenAI(**client_kwargs)
@@ -271,6 +304,8 @@ class OpenAIProvider(LLMProvider):
         # Build request kwargs
         kwargs = self._build_request_kwargs(request)
         kwargs["stream"] = True
+        # WBS-PERF8: Final chunk carries usage so streamed calls are billed
+        kwargs["stream_options"] = {"include_usage": True}
 
         # Get stream - OpenAI returns an async generator directly (not awaitable)
         stream = self._client.chat.completions.create(**kwargs)
@@ -509,6 +544,87 @@ class OpenAIProvider(LLMProvider):
 
         return params
 
+    # =========================================================================
+    # WBS-PERF24: Native Batch API
+    # =========================================================================
+
+    async def submit_batch(self, requests: list[tuple[str, ChatCompletionRequest]]) -> str:
+        """
+        Upload requests as a JSONL file and create a 24h Batch API job.
+
+        Args:
+            requests: (custom_id, request) pairs.
+
+        Returns:
+            The OpenAI batch id.
+        """
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._build_request_kwargs(request),
+                }
+            )
+            for custom_id, request in requests
+        ]
+        uploaded = await self._execute_with_retry(
+            self._client.files.create,
+            file=("batch.jsonl", "\n".join(lines).encode(), "application/jsonl"),
+            purpose="batch",
+        )
+        batch = await self._execute_with_retry(
+            self._client.batches.create,
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def get_batch_status(self, batch_id: str) -> str:
+        """Map the Batch API status onto NativeBatchProvider statuses."""
+        batch = await self._execute_with_retry(self._client.batches.retrieve, batch_id=batch_id)
+        return _BATCH_STATUS.get(batch.status, NATIVE_BATCH_IN_PROGRESS)
+
+    async def iter_batch_results(self, batch_id: str) -> AsyncIterator[NativeBatchResult]:
+        """
+        Read the output and error files of an ended batch.
+
+        Expired and cancelled requests appear in the error file, so every
+        submitted custom_id is reported.
+        """
+        batch = await self._execute_with_retry(self._client.batches.retrieve, batch_id=batch_id)
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await self._execute_with_retry(self._client.files.content, file_id=file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    yield self._transform_batch_line(json.loads(line))
+
+    async def cancel_batch(self, batch_id: str) -> None:
+        """Cancel a Batch API job."""
+        await self._execute_with_retry(self._client.batches.cancel, batch_id=batch_id)
+
+    def _transform_batch_line(self, record: dict[str, Any]) -> NativeBatchResult:
+        """Transform one Batch API output line to a NativeBatchResult."""
+        response = record.get("response") or {}
+        body = response.get("body") or {}
+        if response.get("status_code") == 200:
+            return NativeBatchResult(
+                custom_id=record["custom_id"],
+                response=self._transform_response(ChatCompletion.model_validate(body)),
+            )
+        error = record.get("error") or body.get("error") or {}
+        return NativeBatchResult(
+            custom_id=record["custom_id"],
+            error={
+                "code": error.get("code") or str(response.get("status_code", "unknown")),
+                "message": error.get("message", "Batch request failed"),
+            },
+        )
+
     # =========================================================================
     # Helper Methods
     # =========================================================================
@@ -618,11 +734,7 @@ class OpenAIProvider(LLMProvider):
             created=response.created,
             model=response.model,
             choices=choices,
-            usage=Usage(
-                prompt_tokens=response.usage.prompt_tokens,
-                completion_tokens=response.usage.completion_tokens,
-                total_tokens=response.usage.total_tokens,
-            ),
+            usage=openai_usage(response.usage),
             system_fingerprint=response.system_fingerprint,
         )
 
@@ -644,6 +756,7 @@ class OpenAIProvider(LLMProvider):
             if hasattr(delta, "tool_calls") and delta.tool_calls:
                 tool_calls = [
                     {
+                        "index": getattr(tc, "index", None),
                         "id": getattr(tc, "id", None),
                         "type": getattr(tc, "type", None),
                         "function": {
@@ -676,4 +789,33 @@ class OpenAIProvider(LLMProvider):
             model=chunk.model,
             choices=choices,
             system_fingerprint=getattr(chunk, "system_fingerprint", None),
+            usage=openai_usage(getattr(chunk, "usage", None)),
         )
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def openai_usage(usage: Any) -> Optional[Usage]:
+    """
+    Convert an OpenAI-format usage object (also used by OpenAI-compatible APIs).
+
+    Cached prompt tokens (``prompt_tokens_details.cached_tokens``) become
+    ``cache_read_tokens`` so they are priced at the cache-read rate.
+
+    Returns:
+        Usage, or None when the object carries no usage (stream chunks
+        before the last).
+    """
+    if usage is None:
+        return None
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None)
+    return Usage(
+        prompt_tokens=usage.prompt_tokens or 0,
+        completion_tokens=usage.completion_tokens or 0,
+        total_tokens=usage.total_tokens or 0,
+        cache_read_tokens=cached if isinstance(cached, int) and cached > 0 else None,
+    )
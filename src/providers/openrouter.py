@@ -22,8 +22,9 @@ import logging
 from collections.abc import AsyncIterator
 from typing import Any
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
+from src.clients.http import PROVIDER_SDK_CONNECTION_LIMITS, create_traced_transport
 from src.core.exceptions import (
     AuthenticationError,
     ProviderError,
@@ -40,6 +41,7 @@ from src.models.responses import (
     Usage,
 )
 from src.providers.base import LLMProvider
+from src.providers.openai import openai_usage
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +97,11 @@ class OpenRouterProvider(LLMProvider):
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            http_client=DefaultAsyncHttpxClient(
+                transport=create_traced_transport(
+                    "openrouter", limits=PROVIDER_SDK_CONNECTION_LIMITS
+                )
+            ),
         )
         
         logger.info(f"Initialized OpenRouterProvider with base_url={base_url}")
@@ -176,6 +183,8 @@ class OpenRouterProvider(LLMProvider):
             # Build request parameters with streaming enabled
             params = self._build_request_params(request)
             params["stream"] = True
+            # WBS-PERF8: Final chunk carries usage so streamed calls are billed
+            params["stream_options"] = {"include_usage": True}
             
             # Create streaming response
             stream = await self._client.chat.completions.create(**params)
@@ -319,6 +328,7 @@ class OpenRouterProvider(LLMProvider):
             created=chunk.created,
             model=model,
             choices=choices,
+            usage=openai_usage(getattr(chunk, "usage", None)),
         )
 
     def _transform_chunk_choice(self, choice) -> ChunkChoice:
@@ -348,6 +358,7 @@ class OpenRouterProvider(LLMProvider):
             return None
         return [
             {
+                "index": getattr(tc, "index", None),
                 "id": getattr(tc, "id", None),
                 "type": getattr(tc, "type", None),
                 "function": {
@@ -0,0 +1,239 @@
+"""
+Anthropic Prompt Caching - WBS-PERF3 Automatic Cache Breakpoints
+
+This module decides where to place Anthropic ``cache_control`` breakpoints
+so that large, repeated prefixes (tool definitions, system prompt, early
+conversation history) are served from the provider's prompt cache instead
+of being re-processed at full price and latency on every call.
+
+Anthropic caches prefixes in the order tools -> system -> messages. The
+planner walks that order, hashing the request prefix incrementally, and
+considers a breakpoint at the end of each segment:
+
+1. The last tool definition
+2. The system prompt
+3. The last message before the final turn (stable history)
+
+A breakpoint is inserted only when the prefix is large enough to be
+cacheable (minimum token count). Tool and system breakpoints also require
+the prefix to have been seen recently enough times that the 25%
+cache-write premium is likely to pay off. Prefix sightings are tracked in a
+bounded LRU keyed by SHA-256, expiring with the provider's 5-minute
+ephemeral cache lifetime.
+
+The history prefix is new on every turn, so it would never reach
+``min_sightings``. It is marked on size alone: the next turn of the same
+conversation extends it and reads it back from the cache.
+
+Reference Documents:
+- Anthropic API Docs: Prompt caching (cache_control, ephemeral, 4 breakpoints)
+- GUIDELINES pp. 2309: Cost tracking and token usage
+- GUIDELINES pp. 2153: Caching strategies for repeated computation
+
+Pattern: Policy object (cache placement decisions separated from transport)
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+Anti-Pattern §4.1 Avoided: Cognitive complexity < 15 per function
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+EPHEMERAL_CACHE_CONTROL: dict[str, str] = {"type": "ephemeral"}
+"""cache_control marker for Anthropic's ephemeral (5 minute) prompt cache."""
+
+MAX_CACHE_BREAKPOINTS: int = 4
+"""Maximum cache_control blocks Anthropic accepts per request."""
+
+DEFAULT_MIN_CACHEABLE_TOKENS: int = 1024
+"""Smallest prefix Anthropic will cache for Sonnet/Opus models."""
+
+DEFAULT_MIN_SIGHTINGS: int = 2
+"""Sightings (including the current request) before a breakpoint is placed."""
+
+DEFAULT_PREFIX_TTL_SECONDS: float = 300.0
+"""Prefix sightings expire with the ephemeral cache lifetime."""
+
+DEFAULT_MAX_TRACKED_PREFIXES: int = 4096
+"""Upper bound on tracked prefix hashes (LRU eviction)."""
+
+_CHARS_PER_TOKEN = 4
+
+
+# =============================================================================
+# WBS-PERF3: Prefix Tracker
+# =============================================================================
+
+
+class PrefixTracker:
+    """
+    Bounded LRU of recently seen prefix hashes with sighting counts.
+
+    Attributes:
+        ttl_seconds: Sightings older than this are forgotten.
+        max_entries: Maximum number of tracked prefixes.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_PREFIX_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_TRACKED_PREFIXES,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[int, float]] = OrderedDict()
+
+    def observe(self, prefix_hash: str) -> int:
+        """
+        Record a sighting of ``prefix_hash``.
+
+        Args:
+            prefix_hash: Hex digest of the prefix.
+
+        Returns:
+            Number of sightings within the TTL, including this one.
+        """
+        now = time.monotonic()
+        count, last_seen = self._entries.pop(prefix_hash, (0, now))
+        if now - last_seen > self.ttl_seconds:
+            count = 0
+        count += 1
+        self._entries[prefix_hash] = (count, now)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return count
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# =============================================================================
+# WBS-PERF3: Prompt Cache Planner
+# =============================================================================
+
+
+class PromptCachePlanner:
+    """
+    Insert Anthropic cache_control breakpoints on stable request prefixes.
+
+    WBS-PERF3: Automatic prompt-caching breakpoints.
+
+    Pattern: Policy object applied to provider request kwargs
+    Reference: Anthropic API Docs - Prompt caching
+
+    Example:
+        >>> planner = PromptCachePlanner(min_tokens=1024)
+        >>> kwargs = planner.apply(kwargs)  # before messages.create(**kwargs)
+    """
+
+    def __init__(
+        self,
+        min_tokens: int = DEFAULT_MIN_CACHEABLE_TOKENS,
+        min_sightings: int = DEFAULT_MIN_SIGHTINGS,
+        tracker: Optional[PrefixTracker] = None,
+    ) -> None:
+        """
+        Initialize the planner.
+
+        Args:
+            min_tokens: Minimum estimated prefix tokens for a breakpoint.
+            min_sightings: Sightings within the TTL before caching a tool or
+                system prefix (1 = cache on first sight).
+            tracker: Optional prefix tracker (for testing/sharing).
+        """
+        self.min_tokens = min_tokens
+        self.min_sightings = min_sightings
+        self._tracker = tracker or PrefixTracker()
+
+    def apply(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Return request kwargs with cache breakpoints inserted.
+
+        The input dict is not mutated; modified segments are shallow-copied.
+
+        Args:
+            kwargs: Anthropic messages.create() kwargs.
+
+        Returns:
+            Kwargs with cache_control markers on worthwhile prefixes.
+        """
+        hasher = hashlib.sha256(str(kwargs.get("model", "")).encode("utf-8"))
+        prefix_chars = 0
+        result = dict(kwargs)
+        placed = 0
+
+        tools = kwargs.get("tools")
+        if tools:
+            prefix_chars += self._update(hasher, tools)
+            if self._worthwhile(hasher, prefix_chars):
+                result["tools"] = [*tools[:-1], _with_cache_control(tools[-1])]
+                placed += 1
+
+        system = kwargs.get("system")
+        if system:
+            prefix_chars += self._update(hasher, system)
+            if self._worthwhile(hasher, prefix_chars):
+                result["system"] = _mark_content(system)
+                placed += 1
+
+        messages = kwargs.get("messages") or []
+        history = messages[:-1]
+        if history and placed < MAX_CACHE_BREAKPOINTS:
+            prefix_chars += self._update(hasher, history)
+            last = history[-1]
+            if last.get("content") and self._cacheable(prefix_chars):
+                marked = {**last, "content": _mark_content(last.get("content", ""))}
+                result["messages"] = [*history[:-1], marked, messages[-1]]
+
+        return result
+
+    def _update(self, hasher: Any, segment: Any) -> int:
+        """Feed a segment into the running hash; return its size in chars."""
+        encoded = json.dumps(segment, sort_keys=True, default=str).encode("utf-8")
+        hasher.update(encoded)
+        return len(encoded)
+
+    def _cacheable(self, prefix_chars: int) -> bool:
+        """Whether a prefix is large enough for the provider to cache."""
+        return prefix_chars // _CHARS_PER_TOKEN >= self.min_tokens
+
+    def _worthwhile(self, hasher: Any, prefix_chars: int) -> bool:
+        """Whether the repeated prefix ending here deserves a breakpoint."""
+        if not self._cacheable(prefix_chars):
+            return False
+        return self._tracker.observe(hasher.hexdigest()) >= self.min_sightings
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _with_cache_control(block: dict[str, Any]) -> dict[str, Any]:
+    """Copy a block with an ephemeral cache_control marker."""
+    return {**block, "cache_control": dict(EPHEMERAL_CACHE_CONTROL)}
+
+
+def _mark_content(content: Any) -> list[dict[str, Any]]:
+    """
+    Convert system/message content to blocks with cache_control on the last.
+
+    Args:
+        content: String content or list of content blocks.
+
+    Returns:
+        List of content blocks.
+    """
+    if isinstance(content, str):
+        return [_with_cache_control({"type": "text", "text": content})]
+    blocks = list(content)
+    if blocks:
+        blocks[-1] = _with_cache_control(blocks[-1])
+    return blocks
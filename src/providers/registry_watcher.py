@@ -0,0 +1,193 @@
+"""
+Model Registry Watcher - WBS-PERF6 Hot-Reloadable Model Registry
+
+This module watches config/model_registry.yaml and, when it changes,
+parses and validates it off the event loop, compiles a new immutable
+RegistrySnapshot and swaps it into every tracked ProviderRouter.
+
+Properties:
+- Parsing/validation runs in a worker thread (asyncio.to_thread)
+- An invalid file is logged and counted; the previous snapshot stays live
+- The swap is a single attribute assignment, so in-flight requests keep
+  the route they already resolved
+- Provider instances (and their pooled SDK clients) are never rebuilt;
+  only routing tables change. New API keys still require a restart.
+
+Reference Documents:
+- Microservices Patterns Ch.27: API Gateway routing map
+- GUIDELINES pp. 2145: Graceful degradation (keep last good config)
+
+Pattern: Copy-on-write configuration snapshot
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+Anti-Pattern §4.1 Avoided: Cognitive complexity < 15 per function
+"""
+
+import asyncio
+import logging
+import weakref
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+from src.observability.metrics import record_registry_reload
+from src.providers.router import (
+    _REGISTRY_PATH,
+    ProviderRouter,
+    RegistryValidationError,
+    load_registry_snapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_REGISTRY_POLL_INTERVAL_SECONDS: float = 5.0
+"""Default interval between registry file mtime checks."""
+
+
+def _file_mtime(path: Path) -> Optional[float]:
+    """Return the file's mtime, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+# =============================================================================
+# WBS-PERF6: RegistryWatcher
+# =============================================================================
+
+
+class RegistryWatcher:
+    """
+    Poll the model registry file and hot-swap router snapshots on change.
+
+    Routers created by create_provider_router() are tracked automatically
+    (weakly, so discarded routers are not kept alive).
+
+    Example:
+        >>> watcher = get_registry_watcher()
+        >>> await watcher.start(poll_interval=5.0)
+        >>> ...
+        >>> await watcher.stop()
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            path: Registry YAML path. Defaults to config/model_registry.yaml.
+        """
+        self._path = path or _REGISTRY_PATH
+        self._routers: "weakref.WeakSet[ProviderRouter]" = weakref.WeakSet()
+        self._mtime: Optional[float] = _file_mtime(self._path)
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the polling task is active."""
+        return self._task is not None and not self._task.done()
+
+    def track(self, router: ProviderRouter) -> None:
+        """Swap snapshots into ``router`` on future reloads."""
+        self._routers.add(router)
+
+    async def start(self, poll_interval: float = DEFAULT_REGISTRY_POLL_INTERVAL_SECONDS) -> None:
+        """Start polling the registry file (no-op if already running)."""
+        if self.running:
+            return
+        self._mtime = await asyncio.to_thread(_file_mtime, self._path)
+        self._task = asyncio.create_task(self._poll(poll_interval))
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def check(self) -> bool:
+        """
+        Reload if the registry file's mtime changed.
+
+        Returns:
+            True if a new snapshot was swapped in.
+        """
+        mtime = await asyncio.to_thread(_file_mtime, self._path)
+        if mtime is None or mtime == self._mtime:
+            return False
+        self._mtime = mtime
+        return await self.reload()
+
+    async def reload(self) -> bool:
+        """
+        Parse, validate and swap in the registry unconditionally.
+
+        Returns:
+            True on success; False if the file was invalid (old snapshot kept).
+        """
+        try:
+            snapshot = await asyncio.to_thread(load_registry_snapshot, self._path)
+        except (OSError, yaml.YAMLError, RegistryValidationError) as e:
+            logger.error("Model registry reload failed, keeping previous snapshot: %s", e)
+            record_registry_reload("error")
+            return False
+
+        routers = list(self._routers)
+        for router in routers:
+            router.swap_snapshot(snapshot)
+        record_registry_reload("success")
+        logger.info(
+            "Model registry reloaded: %d registered models, %d routers updated",
+            len(snapshot.registered_models),
+            len(routers),
+        )
+        return True
+
+    async def _poll(self, poll_interval: float) -> None:
+        """Polling loop; errors never kill the task."""
+        while True:
+            await asyncio.sleep(poll_interval)
+            try:
+                await self.check()
+            except Exception as e:  # pragma: no cover - defensive
+                logger.warning("Model registry check failed: %s", e)
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+_watcher: Optional[RegistryWatcher] = None
+
+
+def get_registry_watcher() -> RegistryWatcher:
+    """
+    Get the global registry watcher instance.
+
+    Returns:
+        The global RegistryWatcher.
+    """
+    global _watcher
+    if _watcher is None:
+        _watcher = RegistryWatcher()
+    return _watcher
+
+
+def reset_registry_watcher() -> None:
+    """
+    Reset the global registry watcher.
+
+    Primarily used for testing to ensure a clean state.
+    """
+    global _watcher
+    _watcher = None
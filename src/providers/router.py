@@ -6,23 +6,35 @@ routing requests to the appropriate LLM provider based on model name.
 All routing data is loaded from config/model_registry.yaml at startup.
 The YAML is the SINGLE source of truth — no hardcoded model dicts.
 
+WBS-PERF6: Routing data lives in an immutable RegistrySnapshot that can be
+swapped atomically when the YAML changes (see registry_watcher.py).
+
 Reference: Microservices Patterns Ch.27 (API Gateway routing map pattern),
            MLflow gateway/config.py (YAML-driven provider routing)
 """
 
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 import yaml
 
+from src.observability.logging import LogSampler
 from src.providers.base import LLMProvider
+from src.providers.routing_table import ROUTE_SOURCE_ALIAS, ModelRoute, RoutingTable
 
 if TYPE_CHECKING:
     from src.core.config import Settings
 
 logger = logging.getLogger(__name__)
 
+ROUTE_LOG_SAMPLE_RATE: int = 100
+"""Per-request routing decisions are logged once per this many lookups."""
+
+# WBS-PERF4: get_provider() runs on every request - sample its INFO logs
+_route_log_sampler = LogSampler(rate=ROUTE_LOG_SAMPLE_RATE)
+
 # Path to the canonical model registry
 _REGISTRY_PATH = Path(__file__).parent.parent.parent / "config" / "model_registry.yaml"
 
@@ -132,6 +144,112 @@ class NoProviderError(Exception):
     pass
 
 
+class RegistryValidationError(ValueError):
+    """Raised when model_registry.yaml is structurally invalid."""
+
+    pass
+
+
+def _validate_registry(config: Any) -> dict[str, Any]:
+    """Validate the shape of a parsed registry before it is compiled.
+
+    Args:
+        config: Result of yaml.safe_load().
+
+    Returns:
+        The config, unchanged.
+
+    Raises:
+        RegistryValidationError: If a section has the wrong type.
+    """
+    if not isinstance(config, dict):
+        raise RegistryValidationError("Model registry must be a mapping")
+    providers = config.get("providers") or {}
+    if not isinstance(providers, dict):
+        raise RegistryValidationError("'providers' must be a mapping")
+    for name, provider_config in providers.items():
+        models = (provider_config or {}).get("models") or []
+        if not isinstance(models, list) or not all(isinstance(m, str) for m in models):
+            raise RegistryValidationError(f"providers.{name}.models must be a list of strings")
+    aliases = config.get("aliases") or {}
+    if not isinstance(aliases, dict) or not all(isinstance(v, str) for v in aliases.values()):
+        raise RegistryValidationError("'aliases' must map names to model strings")
+    if not isinstance(config.get("simulation") or {}, dict):
+        raise RegistryValidationError("'simulation' must be a mapping")
+    return config
+
+
+# =============================================================================
+# WBS-PERF6: Registry Snapshot
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class RegistrySnapshot:
+    """Immutable routing data compiled from one version of the registry.
+
+    ProviderRouter swaps its snapshot by a single attribute assignment, so
+    a request that already resolved its route is unaffected by a reload.
+
+    Attributes:
+        registered_models: Model name → provider name.
+        model_prefixes: Prefix → provider name.
+        aliases: Alias → default model name.
+        routes: Compiled RoutingTable.
+        routing_default: YAML routing_default (None = reject unknown).
+    """
+
+    registered_models: dict[str, str]
+    model_prefixes: dict[str, str]
+    aliases: dict[str, str]
+    routes: RoutingTable
+    routing_default: Optional[str] = None
+
+
+def build_registry_snapshot(config: dict[str, Any]) -> RegistrySnapshot:
+    """Compile a parsed registry into a RegistrySnapshot.
+
+    Args:
+        config: Parsed (and validated) model_registry.yaml.
+
+    Returns:
+        The compiled snapshot.
+    """
+    registered = _build_registered_models(config)
+    prefixes = _build_prefix_map(config)
+    aliases = _build_aliases(config)
+    return RegistrySnapshot(
+        registered_models=registered,
+        model_prefixes=prefixes,
+        aliases=aliases,
+        # WBS-PERF5: Compile the tables into O(1) routes once
+        routes=RoutingTable(
+            registered, prefixes, aliases, providers_config=config.get("providers", {})
+        ),
+        routing_default=config.get("routing_default"),
+    )
+
+
+def load_registry_snapshot(path: Path | None = None) -> RegistrySnapshot:
+    """Load, validate and compile the registry YAML.
+
+    Blocking (file I/O + YAML parsing); run via asyncio.to_thread() when
+    called from the event loop.
+
+    Args:
+        path: Override path. Defaults to config/model_registry.yaml.
+
+    Returns:
+        The compiled snapshot.
+
+    Raises:
+        FileNotFoundError: If the registry YAML doesn't exist.
+        yaml.YAMLError: If the YAML is malformed.
+        RegistryValidationError: If the YAML has the wrong shape.
+    """
+    return build_registry_snapshot(_validate_registry(_load_model_registry(path)))
+
+
 class ProviderRouter:
     """Routes requests to appropriate LLM provider based on model name.
 
@@ -175,16 +293,47 @@ class ProviderRouter:
             logger.warning("Model registry YAML not found, using empty routing tables")
             config = {"providers": {}, "routing": [], "aliases": {}}
 
-        self.REGISTERED_MODELS = _build_registered_models(config)
-        self.MODEL_PREFIXES = _build_prefix_map(config)
-        self.PROVIDER_DEFAULTS = _build_aliases(config)
+        self._snapshot = build_registry_snapshot(config)
+        self._apply_routing_default()
 
-        # Respect YAML routing_default setting — null means NO default (reject unknown)
-        yaml_default = config.get("routing_default")
-        if yaml_default is None:
+    def _apply_routing_default(self) -> None:
+        """Respect YAML routing_default setting — null means NO default (reject unknown)."""
+        if self._snapshot.routing_default is None:
             # YAML says null → no silent fallback
             self._default_provider = None
 
+    def swap_snapshot(self, snapshot: RegistrySnapshot) -> None:
+        """Atomically replace the routing data.
+
+        WBS-PERF6: Provider instances (and their pooled SDK clients) are
+        kept; only the model → provider tables change.
+
+        Args:
+            snapshot: Newly compiled registry snapshot.
+        """
+        self._snapshot = snapshot
+        self._apply_routing_default()
+
+    @property
+    def snapshot(self) -> RegistrySnapshot:
+        """Get the current routing snapshot."""
+        return self._snapshot
+
+    @property
+    def REGISTERED_MODELS(self) -> dict[str, str]:  # noqa: N802 - historical public name
+        """Model name → provider name from the current snapshot."""
+        return self._snapshot.registered_models
+
+    @property
+    def MODEL_PREFIXES(self) -> dict[str, str]:  # noqa: N802 - historical public name
+        """Prefix → provider name from the current snapshot."""
+        return self._snapshot.model_prefixes
+
+    @property
+    def PROVIDER_DEFAULTS(self) -> dict[str, str]:  # noqa: N802 - historical public name
+        """Alias → default model from the current snapshot."""
+        return self._snapshot.aliases
+
     @property
     def providers(self) -> dict[str, LLMProvider]:
         """Get the registered providers."""
@@ -206,37 +355,64 @@ class ProviderRouter:
         3. Registered model lookup (THE list — built from all providers' models)
         4. REJECT — raise NoProviderError
 
+        WBS-PERF5: The priority rules are compiled into a RoutingTable at
+        startup, so this is a dict lookup rather than a per-call scan.
+
         Pattern: MLflow gateway/app.py — if name in endpoints → route, else reject
         Pattern: Terraform — if _, exists := m[key]; exists → use, else skip
         """
         if not self._providers:
             raise NoProviderError("No providers registered")
 
-        model_lower = model.lower()
-
-        # 1. Alias? (e.g. "openai" → "gpt-5.2", then re-lookup)
-        if model_lower in self.PROVIDER_DEFAULTS:
-            actual_model = self.PROVIDER_DEFAULTS[model_lower]
-            logger.info(f"Alias '{model}' -> '{actual_model}'")
-            return self.get_provider(actual_model)
-
-        # 2. Explicit prefix? (e.g. "openrouter/mixtral" → openrouter)
-        for prefix, provider_name in self.MODEL_PREFIXES.items():
-            if model_lower.startswith(prefix) and provider_name in self._providers:
-                logger.info(f"Routing {model} to {provider_name} (prefix '{prefix}')")
-                return self._providers[provider_name]
-
-        # 3. On the list? (exact match in REGISTERED_MODELS)
-        provider_name = self.REGISTERED_MODELS.get(model) or self.REGISTERED_MODELS.get(model_lower)
-        if provider_name and provider_name in self._providers:
-            logger.info(f"Routing {model} to {provider_name} (registered)")
-            return self._providers[provider_name]
-
-        # 4. Not on the list = not getting in
-        raise NoProviderError(
-            f"Model '{model}' is not registered in model_registry.yaml. "
-            f"Only registered models can be contacted."
+        route = self.resolve(model)
+        provider = self.provider_for(route)
+        _route_log_sampler.log(
+            logger, logging.INFO, "Routing %s to %s (%s)", model, route.provider, route.source
         )
+        return provider
+
+    def resolve(self, model: str) -> ModelRoute:
+        """Resolve a model name or alias to its compiled route.
+
+        WBS-PERF5: Single lookup for canonical model, provider and
+        context limit, so callers don't re-resolve per attribute.
+
+        Args:
+            model: The model name or alias.
+
+        Returns:
+            The compiled ModelRoute.
+
+        Raises:
+            NoProviderError: If the model is not registered.
+        """
+        route = self._snapshot.routes.resolve(model)
+        if route is None:
+            raise NoProviderError(
+                f"Model '{model}' is not registered in model_registry.yaml. "
+                f"Only registered models can be contacted."
+            )
+        return route
+
+    def provider_for(self, route: ModelRoute) -> LLMProvider:
+        """Get the provider instance serving a resolved route.
+
+        Args:
+            route: Route returned by resolve().
+
+        Returns:
+            The provider instance.
+
+        Raises:
+            NoProviderError: If the route's provider is not configured.
+        """
+        provider = self._providers.get(route.provider)
+        if provider is None:
+            raise NoProviderError(
+                f"Model '{route.model}' is registered to provider '{route.provider}', "
+                f"which is not configured."
+            )
+        return provider
 
     def resolve_model_alias(self, model: str) -> str:
         """Resolve a model alias to the actual model name.
@@ -251,11 +427,9 @@ class ProviderRouter:
         Returns:
             The resolved model name.
         """
-        model_lower = model.lower()
-        if model_lower in self.PROVIDER_DEFAULTS:
-            resolved = self.PROVIDER_DEFAULTS[model_lower]
-            logger.info(f"Resolved alias '{model}' -> '{resolved}'")
-            return resolved
+        route = self._snapshot.routes.resolve(model)
+        if route is not None and route.source == ROUTE_SOURCE_ALIAS:
+            return route.model
         return model
 
     def list_available_models(self) -> list[str]:
@@ -375,7 +549,17 @@ def _register_anthropic(settings: "Settings", providers: dict[str, LLMProvider])
         return
     try:
         from src.providers.anthropic import AnthropicProvider
-        providers["anthropic"] = AnthropicProvider(api_key=anthropic_key)
+        from src.providers.prompt_cache import PromptCachePlanner
+        prompt_cache = None
+        if settings.anthropic_prompt_cache_enabled:
+            prompt_cache = PromptCachePlanner(
+                min_tokens=settings.anthropic_prompt_cache_min_tokens,
+                min_sightings=settings.anthropic_prompt_cache_min_sightings,
+            )
+        providers["anthropic"] = AnthropicProvider(
+            api_key=anthropic_key,
+            prompt_cache=prompt_cache,
+        )
         logger.info("Anthropic provider registered")
     except Exception as e:
         logger.warning(f"Could not initialize Anthropic provider: {e}")
@@ -435,6 +619,31 @@ def _register_llamacpp(settings: "Settings", providers: dict[str, LLMProvider])
         logger.warning(f"Could not initialize LlamaCpp provider: {e}")
 
 
+def _register_simulated(settings: "Settings", providers: dict[str, LLMProvider]) -> None:
+    """Serve every registry provider with a simulating FakeProvider.
+
+    WBS-PERF11: Model names, aliases and routing stay exactly as in
+    production; only the upstream is replaced. Each model gets the
+    profile named in the registry's ``simulation`` section.
+    """
+    from src.providers.fake import FakeProvider, load_simulation_profiles
+
+    config = _load_model_registry()
+    profiles, default_profile = load_simulation_profiles(config.get("simulation"))
+    for name, provider_config in (config.get("providers") or {}).items():
+        providers[name] = FakeProvider(
+            name=name,
+            supported_models=list((provider_config or {}).get("models") or []),
+            response_content=f"Simulated {name} response",
+            profiles=profiles,
+            default_profile=default_profile,
+            seed=settings.simulation_seed,
+        )
+    logger.warning(
+        f"Upstream simulation enabled: {len(providers)} providers served by FakeProvider"
+    )
+
+
 def create_provider_router(settings: "Settings") -> ProviderRouter:
     """Create a provider router from settings.
 
@@ -465,18 +674,22 @@ def create_provider_router(settings: "Settings") -> ProviderRouter:
     # Local models are managed by CMS (Context Management Service).
     # Gateway only handles external/cloud model routing.
     # See: config/model_registry.yaml for the canonical model registry.
-    
-    # Cloud providers
-    _register_openai(settings, providers)
-    _register_anthropic(settings, providers)
-    _register_deepseek(settings, providers)
-    _register_gemini(settings, providers)
-    
-    # OpenRouter - only for explicit requests
-    _register_openrouter(settings, providers)
-    
-    # Legacy local providers
-    _register_llamacpp(settings, providers)
+
+    if getattr(settings, "simulate_upstream", False) is True:
+        # WBS-PERF11: Local load testing without network calls
+        _register_simulated(settings, providers)
+    else:
+        # Cloud providers
+        _register_openai(settings, providers)
+        _register_anthropic(settings, providers)
+        _register_deepseek(settings, providers)
+        _register_gemini(settings, providers)
+
+        # OpenRouter - only for explicit requests
+        _register_openrouter(settings, providers)
+
+        # Legacy local providers
+        _register_llamacpp(settings, providers)
 
     provider_names = list(providers.keys())
     logger.info(f"Provider router initialized with: {provider_names}")
@@ -489,5 +702,10 @@ def create_provider_router(settings: "Settings") -> ProviderRouter:
         )
 
     default = settings.default_provider if settings.default_provider in providers else None
-    return ProviderRouter(providers=providers, default_provider=default)
+    router = ProviderRouter(providers=providers, default_provider=default)
+
+    # WBS-PERF6: Receive registry hot-reloads (import here to avoid circular import)
+    from src.providers.registry_watcher import get_registry_watcher
+    get_registry_watcher().track(router)
+    return router
 
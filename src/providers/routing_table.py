@@ -0,0 +1,232 @@
+"""
+Compiled Routing Table - WBS-PERF5 Precompiled Model Resolution
+
+This module compiles the model registry (registered models, prefixes and
+aliases from config/model_registry.yaml) into immutable ``ModelRoute``
+records once at startup, so per-request routing is a dictionary hit
+instead of a lowercase + linear prefix scan + recursive alias lookup.
+
+Resolution order matches ProviderRouter's bouncer rules:
+
+1. Alias (case-insensitive) -> route of the alias target
+2. Explicit prefix (e.g. "openrouter/") -> prefix provider
+3. Registered model (exact, then lowercase)
+4. Unknown -> None (caller rejects)
+
+Aliases and registered models are compiled into a single exact-match
+dict. Prefix-routed names are open-ended, so their routes are memoized in
+a bounded LRU.
+
+Reference Documents:
+- Microservices Patterns Ch.27: API Gateway "consults a routing map"
+- GUIDELINES pp. 2153: Caching strategies for repeated computation
+
+Pattern: Compiled lookup table (build once, read many)
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+Anti-Pattern §4.1 Avoided: Cognitive complexity < 15 per function
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Optional
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_CONTEXT_LIMIT: int = 4096
+"""Conservative context limit for models without a known limit."""
+
+DEFAULT_CONTEXT_LIMITS: dict[str, int] = {
+    # Registered external models only (gateway manages cloud, CMS manages local)
+    # OpenAI
+    "gpt-5.2": 128000,
+    "gpt-5.2-pro": 128000,
+    "gpt-5-mini": 128000,
+    "gpt-5-nano": 128000,
+    # Anthropic
+    "claude-opus-4.5": 200000,
+    "claude-sonnet-4.5": 200000,
+    "claude-opus-4-5-20250514": 200000,
+    "claude-sonnet-4-5-20250514": 200000,
+    "claude-opus-4-20250514": 200000,
+    "claude-sonnet-4-20250514": 200000,
+    # Google
+    "gemini-2.0-flash": 1048576,
+    "gemini-1.5-pro": 2097152,
+    "gemini-1.5-flash": 1048576,
+    "gemini-pro": 32768,
+    # DeepSeek
+    "deepseek-reasoner": 64000,
+}
+"""Known context limits, matched as substrings of the lowercased model name."""
+
+DEFAULT_PREFIX_CACHE_SIZE: int = 1024
+"""Maximum memoized routes for prefix-routed model names."""
+
+ROUTE_SOURCE_ALIAS = "alias"
+ROUTE_SOURCE_PREFIX = "prefix"
+ROUTE_SOURCE_REGISTERED = "registered"
+
+
+# =============================================================================
+# WBS-PERF5: Model Route
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """
+    Compiled routing decision for a requested model name.
+
+    Attributes:
+        model: Canonical model name sent to the provider (alias resolved).
+        provider: Provider name from model_registry.yaml.
+        source: How the route was matched ("alias", "prefix", "registered").
+        context_limit: Context window in tokens.
+        category: Provider category from the registry (e.g. "local").
+        capabilities: Provider capabilities declared in the registry.
+    """
+
+    model: str
+    provider: str
+    source: str
+    context_limit: int = DEFAULT_CONTEXT_LIMIT
+    category: Optional[str] = None
+    capabilities: frozenset[str] = field(default_factory=frozenset)
+
+
+@lru_cache(maxsize=DEFAULT_PREFIX_CACHE_SIZE)
+def lookup_context_limit(model: str) -> int:
+    """
+    Context limit for a model name (memoized).
+
+    Args:
+        model: Model identifier.
+
+    Returns:
+        Known limit for the first matching key, else DEFAULT_CONTEXT_LIMIT.
+    """
+    model_lower = model.lower()
+    for model_key, limit in DEFAULT_CONTEXT_LIMITS.items():
+        if model_key in model_lower:
+            return limit
+    return DEFAULT_CONTEXT_LIMIT
+
+
+# =============================================================================
+# WBS-PERF5: Routing Table
+# =============================================================================
+
+
+class RoutingTable:
+    """
+    Immutable, precompiled model -> ModelRoute lookup.
+
+    WBS-PERF5: Built once per registry load; resolve() is O(1) for
+    registered models and aliases, and memoized for prefix-routed names.
+
+    Example:
+        >>> table = RoutingTable(registered, prefixes, aliases, providers_config)
+        >>> route = table.resolve("openai")
+        >>> route.model, route.provider
+        ('gpt-5.2', 'openai')
+    """
+
+    def __init__(
+        self,
+        registered: dict[str, str],
+        prefixes: dict[str, str],
+        aliases: dict[str, str],
+        providers_config: Optional[dict[str, Any]] = None,
+        prefix_cache_size: int = DEFAULT_PREFIX_CACHE_SIZE,
+    ) -> None:
+        """
+        Compile the routing table.
+
+        Args:
+            registered: Model name -> provider name.
+            prefixes: Prefix (e.g. "openrouter/") -> provider name.
+            aliases: Alias -> target model name.
+            providers_config: ``providers`` section of the registry YAML,
+                used for category and capabilities.
+            prefix_cache_size: Bound on memoized prefix routes.
+        """
+        self._providers_config = providers_config or {}
+        # Longest prefix first so the most specific prefix wins
+        self._prefixes = sorted(prefixes.items(), key=lambda item: len(item[0]), reverse=True)
+        self._prefix_cache: OrderedDict[str, ModelRoute] = OrderedDict()
+        self._prefix_cache_size = prefix_cache_size
+        self._exact: dict[str, ModelRoute] = {}
+
+        for model, provider in registered.items():
+            route = self._match_prefix(model.lower(), model) or self._build(
+                model, provider, ROUTE_SOURCE_REGISTERED
+            )
+            self._exact[model] = route
+            self._exact.setdefault(model.lower(), route)
+
+        for alias, target in aliases.items():
+            target_route = self._resolve_uncached(target)
+            if target_route is not None:
+                self._exact[alias.lower()] = self._build(
+                    target_route.model, target_route.provider, ROUTE_SOURCE_ALIAS
+                )
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def resolve(self, model: str) -> Optional[ModelRoute]:
+        """
+        Resolve a requested model name.
+
+        Args:
+            model: Model name or alias as sent by the client.
+
+        Returns:
+            The compiled ModelRoute, or None if the model is not routable.
+        """
+        route = self._exact.get(model)
+        if route is not None:
+            return route
+        model_lower = model.lower()
+        route = self._exact.get(model_lower)
+        if route is not None:
+            return route
+
+        cached = self._prefix_cache.get(model)
+        if cached is not None:
+            self._prefix_cache.move_to_end(model)
+            return cached
+        route = self._match_prefix(model_lower, model)
+        if route is not None:
+            self._prefix_cache[model] = route
+            if len(self._prefix_cache) > self._prefix_cache_size:
+                self._prefix_cache.popitem(last=False)
+        return route
+
+    def _resolve_uncached(self, model: str) -> Optional[ModelRoute]:
+        """Resolve without touching the prefix LRU (used during compile)."""
+        route = self._exact.get(model) or self._exact.get(model.lower())
+        return route or self._match_prefix(model.lower(), model)
+
+    def _match_prefix(self, model_lower: str, model: str) -> Optional[ModelRoute]:
+        """Route by explicit prefix, if any prefix matches."""
+        for prefix, provider in self._prefixes:
+            if model_lower.startswith(prefix):
+                return self._build(model, provider, ROUTE_SOURCE_PREFIX)
+        return None
+
+    def _build(self, model: str, provider: str, source: str) -> ModelRoute:
+        """Create a ModelRoute with registry metadata for ``provider``."""
+        provider_config = self._providers_config.get(provider) or {}
+        return ModelRoute(
+            model=model,
+            provider=provider,
+            source=source,
+            context_limit=lookup_context_limit(model),
+            category=provider_config.get("category"),
+            capabilities=frozenset(provider_config.get("capabilities") or ()),
+        )
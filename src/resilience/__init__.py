@@ -6,6 +6,7 @@ WBS-CPA3: Circuit Breaker Fallback Chains
 This module provides resilience patterns including:
 - CircuitBreakerStateMachine: State machine for circuit breaker pattern
 - FallbackChain: Ordered backend fallback with circuit breakers
+- BoundedTTLCache: Size-bounded LRU with TTL for the fallback cache (WBS-PERF14)
 - Prometheus metrics for state transitions
 
 Reference Documents:
@@ -24,9 +25,12 @@ from src.resilience.fallback_chain import (
     FallbackChainError,
     FallbackBackend,
 )
+from src.resilience.local_cache import BoundedTTLCache, CacheLookup
 from src.resilience.metrics import (
     record_circuit_state_transition,
     record_fallback_attempt,
+    record_fallback_cache_eviction,
+    record_fallback_cache_lookup,
     record_fallback_success,
 )
 
@@ -39,8 +43,13 @@ __all__ = [
     "FallbackChain",
     "FallbackChainError",
     "FallbackBackend",
+    # WBS-PERF14: Bounded local cache
+    "BoundedTTLCache",
+    "CacheLookup",
     # Metrics
     "record_circuit_state_transition",
     "record_fallback_attempt",
     "record_fallback_success",
+    "record_fallback_cache_lookup",
+    "record_fallback_cache_eviction",
 ]
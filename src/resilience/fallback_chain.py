@@ -14,12 +14,20 @@ Fallback Chain:
 Each backend has its own circuit breaker. When a backend fails or its
 circuit is open, the chain automatically tries the next backend.
 
+WBS-PERF14: The local cache is a bounded LRU (entries and bytes) with a
+TTL and a stale window. While the primary backend's circuit is open or
+half-open, cached results are served immediately and refreshed in the
+background (stale-while-revalidate), so requests don't queue behind a
+recovering backend.
+
 Anti-Pattern Compliance:
 - AP-1: Constants for configuration keys
 - AP-2: Methods <15 CC
 - AP-5: Exception uses FallbackChainError prefix
 """
 
+import asyncio
+import functools
 import hashlib
 import json
 import logging
@@ -33,7 +41,20 @@ from src.resilience.circuit_breaker_state_machine import (
     CircuitBreakerState,
     CircuitBreakerStateMachine,
 )
-from src.resilience.metrics import record_fallback_attempt, record_fallback_success
+from src.resilience.local_cache import (
+    DEFAULT_CACHE_MAX_BYTES,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_STALE_TTL_SECONDS,
+    DEFAULT_CACHE_TTL_SECONDS,
+    BoundedTTLCache,
+)
+from src.resilience.metrics import (
+    record_fallback_attempt,
+    record_fallback_cache_eviction,
+    record_fallback_cache_lookup,
+    record_fallback_success,
+    set_fallback_cache_bytes,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +75,14 @@ CONFIG_KEY_BACKENDS = "backends"
 CONFIG_KEY_ENABLE_CACHE = "enable_local_cache"
 CONFIG_KEY_URL = "url"
 CONFIG_KEY_TIMEOUT = "timeout"
+CONFIG_KEY_CACHE_MAX_ENTRIES = "cache_max_entries"
+CONFIG_KEY_CACHE_MAX_BYTES = "cache_max_bytes"
+CONFIG_KEY_CACHE_TTL = "cache_ttl_seconds"
+CONFIG_KEY_CACHE_STALE_TTL = "cache_stale_ttl_seconds"
+
+CACHE_RESULT_HIT = "hit"
+CACHE_RESULT_STALE_HIT = "stale_hit"
+CACHE_RESULT_MISS = "miss"
 
 
 # =============================================================================
@@ -143,6 +172,10 @@ class FallbackChain:
         name: str,
         backends: List[FallbackBackend],
         enable_local_cache: bool = True,
+        cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        cache_stale_ttl_seconds: float = DEFAULT_CACHE_STALE_TTL_SECONDS,
     ) -> None:
         """
         Initialize FallbackChain.
@@ -151,6 +184,11 @@ class FallbackChain:
             name: Name for identification and metrics
             backends: Ordered list of backends to try
             enable_local_cache: Whether to use local cache as final fallback
+            cache_max_entries: Maximum cached results
+            cache_max_bytes: Maximum estimated size of cached results
+            cache_ttl_seconds: Age after which a cached result is stale
+            cache_stale_ttl_seconds: Extra age during which stale results
+                are still served
         """
         self._name = name
         self._backends = backends
@@ -165,8 +203,16 @@ class FallbackChain:
                 reset_timeout_seconds=backend.reset_timeout_seconds,
             )
 
-        # Local cache for final fallback
-        self._local_cache: Dict[str, Any] = {}
+        # WBS-PERF14: Bounded local cache for final fallback
+        self._local_cache = BoundedTTLCache(
+            max_entries=cache_max_entries,
+            max_bytes=cache_max_bytes,
+            ttl_seconds=cache_ttl_seconds,
+            stale_ttl_seconds=cache_stale_ttl_seconds,
+            on_evict=functools.partial(record_fallback_cache_eviction, name),
+        )
+        # Background refreshes in flight, one per cache key
+        self._refreshes: Dict[str, "asyncio.Task[None]"] = {}
 
     # =========================================================================
     # Factory Methods
@@ -202,7 +248,17 @@ class FallbackChain:
                 )
             )
 
-        return cls(name=name, backends=backends, enable_local_cache=enable_cache)
+        return cls(
+            name=name,
+            backends=backends,
+            enable_local_cache=enable_cache,
+            cache_max_entries=config.get(CONFIG_KEY_CACHE_MAX_ENTRIES, DEFAULT_CACHE_MAX_ENTRIES),
+            cache_max_bytes=config.get(CONFIG_KEY_CACHE_MAX_BYTES, DEFAULT_CACHE_MAX_BYTES),
+            cache_ttl_seconds=config.get(CONFIG_KEY_CACHE_TTL, DEFAULT_CACHE_TTL_SECONDS),
+            cache_stale_ttl_seconds=config.get(
+                CONFIG_KEY_CACHE_STALE_TTL, DEFAULT_CACHE_STALE_TTL_SECONDS
+            ),
+        )
 
     @classmethod
     def create_search_chain(
@@ -273,6 +329,10 @@ class FallbackChain:
         Tries each backend in order until one succeeds. If all backends
         fail and local cache is enabled, returns cached result if available.
 
+        WBS-PERF14: While the primary backend is recovering (circuit open or
+        half-open), a cached result is returned immediately and refreshed
+        through the chain in the background.
+
         Args:
             operation: Operation name (search, embed, etc.)
             payload: Request payload
@@ -283,8 +343,59 @@ class FallbackChain:
         Raises:
             FallbackChainError: If all backends fail and no cache available
         """
+        cache_key = (
+            self._get_cache_key(operation, payload) if self._enable_local_cache else None
+        )
+
+        # WBS-PERF14: Stale-while-revalidate while the primary recovers
+        if cache_key is not None and cache_key in self._local_cache:
+            if await self._primary_recovering():
+                cached = self._lookup_cache(cache_key)
+                if cached is not None:
+                    self._schedule_refresh(cache_key, operation, payload)
+                    return cached
+
         backend_errors: Dict[str, str] = {}
+        result = await self._try_backends(operation, payload, backend_errors)
+        if result is not None:
+            if cache_key is not None:
+                self._store_cache(cache_key, result)
+            return result
 
+        # All backends failed - try cache
+        if cache_key is not None:
+            cached = self._lookup_cache(cache_key)
+            if cached is not None:
+                logger.info(
+                    f"Using cached result for {operation}",
+                    extra={"chain": self._name, "cache_key": cache_key},
+                )
+                return cached
+
+        # All backends and cache failed
+        raise FallbackChainError(
+            chain_name=self._name,
+            message=f"All backends failed for operation '{operation}'",
+            backend_errors=backend_errors,
+        )
+
+    async def _try_backends(
+        self,
+        operation: str,
+        payload: Dict[str, Any],
+        backend_errors: Dict[str, str],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Try each backend in order.
+
+        Args:
+            operation: Operation name
+            payload: Request payload
+            backend_errors: Filled with the error of each failed backend
+
+        Returns:
+            First successful result, or None if every backend failed
+        """
         for backend in self._backends:
             cb = self._circuit_breakers[backend.name]
 
@@ -307,12 +418,6 @@ class FallbackChain:
                 # Record success
                 await cb.record_success()
                 record_fallback_success(self._name, backend.name)
-
-                # Update cache
-                if self._enable_local_cache:
-                    cache_key = self._get_cache_key(operation, payload)
-                    self._local_cache[cache_key] = result
-
                 return result
 
             except Exception as e:
@@ -323,23 +428,56 @@ class FallbackChain:
                 await cb.record_failure()
                 backend_errors[backend.name] = str(e)
 
-        # All backends failed - try cache
-        if self._enable_local_cache:
-            cache_key = self._get_cache_key(operation, payload)
-            cached_result = self._local_cache.get(cache_key)
-            if cached_result is not None:
-                logger.info(
-                    f"Using cached result for {operation}",
-                    extra={"chain": self._name, "cache_key": cache_key},
-                )
-                return cached_result
+        return None
 
-        # All backends and cache failed
-        raise FallbackChainError(
-            chain_name=self._name,
-            message=f"All backends failed for operation '{operation}'",
-            backend_errors=backend_errors,
+    # =========================================================================
+    # WBS-PERF14: Local Cache
+    # =========================================================================
+
+    async def _primary_recovering(self) -> bool:
+        """Whether the primary backend's circuit is open or half-open."""
+        if not self._backends:
+            return False
+        cb = self._circuit_breakers[self._backends[0].name]
+        return await cb.get_state() != CircuitBreakerState.CLOSED
+
+    def _lookup_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached result, recording hit/stale_hit/miss."""
+        found = self._local_cache.lookup(cache_key)
+        if found is None:
+            record_fallback_cache_lookup(self._name, CACHE_RESULT_MISS)
+            set_fallback_cache_bytes(self._name, self._local_cache.total_bytes)
+            return None
+        record_fallback_cache_lookup(
+            self._name, CACHE_RESULT_STALE_HIT if found.stale else CACHE_RESULT_HIT
         )
+        return found.value
+
+    def _store_cache(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Cache a successful result and update the size gauge."""
+        self._local_cache[cache_key] = result
+        set_fallback_cache_bytes(self._name, self._local_cache.total_bytes)
+
+    def _schedule_refresh(
+        self, cache_key: str, operation: str, payload: Dict[str, Any]
+    ) -> None:
+        """Refresh a cached result in the background (one refresh per key)."""
+        if cache_key in self._refreshes:
+            return
+        task = asyncio.ensure_future(self._refresh(cache_key, operation, payload))
+        self._refreshes[cache_key] = task
+        task.add_done_callback(lambda _: self._refreshes.pop(cache_key, None))
+
+    async def _refresh(self, cache_key: str, operation: str, payload: Dict[str, Any]) -> None:
+        """Re-run the chain for a cached result; keep the old value on failure."""
+        result = await self._try_backends(operation, payload, {})
+        if result is not None:
+            self._store_cache(cache_key, result)
+        else:
+            logger.debug(
+                f"Background refresh failed for {operation}",
+                extra={"chain": self._name, "cache_key": cache_key},
+            )
 
     async def _call_backend(
         self,
@@ -361,9 +499,14 @@ class FallbackChain:
         Raises:
             httpx.HTTPError: On network or HTTP errors
         """
+        # Import here to avoid circular import
+        from src.clients.http import create_traced_transport
+
         endpoint = self._get_endpoint(backend, operation)
 
-        async with httpx.AsyncClient(timeout=backend.timeout) as client:
+        async with httpx.AsyncClient(
+            timeout=backend.timeout, transport=create_traced_transport(backend.name)
+        ) as client:
             response = await client.post(endpoint, json=payload)
             response.raise_for_status()
             return response.json()
@@ -0,0 +1,208 @@
+"""
+Bounded Local Cache - WBS-PERF14
+
+This module implements the size-bounded, TTL-aware LRU used by
+FallbackChain as its final fallback. Unlike a plain dict it cannot grow
+with the number of unique queries: entries are evicted least-recently-used
+first once either the entry count or the estimated byte size exceeds its
+limit, and entries older than ``ttl_seconds + stale_ttl_seconds`` are
+dropped on access.
+
+Entry ages:
+- fresh (age < ttl_seconds): served as an ordinary hit
+- stale (age < ttl_seconds + stale_ttl_seconds): still served, flagged
+  stale so callers can refresh in the background
+- expired: removed
+
+Reference Documents:
+- Building Microservices (Newman): Caching for resilience, serve stale data
+- RFC 5861: stale-while-revalidate semantics
+
+Anti-Pattern Compliance:
+- AP-1: Constants for default limits
+- AP-2: Methods <15 CC
+"""
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, NamedTuple, Optional
+
+
+# =============================================================================
+# Constants (AP-1 Compliance)
+# =============================================================================
+
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+DEFAULT_CACHE_STALE_TTL_SECONDS = 3600.0
+
+EVICTION_CAPACITY = "capacity"
+EVICTION_EXPIRED = "expired"
+
+
+# =============================================================================
+# Cache Entries
+# =============================================================================
+
+
+@dataclass
+class _Entry:
+    """Stored value with its estimated size and insertion time."""
+
+    value: Any
+    size: int
+    stored_at: float
+
+
+class CacheLookup(NamedTuple):
+    """
+    Result of BoundedTTLCache.lookup().
+
+    Attributes:
+        value: Cached value
+        stale: True when the entry is past its TTL but within the stale window
+        age_seconds: Time since the value was stored
+    """
+
+    value: Any
+    stale: bool
+    age_seconds: float
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate a value's size in bytes as its compact JSON encoding."""
+    try:
+        return len(json.dumps(value, separators=(",", ":"), default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+# =============================================================================
+# BoundedTTLCache
+# =============================================================================
+
+
+class BoundedTTLCache:
+    """
+    LRU cache bounded by entry count and bytes, with TTL and a stale window.
+
+    Supports the dict subset FallbackChain used before (``cache[key] = v``,
+    ``cache.get(key)``, ``key in cache``, ``len(cache)``).
+
+    Example:
+        >>> cache = BoundedTTLCache(max_entries=100, ttl_seconds=60)
+        >>> cache["k"] = {"results": []}
+        >>> cache.lookup("k").stale
+        False
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        stale_ttl_seconds: float = DEFAULT_CACHE_STALE_TTL_SECONDS,
+        on_evict: Optional[Callable[[str], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries
+            max_bytes: Maximum total estimated size of stored values
+            ttl_seconds: Age after which an entry is stale
+            stale_ttl_seconds: Extra age during which stale entries are served
+            on_evict: Called with the reason ("capacity" or "expired") per eviction
+            clock: Monotonic clock (injectable for tests)
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._max_age = ttl_seconds + stale_ttl_seconds
+        self._on_evict = on_evict
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated size of all stored values."""
+        return self._bytes
+
+    # =========================================================================
+    # Access
+    # =========================================================================
+
+    def lookup(self, key: str) -> Optional[CacheLookup]:
+        """
+        Get an entry and its freshness, refreshing its LRU position.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CacheLookup, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        age = self._clock() - entry.stored_at
+        if age >= self._max_age:
+            self._remove(key, EVICTION_EXPIRED)
+            return None
+        self._entries.move_to_end(key)
+        return CacheLookup(entry.value, age >= self._ttl, age)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a fresh or stale value (dict-compatible)."""
+        found = self.lookup(key)
+        return found.value if found is not None else default
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, evicting least-recently-used entries to fit.
+
+        Values larger than ``max_bytes`` on their own are not stored.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        size = estimate_size(value)
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key).size
+        if size > self._max_bytes:
+            return
+        self._entries[key] = _Entry(value, size, self._clock())
+        self._bytes += size
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest, EVICTION_CAPACITY)
+
+    def clear(self) -> None:
+        """Remove all entries (not counted as evictions)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str, reason: str) -> None:
+        """Drop an entry and report the eviction."""
+        self._bytes -= self._entries.pop(key).size
+        if self._on_evict is not None:
+            self._on_evict(reason)
@@ -12,6 +12,7 @@ Metrics Provided:
 - Circuit breaker state transitions (counter)
 - Fallback chain attempts (counter)
 - Fallback chain successes (counter)
+- Fallback chain local cache lookups, evictions and size (WBS-PERF14)
 
 Anti-Pattern Compliance:
 - AP-1: Metric names as constants
@@ -27,6 +28,9 @@ METRIC_CIRCUIT_TRANSITIONS = "llm_gateway_circuit_breaker_state_transitions_tota
 METRIC_FALLBACK_ATTEMPTS = "llm_gateway_fallback_chain_attempts_total"
 METRIC_FALLBACK_SUCCESSES = "llm_gateway_fallback_chain_successes_total"
 METRIC_CIRCUIT_STATE = "llm_gateway_circuit_breaker_state"
+METRIC_FALLBACK_CACHE_LOOKUPS = "llm_gateway_fallback_cache_lookups_total"
+METRIC_FALLBACK_CACHE_EVICTIONS = "llm_gateway_fallback_cache_evictions_total"
+METRIC_FALLBACK_CACHE_BYTES = "llm_gateway_fallback_cache_bytes"
 
 
 # =============================================================================
@@ -132,3 +136,59 @@ def record_fallback_success(
         chain_name=chain_name,
         backend_name=backend_name,
     ).inc()
+
+
+# =============================================================================
+# WBS-PERF14: Fallback Chain Local Cache Metrics
+# =============================================================================
+
+FALLBACK_CACHE_LOOKUPS = Counter(
+    name=METRIC_FALLBACK_CACHE_LOOKUPS,
+    documentation="Fallback chain local cache lookups by result (hit, stale_hit, miss)",
+    labelnames=["chain_name", "result"],
+)
+
+FALLBACK_CACHE_EVICTIONS = Counter(
+    name=METRIC_FALLBACK_CACHE_EVICTIONS,
+    documentation="Fallback chain local cache evictions by reason (capacity, expired)",
+    labelnames=["chain_name", "reason"],
+)
+
+FALLBACK_CACHE_BYTES = Gauge(
+    name=METRIC_FALLBACK_CACHE_BYTES,
+    documentation="Estimated size of the fallback chain local cache in bytes",
+    labelnames=["chain_name"],
+)
+
+
+def record_fallback_cache_lookup(chain_name: str, result: str) -> None:
+    """
+    Record a fallback chain local cache lookup.
+
+    Args:
+        chain_name: Name of the fallback chain
+        result: "hit", "stale_hit" or "miss"
+    """
+    FALLBACK_CACHE_LOOKUPS.labels(chain_name=chain_name, result=result).inc()
+
+
+def record_fallback_cache_eviction(chain_name: str, reason: str) -> None:
+    """
+    Record a fallback chain local cache eviction.
+
+    Args:
+        chain_name: Name of the fallback chain
+        reason: "capacity" or "expired"
+    """
+    FALLBACK_CACHE_EVICTIONS.labels(chain_name=chain_name, reason=reason).inc()
+
+
+def set_fallback_cache_bytes(chain_name: str, size_bytes: int) -> None:
+    """
+    Update the fallback chain local cache size gauge.
+
+    Args:
+        chain_name: Name of the fallback chain
+        size_bytes: Estimated size of all cached values
+    """
+    FALLBACK_CACHE_BYTES.labels(chain_name=chain_name).set(size_bytes)
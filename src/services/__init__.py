@@ -14,16 +14,19 @@ WBS Items:
 - 2.6.1: Chat Service Implementation
 - 2.6.2: Cost Tracker
 - 2.6.3: Response Cache
+- WBS-PERF8: Buffered cost aggregation
 """
 
 from src.services.cache import CacheError, ResponseCache
 from src.services.chat import ChatService, ChatServiceError
+from src.services.cost_aggregator import CostAggregator
 from src.services.cost_tracker import CostTracker, CostTrackerError, UsageSummary
 
 __all__ = [
     "CacheError",
     "ChatService",
     "ChatServiceError",
+    "CostAggregator",
     "CostTracker",
     "CostTrackerError",
     "ResponseCache",
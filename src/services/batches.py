@@ -0,0 +1,944 @@
+"""
+Batch Jobs - WBS-PERF24 Offline Batch Execution
+
+Runs OpenAI-format batch files, one ``{"custom_id", "method", "url",
+"body"}`` request per JSONL line, with /v1/chat/completions semantics and
+without a client connection held per prompt.
+
+Each job lives in its own directory under ``batch_storage_dir``:
+- ``input.jsonl``: the uploaded file, validated as it streams to disk
+- ``output.jsonl``: one result line per input line, appended as requests
+  finish (in completion order) and fsynced every checkpoint interval
+- ``job.json``: status, counts and native batch ids, replaced atomically
+
+Unfinished jobs resume after a crash or restart: the output file is cut
+back to its last complete line, the custom_ids it already holds are
+skipped, and native batches that were already submitted are polled
+instead of resubmitted.
+
+Lines run through ChatService on a per-job worker pool, and all jobs
+share one token-bucket budget per provider. With
+``completion_window="24h"``, lines for providers that implement
+NativeBatchProvider are grouped and sent to the provider's batch API,
+which is billed at half the synchronous price.
+
+Reference Documents:
+- OpenAI Batch API: https://platform.openai.com/docs/api-reference/batch
+- GUIDELINES pp. 2309: Rate limiting and backpressure for downstream calls
+
+Pattern: Checkpointed worker pool over an append-only result log
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import shutil
+import time
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import ValidationError
+
+from src.core.exceptions import LLMGatewayException, ProviderError
+from src.models.requests import ChatCompletionRequest
+from src.models.responses import ChatCompletionResponse
+from src.observability.metrics import BATCH_JOBS_RUNNING, record_batch_request
+from src.providers.batch import NATIVE_BATCH_FAILED, NATIVE_BATCH_IN_PROGRESS, NativeBatchProvider
+from src.providers.router import NoProviderError
+from src.services.chat import ChatService, ChatServiceError
+from src.services.cost_aggregator import (
+    ANONYMOUS_API_KEY_ID,
+    get_api_key_id,
+    get_cost_aggregator,
+    set_api_key_id,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+"""The only endpoint batch lines may target."""
+
+COMPLETION_WINDOWS = ("24h", "immediate")
+"""``24h`` allows provider batch APIs; ``immediate`` runs every line through the gateway."""
+
+STATUS_IN_PROGRESS = "in_progress"
+STATUS_CANCELLING = "cancelling"
+STATUS_CANCELLED = "cancelled"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+DEFAULT_MAX_INPUT_BYTES = 200 * 1024 * 1024
+"""Largest accepted input file (the OpenAI Batch API's limit)."""
+
+DEFAULT_MAX_REQUESTS = 50_000
+"""Most requests per input file (the OpenAI Batch API's limit)."""
+
+DEFAULT_CONCURRENCY = 8
+"""Concurrent gateway requests per job."""
+
+DEFAULT_CHECKPOINT_INTERVAL = 100
+"""Results written between fsyncs of the output file and job.json."""
+
+DEFAULT_NATIVE_MIN_REQUESTS = 100
+"""Fewest lines per provider worth a native batch."""
+
+DEFAULT_NATIVE_POLL_SECONDS = 60.0
+"""Interval between status polls of a native batch."""
+
+_JOB_ID_PATTERN = re.compile(r"^batch_[0-9a-f]{32}$")
+
+
+# =============================================================================
+# Exceptions
+# =============================================================================
+
+
+class BatchError(Exception):
+    """Invalid batch input or job parameters."""
+
+
+class BatchNotFoundError(BatchError):
+    """No job with the requested id."""
+
+
+class BatchTooLargeError(BatchError):
+    """Input file exceeds the size or request-count limit."""
+
+
+# =============================================================================
+# BatchJob
+# =============================================================================
+
+
+@dataclass
+class BatchJob:
+    """Persistent state of one batch job (serialized to job.json)."""
+
+    id: str
+    created_at: int
+    completion_window: str
+    concurrency: int
+    status: str = STATUS_IN_PROGRESS
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    completed_at: Optional[int] = None
+    error: Optional[str] = None
+    metadata: dict[str, str] = field(default_factory=dict)
+    native_batches: dict[str, str] = field(default_factory=dict)
+    """Native group key ("provider:first_line") -> remote batch id."""
+    api_key_id: str = ANONYMOUS_API_KEY_ID
+    """Caller the job's usage is attributed to, also after a restart."""
+
+    @property
+    def finished(self) -> bool:
+        """True once the job will not run again."""
+        return self.status not in (STATUS_IN_PROGRESS, STATUS_CANCELLING)
+
+    def to_api(self) -> dict[str, Any]:
+        """Render as an OpenAI-style batch object."""
+        return {
+            "id": self.id,
+            "object": "batch",
+            "endpoint": BATCH_ENDPOINT,
+            "status": self.status,
+            "completion_window": self.completion_window,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
+            "request_counts": {
+                "total": self.total,
+                "completed": self.completed,
+                "failed": self.failed,
+            },
+            "output_url": f"/v1/batches/{self.id}/output",
+            "error": self.error,
+            "metadata": self.metadata,
+        }
+
+
+# =============================================================================
+# ProviderRateBudget
+# =============================================================================
+
+
+class ProviderRateBudget:
+    """
+    Token bucket shared by all batch jobs sending to one provider.
+
+    Waiters queue on a lock, so requests are released in arrival order
+    at ``rate_per_second`` after an initial burst of one second's worth.
+    """
+
+    def __init__(self, rate_per_second: float) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            rate_per_second: Sustained request rate (0 = unlimited)
+        """
+        self._rate = rate_per_second
+        self._capacity = max(1.0, rate_per_second)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until one request may be sent."""
+        if self._rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+# =============================================================================
+# BatchStore
+# =============================================================================
+
+
+class BatchStore:
+    """Filesystem layout and durable writes for batch jobs."""
+
+    def __init__(self, root: str | Path) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding one subdirectory per job
+        """
+        self._root = Path(root)
+
+    def job_dir(self, job_id: str) -> Path:
+        """Directory of a job; rejects ids that are not gateway batch ids."""
+        if not _JOB_ID_PATTERN.match(job_id):
+            raise BatchNotFoundError(f"Batch '{job_id}' not found")
+        return self._root / job_id
+
+    def input_path(self, job_id: str) -> Path:
+        return self.job_dir(job_id) / "input.jsonl"
+
+    def output_path(self, job_id: str) -> Path:
+        return self.job_dir(job_id) / "output.jsonl"
+
+    def save(self, job: BatchJob) -> None:
+        """Write job.json atomically (temp file + rename); safe to call from several threads."""
+        directory = self.job_dir(job.id)
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = directory / f"job.json.{uuid.uuid4().hex}.tmp"
+        with tmp.open("w") as f:
+            json.dump(asdict(job), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, directory / "job.json")
+
+    def load(self, job_id: str) -> BatchJob:
+        """
+        Load a job's checkpoint.
+
+        Raises:
+            BatchNotFoundError: No such job.
+        """
+        path = self.job_dir(job_id) / "job.json"
+        try:
+            return BatchJob(**json.loads(path.read_text()))
+        except FileNotFoundError:
+            raise BatchNotFoundError(f"Batch '{job_id}' not found") from None
+
+    def list_jobs(self) -> list[BatchJob]:
+        """All jobs, newest first."""
+        if not self._root.is_dir():
+            return []
+        jobs = [
+            self.load(entry.name)
+            for entry in self._root.iterdir()
+            if _JOB_ID_PATTERN.match(entry.name) and (entry / "job.json").exists()
+        ]
+        return sorted(jobs, key=lambda job: job.created_at, reverse=True)
+
+    def delete(self, job_id: str) -> None:
+        shutil.rmtree(self.job_dir(job_id), ignore_errors=True)
+
+    async def write_input(
+        self,
+        job_id: str,
+        chunks: AsyncIterator[bytes],
+        max_bytes: int = DEFAULT_MAX_INPUT_BYTES,
+        max_requests: int = DEFAULT_MAX_REQUESTS,
+    ) -> int:
+        """
+        Stream an uploaded JSONL file to disk, validating each line.
+
+        Args:
+            job_id: Job the file belongs to
+            chunks: Request body chunks
+            max_bytes: Largest accepted file; reading stops once exceeded
+            max_requests: Most requests accepted
+
+        Returns:
+            Number of requests (non-blank lines).
+
+        Raises:
+            BatchTooLargeError: The file exceeds max_bytes or max_requests.
+            BatchError: A line is invalid, a custom_id repeats, or the file is empty.
+        """
+        path = self.input_path(job_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        seen: set[str] = set()
+        lineno = 0
+        size = 0
+        pending = b""
+        with path.open("wb") as f:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_bytes:
+                    raise BatchTooLargeError(f"Batch input file exceeds {max_bytes} bytes")
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    lineno += 1
+                    _validate_line(line, lineno, seen)
+                if len(seen) > max_requests:
+                    raise BatchTooLargeError(f"Batch input file exceeds {max_requests} requests")
+                await asyncio.to_thread(f.write, chunk)
+            _validate_line(pending, lineno + 1, seen)
+        if not seen:
+            raise BatchError("Batch input file contains no requests")
+        if len(seen) > max_requests:
+            raise BatchTooLargeError(f"Batch input file exceeds {max_requests} requests")
+        return len(seen)
+
+    def iter_input(self, job_id: str) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Yield (index, record) for each request; index counts non-blank lines."""
+        index = 0
+        with self.input_path(job_id).open("rb") as f:
+            for line in f:
+                if line.strip():
+                    yield index, json.loads(line)
+                    index += 1
+
+    def recover_output(self, job: BatchJob) -> set[str]:
+        """
+        Cut the output file back to its last complete line and recount it.
+
+        Args:
+            job: Job whose completed/failed counts are reset from the file
+
+        Returns:
+            custom_ids that already have a result.
+        """
+        done: set[str] = set()
+        job.completed = job.failed = 0
+        path = self.output_path(job.id)
+        if not path.exists():
+            return done
+        offset = 0
+        with path.open("rb+") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                offset += len(line)
+                done.add(record["custom_id"])
+                if record.get("error") is None:
+                    job.completed += 1
+                else:
+                    job.failed += 1
+            f.truncate(offset)
+        return done
+
+
+def _validate_line(line: bytes, lineno: int, seen: set[str]) -> None:
+    """Check one input line; blank lines are ignored."""
+    if not line.strip():
+        return
+    try:
+        record = json.loads(line)
+    except ValueError:
+        raise BatchError(f"Line {lineno}: not valid JSON") from None
+    if not isinstance(record, dict):
+        raise BatchError(f"Line {lineno}: expected a JSON object")
+    custom_id = record.get("custom_id")
+    if not isinstance(custom_id, str) or not custom_id:
+        raise BatchError(f"Line {lineno}: custom_id must be a non-empty string")
+    if custom_id in seen:
+        raise BatchError(f"Line {lineno}: duplicate custom_id '{custom_id}'")
+    if record.get("method", "POST") != "POST" or record.get("url") != BATCH_ENDPOINT:
+        raise BatchError(f"Line {lineno}: only POST {BATCH_ENDPOINT} is supported")
+    if not isinstance(record.get("body"), dict):
+        raise BatchError(f"Line {lineno}: body must be a JSON object")
+    seen.add(custom_id)
+
+
+def _error(code: Any, message: str) -> dict[str, str]:
+    return {"code": str(getattr(code, "value", code)), "message": message}
+
+
+# =============================================================================
+# Output Writer
+# =============================================================================
+
+
+class _OutputWriter:
+    """
+    Appends result lines and checkpoints the job every ``interval`` lines.
+
+    File writes and fsyncs run on a worker thread, one at a time, so a
+    checkpoint does not stall other requests on the event loop.
+    """
+
+    def __init__(self, store: BatchStore, job: BatchJob, done: set[str], interval: int) -> None:
+        self._store = store
+        self._job = job
+        self._file = store.output_path(job.id).open("ab")
+        self._interval = interval
+        self._unsynced = 0
+        self._lock = asyncio.Lock()
+        self.done = done
+
+    async def write(
+        self,
+        custom_id: str,
+        response: Optional[ChatCompletionResponse] = None,
+        error: Optional[dict[str, Any]] = None,
+        path: str = "gateway",
+    ) -> None:
+        if custom_id in self.done:
+            return
+        self.done.add(custom_id)
+        record = {
+            "id": f"batch_req_{uuid.uuid4().hex}",
+            "custom_id": custom_id,
+            "response": (
+                {"status_code": 200, "body": response.model_dump()}
+                if response is not None
+                else None
+            ),
+            "error": None if response is not None else error,
+        }
+        async with self._lock:
+            await asyncio.to_thread(self._append, json.dumps(record).encode() + b"\n")
+
+            outcome = "completed" if response is not None else "failed"
+            if response is not None:
+                self._job.completed += 1
+            else:
+                self._job.failed += 1
+            record_batch_request(path, outcome)
+
+            self._unsynced += 1
+            if self._unsynced >= self._interval:
+                await self._checkpoint()
+
+    async def checkpoint(self) -> None:
+        """fsync the output file and save job.json."""
+        async with self._lock:
+            await self._checkpoint()
+
+    async def close(self) -> None:
+        try:
+            await self.checkpoint()
+        finally:
+            self._file.close()
+
+    async def _checkpoint(self) -> None:
+        await asyncio.to_thread(self._sync)
+        self._unsynced = 0
+
+    def _append(self, line: bytes) -> None:
+        self._file.write(line)
+        self._file.flush()
+
+    def _sync(self) -> None:
+        os.fsync(self._file.fileno())
+        self._store.save(self._job)
+
+
+# =============================================================================
+# BatchManager
+# =============================================================================
+
+
+class BatchManager:
+    """
+    Create, run, resume and cancel batch jobs.
+
+    Example:
+        >>> manager = BatchManager(BatchStore("data/batches"), get_chat_service)
+        >>> manager.resume()
+        >>> job = await manager.create_job(request.stream(), completion_window="24h")
+    """
+
+    def __init__(
+        self,
+        store: BatchStore,
+        chat_service_factory: Callable[[], ChatService],
+        max_input_bytes: int = DEFAULT_MAX_INPUT_BYTES,
+        max_requests: int = DEFAULT_MAX_REQUESTS,
+        default_concurrency: int = DEFAULT_CONCURRENCY,
+        max_concurrency: int = 64,
+        default_rate_per_second: float = 0.0,
+        provider_rate_limits: Optional[dict[str, float]] = None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        native_enabled: bool = True,
+        native_min_requests: int = DEFAULT_NATIVE_MIN_REQUESTS,
+        native_poll_seconds: float = DEFAULT_NATIVE_POLL_SECONDS,
+    ) -> None:
+        """
+        Initialize the manager.
+
+        Args:
+            store: Job storage
+            chat_service_factory: Returns the ChatService lines run through
+            max_input_bytes: Largest accepted input file
+            max_requests: Most requests per input file
+            default_concurrency: Workers per job when the job sets none
+            max_concurrency: Upper bound on a job's workers
+            default_rate_per_second: Per-provider request budget (0 = unlimited)
+            provider_rate_limits: Per-provider overrides of the budget
+            checkpoint_interval: Results between checkpoints
+            native_enabled: Use provider batch APIs for 24h-window jobs
+            native_min_requests: Fewest lines per provider worth a native batch
+            native_poll_seconds: Interval between native batch status polls
+        """
+        self._store = store
+        self._chat_service_factory = chat_service_factory
+        self._max_input_bytes = max_input_bytes
+        self._max_requests = max_requests
+        self._default_concurrency = default_concurrency
+        self._max_concurrency = max_concurrency
+        self._default_rate = default_rate_per_second
+        self._rate_limits = provider_rate_limits or {}
+        self._checkpoint_interval = checkpoint_interval
+        self._native_enabled = native_enabled
+        self._native_min_requests = native_min_requests
+        self._native_poll_seconds = native_poll_seconds
+        self._budgets: dict[str, ProviderRateBudget] = {}
+        self._jobs: dict[str, BatchJob] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    # -------------------------------------------------------------------------
+    # Job API
+    # -------------------------------------------------------------------------
+
+    async def create_job(
+        self,
+        chunks: AsyncIterator[bytes],
+        completion_window: str = "24h",
+        concurrency: Optional[int] = None,
+        metadata: Optional[dict[str, str]] = None,
+    ) -> BatchJob:
+        """
+        Store an uploaded JSONL file and start the job.
+
+        Raises:
+            BatchTooLargeError: The input file exceeds the configured limits.
+            BatchError: Invalid parameters or input file.
+        """
+        if completion_window not in COMPLETION_WINDOWS:
+            raise BatchError(f"completion_window must be one of {', '.join(COMPLETION_WINDOWS)}")
+        job = BatchJob(
+            id=f"batch_{uuid.uuid4().hex}",
+            created_at=int(time.time()),
+            completion_window=completion_window,
+            concurrency=max(1, min(concurrency or self._default_concurrency, self._max_concurrency)),
+            metadata=metadata or {},
+            api_key_id=get_api_key_id(),
+        )
+        try:
+            job.total = await self._store.write_input(
+                job.id, chunks, self._max_input_bytes, self._max_requests
+            )
+        except BaseException:
+            self._store.delete(job.id)
+            raise
+        await asyncio.to_thread(self._store.save, job)
+        logger.info(f"Batch {job.id} created with {job.total} requests")
+        self._start(job)
+        return job
+
+    def get_job(self, job_id: str) -> BatchJob:
+        """
+        Get one of the calling API key's jobs, with live counts while it runs.
+
+        Raises:
+            BatchNotFoundError: No such job, or it belongs to another API key.
+        """
+        job = self._jobs.get(job_id) or self._store.load(job_id)
+        if job.api_key_id != get_api_key_id():
+            raise BatchNotFoundError(f"Batch '{job_id}' not found")
+        return job
+
+    def list_jobs(self, limit: int = 20) -> list[BatchJob]:
+        """The calling API key's jobs, newest first."""
+        caller = get_api_key_id()
+        owned = [job for job in self._store.list_jobs() if job.api_key_id == caller]
+        return [self._jobs.get(job.id, job) for job in owned[:limit]]
+
+    def output_path(self, job_id: str) -> Path:
+        """
+        Path of one of the calling API key's output files (may not exist yet).
+
+        Raises:
+            BatchNotFoundError: No such job, or it belongs to another API key.
+        """
+        self.get_job(job_id)
+        return self._store.output_path(job_id)
+
+    async def cancel_job(self, job_id: str) -> BatchJob:
+        """
+        Stop a job and cancel its native batches; results so far are kept.
+
+        Raises:
+            BatchNotFoundError: No such job, or it belongs to another API key.
+        """
+        job = self.get_job(job_id)
+        if job.finished:
+            return job
+        job.status = STATUS_CANCELLING
+        await asyncio.to_thread(self._store.save, job)
+
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        for key, remote_id in job.native_batches.items():
+            provider = self._native_provider_named(key.split(":", 1)[0])
+            if provider is None:
+                continue
+            try:
+                await provider.cancel_batch(remote_id)
+            except ProviderError as e:
+                logger.warning(f"Could not cancel native batch {remote_id}: {e.message}")
+
+        job.status = STATUS_CANCELLED
+        job.completed_at = int(time.time())
+        await asyncio.to_thread(self._store.save, job)
+        return job
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def resume(self) -> int:
+        """
+        Restart jobs left unfinished by a previous process.
+
+        Returns:
+            Number of jobs resumed.
+        """
+        resumed = 0
+        for job in self._store.list_jobs():
+            if job.status == STATUS_CANCELLING:
+                job.status = STATUS_CANCELLED
+                job.completed_at = int(time.time())
+                self._store.save(job)
+            elif job.status == STATUS_IN_PROGRESS and job.id not in self._tasks:
+                logger.info(f"Resuming batch {job.id}")
+                self._start(job)
+                resumed += 1
+        return resumed
+
+    async def stop(self) -> None:
+        """Stop running jobs, leaving them in_progress so they resume on restart."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _start(self, job: BatchJob) -> None:
+        self._jobs[job.id] = job
+        self._tasks[job.id] = asyncio.create_task(self._run(job), name=f"batch-{job.id}")
+
+    async def _run(self, job: BatchJob) -> None:
+        set_api_key_id(job.api_key_id)
+        BATCH_JOBS_RUNNING.inc()
+        try:
+            await self._execute(job)
+            job.status = STATUS_COMPLETED
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Storage errors end the job; per-line errors are written as results
+            while isinstance(e, ExceptionGroup):
+                e = e.exceptions[0]
+            logger.error(f"Batch {job.id} failed", exc_info=e)
+            job.status = STATUS_FAILED
+            job.error = str(e)
+        finally:
+            BATCH_JOBS_RUNNING.dec()
+            self._jobs.pop(job.id, None)
+            self._tasks.pop(job.id, None)
+        job.completed_at = int(time.time())
+        await asyncio.to_thread(self._store.save, job)
+        logger.info(
+            f"Batch {job.id} {job.status}: {job.completed} completed, {job.failed} failed"
+        )
+
+    # -------------------------------------------------------------------------
+    # Execution
+    # -------------------------------------------------------------------------
+
+    async def _execute(self, job: BatchJob) -> None:
+        """
+        Feed input lines to gateway workers and native batch groups.
+
+        Workers and native groups run in a TaskGroup: if one fails, the
+        producer is cancelled rather than blocking on a full queue.
+        """
+        chat_service = self._chat_service_factory()
+        done = await asyncio.to_thread(self._store.recover_output, job)
+        writer = _OutputWriter(self._store, job, done, self._checkpoint_interval)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=job.concurrency * 2)
+        groups: dict[str, list[tuple[int, str, ChatCompletionRequest]]] = {}
+        native: dict[str, NativeBatchProvider] = {}
+        try:
+            async with asyncio.TaskGroup() as tasks:
+                for _ in range(job.concurrency):
+                    tasks.create_task(self._worker(chat_service, queue, writer))
+
+                for index, record in self._store.iter_input(job.id):
+                    custom_id = record["custom_id"]
+                    request, error = self._parse_request(record)
+                    if request is None:
+                        await writer.write(custom_id, error=error)
+                        continue
+                    target = self._native_target(job, chat_service, request)
+                    if target is None:
+                        if custom_id not in done:
+                            await queue.put((custom_id, request))
+                        continue
+                    name, provider, request = target
+                    native[name] = provider
+                    group = groups.setdefault(name, [])
+                    group.append((index, custom_id, request))
+                    if len(group) >= provider.native_batch_max_requests:
+                        tasks.create_task(
+                            self._run_native(job, name, provider, groups.pop(name), writer)
+                        )
+
+                for name, group in groups.items():
+                    if (
+                        len(group) >= self._native_min_requests
+                        or _group_key(name, group) in job.native_batches
+                    ):
+                        tasks.create_task(self._run_native(job, name, native[name], group, writer))
+                        continue
+                    # Too small to be worth a day's latency
+                    for _, custom_id, request in group:
+                        if custom_id not in done:
+                            await queue.put((custom_id, request))
+
+                for _ in range(job.concurrency):
+                    await queue.put(None)
+        finally:
+            await writer.close()
+
+    async def _worker(
+        self, chat_service: ChatService, queue: asyncio.Queue, writer: _OutputWriter
+    ) -> None:
+        while (item := await queue.get()) is not None:
+            custom_id, request = item
+            response, error = await self._complete(chat_service, request)
+            await writer.write(custom_id, response=response, error=error)
+
+    async def _complete(
+        self, chat_service: ChatService, request: ChatCompletionRequest
+    ) -> tuple[Optional[ChatCompletionResponse], Optional[dict[str, Any]]]:
+        """Run one line through the gateway; failures become error results."""
+        try:
+            provider = chat_service.router.resolve(request.model).provider
+        except NoProviderError as e:
+            return None, _error("model_not_found", str(e))
+        await self._budget(provider).acquire()
+        try:
+            return await chat_service.complete(request), None
+        except LLMGatewayException as e:
+            return None, _error(e.error_code, e.message)
+        except ChatServiceError as e:
+            return None, _error("invalid_request", str(e))
+        except Exception as e:
+            # One bad line must not fail a job of many thousands
+            logger.exception("Unexpected error in batch request")
+            return None, _error("internal_error", str(e))
+
+    async def _run_native(
+        self,
+        job: BatchJob,
+        name: str,
+        provider: NativeBatchProvider,
+        group: list[tuple[int, str, ChatCompletionRequest]],
+        writer: _OutputWriter,
+    ) -> None:
+        """Submit (or re-attach to) one native batch and write its results."""
+        key = _group_key(name, group)
+        pending = {
+            f"line-{index}": (custom_id, request)
+            for index, custom_id, request in group
+            if custom_id not in writer.done
+        }
+        if not pending:
+            return
+        error = _error("native_batch_failed", f"{name} batch returned no result")
+        try:
+            remote_id = job.native_batches.get(key)
+            if remote_id is None:
+                await self._budget(name).acquire()
+                remote_id = await provider.submit_batch(
+                    [(line_id, request) for line_id, (_, request) in pending.items()]
+                )
+                job.native_batches[key] = remote_id
+                # Persist before polling so a restart re-attaches instead of resubmitting
+                await writer.checkpoint()
+                logger.info(f"Batch {job.id}: {len(pending)} lines sent to {name} batch {remote_id}")
+
+            if await self._wait_native(provider, remote_id) != NATIVE_BATCH_FAILED:
+                async for result in provider.iter_batch_results(remote_id):
+                    entry = pending.pop(result.custom_id, None)
+                    if entry is not None:
+                        _record_native_usage(name, provider, entry[1], result.response)
+                        await writer.write(
+                            entry[0], response=result.response, error=result.error, path="native"
+                        )
+        except ProviderError as e:
+            logger.warning(f"Batch {job.id}: native {name} batch failed: {e.message}")
+            error = _error(e.error_code, e.message)
+        for custom_id, _ in pending.values():
+            await writer.write(custom_id, error=error, path="native")
+
+    async def _wait_native(self, provider: NativeBatchProvider, remote_id: str) -> str:
+        """Poll until a native batch ends; transient poll errors are retried."""
+        while True:
+            try:
+                status = await provider.get_batch_status(remote_id)
+            except ProviderError as e:
+                logger.warning(f"Polling native batch {remote_id} failed: {e.message}")
+                status = NATIVE_BATCH_IN_PROGRESS
+            if status != NATIVE_BATCH_IN_PROGRESS:
+                return status
+            await asyncio.sleep(self._native_poll_seconds)
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _parse_request(
+        record: dict[str, Any],
+    ) -> tuple[Optional[ChatCompletionRequest], Optional[dict[str, Any]]]:
+        try:
+            return ChatCompletionRequest.model_validate({**record["body"], "stream": False}), None
+        except ValidationError as e:
+            return None, _error("invalid_request", str(e))
+
+    def _native_target(
+        self, job: BatchJob, chat_service: ChatService, request: ChatCompletionRequest
+    ) -> Optional[tuple[str, NativeBatchProvider, ChatCompletionRequest]]:
+        """Provider batch API for a line, or None to run it through the gateway."""
+        # Session history and gateway-executed tools need the gateway
+        if not self._native_enabled or job.completion_window != "24h" or request.session_id:
+            return None
+        if any(chat_service.executes_tool(tool.function.name) for tool in request.tools or ()):
+            return None
+        try:
+            route = chat_service.router.resolve(request.model)
+            provider = chat_service.router.provider_for(route)
+        except NoProviderError:
+            return None
+        if not isinstance(provider, NativeBatchProvider):
+            return None
+        if route.model != request.model:
+            request = request.model_copy(update={"model": route.model})
+        return route.provider, provider, request
+
+    def _native_provider_named(self, name: str) -> Optional[NativeBatchProvider]:
+        provider = self._chat_service_factory().router.providers.get(name)
+        return provider if isinstance(provider, NativeBatchProvider) else None
+
+    def _budget(self, provider: str) -> ProviderRateBudget:
+        budget = self._budgets.get(provider)
+        if budget is None:
+            budget = ProviderRateBudget(self._rate_limits.get(provider, self._default_rate))
+            self._budgets[provider] = budget
+        return budget
+
+
+def _record_native_usage(
+    name: str,
+    provider: NativeBatchProvider,
+    request: ChatCompletionRequest,
+    response: Optional[ChatCompletionResponse],
+) -> None:
+    """Feed a native result's usage to the cost aggregator at the batch price."""
+    aggregator = get_cost_aggregator()
+    if aggregator is None or response is None or response.usage is None:
+        return
+    aggregator.record(
+        request.model,
+        response.usage,
+        provider=name,
+        price_multiplier=provider.native_batch_price_multiplier,
+    )
+
+
+def _group_key(name: str, group: list[tuple[int, str, ChatCompletionRequest]]) -> str:
+    """Stable key of a native group: its provider and first input line."""
+    return f"{name}:{group[0][0]}"
+
+
+# =============================================================================
+# Global Instance
+# =============================================================================
+
+_batch_manager: Optional[BatchManager] = None
+
+
+def get_batch_manager() -> Optional[BatchManager]:
+    """
+    Get the manager serving /v1/batches.
+
+    Returns:
+        The manager, or None when batch jobs are disabled (the routes
+        then answer 503).
+    """
+    return _batch_manager
+
+
+def set_batch_manager(manager: Optional[BatchManager]) -> None:
+    """
+    Install the manager serving /v1/batches.
+
+    Install it after resume(), so a job left unfinished by a previous
+    process is running before clients can list or cancel it.
+
+    Args:
+        manager: Manager to serve, or None to disable the routes
+    """
+    global _batch_manager
+    _batch_manager = manager
+
+
+def reset_batch_manager() -> None:
+    """Disable the /v1/batches routes (for testing)."""
+    set_batch_manager(None)
@@ -23,16 +23,30 @@ Pattern: Dependency Injection (router, executor, session_manager)
 Pattern: Command Executor (tool calls as commands)
 """
 
+import functools
 import json
 import logging
 import re
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from src.models.domain import Message as DomainMessage, ToolCall
 from src.models.requests import ChatCompletionRequest, Message
-from src.models.responses import ChatCompletionResponse
+from src.models.responses import ChatCompletionChunk, ChatCompletionResponse
+from src.observability.profiling import profile_phase
 from src.providers.base import LLMProvider
+from src.providers.instrumentation import InstrumentedProvider
 from src.providers.router import ProviderRouter, NoProviderError
+from src.providers.routing_table import (  # noqa: F401 - DEFAULT_CONTEXT_LIMITS re-exported
+    DEFAULT_CONTEXT_LIMITS,
+    ModelRoute,
+    lookup_context_limit,
+)
+from src.services.cost_aggregator import get_cost_aggregator
+from src.services.tool_stream import (
+    EagerToolDispatcher,
+    ToolCallStreamAssembler,
+    holds_tool_turn,
+)
 from src.sessions.manager import SessionManager, SessionNotFoundError
 from src.tools.executor import ToolExecutor
 
@@ -54,28 +68,6 @@ _THINKING_CLOSE_PATTERN = re.compile(
 # Context management configuration
 DEFAULT_CHARS_PER_TOKEN = 4  # Conservative estimate for token counting
 CONTEXT_SAFETY_MARGIN = 0.85  # Use 85% of context limit to leave headroom
-DEFAULT_CONTEXT_LIMITS = {
-    # Registered external models only (gateway manages cloud, CMS manages local)
-    # OpenAI
-    "gpt-5.2": 128000,
-    "gpt-5.2-pro": 128000,
-    "gpt-5-mini": 128000,
-    "gpt-5-nano": 128000,
-    # Anthropic
-    "claude-opus-4.5": 200000,
-    "claude-sonnet-4.5": 200000,
-    "claude-opus-4-5-20250514": 200000,
-    "claude-sonnet-4-5-20250514": 200000,
-    "claude-opus-4-20250514": 200000,
-    "claude-sonnet-4-20250514": 200000,
-    # Google
-    "gemini-2.0-flash": 1048576,
-    "gemini-1.5-pro": 2097152,
-    "gemini-1.5-flash": 1048576,
-    "gemini-pro": 32768,
-    # DeepSeek
-    "deepseek-reasoner": 64000,
-}
 
 
 class ChatServiceError(Exception):
@@ -178,6 +170,15 @@ class ChatService:
         self._session_manager = session_manager
         self._max_tool_iterations = max_tool_iterations
 
+    @property
+    def router(self) -> ProviderRouter:
+        """The provider router (WBS-PERF24: batch jobs resolve providers through it)."""
+        return self._router
+
+    def executes_tool(self, name: str) -> bool:
+        """Whether ``name`` is a gateway-registered tool this service runs itself."""
+        return self._executor.registry.has(name)
+
     async def complete(
         self, request: ChatCompletionRequest
     ) -> ChatCompletionResponse:
@@ -204,42 +205,19 @@ class ChatService:
         Raises:
             ChatServiceError: If provider not found or session not found.
         """
-        # Resolve model aliases (e.g., "openai" -> "gpt-5.2")
-        resolved_model = self._router.resolve_model_alias(request.model)
-        if resolved_model != request.model:
-            # Create new request with resolved model
-            request = ChatCompletionRequest(
-                model=resolved_model,
-                messages=request.messages,
-                temperature=request.temperature,
-                max_tokens=request.max_tokens,
-                top_p=request.top_p,
-                n=request.n,
-                stream=request.stream,
-                stop=request.stop,
-                presence_penalty=request.presence_penalty,
-                frequency_penalty=request.frequency_penalty,
-                tools=request.tools,
-                tool_choice=request.tool_choice,
-                user=request.user,
-                seed=request.seed,
-                session_id=request.session_id,
-            )
-        
-        # WBS 2.6.1.1.6: Get provider from router
-        try:
-            provider = self._router.get_provider(request.model)
-        except NoProviderError as e:
-            raise ChatServiceError(f"No provider available: {e}") from e
+        # WBS 2.6.1.1.6: Get provider from router (aliases resolved, e.g. "openai" -> "gpt-5.2")
+        request, provider, route = self._route_request(request)
 
         # WBS 2.6.1.1.7-8: Load and prepend session history
-        messages = await self._build_messages_with_history(request)
+        with profile_phase("build_messages_with_history"):
+            messages = await self._build_messages_with_history(request)
 
         # Proactive context management: check if we're approaching limits
         # When CMS proxy is enabled, CMS intercepts and handles context window
         # management — skip gateway-side compression to avoid double-processing.
-        context_limit = self._get_context_limit(request.model)
-        estimated_tokens = self._estimate_token_count(messages)
+        context_limit = route.context_limit
+        with profile_phase("estimate_tokens"):
+            estimated_tokens = self._estimate_token_count(messages)
         
         from src.core.config import get_settings
         _settings = get_settings()
@@ -252,11 +230,12 @@ class ChatService:
                 context_limit,
                 request.model,
             )
-            messages = await self._compress_context(
-                messages, 
-                context_limit,
-                request.model,
-            )
+            with profile_phase("compress_context"):
+                messages = await self._compress_context(
+                    messages, 
+                    context_limit,
+                    request.model,
+                )
         elif cms_proxy_active and estimated_tokens > context_limit * CONTEXT_SAFETY_MARGIN:
             logger.info(
                 "CMS proxy active — delegating context management for %d tokens (limit %d) to CMS",
@@ -268,7 +247,8 @@ class ChatService:
         working_request = self._create_working_request(request, messages)
 
         # WBS 2.6.1.1.9: Initial provider call
-        response = await provider.complete(working_request)
+        with profile_phase("provider_call", model=request.model):
+            response = await provider.complete(working_request)
 
         # Handle truncated thinking (Qwen3, DeepSeek-R1 thinking mode)
         # If model exhausted tokens on thinking without answer, retry with /no_think
@@ -277,9 +257,10 @@ class ChatService:
                 "Detected truncated thinking response, retrying with /no_think"
             )
             thinking_content = self._extract_thinking_content(response)
-            response = await self._retry_with_thinking_context(
-                provider, request, messages, thinking_content
-            )
+            with profile_phase("provider_call", model=request.model, retry="no_think"):
+                response = await self._retry_with_thinking_context(
+                    provider, request, messages, thinking_content
+                )
 
         # WBS 2.6.1.1.10-12: Handle tool calls loop
         iteration = 0
@@ -291,11 +272,166 @@ class ChatService:
             iteration += 1
 
         # WBS 2.6.1.1.13: Save messages to session
-        await self._save_to_session(request, messages, response)
+        with profile_phase("save_to_session"):
+            await self._save_to_session(request, messages, response)
 
         # WBS 2.6.1.1.14: Return final response
         return response
 
+    async def stream_completion(
+        self, request: ChatCompletionRequest
+    ) -> AsyncIterator[ChatCompletionChunk]:
+        """
+        Stream a chat completion as provider chunks.
+
+        WBS 2.2.3.2.6: stream_completion async generator used by the SSE route.
+        WBS-PERF20: Streaming tool loop with eager dispatch.
+
+        Provider deltas are forwarded as they arrive. When a turn ends with
+        tool calls that are all registered gateway tools, the results are
+        appended and the next turn is streamed on the same response, as
+        complete() does; that turn's tool-call deltas and finish chunk are
+        not sent, so the client never sees calls it should not run. When
+        every tool the request declares is a gateway tool, each call starts
+        executing as soon as its arguments close, while the model is still
+        generating the rest of the turn. Turns calling tools the gateway
+        does not know end the stream with their held-back chunks so the
+        client can run them. Truncated-thinking retries only apply to
+        complete(). Closing this generator closes the upstream provider
+        stream and cancels running tools.
+
+        Args:
+            request: The chat completion request.
+
+        Yields:
+            ChatCompletionChunk: Streamed chunks from the provider.
+
+        Raises:
+            ChatServiceError: If provider not found or session not found.
+        """
+        request, provider, _ = self._route_request(request)
+
+        with profile_phase("build_messages_with_history"):
+            messages = await self._build_messages_with_history(request)
+        working_request = self._create_working_request(request, messages)
+
+        from src.core.config import get_settings
+        tool_loop = get_settings().stream_tool_loop_enabled
+        eager = tool_loop and all(
+            self.executes_tool(tool.function.name) for tool in request.tools or ()
+        )
+
+        for iteration in range(self._max_tool_iterations + 1):
+            dispatcher = EagerToolDispatcher(self._executor, eager=eager)
+            assembler = ToolCallStreamAssembler(
+                on_complete=dispatcher.dispatch if tool_loop else None
+            )
+            held: list[ChatCompletionChunk] = []
+            try:
+                async for chunk in self._stream_turn(provider, working_request):
+                    assembler.feed(chunk)
+                    if tool_loop and holds_tool_turn(chunk):
+                        held.append(chunk)
+                    else:
+                        yield chunk
+
+                calls = assembler.finish()
+                if not (
+                    tool_loop
+                    and assembler.finish_reason == "tool_calls"
+                    and calls
+                    and iteration < self._max_tool_iterations
+                    and all(dispatcher.handles(call.name) for call in calls)
+                ):
+                    dispatcher.detach()
+                    for chunk in held:
+                        yield chunk
+                    return
+
+                logger.debug(
+                    f"Streaming tool turn {iteration}: {dispatcher.dispatched}/{len(calls)} "
+                    "calls dispatched before the turn ended"
+                )
+                tool_calls = [call.to_tool_call() for call in calls]
+                with profile_phase("tool_wait", count=len(tool_calls)):
+                    results = await dispatcher.results(tool_calls)
+            finally:
+                dispatcher.cancel()
+
+            messages = list(messages) + [
+                Message(
+                    role="assistant",
+                    content="".join(assembler.content) or None,
+                    tool_calls=[call.to_message_dict() for call in calls],
+                )
+            ]
+            messages.extend(
+                Message(role="tool", content=result.content, tool_call_id=result.tool_call_id)
+                for result in results
+            )
+            working_request = self._create_working_request(request, messages)
+
+    async def _stream_turn(
+        self, provider: LLMProvider, request: ChatCompletionRequest
+    ) -> AsyncIterator[ChatCompletionChunk]:
+        """
+        Stream one provider turn.
+
+        WBS-PERF2: Close the provider stream promptly when the consumer
+        stops early (client disconnect) instead of waiting for GC.
+        """
+        provider_stream = provider.stream(request)
+        try:
+            async for chunk in provider_stream:
+                yield chunk
+        finally:
+            aclose = getattr(provider_stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def _route_request(
+        self, request: ChatCompletionRequest
+    ) -> tuple[ChatCompletionRequest, LLMProvider, ModelRoute]:
+        """
+        Resolve the request's model to a compiled route and provider.
+
+        WBS-PERF5: One routing-table lookup yields the canonical model,
+        provider and context limit. Aliased requests are shallow-copied
+        with the canonical model instead of being re-validated.
+        WBS-PERF7: The provider is wrapped with call instrumentation.
+        WBS-PERF8: Usage is fed to the cost aggregator when one is running.
+        WBS-PERF9: Provider and session are attached for usage rollups.
+
+        Args:
+            request: The chat completion request.
+
+        Returns:
+            Tuple of (request with canonical model, provider, route).
+
+        Raises:
+            ChatServiceError: If no provider serves the model.
+        """
+        try:
+            route = self._router.resolve(request.model)
+            aggregator = get_cost_aggregator()
+            provider = InstrumentedProvider(
+                self._router.provider_for(route),
+                route.provider,
+                on_usage=(
+                    functools.partial(
+                        aggregator.record, provider=route.provider, session_id=request.session_id
+                    )
+                    if aggregator is not None
+                    else None
+                ),
+            )
+        except NoProviderError as e:
+            raise ChatServiceError(f"No provider available: {e}") from e
+
+        if route.model != request.model:
+            request = request.model_copy(update={"model": route.model})
+        return request, provider, route
+
     async def _build_messages_with_history(
         self, request: ChatCompletionRequest
     ) -> list[Message]:
@@ -509,13 +645,8 @@ class ChatService:
         Returns:
             Context limit in tokens.
         """
-        # Check known limits
-        for model_key, limit in DEFAULT_CONTEXT_LIMITS.items():
-            if model_key in model.lower():
-                return limit
-        
-        # Conservative fallback for unknown models
-        return 4096
+        # Known limits (memoized), conservative fallback for unknown models
+        return lookup_context_limit(model)
     
     def _estimate_token_count(self, messages: list[Message]) -> int:
         """
@@ -857,7 +988,8 @@ class ChatService:
 
         # WBS 2.6.1.2.6: Call provider again
         working_request = self._create_working_request(request, messages)
-        new_response = await provider.complete(working_request)
+        with profile_phase("provider_call", model=request.model):
+            new_response = await provider.complete(working_request)
 
         return new_response, messages
 
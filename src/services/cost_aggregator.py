@@ -0,0 +1,340 @@
+"""
+Cost Aggregator - WBS-PERF8 Buffered, Batched Cost Tracking
+
+This module records token usage for every provider call without a Redis
+round trip on the request path. Usage is accumulated in process per
+(day, model, API key) and flushed to Redis through
+CostTracker.record_usage_batch() in a single pipeline, either every
+``flush_interval_ms`` or as soon as ``max_pending`` records are buffered.
+
+Durability bound: a crash loses at most one flush interval (or
+``max_pending`` records) of usage; a clean shutdown flushes everything
+from the lifespan teardown. A failed flush keeps the deltas and retries
+on the next cycle.
+
+WBS-PERF9: When a UsageRollupStore is attached, the same records are also
+accumulated per (minute, dimension, value) and written as time-bucketed
+rollups on each flush.
+
+Reference Documents:
+- GUIDELINES pp. 2309: Cost tracking and token usage
+- GUIDELINES pp. 2145: Graceful degradation (Redis is optional)
+
+Pattern: Write-behind buffer with periodic batch flush
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+Anti-Pattern §4.1 Avoided: Cognitive complexity < 15 per function
+"""
+
+import asyncio
+import contextvars
+import datetime as dt
+import hashlib
+import logging
+import time
+from typing import TYPE_CHECKING, Mapping, Optional
+
+from src.services.cost_tracker import (
+    CostTracker,
+    CostTrackerError,
+    UsageBucket,
+    UsageSummary,
+    merge_usage,
+)
+from src.services.usage_rollup import RollupPoint, UsageRollupError, UsageRollupStore
+
+if TYPE_CHECKING:
+    from src.models.responses import Usage
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_FLUSH_INTERVAL_MS: int = 1000
+"""Default maximum time usage stays buffered before a flush."""
+
+DEFAULT_MAX_PENDING_RECORDS: int = 500
+"""Default number of buffered records that triggers an early flush."""
+
+ANONYMOUS_API_KEY_ID = "anonymous"
+"""API key identifier used when the request carries no key."""
+
+
+# =============================================================================
+# WBS-PERF8: API Key Attribution
+# =============================================================================
+
+_api_key_id: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "api_key_id", default=ANONYMOUS_API_KEY_ID
+)
+
+
+def api_key_id_from_headers(headers: Mapping[str, str]) -> str:
+    """
+    Derive a stable, non-reversible identifier for the caller's API key.
+
+    Args:
+        headers: Request headers (Authorization: Bearer ... or X-API-Key).
+
+    Returns:
+        First 16 hex chars of the key's SHA-256, or "anonymous".
+    """
+    key = headers.get("x-api-key") or ""
+    authorization = headers.get("authorization") or ""
+    if not key and authorization.lower().startswith("bearer "):
+        key = authorization[7:].strip()
+    if not key:
+        return ANONYMOUS_API_KEY_ID
+    return hash_identifier(key)
+
+
+def hash_identifier(value: str) -> str:
+    """First 16 hex chars of ``value``'s SHA-256, for storing caller identifiers."""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+
+
+def set_api_key_id(api_key_id: str) -> None:
+    """Attribute usage in the current request context to ``api_key_id``."""
+    _api_key_id.set(api_key_id)
+
+
+def get_api_key_id() -> str:
+    """Get the API key identifier for the current request context."""
+    return _api_key_id.get()
+
+
+# =============================================================================
+# WBS-PERF8: CostAggregator
+# =============================================================================
+
+
+class CostAggregator:
+    """
+    In-process usage accumulator with periodic single-pipeline flushes.
+
+    Example:
+        >>> aggregator = CostAggregator(CostTracker(redis))
+        >>> await aggregator.start()
+        >>> aggregator.record("gpt-5.2", usage)   # non-blocking
+        >>> await aggregator.stop()               # final flush
+    """
+
+    def __init__(
+        self,
+        tracker: CostTracker,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        max_pending: int = DEFAULT_MAX_PENDING_RECORDS,
+        rollup: Optional[UsageRollupStore] = None,
+    ) -> None:
+        """
+        Initialize the aggregator.
+
+        Args:
+            tracker: CostTracker used for pricing and Redis writes.
+            flush_interval_ms: Maximum time between flushes.
+            max_pending: Buffered records that trigger an early flush.
+            rollup: Optional time-bucketed rollup store (WBS-PERF9).
+        """
+        self._tracker = tracker
+        self._flush_interval = flush_interval_ms / 1000
+        self._max_pending = max_pending
+        self._rollup = rollup
+        self._deltas: dict[UsageBucket, UsageSummary] = {}
+        self._rollup_deltas: dict[RollupPoint, UsageSummary] = {}
+        self._pending = 0
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of records buffered since the last flush."""
+        return self._pending
+
+    def record(
+        self,
+        model: str,
+        usage: "Usage",
+        api_key_id: Optional[str] = None,
+        provider: Optional[str] = None,
+        session_id: Optional[str] = None,
+        price_multiplier: float = 1.0,
+    ) -> None:
+        """
+        Buffer usage for one provider call.
+
+        Args:
+            model: Model name
+            usage: Usage with token counts
+            api_key_id: Caller identifier (defaults to the request context's)
+            provider: Provider name (rollup dimension)
+            session_id: Session id (rollup dimension, stored hashed)
+            price_multiplier: Scales the list price (e.g. 0.5 for provider batch APIs)
+        """
+        api_key_id = api_key_id or get_api_key_id()
+        delta = UsageSummary(
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=usage.completion_tokens,
+            total_tokens=usage.total_tokens,
+            total_cost=self._tracker.calculate_cost(
+                model,
+                usage.prompt_tokens,
+                usage.completion_tokens,
+                usage.cache_read_tokens or 0,
+                usage.cache_write_tokens or 0,
+            )
+            * price_multiplier,
+            request_count=1,
+        )
+        merge_usage(self._deltas, UsageBucket(dt.date.today(), model, api_key_id), delta)
+        if self._rollup is not None:
+            minute = int(time.time()) // 60 * 60
+            dimensions = {
+                "model": model,
+                "provider": provider,
+                "api_key": api_key_id,
+                "session": hash_identifier(session_id) if session_id else None,
+            }
+            for dimension, value in dimensions.items():
+                if value:
+                    merge_usage(self._rollup_deltas, RollupPoint(minute, dimension, value), delta)
+
+        self._pending += 1
+        if self._pending >= self._max_pending:
+            self._flush_requested.set()
+
+    async def flush(self) -> int:
+        """
+        Write buffered deltas to Redis, one pipeline per store.
+
+        Deltas taken for the write are merged back into the buffer if it
+        fails or is cancelled, so they are retried by the next flush.
+
+        Returns:
+            Number of records flushed (0 if empty or a write failed).
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            deltas, rollup_deltas, pending = self._deltas, self._rollup_deltas, self._pending
+            self._deltas, self._rollup_deltas, self._pending = {}, {}, 0
+            try:
+                failed = not await self._write(deltas, rollup_deltas)
+            except BaseException:
+                _restore(self._deltas, deltas)
+                _restore(self._rollup_deltas, rollup_deltas)
+                self._pending += pending
+                raise
+            if failed:
+                self._pending += pending
+                return 0
+            return pending
+
+    async def _write(
+        self,
+        deltas: dict[UsageBucket, UsageSummary],
+        rollup_deltas: dict[RollupPoint, UsageSummary],
+    ) -> bool:
+        """
+        Write one batch of deltas; a store whose write failed gets its deltas back.
+
+        The written dicts are emptied as each store succeeds, so a
+        cancellation part-way through only restores what was not written.
+
+        Returns:
+            True if every store was written.
+        """
+        ok = True
+        try:
+            await self._tracker.record_usage_batch(deltas)
+            deltas.clear()
+        except CostTrackerError as e:
+            logger.warning("Cost flush failed, retrying next cycle: %s", e)
+            _restore(self._deltas, deltas)
+            deltas.clear()
+            ok = False
+        if self._rollup is not None:
+            try:
+                await self._rollup.write_batch(rollup_deltas)
+                rollup_deltas.clear()
+            except UsageRollupError as e:
+                logger.warning("Usage rollup flush failed, retrying next cycle: %s", e)
+                _restore(self._rollup_deltas, rollup_deltas)
+                rollup_deltas.clear()
+                ok = False
+        else:
+            rollup_deltas.clear()
+        return ok
+
+    async def start(self) -> None:
+        """Start the background flush loop (no-op if running)."""
+        if self._task is None or self._task.done():
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the flush loop and flush whatever is buffered.
+
+        The loop is asked to exit rather than cancelled, so a flush in
+        progress completes before the final one runs.
+        """
+        if self._task is not None:
+            self._stopping.set()
+            self._flush_requested.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        """Flush every interval, or earlier when max_pending is reached."""
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            if self._stopping.is_set():
+                return
+            await self.flush()
+
+
+def _restore(target: dict, deltas: Mapping) -> None:
+    """Merge un-flushed deltas back into a buffer."""
+    for key, delta in deltas.items():
+        merge_usage(target, key, delta)
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+_aggregator: Optional[CostAggregator] = None
+
+
+def get_cost_aggregator() -> Optional[CostAggregator]:
+    """
+    Get the global cost aggregator.
+
+    Returns:
+        The aggregator, or None when Redis is unavailable.
+    """
+    return _aggregator
+
+
+def set_cost_aggregator(aggregator: Optional[CostAggregator]) -> None:
+    """
+    Install (or clear) the global cost aggregator.
+
+    Called from the application lifespan once Redis is available.
+    """
+    global _aggregator
+    _aggregator = aggregator
+
+
+def reset_cost_aggregator() -> None:
+    """Reset the global cost aggregator (for testing)."""
+    set_cost_aggregator(None)
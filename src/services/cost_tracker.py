@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import datetime as dt
 from decimal import Decimal
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Hashable, Mapping, NamedTuple, Optional
 
 from pydantic import BaseModel, Field
 from redis.asyncio import Redis
@@ -60,6 +60,37 @@ class UsageSummary(BaseModel):
     request_count: int = Field(default=0, description="Number of requests")
 
 
+def merge_usage(target: dict, key: Hashable, delta: UsageSummary) -> None:
+    """
+    Add ``delta`` into ``target[key]``, creating the entry if needed.
+
+    Used to accumulate usage deltas before batched writes (WBS-PERF8/9).
+    """
+    current = target.get(key)
+    if current is None:
+        current = target[key] = UsageSummary()
+    current.prompt_tokens += delta.prompt_tokens
+    current.completion_tokens += delta.completion_tokens
+    current.total_tokens += delta.total_tokens
+    current.total_cost += delta.total_cost
+    current.request_count += delta.request_count
+
+
+class UsageBucket(NamedTuple):
+    """
+    Aggregation key for batched usage writes (WBS-PERF8).
+
+    Attributes:
+        date: Usage day
+        model: Model name
+        api_key_id: Hashed API key identifier ("anonymous" if none)
+    """
+
+    date: dt.date
+    model: str
+    api_key_id: str
+
+
 # =============================================================================
 # Model Pricing Configuration - WBS 2.6.2.1.3
 # Prices per 1M tokens (input/output)
@@ -159,6 +190,130 @@ DEFAULT_PRICING: dict[str, dict[str, Decimal]] = {
 }
 
 
+PRICING_CACHE_SIZE: int = 1024
+"""Maximum memoized model -> pricing resolutions per PricingTable (WBS-PERF5)."""
+
+_PER_MILLION = Decimal("1000000")
+
+CACHE_READ_PRICE_MULTIPLIER = Decimal("0.1")
+"""Price of prompt-cache reads relative to input, unless a model sets ``cache_read``."""
+
+CACHE_WRITE_PRICE_MULTIPLIER = Decimal("1.25")
+"""Price of prompt-cache writes relative to input, unless a model sets ``cache_write``."""
+
+
+# =============================================================================
+# WBS-PERF5: Pricing Lookup
+# =============================================================================
+
+
+class PricingTable:
+    """
+    Model pricing lookup with prefix matching and memoization.
+
+    Prefixes are sorted once at construction; per-model resolutions are
+    memoized. Needs no Redis, so it is usable from the request path
+    (e.g. provider instrumentation) as well as by CostTracker.
+
+    Attributes:
+        pricing: Model pricing configuration
+    """
+
+    def __init__(self, pricing: Optional[dict[str, dict[str, Decimal]]] = None) -> None:
+        """
+        Initialize PricingTable.
+
+        Args:
+            pricing: Optional custom pricing (defaults to DEFAULT_PRICING)
+        """
+        self.pricing = pricing or DEFAULT_PRICING
+        self._sorted_prefixes = sorted(
+            (k for k in self.pricing if k != "_default"),
+            key=len,
+            reverse=True,
+        )
+        self._cache: dict[str, dict[str, Decimal]] = {}
+
+    def get(self, model: str) -> dict[str, Decimal]:
+        """
+        Get pricing for a specific model.
+
+        Args:
+            model: Model name
+
+        Returns:
+            Pricing dict with input/output rates
+        """
+        # Try exact match first
+        if model in self.pricing:
+            return self.pricing[model]
+
+        cached = self._cache.get(model)
+        if cached is not None:
+            return cached
+
+        pricing = self._match_prefix(model)
+        if len(self._cache) >= PRICING_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[model] = pricing
+        return pricing
+
+    def _match_prefix(self, model: str) -> dict[str, Decimal]:
+        """Match a model against pricing prefixes, falling back to _default."""
+        # Try prefix match (e.g., "gpt-4-0613" matches "gpt-4")
+        # Prefixes are sorted by length descending to prefer more specific ones
+        # e.g., "gpt-4-turbo-preview" should match "gpt-4-turbo", not "gpt-4"
+        for model_prefix in self._sorted_prefixes:
+            if model.startswith(model_prefix):
+                return self.pricing[model_prefix]
+
+        # Fallback to default
+        return self.pricing.get("_default", {"input": Decimal("1.00"), "output": Decimal("2.00")})
+
+    def calculate_cost(
+        self,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+    ) -> float:
+        """
+        Calculate cost for token usage.
+
+        Cache tokens are part of prompt_tokens (OpenAI semantics) and are
+        priced at the model's ``cache_read``/``cache_write`` rates, or at
+        the input rate scaled by the default cache multipliers.
+
+        Args:
+            model: Model name
+            prompt_tokens: Number of prompt tokens, including cache tokens
+            completion_tokens: Number of completion tokens
+            cache_read_tokens: Prompt tokens read from the prompt cache
+            cache_write_tokens: Prompt tokens written to the prompt cache
+
+        Returns:
+            Estimated cost in USD as float
+        """
+        pricing = self.get(model)
+        input_price = pricing["input"]
+        uncached = max(0, prompt_tokens - cache_read_tokens - cache_write_tokens)
+        # Prices are per 1M tokens
+        input_cost = (
+            Decimal(uncached) * input_price
+            + Decimal(cache_read_tokens)
+            * pricing.get("cache_read", input_price * CACHE_READ_PRICE_MULTIPLIER)
+            + Decimal(cache_write_tokens)
+            * pricing.get("cache_write", input_price * CACHE_WRITE_PRICE_MULTIPLIER)
+        ) / _PER_MILLION
+        output_cost = (Decimal(completion_tokens) / _PER_MILLION) * pricing["output"]
+        return float(input_cost + output_cost)
+
+
+DEFAULT_PRICING_TABLE = PricingTable(DEFAULT_PRICING)
+"""Shared lookup over DEFAULT_PRICING."""
+
+
 # =============================================================================
 # CostTracker Service - WBS 2.6.2.1.2
 # =============================================================================
@@ -180,6 +335,7 @@ class CostTracker:
     KEY_PREFIX = "cost:"
     DAILY_KEY_PREFIX = "cost:daily:"
     MODEL_KEY_PREFIX = "cost:model:"
+    API_KEY_KEY_PREFIX = "cost:key:"
 
     def __init__(
         self,
@@ -194,7 +350,9 @@ class CostTracker:
             pricing: Optional custom pricing (defaults to DEFAULT_PRICING)
         """
         self._redis = redis_client
-        self._pricing = pricing or DEFAULT_PRICING
+        # WBS-PERF5: Prefixes sorted once; resolved pricing memoized per model
+        self._pricing_table = PricingTable(pricing) if pricing else DEFAULT_PRICING_TABLE
+        self._pricing = self._pricing_table.pricing
 
     @property
     def pricing(self) -> dict[str, dict[str, Decimal]]:
@@ -211,30 +369,15 @@ class CostTracker:
         Returns:
             Pricing dict with input/output rates
         """
-        # Try exact match first
-        if model in self._pricing:
-            return self._pricing[model]
-
-        # Try prefix match (e.g., "gpt-4-0613" matches "gpt-4")
-        # Sort by length descending to prefer longer/more specific prefixes
-        # e.g., "gpt-4-turbo-preview" should match "gpt-4-turbo", not "gpt-4"
-        sorted_prefixes = sorted(
-            (k for k in self._pricing if k != "_default"),
-            key=len,
-            reverse=True,
-        )
-        for model_prefix in sorted_prefixes:
-            if model.startswith(model_prefix):
-                return self._pricing[model_prefix]
-
-        # Fallback to default
-        return self._pricing.get("_default", {"input": Decimal("1.00"), "output": Decimal("2.00")})
+        return self._pricing_table.get(model)
 
     def calculate_cost(
         self,
         model: str,
         prompt_tokens: int,
         completion_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> float:
         """
         Calculate cost for token usage.
@@ -243,17 +386,17 @@ class CostTracker:
 
         Args:
             model: Model name
-            prompt_tokens: Number of prompt tokens
+            prompt_tokens: Number of prompt tokens, including cache tokens
             completion_tokens: Number of completion tokens
+            cache_read_tokens: Prompt tokens read from the prompt cache
+            cache_write_tokens: Prompt tokens written to the prompt cache
 
         Returns:
             Estimated cost in USD as float
         """
-        pricing = self._get_model_pricing(model)
-        # Prices are per 1M tokens
-        input_cost = (Decimal(prompt_tokens) / Decimal("1000000")) * pricing["input"]
-        output_cost = (Decimal(completion_tokens) / Decimal("1000000")) * pricing["output"]
-        return float(input_cost + output_cost)
+        return self._pricing_table.calculate_cost(
+            model, prompt_tokens, completion_tokens, cache_read_tokens, cache_write_tokens
+        )
 
     def _get_daily_key(self, target_date: Optional[dt.date] = None) -> str:
         """Get Redis key for daily usage."""
@@ -288,7 +431,13 @@ class CostTracker:
             prompt_tokens = usage.prompt_tokens
             completion_tokens = usage.completion_tokens
             total_tokens = usage.total_tokens
-            cost = self.calculate_cost(model, prompt_tokens, completion_tokens)
+            cost = self.calculate_cost(
+                model,
+                prompt_tokens,
+                completion_tokens,
+                usage.cache_read_tokens or 0,
+                usage.cache_write_tokens or 0,
+            )
 
             # Get keys
             daily_key = self._get_daily_key()
@@ -328,6 +477,40 @@ class CostTracker:
         except Exception as e:
             raise CostTrackerError(f"Failed to record usage: {e}") from e
 
+    async def record_usage_batch(self, deltas: Mapping[UsageBucket, UsageSummary]) -> None:
+        """
+        Apply pre-aggregated usage deltas in a single pipeline.
+
+        WBS-PERF8: Used by CostAggregator so that many requests cost one
+        Redis round trip. Writes the same daily/model hashes as
+        record_usage(), plus per-API-key hashes.
+
+        Args:
+            deltas: Usage accumulated per (date, model, api_key_id)
+
+        Raises:
+            CostTrackerError: If the pipeline fails
+        """
+        if not deltas:
+            return
+        try:
+            pipe = self._redis.pipeline()
+            for bucket, delta in deltas.items():
+                keys = (
+                    self._get_daily_key(bucket.date),
+                    self._get_model_key(bucket.model, bucket.date),
+                    f"{self.API_KEY_KEY_PREFIX}{bucket.date.isoformat()}:{bucket.api_key_id}",
+                )
+                for key in keys:
+                    pipe.hincrby(key, "prompt_tokens", delta.prompt_tokens)
+                    pipe.hincrby(key, "completion_tokens", delta.completion_tokens)
+                    pipe.hincrby(key, "total_tokens", delta.total_tokens)
+                    pipe.hincrbyfloat(key, "total_cost", delta.total_cost)
+                    pipe.hincrby(key, "request_count", delta.request_count)
+            await pipe.execute()
+        except Exception as e:
+            raise CostTrackerError(f"Failed to record usage batch: {e}") from e
+
     async def get_daily_usage(
         self,
         date: Optional[dt.date] = None,
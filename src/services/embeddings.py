@@ -0,0 +1,166 @@
+"""
+Embedding Service - WBS-PERF23
+
+Serves OpenAI-compatible embeddings requests. The request's model is
+resolved to a backend through the EmbeddingRouter; the input is split into
+chunks of the backend's ``max_batch_size``, the chunks are embedded
+concurrently (bounded per request), and the vectors are reassembled in
+input order. Vectors are returned as float lists, or as base64 of
+little-endian float32 when ``encoding_format="base64"``, which is roughly
+a quarter of the JSON size and needs no float parsing on the client.
+
+Reference Documents:
+- OpenAI Embeddings API: https://platform.openai.com/docs/api-reference/embeddings
+- GUIDELINES pp. 2309: Batching and connection reuse for downstream calls
+
+Pattern: Scatter-gather over provider-sized batches
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+"""
+
+import asyncio
+import logging
+from typing import Optional, Union
+
+from src.core.exceptions import GatewayValidationError
+from src.models.requests import EmbeddingRequest
+from src.models.responses import EmbeddingData, EmbeddingResponse, EmbeddingUsage
+from src.providers.embeddings import (
+    EmbeddingBackend,
+    EmbeddingBatch,
+    EmbeddingRouter,
+    encode_float32_base64,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_MAX_INPUTS = 8192
+"""Most input texts accepted per request."""
+
+DEFAULT_MAX_CONCURRENT_BATCHES = 4
+"""Provider-sized batches of one request embedded at the same time."""
+
+CHARS_PER_TOKEN = 4
+"""Token estimate for backends that do not report usage."""
+
+
+# =============================================================================
+# EmbeddingService
+# =============================================================================
+
+
+class EmbeddingService:
+    """
+    Embed request inputs through the backend that serves the model.
+
+    Example:
+        >>> service = EmbeddingService(create_embedding_router(settings))
+        >>> response = await service.create(EmbeddingRequest(model="bge-m3", input=texts))
+    """
+
+    def __init__(
+        self,
+        router: EmbeddingRouter,
+        max_inputs: int = DEFAULT_MAX_INPUTS,
+        max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+    ) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            router: Resolves models to backends
+            max_inputs: Most input texts per request
+            max_concurrent_batches: Concurrent upstream requests per request
+        """
+        self._router = router
+        self._max_inputs = max_inputs
+        self._max_concurrent_batches = max(1, max_concurrent_batches)
+
+    @property
+    def router(self) -> EmbeddingRouter:
+        """The model router."""
+        return self._router
+
+    async def create(self, request: EmbeddingRequest) -> EmbeddingResponse:
+        """
+        Embed all inputs of a request.
+
+        Args:
+            request: OpenAI-compatible embeddings request
+
+        Returns:
+            EmbeddingResponse with one entry per input, in order
+
+        Raises:
+            NoProviderError: The model is not registered or not configured.
+            GatewayValidationError: Too many inputs.
+            ProviderError: A backend request failed.
+        """
+        texts = request.texts
+        if len(texts) > self._max_inputs:
+            raise GatewayValidationError(
+                f"Too many inputs: {len(texts)} (maximum {self._max_inputs})"
+            )
+        backend = self._router.resolve(request.model)
+        batches = await self._embed_batches(backend, texts, request.model, request.dimensions)
+
+        vectors = [vector for batch in batches for vector in batch.vectors]
+        prompt_tokens = sum(
+            batch.prompt_tokens or self._estimate_tokens(chunk)
+            for batch, chunk in zip(batches, self._chunks(texts, backend.max_batch_size))
+        )
+        return EmbeddingResponse(
+            data=[
+                EmbeddingData(index=i, embedding=self._encode(vector, request.encoding_format))
+                for i, vector in enumerate(vectors)
+            ],
+            model=request.model,
+            usage=EmbeddingUsage(prompt_tokens=prompt_tokens, total_tokens=prompt_tokens),
+        )
+
+    async def _embed_batches(
+        self,
+        backend: EmbeddingBackend,
+        texts: list[str],
+        model: str,
+        dimensions: Optional[int],
+    ) -> list[EmbeddingBatch]:
+        """Embed provider-sized chunks concurrently; results are in chunk order."""
+        chunks = self._chunks(texts, backend.max_batch_size)
+        if len(chunks) == 1:
+            return [await backend.embed(chunks[0], model, dimensions)]
+
+        semaphore = asyncio.Semaphore(self._max_concurrent_batches)
+
+        async def run(chunk: list[str]) -> EmbeddingBatch:
+            async with semaphore:
+                return await backend.embed(chunk, model, dimensions)
+
+        logger.debug(
+            f"Embedding {len(texts)} inputs in {len(chunks)} batches via {backend.name}"
+        )
+        tasks = [asyncio.ensure_future(run(chunk)) for chunk in chunks]
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            # One failed batch fails the request; stop the others
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _chunks(texts: list[str], size: int) -> list[list[str]]:
+        return [texts[i : i + size] for i in range(0, len(texts), size)]
+
+    @staticmethod
+    def _estimate_tokens(texts: list[str]) -> int:
+        return sum(max(1, len(text) // CHARS_PER_TOKEN) for text in texts)
+
+    @staticmethod
+    def _encode(vector: list[float], encoding_format: str) -> Union[list[float], str]:
+        if encoding_format == "base64":
+            return encode_float32_base64(vector)
+        return vector
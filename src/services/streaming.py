@@ -0,0 +1,223 @@
+"""
+Stream Coalescing - WBS-PERF1 Adaptive SSE Frame Coalescing
+
+This module provides an optional stage between a provider's stream() and the
+SSE writer that merges small content deltas into a single frame.
+
+Fast local models (and some cloud providers) emit one delta per token. Each
+delta becomes its own SSE frame and ASGI send, paying syscall and per-message
+middleware overhead. The coalescer buffers consecutive content-only deltas and
+flushes them as one chunk when either the time window elapses or the buffered
+payload reaches a byte threshold.
+
+Rules:
+- The first content delta is always flushed immediately (TTFT is unaffected)
+- Only single-choice content deltas are merged; tool_calls and finish_reason
+  chunks, and any change of role, act as barriers and are forwarded as-is
+- A window of 0 disables coalescing entirely (pass-through)
+
+Reference Documents:
+- GUIDELINES p. 2149: Token generation and streaming patterns, iterator protocol
+- GUIDELINES p. 2043: Reactive programming patterns (buffer/window operators)
+
+Pattern: Async generator pipeline stage (Observable buffer-with-time-or-count)
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+Anti-Pattern §4.1 Avoided: Cognitive complexity < 15 per function
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator, Optional
+
+from src.models.responses import ChatCompletionChunk
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_COALESCE_WINDOW_MS: int = 0
+"""Default coalescing window in milliseconds (0 = disabled)."""
+
+DEFAULT_COALESCE_MAX_BYTES: int = 512
+"""Default buffered payload size (UTF-8 bytes) that forces a flush."""
+
+
+# =============================================================================
+# WBS-PERF1: Chunk Classification
+# =============================================================================
+
+
+def _mergeable_content(chunk: ChatCompletionChunk) -> Optional[str]:
+    """
+    Return the delta content if the chunk can be merged with its neighbours.
+
+    A chunk is mergeable when it has exactly one choice carrying non-empty
+    content and no tool_calls or finish_reason. Some providers (Anthropic)
+    repeat role="assistant" on every delta, so role alone is not a barrier.
+
+    Args:
+        chunk: Streamed chunk from the provider.
+
+    Returns:
+        The content string, or None if the chunk is a barrier.
+    """
+    if len(chunk.choices) != 1:
+        return None
+    choice = chunk.choices[0]
+    delta = choice.delta
+    if choice.finish_reason is not None or delta.tool_calls:
+        return None
+    return delta.content or None
+
+
+def _role(chunk: Optional[ChatCompletionChunk]) -> Optional[str]:
+    """Return the delta role of a single-choice chunk."""
+    return chunk.choices[0].delta.role if chunk is not None else None
+
+
+def _merge_chunks(first: ChatCompletionChunk, contents: list[str]) -> ChatCompletionChunk:
+    """
+    Build a single chunk carrying the concatenated content.
+
+    Args:
+        first: First buffered chunk (supplies id, model, created, index).
+        contents: Buffered content fragments in arrival order.
+
+    Returns:
+        The merged chunk (``first`` itself when only one fragment is buffered).
+    """
+    if len(contents) == 1:
+        return first
+    choice = first.choices[0]
+    merged_choice = choice.model_copy(
+        update={"delta": choice.delta.model_copy(update={"content": "".join(contents)})}
+    )
+    return first.model_copy(update={"choices": [merged_choice]})
+
+
+# =============================================================================
+# WBS-PERF1: StreamCoalescer
+# =============================================================================
+
+
+class StreamCoalescer:
+    """
+    Merge small streamed deltas into fewer, larger chunks.
+
+    WBS-PERF1: Adaptive SSE frame coalescing.
+
+    The upstream iterator is advanced through a single pending task so that a
+    window timeout never cancels the provider stream mid-read; the buffer is
+    flushed on timeout and the same task is awaited again.
+
+    Pattern: Buffer with time-or-count (Reactive Extensions)
+    Reference: GUIDELINES p. 2043 - Observable stream operators
+
+    Attributes:
+        window_seconds: Maximum time a delta may wait in the buffer.
+        max_bytes: Buffered payload size that forces a flush.
+
+    Example:
+        >>> coalescer = StreamCoalescer(window_ms=15, max_bytes=512)
+        >>> async for chunk in coalescer.coalesce(provider.stream(request)):
+        ...     yield f"data: {chunk.model_dump_json()}\\n\\n"
+    """
+
+    def __init__(
+        self,
+        window_ms: int = DEFAULT_COALESCE_WINDOW_MS,
+        max_bytes: int = DEFAULT_COALESCE_MAX_BYTES,
+    ) -> None:
+        """
+        Initialize the coalescer.
+
+        Args:
+            window_ms: Coalescing window in milliseconds (0 disables merging).
+            max_bytes: Flush once the buffered content reaches this many bytes.
+        """
+        self.window_seconds = max(window_ms, 0) / 1000.0
+        self.max_bytes = max(max_bytes, 1)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether coalescing is active."""
+        return self.window_seconds > 0
+
+    async def coalesce(
+        self, stream: AsyncIterator[ChatCompletionChunk]
+    ) -> AsyncIterator[ChatCompletionChunk]:
+        """
+        Yield chunks from ``stream`` with adjacent content deltas merged.
+
+        Args:
+            stream: Upstream chunk iterator (typically provider.stream()).
+
+        Yields:
+            ChatCompletionChunk: Forwarded or merged chunks, in order.
+        """
+        if not self.enabled:
+            async for chunk in stream:
+                yield chunk
+            return
+
+        iterator = stream.__aiter__()
+        buffer: list[str] = []
+        buffer_bytes = 0
+        first_buffered: Optional[ChatCompletionChunk] = None
+        deadline = 0.0
+        first_content_sent = False
+        pending: Optional[asyncio.Task] = None
+
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(iterator.__anext__())
+
+                timeout = max(deadline - time.monotonic(), 0.0) if buffer else None
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+                if not done:
+                    # Window elapsed while upstream is still producing
+                    yield _merge_chunks(first_buffered, buffer)  # type: ignore[arg-type]
+                    buffer, buffer_bytes, first_buffered = [], 0, None
+                    continue
+
+                task, pending = pending, None
+                try:
+                    chunk = task.result()
+                except StopAsyncIteration:
+                    break
+
+                content = _mergeable_content(chunk)
+                if content is not None and buffer and _role(chunk) != _role(first_buffered):
+                    yield _merge_chunks(first_buffered, buffer)  # type: ignore[arg-type]
+                    buffer, buffer_bytes, first_buffered = [], 0, None
+
+                if content is None or not first_content_sent:
+                    if buffer:
+                        yield _merge_chunks(first_buffered, buffer)  # type: ignore[arg-type]
+                        buffer, buffer_bytes, first_buffered = [], 0, None
+                    first_content_sent = first_content_sent or content is not None
+                    yield chunk
+                    continue
+
+                if not buffer:
+                    first_buffered = chunk
+                    deadline = time.monotonic() + self.window_seconds
+                buffer.append(content)
+                buffer_bytes += len(content.encode("utf-8"))
+
+                if buffer_bytes >= self.max_bytes or time.monotonic() >= deadline:
+                    yield _merge_chunks(first_buffered, buffer)  # type: ignore[arg-type]
+                    buffer, buffer_bytes, first_buffered = [], 0, None
+
+            if buffer:
+                yield _merge_chunks(first_buffered, buffer)  # type: ignore[arg-type]
+        finally:
+            # Consumer stopped early: unwind the pending read and close upstream
+            if pending is not None and not pending.done():
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
@@ -0,0 +1,342 @@
+"""
+Eager Tool Dispatch While Streaming - WBS-PERF20
+
+In a streaming tool loop each ``tool_calls`` entry is complete (name plus
+fully-closed JSON arguments) well before the assistant turn ends. This
+module detects completed calls incrementally and starts executing them
+right away, so tool latency overlaps with the rest of the generation.
+
+Components:
+- JsonObjectScanner: incremental scanner that reports when streamed
+  argument text closes its top-level JSON object (each character is
+  scanned once, no re-parsing of the growing buffer)
+- ToolCallStreamAssembler: merges tool_call deltas by index and reports
+  each call the moment its arguments close (or when the next call starts)
+- EagerToolDispatcher: starts ToolExecutor tasks for completed calls of
+  registered tools and collects their results in call order
+- holds_tool_turn: which chunks are held back until it is known whether
+  the gateway or the client runs the turn's tools
+
+Reference Documents:
+- GUIDELINES p. 2149: Token generation and streaming patterns
+- GUIDELINES pp. 1544: Agent tool orchestration patterns
+- OpenAI Chat Completions streaming: tool_calls deltas keyed by index
+
+Pattern: Incremental parser feeding a task dispatcher
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+Anti-Pattern §4.1 Avoided: Cognitive complexity < 15 per function
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from src.models.domain import ToolCall, ToolResult
+from src.models.responses import ChatCompletionChunk
+from src.tools.executor import ToolExecutor
+
+logger = logging.getLogger(__name__)
+
+_detached: set[asyncio.Task[ToolResult]] = set()
+"""Executions left running after their turn was handed to the client."""
+
+
+# =============================================================================
+# Incremental JSON Scanner
+# =============================================================================
+
+_OPENERS = frozenset("{[")
+_CLOSERS = frozenset("}]")
+_WHITESPACE = frozenset(" \t\r\n")
+
+
+class JsonObjectScanner:
+    """
+    Track whether streamed text has closed its top-level JSON object.
+
+    Only structure is tracked (nesting depth, strings, escapes); the text
+    is parsed with json.loads once the outer object closes.
+
+    Example:
+        >>> scanner = JsonObjectScanner()
+        >>> scanner.feed('{"q": "a}')
+        False
+        >>> scanner.feed('b"}')
+        True
+    """
+
+    __slots__ = ("depth", "in_string", "escaped", "started", "closed", "invalid")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+        self.closed = False
+        self.invalid = False
+
+    def feed(self, text: str) -> bool:
+        """
+        Scan more text.
+
+        Returns:
+            True once the top-level object has closed.
+        """
+        for char in text:
+            if self.closed or self.invalid:
+                break
+            self._step(char)
+        return self.closed
+
+    def _step(self, char: str) -> None:
+        if not self.started:
+            if char == "{":
+                self.started = True
+                self.depth = 1
+            elif char not in _WHITESPACE:
+                self.invalid = True  # Not an object; leave it to the final parse
+            return
+        if self.in_string:
+            if self.escaped:
+                self.escaped = False
+            elif char == "\\":
+                self.escaped = True
+            elif char == '"':
+                self.in_string = False
+        elif char == '"':
+            self.in_string = True
+        elif char in _OPENERS:
+            self.depth += 1
+        elif char in _CLOSERS:
+            self.depth -= 1
+            self.closed = self.depth == 0
+
+
+# =============================================================================
+# Tool Call Assembly
+# =============================================================================
+
+
+@dataclass
+class StreamedToolCall:
+    """A tool call being assembled from streamed deltas."""
+
+    index: int
+    id: str = ""
+    name: str = ""
+    arguments: str = ""
+    scanner: JsonObjectScanner = field(default_factory=JsonObjectScanner)
+    parsed: Optional[dict[str, Any]] = None
+
+    @property
+    def complete(self) -> bool:
+        return self.parsed is not None
+
+    def try_parse(self) -> bool:
+        """Parse the arguments if they form a JSON object."""
+        if self.parsed is None and self.name:
+            try:
+                value = json.loads(self.arguments or "{}")
+            except json.JSONDecodeError:
+                return False
+            if isinstance(value, dict):
+                self.parsed = value
+        return self.parsed is not None
+
+    def to_tool_call(self) -> ToolCall:
+        return ToolCall(id=self.id, name=self.name, arguments=self.parsed or {})
+
+    def to_message_dict(self) -> dict[str, Any]:
+        """OpenAI-format tool call for the assistant message."""
+        return {
+            "id": self.id,
+            "type": "function",
+            "function": {"name": self.name, "arguments": self.arguments},
+        }
+
+
+class ToolCallStreamAssembler:
+    """
+    Assemble tool calls from a chunk stream, reporting each one on completion.
+
+    A call is complete when its arguments close a JSON object, or, for
+    arguments that do not scan as an object, when the next call starts or
+    the stream ends. Deltas are matched by ``index``; deltas without one
+    continue the latest call unless they carry a new ``id``.
+
+    Example:
+        >>> assembler = ToolCallStreamAssembler(on_complete=dispatcher.dispatch)
+        >>> async for chunk in provider.stream(request):
+        ...     assembler.feed(chunk)
+        >>> calls = assembler.finish()
+    """
+
+    def __init__(self, on_complete: Optional[Callable[[ToolCall], None]] = None) -> None:
+        """
+        Initialize the assembler.
+
+        Args:
+            on_complete: Called once per call as soon as it is complete
+        """
+        self._on_complete = on_complete
+        self._calls: dict[int, StreamedToolCall] = {}
+        self.content: list[str] = []
+        self.finish_reason: Optional[str] = None
+
+    def feed(self, chunk: ChatCompletionChunk) -> None:
+        """Consume one chunk (only the first choice is considered)."""
+        if not chunk.choices:
+            return
+        choice = chunk.choices[0]
+        if choice.delta.content:
+            self.content.append(choice.delta.content)
+        for delta in choice.delta.tool_calls or ():
+            self._feed_delta(delta)
+        if choice.finish_reason is not None:
+            self.finish_reason = choice.finish_reason
+
+    def _feed_delta(self, delta: dict[str, Any]) -> None:
+        index = self._delta_index(delta)
+        call = self._calls.get(index)
+        if call is None:
+            for previous in self._calls.values():
+                self._complete(previous, force=True)
+            call = self._calls[index] = StreamedToolCall(index=index)
+        if delta.get("id"):
+            call.id = delta["id"]
+        function = delta.get("function") or {}
+        if function.get("name") and not call.name:
+            call.name = function["name"]
+        fragment = function.get("arguments")
+        if fragment:
+            call.arguments += fragment
+            if call.scanner.feed(fragment):
+                self._complete(call)
+
+    def _delta_index(self, delta: dict[str, Any]) -> int:
+        index = delta.get("index")
+        if isinstance(index, int):
+            return index
+        if not self._calls:
+            return 0
+        latest = max(self._calls)
+        existing_id = self._calls[latest].id
+        return latest + 1 if delta.get("id") and existing_id and delta["id"] != existing_id else latest
+
+    def _complete(self, call: StreamedToolCall, force: bool = False) -> None:
+        """Report a call once its arguments parse (force: no more deltas will come)."""
+        if call.complete or not (force or call.scanner.closed):
+            return
+        if not call.id:
+            call.id = f"call_{call.index}"
+        if call.try_parse() and self._on_complete is not None:
+            self._on_complete(call.to_tool_call())
+
+    def finish(self) -> list[StreamedToolCall]:
+        """
+        Complete any remaining calls at end of stream.
+
+        Returns:
+            All calls in index order; unparseable arguments become {}.
+        """
+        calls = [self._calls[index] for index in sorted(self._calls)]
+        for call in calls:
+            self._complete(call, force=True)
+            if not call.id:
+                call.id = f"call_{call.index}"
+        return calls
+
+
+# =============================================================================
+# Eager Dispatch
+# =============================================================================
+
+
+class EagerToolDispatcher:
+    """
+    Start tool executions as soon as calls complete; collect results in order.
+
+    Only tools registered with the executor's registry are dispatched;
+    other calls are left to the client. Eager dispatch is off when the
+    request declares tools the gateway does not run, since the turn may
+    then be handed to the client.
+    """
+
+    def __init__(self, executor: ToolExecutor, eager: bool = True) -> None:
+        """
+        Initialize the dispatcher.
+
+        Args:
+            executor: Executor running the gateway's registered tools
+            eager: Start calls as they complete; otherwise only in results()
+        """
+        self._executor = executor
+        self._eager = eager
+        self._tasks: dict[str, asyncio.Task[ToolResult]] = {}
+
+    def handles(self, name: str) -> bool:
+        """Whether the gateway executes this tool itself."""
+        return self._executor.registry.has(name)
+
+    def dispatch(self, tool_call: ToolCall) -> None:
+        """Start executing a completed call (ignored for unknown tools)."""
+        if not self._eager or tool_call.id in self._tasks or not self.handles(tool_call.name):
+            return
+        logger.debug(f"Eagerly dispatching tool {tool_call.name} ({tool_call.id})")
+        self._tasks[tool_call.id] = asyncio.create_task(
+            self._executor.execute_safe(tool_call)
+        )
+
+    @property
+    def dispatched(self) -> int:
+        """Number of calls started before the end of the stream."""
+        return len(self._tasks)
+
+    async def results(self, tool_calls: list[ToolCall]) -> list[ToolResult]:
+        """
+        Wait for results of all calls, starting any that were not dispatched.
+
+        Args:
+            tool_calls: The turn's calls, in order
+
+        Returns:
+            Results in the same order
+        """
+        for tool_call in tool_calls:
+            if tool_call.id not in self._tasks:
+                self._tasks[tool_call.id] = asyncio.create_task(
+                    self._executor.execute_safe(tool_call)
+                )
+        return list(await asyncio.gather(*(self._tasks[tc.id] for tc in tool_calls)))
+
+    def detach(self) -> None:
+        """
+        Let running executions finish in the background.
+
+        Used when the turn goes back to the client: a tool that already
+        started may have side effects, so it is not cut off part-way.
+        """
+        for task in self._tasks.values():
+            if not task.done():
+                _detached.add(task)
+                task.add_done_callback(_detached.discard)
+        self._tasks.clear()
+
+    def cancel(self) -> None:
+        """Cancel executions still running (stream abandoned)."""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+
+
+def holds_tool_turn(chunk: ChatCompletionChunk) -> bool:
+    """
+    Whether a chunk is held back until the turn's outcome is known.
+
+    Tool-call deltas and the finish chunk reach the client only when the
+    client runs the turn's tools; turns the gateway executes are hidden,
+    as they are from complete().
+    """
+    return any(choice.delta.tool_calls or choice.finish_reason for choice in chunk.choices)
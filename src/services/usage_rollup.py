@@ -0,0 +1,366 @@
+"""
+Usage Rollup Store - WBS-PERF9 Time-Bucketed Usage Analytics
+
+This module keeps pre-aggregated usage per minute, hour and day, broken
+down by model, provider, API key and session, so that chargeback queries
+read O(buckets) Redis hashes instead of scanning keys.
+
+Storage layout (one hash per granularity and bucket start):
+
+    usage:{granularity}:{bucket_epoch}
+        {dimension}|{value}|{metric} -> counter
+
+Each flush writes every granularity at once, so downsampling happens at
+write time; retention is enforced with EXPIRE per granularity (minute
+buckets age out first, day buckets last).
+
+Reference Documents:
+- GUIDELINES pp. 2309: Cost tracking and token usage
+- GUIDELINES pp. 2153: Redis for external state stores
+
+Pattern: Pre-aggregated rollups (write-time downsampling)
+Anti-Pattern §1.1 Avoided: Uses Optional[T] with explicit None defaults
+Anti-Pattern §4.1 Avoided: Cognitive complexity < 15 per function
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Mapping, NamedTuple, Optional, Sequence
+
+from pydantic import BaseModel, Field
+from redis.asyncio import Redis
+
+from src.services.cost_tracker import UsageSummary, merge_usage
+
+if TYPE_CHECKING:
+    from src.core.config import Settings
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+ROLLUP_KEY_PREFIX = "usage:"
+"""Redis key prefix for rollup hashes."""
+
+ROLLUP_DIMENSIONS: tuple[str, ...] = ("model", "provider", "api_key", "session")
+"""Dimensions usage can be grouped by."""
+
+ROLLUP_METRICS: tuple[str, ...] = (
+    "prompt_tokens",
+    "completion_tokens",
+    "total_tokens",
+    "total_cost",
+    "request_count",
+)
+"""UsageSummary fields stored per dimension value."""
+
+MAX_QUERY_BUCKETS: int = 1500
+"""Upper bound on buckets read by a single query."""
+
+_FIELD_SEPARATOR = "|"
+
+
+# =============================================================================
+# Exceptions
+# =============================================================================
+
+
+class UsageRollupError(Exception):
+    """Raised when rollups cannot be read from or written to Redis."""
+
+    pass
+
+
+class UsageQueryError(UsageRollupError):
+    """Raised for invalid rollup queries (bad dimension, range or granularity)."""
+
+    pass
+
+
+# =============================================================================
+# Granularities
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class RollupGranularity:
+    """
+    A bucket size and how long its buckets are kept.
+
+    Attributes:
+        name: Granularity name ("minute", "hour", "day")
+        seconds: Bucket width in seconds
+        retention_seconds: TTL applied to each bucket hash
+    """
+
+    name: str
+    seconds: int
+    retention_seconds: int
+
+    def floor(self, epoch: int) -> int:
+        """Start of the bucket containing ``epoch``."""
+        return epoch - epoch % self.seconds
+
+
+DEFAULT_GRANULARITIES: tuple[RollupGranularity, ...] = (
+    RollupGranularity("minute", 60, 48 * 3600),
+    RollupGranularity("hour", 3600, 31 * 86400),
+    RollupGranularity("day", 86400, 400 * 86400),
+)
+"""Finest to coarsest; minute buckets for 2 days, hour for 31, day for 400."""
+
+
+class RollupPoint(NamedTuple):
+    """
+    Buffered rollup key: one dimension value within one minute.
+
+    Attributes:
+        minute: Epoch seconds of the minute bucket start
+        dimension: One of ROLLUP_DIMENSIONS
+        value: Dimension value (model name, provider, key hash, session id)
+    """
+
+    minute: int
+    dimension: str
+    value: str
+
+
+# =============================================================================
+# Query Models
+# =============================================================================
+
+
+class UsageRollupBucket(BaseModel):
+    """Usage for one time bucket, keyed by group value."""
+
+    start: dt.datetime = Field(..., description="Bucket start (UTC)")
+    groups: dict[str, UsageSummary] = Field(default_factory=dict, description="Usage per group")
+
+
+class UsageQueryResult(BaseModel):
+    """Answer to a rollup query."""
+
+    group_by: str = Field(..., description="Dimension usage is grouped by")
+    granularity: str = Field(..., description="Bucket granularity used")
+    start: dt.datetime = Field(..., description="Query range start (UTC)")
+    end: dt.datetime = Field(..., description="Query range end (UTC)")
+    buckets: list[UsageRollupBucket] = Field(default_factory=list, description="Non-empty buckets")
+    totals: dict[str, UsageSummary] = Field(default_factory=dict, description="Usage per group")
+
+
+# =============================================================================
+# WBS-PERF9: UsageRollupStore
+# =============================================================================
+
+
+class UsageRollupStore:
+    """
+    Redis-backed store of time-bucketed usage rollups.
+
+    Example:
+        >>> store = UsageRollupStore(redis)
+        >>> await store.write_batch(deltas)
+        >>> result = await store.query("model", start, end)
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        granularities: Optional[Sequence[RollupGranularity]] = None,
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            redis_client: Async Redis client
+            granularities: Bucket sizes, finest first (defaults to
+                DEFAULT_GRANULARITIES)
+        """
+        self._redis = redis_client
+        self._granularities = tuple(granularities or DEFAULT_GRANULARITIES)
+        self._by_name = {g.name: g for g in self._granularities}
+
+    @property
+    def granularities(self) -> tuple[RollupGranularity, ...]:
+        """Configured granularities, finest first."""
+        return self._granularities
+
+    async def write_batch(self, deltas: Mapping[RollupPoint, UsageSummary]) -> None:
+        """
+        Add per-minute deltas to every granularity in one pipeline.
+
+        Args:
+            deltas: Usage accumulated per (minute, dimension, value)
+
+        Raises:
+            UsageRollupError: If the pipeline fails
+        """
+        if not deltas:
+            return
+        merged = self._downsample(deltas)
+        try:
+            pipe = self._redis.pipeline()
+            for (key, prefix), delta in merged.items():
+                for metric in ROLLUP_METRICS:
+                    value = getattr(delta, metric)
+                    if metric == "total_cost":
+                        pipe.hincrbyfloat(key, prefix + metric, value)
+                    else:
+                        pipe.hincrby(key, prefix + metric, value)
+            for key, ttl in self._ttls(merged).items():
+                pipe.expire(key, ttl)
+            await pipe.execute()
+        except Exception as e:
+            raise UsageRollupError(f"Failed to write usage rollups: {e}") from e
+
+    async def query(
+        self,
+        group_by: str,
+        start: dt.datetime,
+        end: dt.datetime,
+        granularity: Optional[str] = None,
+    ) -> UsageQueryResult:
+        """
+        Read usage between ``start`` and ``end`` grouped by a dimension.
+
+        Args:
+            group_by: One of ROLLUP_DIMENSIONS
+            start: Range start (naive datetimes are treated as UTC)
+            end: Range end
+            granularity: Bucket size; chosen automatically if None
+
+        Returns:
+            UsageQueryResult with per-bucket and total usage
+
+        Raises:
+            UsageQueryError: On invalid arguments
+            UsageRollupError: On storage failures
+        """
+        if group_by not in ROLLUP_DIMENSIONS:
+            raise UsageQueryError(f"Unknown group_by: {group_by}")
+        start, end = _as_utc(start), _as_utc(end)
+        if end < start:
+            raise UsageQueryError("Query end is before start")
+        gran = self._select_granularity(start, end, granularity)
+        first = gran.floor(int(start.timestamp()))
+        bucket_starts = list(range(first, int(end.timestamp()) + 1, gran.seconds))
+        if len(bucket_starts) > MAX_QUERY_BUCKETS:
+            raise UsageQueryError(
+                f"Query spans {len(bucket_starts)} {gran.name} buckets "
+                f"(max {MAX_QUERY_BUCKETS}); use a coarser granularity"
+            )
+
+        try:
+            pipe = self._redis.pipeline()
+            for bucket_start in bucket_starts:
+                pipe.hgetall(self._key(gran, bucket_start))
+            hashes = await pipe.execute()
+        except Exception as e:
+            raise UsageRollupError(f"Failed to query usage rollups: {e}") from e
+
+        result = UsageQueryResult(group_by=group_by, granularity=gran.name, start=start, end=end)
+        for bucket_start, fields in zip(bucket_starts, hashes):
+            groups = _parse_groups(fields, group_by)
+            if not groups:
+                continue
+            result.buckets.append(
+                UsageRollupBucket(
+                    start=dt.datetime.fromtimestamp(bucket_start, dt.timezone.utc), groups=groups
+                )
+            )
+            for value, summary in groups.items():
+                merge_usage(result.totals, value, summary)
+        return result
+
+    # =========================================================================
+    # Helpers
+    # =========================================================================
+
+    def _key(self, granularity: RollupGranularity, bucket_start: int) -> str:
+        """Redis key for one bucket."""
+        return f"{ROLLUP_KEY_PREFIX}{granularity.name}:{bucket_start}"
+
+    def _downsample(
+        self, deltas: Mapping[RollupPoint, UsageSummary]
+    ) -> dict[tuple[str, str], UsageSummary]:
+        """Merge minute deltas into (bucket key, field prefix) per granularity."""
+        merged: dict[tuple[str, str], UsageSummary] = {}
+        for point, delta in deltas.items():
+            prefix = f"{point.dimension}{_FIELD_SEPARATOR}{point.value}{_FIELD_SEPARATOR}"
+            for gran in self._granularities:
+                merge_usage(merged, (self._key(gran, gran.floor(point.minute)), prefix), delta)
+        return merged
+
+    def _ttls(self, merged: Mapping[tuple[str, str], UsageSummary]) -> dict[str, int]:
+        """Retention TTL for every key touched by a batch."""
+        ttls: dict[str, int] = {}
+        for key, _prefix in merged:
+            name = key[len(ROLLUP_KEY_PREFIX):].split(":", 1)[0]
+            ttls[key] = self._by_name[name].retention_seconds
+        return ttls
+
+    def _select_granularity(
+        self, start: dt.datetime, end: dt.datetime, name: Optional[str]
+    ) -> RollupGranularity:
+        """Use the requested granularity, or the finest one that covers the range."""
+        if name is not None:
+            if name not in self._by_name:
+                raise UsageQueryError(f"Unknown granularity: {name}")
+            return self._by_name[name]
+        now = dt.datetime.now(dt.timezone.utc)
+        span = (end - start).total_seconds()
+        for gran in self._granularities:
+            retained = (now - start).total_seconds() <= gran.retention_seconds
+            if retained and span / gran.seconds <= MAX_QUERY_BUCKETS:
+                return gran
+        return self._granularities[-1]
+
+
+def create_usage_rollup_store(redis_client: Redis, settings: "Settings") -> UsageRollupStore:
+    """
+    Build a UsageRollupStore with retention taken from settings.
+
+    Args:
+        redis_client: Async Redis client
+        settings: Application settings (usage_rollup_* retention fields)
+
+    Returns:
+        Configured UsageRollupStore
+    """
+    return UsageRollupStore(
+        redis_client,
+        granularities=(
+            RollupGranularity("minute", 60, settings.usage_rollup_minute_retention_hours * 3600),
+            RollupGranularity("hour", 3600, settings.usage_rollup_hour_retention_days * 86400),
+            RollupGranularity("day", 86400, settings.usage_rollup_day_retention_days * 86400),
+        ),
+    )
+
+
+def _as_utc(value: dt.datetime) -> dt.datetime:
+    """Interpret naive datetimes as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt.timezone.utc)
+    return value.astimezone(dt.timezone.utc)
+
+
+def _parse_groups(fields: Mapping[str, str], group_by: str) -> dict[str, UsageSummary]:
+    """Extract per-value summaries for one dimension from a bucket hash."""
+    groups: dict[str, UsageSummary] = {}
+    prefix = group_by + _FIELD_SEPARATOR
+    for field, raw in fields.items():
+        if isinstance(field, bytes):
+            field, raw = field.decode(), raw.decode()
+        if not field.startswith(prefix):
+            continue
+        value, _, metric = field[len(prefix):].rpartition(_FIELD_SEPARATOR)
+        if metric not in ROLLUP_METRICS:
+            continue
+        summary = groups.get(value)
+        if summary is None:
+            summary = groups[value] = UsageSummary()
+        setattr(summary, metric, float(raw) if metric == "total_cost" else int(raw))
+    return groups
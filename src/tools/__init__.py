@@ -20,6 +20,21 @@ from src.tools.executor import (
     ToolValidationError,
     get_tool_executor,
 )
+from src.tools.result_cache import (
+    ToolResultCache,
+    get_tool_result_cache,
+    set_tool_result_cache,
+)
+from src.tools.bulkhead import (
+    BulkheadFullError,
+    ToolBulkhead,
+    get_tool_bulkhead,
+    set_tool_bulkhead,
+)
+from src.tools.validation import (
+    ArgumentValidator,
+    SchemaValidationError,
+)
 
 __all__ = [
     # Registry
@@ -31,4 +46,16 @@ __all__ = [
     "ToolExecutionError",
     "ToolValidationError",
     "get_tool_executor",
+    # Result Cache (WBS-PERF15)
+    "ToolResultCache",
+    "get_tool_result_cache",
+    "set_tool_result_cache",
+    # Bulkheads (WBS-PERF19)
+    "BulkheadFullError",
+    "ToolBulkhead",
+    "get_tool_bulkhead",
+    "set_tool_bulkhead",
+    # Argument Validation (WBS-PERF18)
+    "ArgumentValidator",
+    "SchemaValidationError",
 ]
@@ -21,6 +21,7 @@ from typing import Any
 import httpx
 
 from src.clients.circuit_breaker import CircuitOpenError
+from src.clients.http import create_traced_transport
 from src.core.config import get_settings
 from src.models.domain import ToolDefinition
 # WBS 3.2.3.1.5: Share circuit breaker with semantic_search.py
@@ -83,6 +84,10 @@ GET_CHUNK_DEFINITION = ToolDefinition(
         },
         "required": ["chunk_id"],
     },
+    # WBS-PERF15: A chunk id always names the same content
+    cacheable=True,
+    cache_ttl_seconds=3600.0,
+    downstream="semantic-search",
 )
 
 
@@ -102,7 +107,9 @@ async def _do_get_chunk(
     
     Separated for circuit breaker wrapping.
     """
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+    async with httpx.AsyncClient(
+        timeout=timeout_seconds, transport=create_traced_transport("semantic-search")
+    ) as client:
         response = await client.get(
             f"{base_url}/v1/chunks/{chunk_id}",
         )
@@ -25,6 +25,9 @@ from typing import Any, Optional
 import httpx
 
 from src.clients.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.clients.embedding_batcher import EmbeddingBatcher
+from src.clients.embedding_cache import get_embedding_cache
+from src.clients.http import create_traced_transport
 from src.core.config import get_settings
 from src.models.domain import ToolDefinition
 
@@ -43,6 +46,9 @@ ENDPOINT_SIMILARITY = "/v1/similarity"
 ENDPOINT_KEYWORDS = "/v1/keywords"
 ENDPOINT_EMBEDDINGS = "/v1/embeddings"
 
+EMBEDDINGS_CACHE_NAMESPACE = "code-orchestrator"
+"""Embedding cache model key (the service picks its SBERT model itself)."""
+
 
 # =============================================================================
 # Circuit Breaker for Code-Orchestrator Service
@@ -108,6 +114,10 @@ COMPUTE_SIMILARITY_DEFINITION = ToolDefinition(
         },
         "required": ["text1", "text2"],
     },
+    # WBS-PERF15: Fixed for a given text pair and SBERT model
+    cacheable=True,
+    cache_ttl_seconds=3600.0,
+    downstream="code-orchestrator",
 )
 
 
@@ -137,6 +147,7 @@ EXTRACT_KEYWORDS_DEFINITION = ToolDefinition(
         },
         "required": ["corpus"],
     },
+    downstream="code-orchestrator",
 )
 
 
@@ -161,6 +172,7 @@ GENERATE_EMBEDDINGS_DEFINITION = ToolDefinition(
         },
         "required": ["texts"],
     },
+    downstream="code-orchestrator",
 )
 
 
@@ -190,7 +202,9 @@ async def _do_code_orchestrator_request(
     settings = get_settings()
     base_url = settings.code_orchestrator_url
     
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+    async with httpx.AsyncClient(
+        timeout=timeout_seconds, transport=create_traced_transport("code-orchestrator")
+    ) as client:
         response = await client.post(
             f"{base_url}{endpoint}",
             json=payload,
@@ -199,6 +213,57 @@ async def _do_code_orchestrator_request(
         return response.json()
 
 
+# =============================================================================
+# WBS-PERF21: Embedding Micro-Batcher
+# Pattern: Singleton batcher per downstream service
+# =============================================================================
+
+_embeddings_batcher: Optional[EmbeddingBatcher] = None
+
+
+async def _send_embeddings_batch(texts: list[str], model: Optional[str]) -> dict[str, Any]:
+    """Send one (possibly coalesced) embeddings request through the circuit breaker."""
+    timeout_seconds = get_settings().code_orchestrator_timeout_seconds
+    return await get_code_orchestrator_circuit_breaker().call(
+        _do_code_orchestrator_request,
+        ENDPOINT_EMBEDDINGS,
+        {"texts": texts},
+        timeout_seconds,
+    )
+
+
+def get_embeddings_batcher() -> Optional[EmbeddingBatcher]:
+    """
+    Get the shared embedding batcher for Code-Orchestrator-Service.
+
+    WBS-PERF21: Concurrent generate_embeddings calls share one request.
+
+    Returns:
+        EmbeddingBatcher, or None when micro-batching is disabled.
+    """
+    global _embeddings_batcher
+    settings = get_settings()
+    if not settings.embed_batch_enabled:
+        return None
+    if _embeddings_batcher is None:
+        _embeddings_batcher = EmbeddingBatcher(
+            "code-orchestrator",
+            send=_send_embeddings_batch,
+            max_batch_size=settings.embed_batch_max_size,
+            max_wait_ms=settings.embed_batch_max_wait_ms,
+        )
+    return _embeddings_batcher
+
+
+async def _embed_texts(texts: list[str]) -> dict[str, Any]:
+    """Embed texts downstream, coalescing with concurrent callers when enabled."""
+    # WBS-PERF21: Micro-batching
+    batcher = get_embeddings_batcher()
+    if batcher is not None:
+        return await batcher.embed(texts)
+    return await _send_embeddings_batch(texts, None)
+
+
 # =============================================================================
 # Error Handler (reduces duplication across tool functions)
 # =============================================================================
@@ -393,26 +458,19 @@ async def generate_embeddings(args: dict[str, Any]) -> dict[str, Any]:
     """
     settings = get_settings()
     timeout_seconds = settings.code_orchestrator_timeout_seconds
-    circuit_breaker = get_code_orchestrator_circuit_breaker()
 
     # Extract parameters
     texts = args.get("texts", [])
 
-    # Build request payload - matches EmbeddingsRequest schema
-    payload = {
-        "texts": texts,
-    }
-
     logger.debug(f"Generating embeddings: num_texts={len(texts)}")
 
+    # WBS-PERF22: Only texts not already cached are sent downstream
+    cache = get_embedding_cache()
+
     try:
-        result = await circuit_breaker.call(
-            _do_code_orchestrator_request,
-            ENDPOINT_EMBEDDINGS,
-            payload,
-            timeout_seconds,
-        )
-        return result
+        if cache is not None:
+            return await cache.embed_response(EMBEDDINGS_CACHE_NAMESPACE, texts, _embed_texts)
+        return await _embed_texts(texts)
     except Exception as e:
         _handle_code_orchestrator_error(e, "embeddings", timeout_seconds)
         raise
@@ -29,6 +29,7 @@ from typing import Any
 import httpx
 
 from src.clients.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.clients.http import create_traced_transport
 from src.core.config import get_settings
 from src.models.domain import ToolDefinition
 
@@ -159,6 +160,10 @@ CROSS_REFERENCE_DEFINITION = ToolDefinition(
         },
         "required": ["book", "chapter", "title", "tier"],
     },
+    # WBS-PERF15: References only change when the taxonomy is re-indexed
+    cacheable=True,
+    cache_ttl_seconds=300.0,
+    downstream="ai-agents",
 )
 
 
@@ -186,7 +191,9 @@ async def _do_cross_reference(
     Returns:
         Response JSON as dictionary.
     """
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+    async with httpx.AsyncClient(
+        timeout=timeout_seconds, transport=create_traced_transport("ai-agents")
+    ) as client:
         response = await client.post(
             f"{base_url}/v1/agents/cross-reference",
             json=payload,
@@ -22,6 +22,7 @@ from typing import Any
 
 import httpx
 
+from src.clients.http import create_traced_transport
 from src.core.config import get_settings
 from src.models.domain import ToolDefinition
 
@@ -64,6 +65,7 @@ GENERATE_DOCUMENTATION_DEFINITION = ToolDefinition(
         },
         "required": ["code"],
     },
+    downstream="ai-agents",
 )
 
 
@@ -84,7 +86,9 @@ async def _do_doc_generate(
     
     Anti-pattern §67 avoided: Uses context manager for connection management.
     """
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+    async with httpx.AsyncClient(
+        timeout=timeout_seconds, transport=create_traced_transport("ai-agents")
+    ) as client:
         response = await client.post(
             f"{base_url}/v1/agents/doc-generate/run",
             json=payload,
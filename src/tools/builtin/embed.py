@@ -27,6 +27,9 @@ from typing import Any, Optional
 import httpx
 
 from src.clients.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.clients.embedding_batcher import EmbeddingBatcher
+from src.clients.embedding_cache import get_embedding_cache
+from src.clients.http import create_traced_transport
 from src.core.config import get_settings
 from src.models.domain import ToolDefinition
 
@@ -69,6 +72,43 @@ def get_embed_circuit_breaker() -> CircuitBreaker:
     return _embed_circuit_breaker
 
 
+# =============================================================================
+# WBS-PERF21: Embedding Micro-Batcher
+# Pattern: Singleton batcher per downstream service
+# =============================================================================
+
+_embed_batcher: Optional[EmbeddingBatcher] = None
+
+
+async def _send_embed_batch(texts: list[str], model: Optional[str]) -> dict[str, Any]:
+    """Send one (possibly coalesced) embeddings request through the circuit breaker."""
+    payload = {"texts": texts, "model": model}
+    return await get_embed_circuit_breaker().call(_do_embed_request, payload)
+
+
+def get_embed_batcher() -> Optional[EmbeddingBatcher]:
+    """
+    Get the shared embedding batcher for semantic-search.
+
+    WBS-PERF21: Concurrent embed calls share one /v1/embeddings request.
+
+    Returns:
+        EmbeddingBatcher, or None when micro-batching is disabled.
+    """
+    global _embed_batcher
+    settings = get_settings()
+    if not settings.embed_batch_enabled:
+        return None
+    if _embed_batcher is None:
+        _embed_batcher = EmbeddingBatcher(
+            "semantic-search",
+            send=_send_embed_batch,
+            max_batch_size=settings.embed_batch_max_size,
+            max_wait_ms=settings.embed_batch_max_wait_ms,
+        )
+    return _embed_batcher
+
+
 # =============================================================================
 # Exceptions (AP-5 compliance: {Service}Error prefix)
 # =============================================================================
@@ -108,6 +148,8 @@ EMBED_DEFINITION = ToolDefinition(
         },
         "required": ["texts"],
     },
+    # Not result-cached: EmbeddingCache (WBS-PERF22) already caches per text
+    downstream="semantic-search",
 )
 
 
@@ -132,7 +174,9 @@ async def _do_embed_request(payload: dict[str, Any]) -> dict[str, Any]:
     base_url = settings.semantic_search_url
     timeout = getattr(settings, "tool_timeout_seconds", 30.0)
     
-    async with httpx.AsyncClient(timeout=timeout) as client:
+    async with httpx.AsyncClient(
+        timeout=timeout, transport=create_traced_transport("semantic-search")
+    ) as client:
         response = await client.post(
             f"{base_url}{ENDPOINT_EMBEDDINGS}",
             json=payload,
@@ -141,6 +185,16 @@ async def _do_embed_request(payload: dict[str, Any]) -> dict[str, Any]:
         return response.json()
 
 
+async def _embed_texts(texts: list[str], model: str) -> dict[str, Any]:
+    """Embed texts downstream, coalescing with concurrent callers when enabled."""
+    # WBS-PERF21: Micro-batching
+    batcher = get_embed_batcher()
+    # Execute with circuit breaker protection
+    if batcher is not None:
+        return await batcher.embed(texts, model)
+    return await _send_embed_batch(texts, model)
+
+
 # =============================================================================
 # WBS-CPA6.2: Embed Tool Function
 # =============================================================================
@@ -171,18 +225,15 @@ async def embed(params: dict[str, Any]) -> dict[str, Any]:
     texts = params.get("texts", [])
     model = params.get("model", "all-MiniLM-L6-v2")
     
-    # Build request payload
-    payload = {
-        "texts": texts,
-        "model": model,
-    }
-    
-    circuit_breaker = get_embed_circuit_breaker()
+    # WBS-PERF22: Only texts not already cached are sent downstream
+    cache = get_embedding_cache()
     
     try:
-        # Execute with circuit breaker protection
-        result = await circuit_breaker.call(_do_embed_request, payload)
-        return result
+        if cache is not None:
+            return await cache.embed_response(
+                model, texts, lambda missing: _embed_texts(missing, model)
+            )
+        return await _embed_texts(texts, model)
     
     except CircuitOpenError as e:
         logger.warning(f"Embed circuit breaker open: {e}")
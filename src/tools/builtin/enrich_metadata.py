@@ -27,6 +27,7 @@ from typing import Any
 import httpx
 
 from src.clients.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.clients.http import create_traced_transport
 from src.core.config import get_settings
 from src.models.domain import ToolDefinition
 
@@ -159,6 +160,7 @@ ENRICH_METADATA_DEFINITION = ToolDefinition(
         },
         "required": ["corpus", "chapter_index"],
     },
+    downstream="ai-agents",
 )
 
 
@@ -186,7 +188,9 @@ async def _do_enrich_metadata(
     """
     url = f"{base_url}/v1/agents/enrich-metadata"
 
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+    async with httpx.AsyncClient(
+        timeout=timeout_seconds, transport=create_traced_transport("ai-agents")
+    ) as client:
         response = await client.post(url, json=payload)
         response.raise_for_status()
         return response.json()
@@ -25,6 +25,7 @@ from typing import Any, Optional
 import httpx
 
 from src.clients.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.clients.http import create_traced_transport
 from src.core.config import get_settings
 from src.models.domain import ToolDefinition
 
@@ -149,6 +150,10 @@ HYBRID_SEARCH_DEFINITION = ToolDefinition(
         },
         "required": ["query"],
     },
+    # WBS-PERF15: Short TTL - rankings follow the live index and graph
+    cacheable=True,
+    cache_ttl_seconds=300.0,
+    downstream="semantic-search",
 )
 
 
@@ -175,7 +180,9 @@ async def _do_hybrid_search(
     Returns:
         Response JSON matching HybridSearchResponse schema.
     """
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+    async with httpx.AsyncClient(
+        timeout=timeout_seconds, transport=create_traced_transport("semantic-search")
+    ) as client:
         response = await client.post(
             f"{base_url}{ENDPOINT_PATH}",
             json=payload,
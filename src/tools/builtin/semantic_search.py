@@ -22,6 +22,7 @@ from typing import Any, Optional
 import httpx
 
 from src.clients.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.clients.http import create_traced_transport
 from src.core.config import get_settings
 from src.models.domain import ToolDefinition
 
@@ -97,6 +98,10 @@ SEARCH_CORPUS_DEFINITION = ToolDefinition(
         },
         "required": ["query"],
     },
+    # WBS-PERF15: Short TTL - rankings follow the live index
+    cacheable=True,
+    cache_ttl_seconds=300.0,
+    downstream="semantic-search",
 )
 
 
@@ -116,7 +121,9 @@ async def _do_search(
     
     Separated for circuit breaker wrapping.
     """
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+    async with httpx.AsyncClient(
+        timeout=timeout_seconds, transport=create_traced_transport("semantic-search")
+    ) as client:
         response = await client.post(
             f"{base_url}/v1/search",
             json=payload,
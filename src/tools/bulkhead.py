@@ -0,0 +1,255 @@
+"""
+Tool Bulkheads - WBS-PERF19
+
+This module limits how many tool calls may run at once against each
+downstream service (semantic-search, ai-agents, code-orchestrator, ...).
+A model that emits 30 ``search_corpus`` calls in one turn queues behind
+the semantic-search compartment instead of saturating it, and calls to
+other services (from the same or other requests) are unaffected.
+
+Each compartment has:
+- a concurrency limit (default, or a per-service override)
+- a FIFO wait queue with a queue-wait timeout; callers that wait longer
+  are rejected with BulkheadFullError instead of piling up
+
+In-flight and queued calls per service are exported as Prometheus gauges,
+with rejections and queue wait time alongside.
+
+Reference Documents:
+- Release It! (Nygard): Bulkheads pattern
+- GUIDELINES pp. 1004: Circuit breakers and timeouts
+- Building Microservices (Newman): Isolating downstream failures
+
+Pattern: Bulkhead (per-downstream compartments)
+
+Anti-Pattern Compliance:
+- AP-1: Constants for defaults
+- AP-2: Methods <15 CC
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from src.observability.metrics import (
+    record_tool_bulkhead_rejection,
+    record_tool_queue_wait,
+    set_tool_bulkhead_state,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants (AP-1 Compliance)
+# =============================================================================
+
+DEFAULT_BULKHEAD_LIMIT = 16
+"""Concurrent calls per downstream service unless overridden."""
+
+DEFAULT_QUEUE_TIMEOUT_SECONDS = 5.0
+"""How long a call may wait for a slot before it is rejected."""
+
+LOCAL_DOWNSTREAM = "local"
+"""Compartment for tools that run in-process (no downstream service)."""
+
+
+# =============================================================================
+# Exceptions
+# =============================================================================
+
+
+class BulkheadFullError(Exception):
+    """Raised when a call waits longer than the queue timeout for a slot."""
+
+    def __init__(self, service: str, waited_seconds: float) -> None:
+        self.service = service
+        self.waited_seconds = waited_seconds
+        super().__init__(
+            f"Downstream '{service}' is at its concurrency limit "
+            f"(waited {waited_seconds:.2f}s for a slot)"
+        )
+
+
+# =============================================================================
+# Compartment
+# =============================================================================
+
+
+class _Compartment:
+    """Slot accounting and FIFO waiters for one downstream service."""
+
+    __slots__ = ("service", "limit", "in_flight", "waiters")
+
+    def __init__(self, service: str, limit: int) -> None:
+        self.service = service
+        self.limit = limit
+        self.in_flight = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+
+    def publish(self) -> None:
+        set_tool_bulkhead_state(self.service, self.in_flight, len(self.waiters))
+
+
+# =============================================================================
+# ToolBulkhead
+# =============================================================================
+
+
+class ToolBulkhead:
+    """
+    Per-downstream concurrency limits for tool calls.
+
+    Slots are handed directly to the longest-waiting caller on release, so
+    a compartment stays FIFO and a burst cannot starve earlier waiters.
+
+    Example:
+        >>> bulkhead = ToolBulkhead(default_limit=8, limits={"ai-agents": 2})
+        >>> async with bulkhead.acquire("ai-agents"):
+        ...     await call_ai_agents()
+    """
+
+    def __init__(
+        self,
+        default_limit: int = DEFAULT_BULKHEAD_LIMIT,
+        limits: Optional[dict[str, int]] = None,
+        queue_timeout_seconds: Optional[float] = DEFAULT_QUEUE_TIMEOUT_SECONDS,
+    ) -> None:
+        """
+        Initialize the bulkhead.
+
+        Args:
+            default_limit: Concurrent calls per service without an override
+            limits: Per-service overrides, e.g. {"ai-agents": 4}
+            queue_timeout_seconds: Maximum wait for a slot (None waits forever)
+        """
+        self.default_limit = default_limit
+        self.limits = dict(limits or {})
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self._compartments: dict[str, _Compartment] = {}
+
+    def _compartment(self, service: str) -> _Compartment:
+        compartment = self._compartments.get(service)
+        if compartment is None:
+            limit = self.limits.get(service, self.default_limit)
+            compartment = _Compartment(service, max(1, limit))
+            self._compartments[service] = compartment
+        return compartment
+
+    @asynccontextmanager
+    async def acquire(self, service: Optional[str]) -> AsyncIterator[None]:
+        """
+        Hold a slot in a service's compartment for the duration of the block.
+
+        Args:
+            service: Downstream service name (None uses the local compartment)
+
+        Raises:
+            BulkheadFullError: No slot became free within the queue timeout.
+        """
+        compartment = self._compartment(service or LOCAL_DOWNSTREAM)
+        await self._enter(compartment)
+        try:
+            yield
+        finally:
+            self._release(compartment)
+
+    async def _enter(self, compartment: _Compartment) -> None:
+        """Take a free slot, or queue until one is handed over."""
+        if compartment.in_flight < compartment.limit and not compartment.waiters:
+            compartment.in_flight += 1
+            compartment.publish()
+            record_tool_queue_wait(compartment.service, 0.0)
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        compartment.waiters.append(waiter)
+        compartment.publish()
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                self._release(compartment)
+            waited = time.perf_counter() - start
+            record_tool_bulkhead_rejection(compartment.service)
+            logger.warning(
+                f"Tool bulkhead rejected call to {compartment.service} after {waited:.2f}s"
+            )
+            raise BulkheadFullError(compartment.service, waited) from None
+        except BaseException:
+            # Cancelled after the slot was handed over: give it back
+            if waiter.done() and not waiter.cancelled():
+                self._release(compartment)
+            raise
+        finally:
+            if waiter in compartment.waiters:
+                compartment.waiters.remove(waiter)
+            compartment.publish()
+        record_tool_queue_wait(compartment.service, time.perf_counter() - start)
+
+    def _release(self, compartment: _Compartment) -> None:
+        """Free a slot, handing it to the next live waiter if any."""
+        while compartment.waiters:
+            waiter = compartment.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                compartment.publish()
+                return
+        compartment.in_flight -= 1
+        compartment.publish()
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        """
+        Current per-service state.
+
+        Returns:
+            {service: {"limit": ..., "in_flight": ..., "queued": ...}}
+        """
+        return {
+            service: {
+                "limit": c.limit,
+                "in_flight": c.in_flight,
+                "queued": len(c.waiters),
+            }
+            for service, c in self._compartments.items()
+        }
+
+
+# =============================================================================
+# Singleton Access
+# =============================================================================
+
+_bulkhead: Optional[ToolBulkhead] = None
+
+
+def get_tool_bulkhead() -> Optional[ToolBulkhead]:
+    """
+    Get the compartments shared by ToolExecutor and /v1/tools/execute.
+
+    Returns:
+        The bulkhead, or None when tool calls are not limited.
+    """
+    return _bulkhead
+
+
+def set_tool_bulkhead(bulkhead: Optional[ToolBulkhead]) -> None:
+    """
+    Install the shared compartments.
+
+    Both executors look the bulkhead up per call, so calls already holding
+    a slot keep it and new calls use the new limits.
+
+    Args:
+        bulkhead: Bulkhead to share; None lets tool calls run unlimited.
+    """
+    global _bulkhead
+    _bulkhead = bulkhead
+
+
+def reset_tool_bulkhead() -> None:
+    """Remove the shared compartments (for testing)."""
+    set_tool_bulkhead(None)
@@ -20,10 +20,19 @@ Pattern: Fail-fast validation with graceful error wrapping
 import asyncio
 import inspect
 import logging
+import time
 from typing import Any, Optional
 
+from opentelemetry.trace import Status, StatusCode
+
 from src.models.domain import ToolCall, ToolResult
+from src.observability.metrics import record_tool_execution
+from src.observability.profiling import profile_phase
+from src.observability.tracing import get_tracer
+from src.tools.bulkhead import BulkheadFullError, ToolBulkhead, get_tool_bulkhead
 from src.tools.registry import ToolRegistry, ToolNotFoundError, get_tool_registry
+from src.tools.result_cache import ToolResultCache, get_tool_result_cache
+from src.tools.validation import SchemaValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +85,8 @@ class ToolExecutor:
     Attributes:
         registry: The ToolRegistry to look up tools from.
         timeout: Maximum execution time in seconds.
+        result_cache: Cache for cacheable tools (None = global cache).
+        bulkhead: Per-downstream concurrency limits (None = global bulkhead).
 
     Example:
         >>> executor = ToolExecutor(registry=get_tool_registry())
@@ -83,20 +94,32 @@ class ToolExecutor:
     """
 
     def __init__(
-        self, registry: ToolRegistry, timeout: float = DEFAULT_TIMEOUT
+        self,
+        registry: ToolRegistry,
+        timeout: float = DEFAULT_TIMEOUT,
+        result_cache: Optional[ToolResultCache] = None,
+        bulkhead: Optional[ToolBulkhead] = None,
     ) -> None:
         """
         Initialize the executor with a registry.
 
         WBS 2.4.2.1.3: Inject ToolRegistry dependency.
         WBS 2.4.2.1.10: Add execution timeout.
+        WBS-PERF15: Optional tool result cache.
+        WBS-PERF19: Optional per-downstream bulkhead.
 
         Args:
             registry: The ToolRegistry to use for tool lookup.
             timeout: Maximum execution time in seconds (default: 30).
+            result_cache: Cache for tools marked cacheable. Defaults to the
+                global cache installed at startup (if any).
+            bulkhead: Concurrency limits keyed by each tool's downstream
+                service. Defaults to the global bulkhead (if any).
         """
         self.registry = registry
         self.timeout = timeout
+        self.result_cache = result_cache
+        self.bulkhead = bulkhead
 
     # =========================================================================
     # WBS 2.4.2.1.4: execute() Method
@@ -136,7 +159,92 @@ class ToolExecutor:
             ) from e
 
         # WBS 2.4.2.1.6: Validate arguments against schema
-        self._validate_arguments(tool_name, tool.parameters, tool_call.arguments)
+        self._validate_arguments(tool_name, tool, tool_call.arguments)
+
+        # WBS-PERF7: One span and latency sample per tool execution
+        # WBS-PERF12: One profile phase per tool when the request is profiled
+        with get_tracer(__name__).start_as_current_span("tool.execute") as span, profile_phase(
+            f"tool:{tool_name}", tool_call_id=tool_call_id
+        ):
+            span.set_attribute("tool.name", tool_name)
+            start = time.perf_counter()
+            result, status = await self._run_cached(tool, tool_call)
+            span.set_attribute("tool.cache_hit", status == "cache_hit")
+            record_tool_execution(tool_name, status, time.perf_counter() - start)
+            if result.is_error:
+                span.set_status(Status(StatusCode.ERROR, result.content))
+            return result
+
+    async def _run_cached(self, tool: Any, tool_call: ToolCall) -> tuple[ToolResult, str]:
+        """
+        Run a tool through the result cache when its definition allows it.
+
+        WBS-PERF15: Read-only tools are served from the cache, and concurrent
+        identical calls share one handler execution.
+
+        Args:
+            tool: The registered tool.
+            tool_call: The ToolCall being executed.
+
+        Returns:
+            Tuple of (ToolResult, status); status is "cache_hit" when the
+            result came from the cache.
+        """
+        cache = self.result_cache or get_tool_result_cache()
+        definition = tool.definition
+        if cache is None or not definition.cacheable:
+            return await self._run_bounded(tool, tool_call)
+        return await cache.get_or_load(
+            tool_call,
+            loader=lambda: self._run_bounded(tool, tool_call),
+            ttl_seconds=definition.cache_ttl_seconds,
+            parameters=definition.parameters,
+        )
+
+    async def _run_bounded(self, tool: Any, tool_call: ToolCall) -> tuple[ToolResult, str]:
+        """
+        Run a tool handler inside its downstream service's bulkhead.
+
+        WBS-PERF19: Calls queue for a slot in the compartment of the
+        service the tool targets; a call that waits past the queue timeout
+        is rejected rather than piling onto a saturated backend. Cache hits
+        never take a slot.
+
+        Args:
+            tool: The registered tool.
+            tool_call: The ToolCall being executed.
+
+        Returns:
+            Tuple of (ToolResult, status); status is "rejected" when no
+            slot became free in time.
+        """
+        bulkhead = self.bulkhead or get_tool_bulkhead()
+        if bulkhead is None:
+            return await self._run_handler(tool, tool_call)
+        try:
+            async with bulkhead.acquire(tool.definition.downstream):
+                return await self._run_handler(tool, tool_call)
+        except BulkheadFullError as e:
+            return ToolResult(
+                tool_call_id=tool_call.id,
+                content=f"Tool execution rejected: {e}",
+                is_error=True,
+            ), "rejected"
+
+    async def _run_handler(self, tool: Any, tool_call: ToolCall) -> tuple[ToolResult, str]:
+        """
+        Run a tool handler and wrap the outcome.
+
+        Args:
+            tool: The registered tool.
+            tool_call: The ToolCall being executed.
+
+        Returns:
+            Tuple of (ToolResult, status) where status is
+            "success", "timeout" or "error".
+        """
+        tool_name = tool_call.name
+        tool_call_id = tool_call.id
 
         # WBS 2.4.2.1.7: Execute handler with timeout
         # WBS 2.4.2.1.9: Handle errors gracefully
@@ -149,102 +257,48 @@ class ToolExecutor:
                 tool_call_id=tool_call_id,
                 content=str(result_content),
                 is_error=False,
-            )
+            ), "success"
         except asyncio.TimeoutError:
             logger.warning(f"Tool {tool_name} timed out after {self.timeout}s")
             return ToolResult(
                 tool_call_id=tool_call_id,
                 content=f"Tool execution timeout after {self.timeout}s",
                 is_error=True,
-            )
+            ), "timeout"
         except Exception as e:
             logger.error(f"Tool {tool_name} execution failed: {e}")
             return ToolResult(
                 tool_call_id=tool_call_id,
                 content=f"Tool execution failed: {e}",
                 is_error=True,
-            )
+            ), "error"
 
     # =========================================================================
     # WBS 2.4.2.1.6: Argument Validation
     # =========================================================================
 
     def _validate_arguments(
-        self, tool_name: str, schema: dict[str, Any], arguments: dict[str, Any]
+        self, tool_name: str, tool: Any, arguments: dict[str, Any]
     ) -> None:
         """
         Validate arguments against tool's JSON Schema.
 
         WBS 2.4.2.1.6: Validate arguments against tool schema.
-
-        Performs basic validation:
-        - Required properties are present
-        - Type checking for known types
+        WBS-PERF18: Uses the validator compiled once per RegisteredTool,
+        which also checks nested objects, arrays, enums and bounds.
 
         Args:
             tool_name: Name of the tool (for error messages).
-            schema: JSON Schema for the tool's parameters.
+            tool: The registered tool.
             arguments: Arguments provided in the tool call.
 
         Raises:
             ToolValidationError: If validation fails.
         """
-        # Check required properties
-        required = schema.get("required", [])
-        for prop in required:
-            if prop not in arguments:
-                raise ToolValidationError(
-                    f"Missing required argument: {prop}",
-                    tool_name=tool_name,
-                    field=prop,
-                )
-
-        # Check types of provided properties
-        properties = schema.get("properties", {})
-        for prop_name, value in arguments.items():
-            if prop_name not in properties:
-                continue  # Allow extra properties
-
-            prop_schema = properties[prop_name]
-            expected_type = prop_schema.get("type")
-
-            if expected_type and not self._check_type(value, expected_type):
-                raise ToolValidationError(
-                    f"Invalid type for '{prop_name}': expected {expected_type}, "
-                    f"got {type(value).__name__}",
-                    tool_name=tool_name,
-                    field=prop_name,
-                )
-
-    def _check_type(self, value: Any, expected_type: str) -> bool:
-        """
-        Check if a value matches the expected JSON Schema type.
-
-        Args:
-            value: The value to check.
-            expected_type: The JSON Schema type string.
-
-        Returns:
-            True if the value matches the type, False otherwise.
-        """
-        type_map = {
-            "string": str,
-            "integer": int,
-            "number": (int, float),
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
-
-        python_type = type_map.get(expected_type)
-        if python_type is None:
-            return True  # Unknown type, allow
-
-        # Special case: integers are valid numbers
-        if expected_type == "number" and isinstance(value, bool):
-            return False  # bool is subclass of int, but not a valid number
-
-        return isinstance(value, python_type)
+        try:
+            tool.validator.validate(arguments)
+        except SchemaValidationError as e:
+            raise ToolValidationError(str(e), tool_name=tool_name, field=e.field) from e
 
     # =========================================================================
     # WBS 2.4.2.1.10: Timeout Handling
@@ -300,6 +354,8 @@ class ToolExecutor:
         All tool calls are executed in parallel using asyncio.gather.
         Results are returned in the same order as input tool_calls.
         Failures in individual tools don't affect other executions.
+        WBS-PERF19: Calls to the same downstream service share its
+        bulkhead, so a large batch queues instead of flooding it.
 
         Args:
             tool_calls: List of ToolCalls to execute.
@@ -310,27 +366,37 @@ class ToolExecutor:
         if not tool_calls:
             return []
 
-        # Execute all concurrently, wrapping errors in ToolResult
-        async def safe_execute(tool_call: ToolCall) -> ToolResult:
-            """Execute a single tool call, catching validation errors."""
-            try:
-                return await self.execute(tool_call)
-            except ToolExecutionError as e:
-                # ToolValidationError inherits from ToolExecutionError, so this catches both
-                return ToolResult(
-                    tool_call_id=tool_call.id,
-                    content=f"Tool error: {e}",
-                    is_error=True,
-                )
-
         # WBS 2.4.2.2.2: Concurrent execution with gather
         results = await asyncio.gather(
-            *[safe_execute(tc) for tc in tool_calls],
-            return_exceptions=False,  # We handle exceptions in safe_execute
+            *[self.execute_safe(tc) for tc in tool_calls],
+            return_exceptions=False,  # We handle exceptions in execute_safe
         )
 
         return list(results)
 
+    async def execute_safe(self, tool_call: ToolCall) -> ToolResult:
+        """
+        Execute a single tool call, returning lookup/validation errors as results.
+
+        Used by execute_batch and by eager dispatch during streaming
+        (WBS-PERF20), where one bad call must not fail the others.
+
+        Args:
+            tool_call: The ToolCall to execute.
+
+        Returns:
+            ToolResult (is_error=True if the tool is unknown or arguments invalid).
+        """
+        try:
+            return await self.execute(tool_call)
+        except ToolExecutionError as e:
+            # ToolValidationError inherits from ToolExecutionError, so this catches both
+            return ToolResult(
+                tool_call_id=tool_call.id,
+                content=f"Tool error: {e}",
+                is_error=True,
+            )
+
 
 # =============================================================================
 # Singleton Access
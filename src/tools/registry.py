@@ -96,6 +96,8 @@ class ToolRegistry:
         Example:
             >>> registry.register("search", search_tool)
         """
+        # WBS-PERF18: Compile the argument validator once, up front
+        tool.validator  # noqa: B018
         self._tools[name] = tool
         self._definitions[name] = tool.definition
         logger.debug(f"Registered tool: {name}")
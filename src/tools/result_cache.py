@@ -0,0 +1,307 @@
+"""
+Tool Result Cache - WBS-PERF15
+
+This module caches results of read-only tools (search, chunk retrieval,
+embeddings, similarity) so repeated calls with identical arguments do not
+hit the downstream service again. LLM tool loops frequently repeat the
+same call within a turn and across turns of a conversation.
+
+Lookups go through two tiers:
+1. In-process BoundedTTLCache (LRU, bounded by entries and bytes)
+2. Redis (shared across gateway replicas, optional)
+
+Concurrent identical calls are coalesced (single-flight): only the first
+caller runs the handler, the others await its result.
+
+Only tools whose ToolDefinition sets ``cacheable=True`` are cached, and
+only successful results are stored.
+
+Reference Documents:
+- GUIDELINES pp. 2309-2319: Latency reduction through caching
+- Building Microservices (Newman): Client-side and shared caching
+
+Pattern: Cache-aside with request coalescing
+
+Anti-Pattern Compliance:
+- AP-1: Constants for key prefix and defaults
+- AP-2: Methods <15 CC
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from src.models.domain import ToolCall, ToolResult
+from src.observability.metrics import record_tool_cache_lookup
+from src.resilience.local_cache import BoundedTTLCache
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants (AP-1 Compliance)
+# =============================================================================
+
+TOOL_CACHE_KEY_PREFIX = "cache:tool:"
+"""Redis/local key prefix for cached tool results."""
+
+DEFAULT_TOOL_CACHE_TTL_SECONDS = 300.0
+DEFAULT_TOOL_CACHE_MAX_ENTRIES = 2048
+DEFAULT_TOOL_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+MAX_TOOL_CACHE_TTL_SECONDS = 86400.0
+"""Upper bound for the in-process tier; per-entry expiry is checked on top."""
+
+CACHE_HIT_STATUS = "cache_hit"
+"""Execution status reported for results served from the cache."""
+
+ToolLoader = Callable[[], Awaitable[tuple[ToolResult, str]]]
+
+
+# =============================================================================
+# Key Canonicalization
+# =============================================================================
+
+
+def canonicalize_arguments(
+    arguments: dict[str, Any], parameters: Optional[dict[str, Any]] = None
+) -> str:
+    """
+    Serialize arguments so equivalent calls produce the same string.
+
+    Keys are sorted and schema defaults are filled in, so
+    ``{"query": "x"}`` and ``{"query": "x", "top_k": 10}`` match when
+    ``top_k`` defaults to 10.
+
+    Args:
+        arguments: Tool call arguments
+        parameters: Tool JSON Schema (for property defaults)
+
+    Returns:
+        Compact, key-sorted JSON string
+    """
+    merged = dict(arguments)
+    properties = (parameters or {}).get("properties", {})
+    for name, schema in properties.items():
+        if name not in merged and isinstance(schema, dict) and "default" in schema:
+            merged[name] = schema["default"]
+    return json.dumps(merged, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def make_cache_key(
+    tool_name: str, arguments: dict[str, Any], parameters: Optional[dict[str, Any]] = None
+) -> str:
+    """
+    Build the cache key for a tool call.
+
+    Args:
+        tool_name: Tool name
+        arguments: Tool call arguments
+        parameters: Tool JSON Schema (for property defaults)
+
+    Returns:
+        Key of the form ``cache:tool:{tool_name}:{sha256}``
+    """
+    digest = hashlib.sha256(
+        canonicalize_arguments(arguments, parameters).encode("utf-8")
+    ).hexdigest()
+    return f"{TOOL_CACHE_KEY_PREFIX}{tool_name}:{digest}"
+
+
+# =============================================================================
+# ToolResultCache
+# =============================================================================
+
+
+class ToolResultCache:
+    """
+    Two-tier (in-process + Redis) cache for read-only tool results.
+
+    Example:
+        >>> cache = ToolResultCache(redis_client=redis)
+        >>> result, status = await cache.get_or_load(
+        ...     tool_call, ttl_seconds=300, loader=lambda: run(tool_call)
+        ... )
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        default_ttl_seconds: float = DEFAULT_TOOL_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_TOOL_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_TOOL_CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: Async Redis client (None = in-process only)
+            default_ttl_seconds: TTL for tools without cache_ttl_seconds
+            max_entries: Maximum in-process entries
+            max_bytes: Maximum estimated in-process size
+            clock: Monotonic clock (injectable for tests)
+        """
+        self._redis = redis_client
+        self._default_ttl = default_ttl_seconds
+        self._clock = clock
+        self._local = BoundedTTLCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            ttl_seconds=MAX_TOOL_CACHE_TTL_SECONDS,
+            stale_ttl_seconds=0.0,
+            clock=clock,
+        )
+        self._inflight: dict[str, asyncio.Future[tuple[ToolResult, str]]] = {}
+
+    @property
+    def default_ttl_seconds(self) -> float:
+        """TTL used for tools that do not declare one."""
+        return self._default_ttl
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
+
+    async def get_or_load(
+        self,
+        tool_call: ToolCall,
+        loader: ToolLoader,
+        ttl_seconds: Optional[float] = None,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> tuple[ToolResult, str]:
+        """
+        Return a cached result, or run the loader once for all concurrent callers.
+
+        Args:
+            tool_call: The tool call being executed
+            loader: Runs the tool; returns (ToolResult, status)
+            ttl_seconds: Result lifetime (None = default TTL)
+            parameters: Tool JSON Schema (for argument canonicalization)
+
+        Returns:
+            Tuple of (ToolResult for this tool_call.id, status). Status is
+            "cache_hit" when served from either tier, otherwise the loader's.
+        """
+        key = make_cache_key(tool_call.name, tool_call.arguments, parameters)
+
+        content = self._get_local(key)
+        if content is not None:
+            record_tool_cache_lookup(tool_call.name, "hit_local")
+            return self._as_result(tool_call, content), CACHE_HIT_STATUS
+
+        task = self._inflight.get(key)
+        if task is not None:
+            record_tool_cache_lookup(tool_call.name, "coalesced")
+        else:
+            ttl = ttl_seconds or self._default_ttl
+            task = asyncio.ensure_future(self._load(key, tool_call.name, ttl, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        # Shield so one caller's cancellation does not cancel the shared load
+        result, status = await asyncio.shield(task)
+        if result.tool_call_id != tool_call.id:
+            result = result.model_copy(update={"tool_call_id": tool_call.id})
+        return result, status
+
+    def clear(self) -> None:
+        """Drop all in-process entries (Redis entries expire on their own)."""
+        self._local.clear()
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    async def _load(
+        self, key: str, tool_name: str, ttl: float, loader: ToolLoader
+    ) -> tuple[ToolResult, str]:
+        """Check Redis, then run the loader and store a successful result."""
+        content = await self._get_redis(key)
+        if content is not None:
+            record_tool_cache_lookup(tool_name, "hit_redis")
+            self._set_local(key, content, ttl)
+            return ToolResult(tool_call_id="", content=content), CACHE_HIT_STATUS
+
+        record_tool_cache_lookup(tool_name, "miss")
+        result, status = await loader()
+        if not result.is_error:
+            self._set_local(key, result.content, ttl)
+            await self._set_redis(key, result.content, ttl)
+        return result, status
+
+    def _forget(self, key: str, task: "asyncio.Future[Any]") -> None:
+        """Drop a finished load from the in-flight table."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def _get_local(self, key: str) -> Optional[str]:
+        """Get an unexpired in-process entry."""
+        entry = self._local.get(key)
+        if entry is None or entry["expires_at"] <= self._clock():
+            return None
+        return entry["content"]
+
+    def _set_local(self, key: str, content: str, ttl: float) -> None:
+        """Store an in-process entry with its own expiry."""
+        self._local.set(key, {"content": content, "expires_at": self._clock() + ttl})
+
+    async def _get_redis(self, key: str) -> Optional[str]:
+        """Get a shared entry; Redis errors are treated as misses."""
+        if self._redis is None:
+            return None
+        try:
+            value = await self._redis.get(key)
+        except Exception as e:
+            logger.warning(f"Tool cache Redis read failed: {e}")
+            return None
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        return value
+
+    async def _set_redis(self, key: str, content: str, ttl: float) -> None:
+        """Store a shared entry; Redis errors are logged and ignored."""
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(key, content, px=max(1, math.ceil(ttl * 1000)))
+        except Exception as e:
+            logger.warning(f"Tool cache Redis write failed: {e}")
+
+    @staticmethod
+    def _as_result(tool_call: ToolCall, content: str) -> ToolResult:
+        """Wrap cached content for the current tool call."""
+        return ToolResult(tool_call_id=tool_call.id, content=content, is_error=False)
+
+
+# =============================================================================
+# Singleton Access
+# =============================================================================
+
+_cache: Optional[ToolResultCache] = None
+
+
+def get_tool_result_cache() -> Optional[ToolResultCache]:
+    """Cache consulted by ToolExecutors built without one (None = caching off)."""
+    return _cache
+
+
+def set_tool_result_cache(cache: Optional[ToolResultCache]) -> None:
+    """
+    Install the cache ToolExecutor falls back to.
+
+    Args:
+        cache: Cache to use, with a Redis tier when Redis was reachable at
+            startup; None turns tool result caching off.
+    """
+    global _cache
+    _cache = cache
+
+
+def reset_tool_result_cache() -> None:
+    """Turn tool result caching off (for testing)."""
+    set_tool_result_cache(None)
@@ -0,0 +1,315 @@
+"""
+Tests for admission control - WBS-PERF25 Priority- and Tenant-Aware Queue
+
+AdmissionController grants request slots in weighted-fair order across
+priority classes and API keys, rejects requests whose projected wait
+exceeds their queue deadline, and MemoryMiddleware maps rejections to 503.
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.api.middleware.admission import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    AdmissionController,
+    AdmissionRejectedError,
+    classify_request,
+)
+from src.api.middleware.memory import MemoryMiddleware, memory_tracker
+from src.services.cost_aggregator import ANONYMOUS_API_KEY_ID
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+async def _queue(
+    controller: AdmissionController, order: list[str], label: str, priority: str, tenant: str = "t"
+) -> asyncio.Task:
+    """Start a waiter that records ``label`` when admitted and releases at once."""
+
+    async def run() -> None:
+        granted_at = await controller.acquire(priority, tenant)
+        order.append(label)
+        controller.release(granted_at)
+
+    task = asyncio.create_task(run())
+    await asyncio.sleep(0)
+    return task
+
+
+# =============================================================================
+# AdmissionController
+# =============================================================================
+
+
+class TestAdmissionController:
+    """Fair ordering, deadlines and queue accounting."""
+
+    async def test_free_slot_granted_immediately(self) -> None:
+        controller = AdmissionController(max_concurrent=2)
+
+        granted_at = await controller.acquire()
+
+        assert controller.active == 1
+        controller.release(granted_at)
+        assert controller.active == 0
+
+    async def test_interactive_served_before_background(self) -> None:
+        controller = AdmissionController(max_concurrent=1)
+        held = await controller.acquire()
+        order: list[str] = []
+
+        tasks = [
+            await _queue(controller, order, "bg", PRIORITY_BACKGROUND),
+            await _queue(controller, order, "batch", PRIORITY_BATCH),
+            await _queue(controller, order, "ui", PRIORITY_INTERACTIVE),
+        ]
+        assert controller.depth(PRIORITY_BACKGROUND) == 1
+        controller.release(held)
+        await asyncio.gather(*tasks)
+
+        assert order == ["ui", "batch", "bg"]
+        assert controller.queued == 0
+
+    async def test_flooding_tenant_does_not_starve_others(self) -> None:
+        controller = AdmissionController(max_concurrent=1)
+        held = await controller.acquire()
+        order: list[str] = []
+
+        tasks = [await _queue(controller, order, f"a{i}", PRIORITY_BATCH, "a") for i in range(4)]
+        tasks.append(await _queue(controller, order, "b0", PRIORITY_BATCH, "b"))
+        controller.release(held)
+        await asyncio.gather(*tasks)
+
+        assert order.index("b0") == 1
+
+    async def test_tenant_weight_scales_share(self) -> None:
+        controller = AdmissionController(max_concurrent=1, tenant_weights={"gold": 3.0})
+        held = await controller.acquire()
+        order: list[str] = []
+
+        tasks = [await _queue(controller, order, f"g{i}", PRIORITY_BATCH, "gold") for i in range(3)]
+        tasks += [await _queue(controller, order, f"s{i}", PRIORITY_BATCH, "std") for i in range(2)]
+        controller.release(held)
+        await asyncio.gather(*tasks)
+
+        assert order[:4] == ["g0", "g1", "g2", "s0"]
+
+    async def test_deadline_expires_in_queue(self) -> None:
+        controller = AdmissionController(max_concurrent=1)
+        await controller.acquire()
+
+        with pytest.raises(AdmissionRejectedError) as exc:
+            await controller.acquire(PRIORITY_INTERACTIVE, timeout_seconds=0.02)
+
+        assert exc.value.reason == "deadline_expired"
+        assert controller.queued == 0
+
+    async def test_projected_wait_rejected_early(self) -> None:
+        controller = AdmissionController(max_concurrent=1)
+        controller.release(await controller.acquire() - 1.0)  # ~1s mean service time
+        await controller.acquire()
+
+        start = time.monotonic()
+        with pytest.raises(AdmissionRejectedError) as exc:
+            await controller.acquire(PRIORITY_INTERACTIVE, timeout_seconds=0.5)
+
+        assert exc.value.reason == "deadline_projected"
+        assert exc.value.retry_after_seconds >= 1.0
+        assert time.monotonic() - start < 0.1
+
+    async def test_queue_full(self) -> None:
+        controller = AdmissionController(max_concurrent=1, max_queue_depth=1)
+        await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejectedError) as exc:
+            await controller.acquire()
+
+        assert exc.value.reason == "queue_full"
+        waiter.cancel()
+
+    async def test_cancelled_waiter_is_skipped(self) -> None:
+        controller = AdmissionController(max_concurrent=1)
+        held = await controller.acquire()
+        order: list[str] = []
+        gone = asyncio.create_task(controller.acquire(PRIORITY_INTERACTIVE))
+        await asyncio.sleep(0)
+        task = await _queue(controller, order, "next", PRIORITY_BATCH)
+
+        gone.cancel()
+        await asyncio.gather(gone, return_exceptions=True)
+        controller.release(held)
+        await task
+
+        assert order == ["next"]
+        assert controller.active == 0
+
+    def test_non_positive_or_unknown_weights_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            AdmissionController(max_concurrent=1, tenant_weights={"t": 0})
+        with pytest.raises(ValueError):
+            AdmissionController(max_concurrent=1, class_weights={"urgent": 2.0})
+
+    def test_settings_validate_weights(self) -> None:
+        from pydantic import ValidationError
+
+        from src.core.config import Settings
+
+        with pytest.raises(ValidationError):
+            Settings(admission_tenant_weights={"t": 0})
+        with pytest.raises(ValidationError):
+            Settings(admission_class_weights={"urgent": 2.0})
+
+
+# =============================================================================
+# Request Classification
+# =============================================================================
+
+
+class TestClassifyRequest:
+    """Priority, tenant and deadline derived from the request."""
+
+    def test_defaults(self) -> None:
+        assert classify_request("/v1/chat/completions", {}) == (
+            PRIORITY_INTERACTIVE,
+            ANONYMOUS_API_KEY_ID,
+            None,
+        )
+        assert classify_request("/v1/batches", {})[0] == PRIORITY_BACKGROUND
+
+    def test_headers(self) -> None:
+        priority, tenant, timeout = classify_request(
+            "/v1/chat/completions",
+            {"x-priority": "Batch", "x-request-timeout": "2.5", "x-api-key": "k"},
+        )
+
+        assert (priority, timeout) == (PRIORITY_BATCH, 2.5)
+        assert tenant != ANONYMOUS_API_KEY_ID
+
+
+# =============================================================================
+# MemoryMiddleware
+# =============================================================================
+
+
+class TestMemoryMiddlewareAdmission:
+    """Rejections become 503 with the admission reason."""
+
+    @pytest.fixture
+    def controller(self):
+        original = memory_tracker.admission
+        controller = AdmissionController(max_concurrent=1)
+        memory_tracker.set_admission_controller(controller)
+        yield controller
+        memory_tracker.set_admission_controller(original)
+
+    def test_rejected_request_is_503(self, controller: AdmissionController) -> None:
+        app = FastAPI()
+        app.add_middleware(MemoryMiddleware)
+
+        @app.get("/v1/work")
+        async def work() -> dict:
+            return {"ok": True}
+
+        client = TestClient(app)
+        assert client.get("/v1/work").status_code == 200
+
+        # Hold the only slot (private loop: leave the default loop untouched)
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(controller.acquire())
+        loop.close()
+        response = client.get("/v1/work", headers={"X-Request-Timeout": "0"})
+
+        assert response.status_code == 503
+        assert response.json()["admission_reason"] == "deadline_projected"
+        assert response.headers["Retry-After"] == "1"
+
+    def test_memory_rejection_is_recorded(self, controller, monkeypatch) -> None:
+        from src.api.middleware import memory
+
+        recorded: list[tuple[str, str]] = []
+        monkeypatch.setattr(memory, "MEMORY_THRESHOLD_MB", 0)
+        monkeypatch.setattr(
+            memory, "record_admission_rejection", lambda *args: recorded.append(args)
+        )
+        app = FastAPI()
+        app.add_middleware(MemoryMiddleware)
+
+        @app.get("/v1/work")
+        async def work() -> dict:
+            return {"ok": True}
+
+        response = TestClient(app).get("/v1/work")
+
+        assert response.json()["admission_reason"] == "memory"
+        assert recorded == [(PRIORITY_INTERACTIVE, "memory")]
+
+    def test_streamed_response_holds_slot_until_done(self, controller) -> None:
+        active_while_streaming: list[int] = []
+        app = FastAPI()
+        app.add_middleware(MemoryMiddleware)
+
+        @app.get("/v1/stream")
+        async def stream() -> StreamingResponse:
+            async def body():
+                yield b"first\n"
+                await asyncio.sleep(0.01)
+                active_while_streaming.append(controller.active)
+                yield b"second\n"
+
+            return StreamingResponse(body(), media_type="application/x-ndjson")
+
+        response = TestClient(app).get("/v1/stream")
+
+        assert response.text == "first\nsecond\n"
+        assert active_while_streaming == [1]
+        assert controller.active == 0
+
+    async def test_slot_released_when_body_never_sent(self, controller) -> None:
+        app = FastAPI()
+        app.add_middleware(MemoryMiddleware)
+
+        @app.get("/v1/stream")
+        async def stream() -> StreamingResponse:
+            async def body():
+                yield b"never sent\n"
+
+            return StreamingResponse(body(), media_type="application/x-ndjson")
+
+        async def receive() -> dict:
+            await asyncio.sleep(1)
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict) -> None:
+            raise OSError("client went away")
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/v1/stream",
+            "raw_path": b"/v1/stream",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [],
+            "client": ("testclient", 123),
+            "server": ("testserver", 80),
+        }
+
+        with pytest.raises(OSError):
+            await app(scope, receive, send)
+
+        assert controller.active == 0
@@ -0,0 +1,221 @@
+"""
+Tests for Client Disconnect Propagation - WBS-PERF2
+
+Reference Documents:
+- GUIDELINES pp. 2145: Graceful degradation, timeouts prevent cascading failures
+- GUIDELINES p. 2149: Token generation and streaming patterns
+
+WBS Items Covered:
+- WBS-PERF2: DisconnectWatcher.run() cancels work on disconnect
+- WBS-PERF2: DisconnectWatcher.guard_stream() closes upstream streams
+- WBS-PERF2: SSE generator stops without [DONE] and records metrics
+"""
+
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+
+from src.models.requests import ChatCompletionRequest
+from src.models.responses import ChatCompletionChunk, ChunkChoice, ChunkDelta
+
+
+# =============================================================================
+# Test Doubles
+# =============================================================================
+
+
+class FakeHTTPRequest:
+    """Request double that reports a disconnect after N checks."""
+
+    def __init__(self, disconnect_after: int = 10**9) -> None:
+        self.checks = 0
+        self._disconnect_after = disconnect_after
+
+    async def is_disconnected(self) -> bool:
+        self.checks += 1
+        return self.checks > self._disconnect_after
+
+
+class TrackingStream:
+    """Async generator wrapper that records whether it was closed."""
+
+    def __init__(self, count: int) -> None:
+        self.closed = False
+        self.produced = 0
+        self._gen = self._generate(count)
+
+    async def _generate(self, count: int) -> AsyncIterator[ChatCompletionChunk]:
+        try:
+            for i in range(count):
+                self.produced += 1
+                yield _chunk(f"tok{i} ")
+        finally:
+            self.closed = True
+
+    def __aiter__(self) -> "TrackingStream":
+        return self
+
+    async def __anext__(self) -> ChatCompletionChunk:
+        return await self._gen.__anext__()
+
+    async def aclose(self) -> None:
+        await self._gen.aclose()
+
+
+class FakeChatService:
+    """Chat service double exposing stream_completion()."""
+
+    def __init__(self, stream: TrackingStream) -> None:
+        self.stream = stream
+
+    def stream_completion(self, request: ChatCompletionRequest) -> TrackingStream:
+        return self.stream
+
+
+def _chunk(content: str) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id="chatcmpl-test",
+        created=1234567890,
+        model="test-model",
+        choices=[ChunkChoice(index=0, delta=ChunkDelta(content=content), finish_reason=None)],
+    )
+
+
+@pytest.fixture
+def chat_request() -> ChatCompletionRequest:
+    return ChatCompletionRequest(
+        model="test-model",
+        messages=[{"role": "user", "content": "Hello"}],
+        stream=True,
+        max_tokens=100,
+    )
+
+
+# =============================================================================
+# WBS-PERF2: DisconnectWatcher.run()
+# =============================================================================
+
+
+class TestDisconnectWatcherRun:
+    """Tests for DisconnectWatcher.run()."""
+
+    async def test_returns_result_when_client_connected(self) -> None:
+        from src.api.disconnect import DisconnectWatcher
+
+        async def work() -> str:
+            await asyncio.sleep(0.01)
+            return "done"
+
+        watcher = DisconnectWatcher(FakeHTTPRequest(), poll_interval=0.001)
+
+        assert await watcher.run(work()) == "done"
+        assert watcher.disconnected is False
+
+    async def test_cancels_work_on_disconnect(self) -> None:
+        from src.api.disconnect import ClientDisconnectedError, DisconnectWatcher
+
+        cancelled = asyncio.Event()
+
+        async def slow_work() -> str:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "never"
+
+        watcher = DisconnectWatcher(FakeHTTPRequest(disconnect_after=1), poll_interval=0.001)
+
+        with pytest.raises(ClientDisconnectedError):
+            await watcher.run(slow_work())
+
+        assert cancelled.is_set()
+        assert watcher.disconnected is True
+
+
+# =============================================================================
+# WBS-PERF2: DisconnectWatcher.guard_stream()
+# =============================================================================
+
+
+class TestDisconnectWatcherStream:
+    """Tests for DisconnectWatcher.guard_stream()."""
+
+    async def test_stops_and_closes_upstream_on_disconnect(self) -> None:
+        from src.api.disconnect import DisconnectWatcher
+
+        upstream = TrackingStream(count=50)
+        watcher = DisconnectWatcher(FakeHTTPRequest(disconnect_after=3))
+
+        received = [c async for c in watcher.guard_stream(upstream)]
+
+        assert len(received) == 3
+        assert upstream.closed is True
+        assert upstream.produced < 50
+
+    async def test_forwards_everything_when_connected(self) -> None:
+        from src.api.disconnect import DisconnectWatcher
+
+        upstream = TrackingStream(count=5)
+        watcher = DisconnectWatcher(FakeHTTPRequest())
+
+        received = [c async for c in watcher.guard_stream(upstream)]
+
+        assert len(received) == 5
+        assert upstream.closed is True
+
+
+# =============================================================================
+# WBS-PERF2: SSE Generator Integration
+# =============================================================================
+
+
+class TestSSEGeneratorDisconnect:
+    """Tests for _stream_sse_generator() disconnect handling."""
+
+    async def test_disconnect_skips_done_marker_and_records_metrics(
+        self, chat_request: ChatCompletionRequest
+    ) -> None:
+        from src.api.disconnect import DisconnectWatcher
+        from src.api.routes.chat import _stream_sse_generator
+        from src.observability.metrics import (
+            CANCELLED_TOKENS_SAVED_TOTAL,
+            CLIENT_DISCONNECTS_TOTAL,
+        )
+
+        disconnects = CLIENT_DISCONNECTS_TOTAL.labels(
+            endpoint="/v1/chat/completions", mode="stream"
+        )
+        saved = CANCELLED_TOKENS_SAVED_TOTAL.labels(model="test-model")
+        disconnects_before = disconnects._value.get()
+        saved_before = saved._value.get()
+
+        upstream = TrackingStream(count=50)
+        watcher = DisconnectWatcher(FakeHTTPRequest(disconnect_after=2))
+
+        frames = [
+            f async for f in _stream_sse_generator(FakeChatService(upstream), chat_request, watcher)
+        ]
+
+        assert len(frames) == 2
+        assert "data: [DONE]\n\n" not in frames
+        assert upstream.closed is True
+        assert disconnects._value.get() == disconnects_before + 1
+        assert saved._value.get() == saved_before + 98
+
+    async def test_connected_stream_ends_with_done(
+        self, chat_request: ChatCompletionRequest
+    ) -> None:
+        from src.api.disconnect import DisconnectWatcher
+        from src.api.routes.chat import _stream_sse_generator
+
+        upstream = TrackingStream(count=3)
+        watcher = DisconnectWatcher(FakeHTTPRequest())
+
+        frames = [
+            f async for f in _stream_sse_generator(FakeChatService(upstream), chat_request, watcher)
+        ]
+
+        assert frames[-1] == "data: [DONE]\n\n"
+        assert len(frames) == 4
@@ -0,0 +1,222 @@
+"""
+Tests for Embeddings Router - WBS-PERF23 OpenAI-Compatible Embeddings Endpoint
+
+POST /v1/embeddings resolves the model through the ``embeddings:`` registry
+section, splits large inputs into provider-sized batches embedded
+concurrently, and returns float lists or base64 float32.
+"""
+
+import asyncio
+import base64
+import json
+import struct
+from typing import Any, Optional
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import SecretStr
+
+from src.api.routes.embeddings import get_embedding_service, router as embeddings_router
+from src.core.exceptions import GatewayValidationError, ProviderError
+from src.models.requests import EmbeddingRequest
+from src.providers.embeddings import (
+    EmbeddingBackend,
+    EmbeddingBatch,
+    EmbeddingRouter,
+    OpenAICompatibleEmbeddingBackend,
+    create_embedding_router,
+    decode_float32_base64,
+)
+from src.providers.router import NoProviderError
+from src.services.embeddings import EmbeddingService
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class RecordingBackend(EmbeddingBackend):
+    """Embeds each text as [len(text), index-in-batch]; tracks concurrency."""
+
+    def __init__(self, max_batch_size: int = 2, fail: bool = False) -> None:
+        super().__init__("recording", max_batch_size)
+        self.batches: list[list[str]] = []
+        self.active = 0
+        self.peak = 0
+        self.fail = fail
+
+    async def embed(
+        self, texts: list[str], model: str, dimensions: Optional[int] = None
+    ) -> EmbeddingBatch:
+        self.batches.append(list(texts))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if self.fail:
+            raise ProviderError("upstream down", provider=self.name, status_code=503)
+        return EmbeddingBatch([[float(len(t)), float(i)] for i, t in enumerate(texts)], len(texts))
+
+
+def _service(backend: EmbeddingBackend, **kwargs: Any) -> EmbeddingService:
+    return EmbeddingService(
+        EmbeddingRouter({"recording": backend}, {"embed-small": "recording"}), **kwargs
+    )
+
+
+def _client(service: EmbeddingService) -> TestClient:
+    app = FastAPI()
+    app.include_router(embeddings_router)
+    app.dependency_overrides[get_embedding_service] = lambda: service
+    return TestClient(app)
+
+
+# =============================================================================
+# EmbeddingService
+# =============================================================================
+
+
+class TestEmbeddingService:
+    """Batch splitting, ordering and concurrency."""
+
+    async def test_large_input_split_into_concurrent_batches(self) -> None:
+        backend = RecordingBackend(max_batch_size=2)
+        service = _service(backend, max_concurrent_batches=2)
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+        response = await service.create(EmbeddingRequest(model="embed-small", input=texts))
+
+        assert sorted(backend.batches) == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+        assert backend.peak == 2
+        assert [d.index for d in response.data] == [0, 1, 2, 3, 4]
+        assert [d.embedding[0] for d in response.data] == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert response.usage.prompt_tokens == 5
+
+    async def test_too_many_inputs_rejected(self) -> None:
+        service = _service(RecordingBackend(), max_inputs=2)
+
+        with pytest.raises(GatewayValidationError):
+            await service.create(EmbeddingRequest(model="embed-small", input=["a", "b", "c"]))
+
+
+# =============================================================================
+# Backends and Registry
+# =============================================================================
+
+
+class TestEmbeddingBackends:
+    """Registry parsing and the OpenAI-compatible backend."""
+
+    def test_router_registers_keyed_backends_only(self) -> None:
+        settings = type(
+            "S",
+            (),
+            {
+                "openai_api_key": SecretStr(""),
+                "gemini_api_key": SecretStr("g-key"),
+                "inference_service_url": "http://inference:8085",
+            },
+        )()
+        config = {
+            "embeddings": {
+                "providers": {
+                    "openai": {"batch_size": 2048, "models": ["text-embedding-3-small"]},
+                    "google": {"batch_size": 100, "models": ["text-embedding-004"]},
+                    "semantic-search": {"models": ["all-MiniLM-L6-v2"]},
+                }
+            }
+        }
+
+        router = create_embedding_router(settings, config)
+
+        assert router.resolve("text-embedding-004").max_batch_size == 100
+        assert router.list_models() == ["all-MiniLM-L6-v2", "text-embedding-004"]
+        with pytest.raises(NoProviderError):
+            router.resolve("text-embedding-3-small")
+
+    async def test_openai_backend_decodes_base64_in_index_order(self, monkeypatch) -> None:
+        sent: list[dict[str, Any]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            sent.append(body)
+            data = [
+                {
+                    "index": i,
+                    "embedding": base64.b64encode(struct.pack("<2f", i, 0.5)).decode(),
+                }
+                for i in range(len(body["input"]))
+            ]
+            return httpx.Response(
+                200, json={"data": list(reversed(data)), "usage": {"prompt_tokens": 7}}
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(
+            "src.providers.embeddings.get_shared_client", lambda name, timeout: client
+        )
+        backend = OpenAICompatibleEmbeddingBackend(
+            "openai", "https://api.test/v1", api_key="k", request_base64=True
+        )
+
+        batch = await backend.embed(["x", "y"], "text-embedding-3-small")
+
+        assert sent[0]["encoding_format"] == "base64"
+        assert batch.vectors == [[0.0, 0.5], [1.0, 0.5]]
+        assert batch.prompt_tokens == 7
+        await client.aclose()
+
+
+# =============================================================================
+# Route
+# =============================================================================
+
+
+class TestEmbeddingsRoute:
+    """POST /v1/embeddings."""
+
+    def test_float_response(self) -> None:
+        response = _client(_service(RecordingBackend())).post(
+            "/v1/embeddings", json={"model": "embed-small", "input": "hello"}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["object"] == "list"
+        assert body["data"][0] == {"object": "embedding", "index": 0, "embedding": [5.0, 0.0]}
+        assert body["usage"] == {"prompt_tokens": 1, "total_tokens": 1}
+
+    def test_base64_response(self) -> None:
+        response = _client(_service(RecordingBackend())).post(
+            "/v1/embeddings",
+            json={"model": "embed-small", "input": ["ab", "c"], "encoding_format": "base64"},
+        )
+
+        data = response.json()["data"]
+        assert decode_float32_base64(data[1]["embedding"]) == [1.0, 1.0]
+
+    def test_unknown_model_is_404(self) -> None:
+        response = _client(_service(RecordingBackend())).post(
+            "/v1/embeddings", json={"model": "nope", "input": "x"}
+        )
+
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "model_not_found"
+
+    def test_provider_error_is_502(self) -> None:
+        response = _client(_service(RecordingBackend(fail=True))).post(
+            "/v1/embeddings", json={"model": "embed-small", "input": ["a", "b", "c"]}
+        )
+
+        assert response.status_code == 502
+        assert response.json()["error"]["type"] == "provider_error"
+
+    def test_empty_input_is_422(self) -> None:
+        response = _client(_service(RecordingBackend())).post(
+            "/v1/embeddings", json={"model": "embed-small", "input": []}
+        )
+
+        assert response.status_code == 422
@@ -0,0 +1,224 @@
+"""
+Tests for /v1/responses streaming and pooled clients - WBS-PERF16
+
+Upstream providers are replaced with an httpx.MockTransport installed as
+the shared provider client, so the tests cover payload building, SSE
+relay/translation and error mapping without network access.
+"""
+
+import json
+from typing import Callable, Iterator
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import SecretStr
+
+from src.api.routes import responses
+from src.api.routes.responses import ResponsesStreamTranslator
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _parse_events(body: str) -> list[dict]:
+    """Parse the data payloads of an SSE body."""
+    return [
+        json.loads(line[len("data: "):])
+        for line in body.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+def _sse(*events: dict, done: bool = False) -> bytes:
+    lines = [f"data: {json.dumps(e)}\n\n" for e in events]
+    if done:
+        lines.append("data: [DONE]\n\n")
+    return "".join(lines).encode()
+
+
+@pytest.fixture
+def upstream(monkeypatch) -> Iterator[Callable[[httpx.Response], list[httpx.Request]]]:
+    """Install a mock upstream; returns a setter that records requests."""
+    settings = MagicMock()
+    settings.openai_api_key = SecretStr("sk-openai")
+    settings.anthropic_api_key = SecretStr("sk-anthropic")
+    settings.deepseek_api_key = SecretStr("sk-deepseek")
+    settings.responses_read_timeout_seconds = 600.0
+    settings.responses_connect_timeout_seconds = 10.0
+    monkeypatch.setattr("src.core.config.get_settings", lambda: settings)
+
+    clients: dict[str, httpx.AsyncClient] = {}
+
+    def install(reply: httpx.Response) -> list[httpx.Request]:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return reply
+
+        transport = httpx.MockTransport(handler)
+
+        def shared_client(provider: str, timeout: httpx.Timeout) -> httpx.AsyncClient:
+            if provider not in clients:
+                clients[provider] = httpx.AsyncClient(transport=transport, timeout=timeout)
+            return clients[provider]
+
+        monkeypatch.setattr(responses, "get_shared_client", shared_client)
+        return seen
+
+    yield install
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(responses.router)
+    return TestClient(app)
+
+
+# =============================================================================
+# Streaming
+# =============================================================================
+
+
+class TestResponsesStreaming:
+    """stream=true returns Responses API events."""
+
+    def test_openai_stream_relayed_verbatim(self, client, upstream) -> None:
+        upstream_body = (
+            b'event: response.created\ndata: {"type":"response.created"}\n\n'
+            b'event: response.output_text.delta\ndata: {"type":"response.output_text.delta",'
+            b'"delta":"Hi"}\n\n'
+        )
+        seen = upstream(
+            httpx.Response(200, content=upstream_body, headers={"content-type": "text/event-stream"})
+        )
+
+        response = client.post(
+            "/v1/responses", json={"model": "gpt-5.2-pro", "input": "hello", "stream": True}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.content == upstream_body
+        assert json.loads(seen[0].content)["stream"] is True
+
+    def test_anthropic_stream_translated(self, client, upstream) -> None:
+        upstream(
+            httpx.Response(
+                200,
+                content=_sse(
+                    {"type": "message_start", "message": {"usage": {"input_tokens": 12}}},
+                    {"type": "content_block_start", "index": 0},
+                    {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hel"}},
+                    {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "lo"}},
+                    {"type": "message_delta", "usage": {"output_tokens": 2}},
+                    {"type": "message_stop"},
+                ),
+            )
+        )
+
+        response = client.post(
+            "/v1/responses",
+            json={"model": "claude-sonnet-4", "input": "hello", "stream": True},
+        )
+        events = _parse_events(response.text)
+
+        assert [e["type"] for e in events] == [
+            "response.created",
+            "response.output_item.added",
+            "response.content_part.added",
+            "response.output_text.delta",
+            "response.output_text.delta",
+            "response.output_text.done",
+            "response.content_part.done",
+            "response.output_item.done",
+            "response.completed",
+        ]
+        assert [e["sequence_number"] for e in events] == list(range(len(events)))
+        completed = events[-1]["response"]
+        assert completed["output"][0]["content"][0]["text"] == "Hello"
+        assert completed["usage"]["input_tokens"] == 12
+        assert completed["usage"]["output_tokens"] == 2
+
+    def test_deepseek_stream_translated_with_usage(self, client, upstream) -> None:
+        seen = upstream(
+            httpx.Response(
+                200,
+                content=_sse(
+                    {"choices": [{"delta": {"role": "assistant", "content": ""}}]},
+                    {"choices": [{"delta": {"content": "Hi"}}]},
+                    {"choices": [], "usage": {"prompt_tokens": 5, "completion_tokens": 1}},
+                    done=True,
+                ),
+            )
+        )
+
+        response = client.post(
+            "/v1/responses", json={"model": "deepseek-chat", "input": "hi", "stream": True}
+        )
+        events = _parse_events(response.text)
+
+        assert [e["delta"] for e in events if e["type"] == "response.output_text.delta"] == ["Hi"]
+        assert events[-1]["type"] == "response.completed"
+        assert events[-1]["response"]["usage"]["total_tokens"] == 6
+        assert json.loads(seen[0].content)["stream_options"] == {"include_usage": True}
+
+    def test_upstream_error_before_stream_returns_json(self, client, upstream) -> None:
+        upstream(httpx.Response(429, json={"error": {"message": "slow down"}}))
+
+        response = client.post(
+            "/v1/responses", json={"model": "claude-sonnet-4", "input": "hi", "stream": True}
+        )
+
+        assert response.status_code == 429
+        assert response.json()["error"]["message"] == "Anthropic API error: slow down"
+
+
+# =============================================================================
+# Pooled Clients and Translator
+# =============================================================================
+
+
+class TestResponsesPooling:
+    """Non-streaming calls reuse the shared client."""
+
+    def test_shared_client_not_closed_between_requests(self, client, upstream) -> None:
+        seen = upstream(
+            httpx.Response(
+                200,
+                json={
+                    "choices": [{"message": {"content": "ok"}}],
+                    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+                },
+            )
+        )
+
+        for _ in range(2):
+            response = client.post(
+                "/v1/responses", json={"model": "deepseek-chat", "input": "hi"}
+            )
+            assert response.status_code == 200
+            assert response.json()["output"][0]["content"][0]["text"] == "ok"
+
+        assert len(seen) == 2
+        assert "stream" not in json.loads(seen[0].content)
+
+
+class TestResponsesStreamTranslator:
+    """Translator lifecycle edge cases."""
+
+    def test_finish_and_fail_are_terminal(self) -> None:
+        translator = ResponsesStreamTranslator("m")
+        frames = translator.fail("boom")
+        failed = _parse_events(b"".join(frames).decode())[-1]
+
+        assert failed["type"] == "response.failed"
+        assert failed["response"]["error"]["message"] == "boom"
+        assert translator.finish() == []
+        assert translator.delta("") == []
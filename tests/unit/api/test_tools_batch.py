@@ -0,0 +1,191 @@
+"""
+Tests for batch tool execution - WBS-PERF17
+
+POST /v1/tools/execute:batch runs calls concurrently with per-call
+deadlines, per-downstream concurrency limits and sync tools on a bounded
+thread pool, streaming each result as it completes.
+"""
+
+import asyncio
+import json
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes import tools
+from src.api.routes.tools import ToolExecutorService, get_tool_executor
+from src.models.tools import ToolDefinition
+from src.tools.bulkhead import ToolBulkhead
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _definition(name: str) -> ToolDefinition:
+    return ToolDefinition(
+        name=name,
+        description=name,
+        parameters={"type": "object", "properties": {"delay": {"type": "number"}}},
+    )
+
+
+async def slow_tool(delay: float = 0.0) -> dict[str, Any]:
+    await asyncio.sleep(delay)
+    return {"slept": delay}
+
+
+def thread_tool() -> dict[str, Any]:
+    return {"thread": threading.current_thread().name}
+
+
+class ConcurrencyProbe:
+    """Async tool that records peak concurrency."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, delay: float = 0.0) -> dict[str, Any]:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.active -= 1
+        return {}
+
+
+@pytest.fixture
+def service() -> ToolExecutorService:
+    executor = ToolExecutorService(
+        timeout_seconds=5.0, bulkhead=ToolBulkhead(default_limit=2, queue_timeout_seconds=None)
+    )
+    executor._tools["slow"] = (_definition("slow"), slow_tool)
+    executor._tools["thread"] = (_definition("thread"), thread_tool)
+    yield executor
+    executor.close()
+
+
+@pytest.fixture
+def client(service: ToolExecutorService) -> TestClient:
+    app = FastAPI()
+    app.include_router(tools.router)
+    app.dependency_overrides[get_tool_executor] = lambda: service
+    return TestClient(app)
+
+
+def _post(client: TestClient, calls: list[dict], **kwargs: Any):
+    return client.post("/v1/tools/execute:batch", json={"calls": calls, **kwargs})
+
+
+def _lines(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestToolBatchEndpoint:
+    """Streaming, deadlines and isolation of batch calls."""
+
+    def test_results_stream_in_completion_order(self, client) -> None:
+        response = _post(
+            client,
+            [
+                {"id": "a", "name": "slow", "arguments": {"delay": 0.2}},
+                {"id": "b", "name": "echo", "arguments": {"message": "hi"}},
+                {"id": "c", "name": "missing"},
+            ],
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        results = _lines(response)
+        assert [r["id"] for r in results][-1] == "a"
+        assert sorted(r["index"] for r in results) == [0, 1, 2]
+        by_id = {r["id"]: r for r in results}
+        assert by_id["b"]["result"] == {"echoed": "hi"}
+        assert by_id["c"]["success"] is False
+        assert "Tool not found" in by_id["c"]["error"]
+        assert by_id["a"]["duration_ms"] >= by_id["b"]["duration_ms"]
+
+    def test_per_call_deadline(self, client) -> None:
+        response = _post(
+            client,
+            [
+                {"name": "slow", "arguments": {"delay": 1.0}, "timeout_seconds": 0.05},
+                {"name": "slow", "arguments": {"delay": 0.0}},
+            ],
+        )
+
+        timed_out, ok = sorted(_lines(response), key=lambda r: r["index"])
+        assert timed_out["success"] is False
+        assert "timed out after 0.05s" in timed_out["error"]
+        assert ok["success"] is True
+
+    def test_per_call_deadline_capped(self, client, service) -> None:
+        service._max_timeout_seconds = 0.05
+
+        (result,) = _lines(
+            _post(client, [{"name": "slow", "arguments": {"delay": 1.0}, "timeout_seconds": 3600}])
+        )
+
+        assert "timed out after 0.05s" in result["error"]
+
+    def test_sync_tools_run_on_thread_pool(self, client) -> None:
+        (result,) = _lines(_post(client, [{"name": "thread"}]))
+
+        assert result["result"]["thread"].startswith("tool-sync")
+
+    def test_downstream_concurrency_limited(self, client, service, monkeypatch) -> None:
+        probe = ConcurrencyProbe()
+        service._tools["probe"] = (_definition("probe"), probe)
+        monkeypatch.setitem(tools.TOOL_DOWNSTREAMS, "probe", "unified-search")
+
+        response = _post(client, [{"name": "probe", "arguments": {"delay": 0.02}}] * 6)
+
+        assert all(r["success"] for r in _lines(response))
+        assert probe.peak == 2
+
+    def test_no_bulkhead_means_no_limit(self, client, service, monkeypatch) -> None:
+        probe = ConcurrencyProbe()
+        service._tools["probe"] = (_definition("probe"), probe)
+        service._bulkhead = None
+        monkeypatch.setitem(tools.TOOL_DOWNSTREAMS, "probe", "unified-search")
+
+        _post(client, [{"name": "probe", "arguments": {"delay": 0.02}}] * 6)
+
+        assert probe.peak == 6
+
+    def test_builtin_downstreams_come_from_definitions(self) -> None:
+        assert tools.TOOL_DOWNSTREAMS["review_code"] == "ai-agents"
+        assert tools.TOOL_DOWNSTREAMS["search_corpus"] == "semantic-search"
+        assert "echo" not in tools.TOOL_DOWNSTREAMS
+
+    def test_sse_format(self, client) -> None:
+        response = client.post(
+            "/v1/tools/execute:batch",
+            json={"calls": [{"name": "echo", "arguments": {"message": "x"}}]},
+            headers={"Accept": "text/event-stream"},
+        )
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text.startswith("event: result\ndata: ")
+        assert response.text.endswith('event: done\ndata: {"done": true}\n\n')
+
+    def test_batch_size_limit(self, client, monkeypatch) -> None:
+        settings = MagicMock()
+        settings.tool_batch_max_calls = 1
+        monkeypatch.setattr(tools, "get_settings", lambda: settings)
+
+        response = _post(client, [{"name": "echo", "arguments": {"message": "x"}}] * 2)
+
+        assert response.status_code == 422
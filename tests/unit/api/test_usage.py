@@ -0,0 +1,93 @@
+"""
+Tests for Usage Router - WBS-PERF9 Usage Analytics Endpoint
+
+Reference Documents:
+- GUIDELINES pp. 2309: Cost tracking and token usage
+- GUIDELINES: FastAPI dependency injection (Sinha pp. 89-91)
+"""
+
+import datetime as dt
+from unittest.mock import MagicMock
+
+import fakeredis.aioredis
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import SecretStr
+
+from src.api.routes.usage import router as usage_router
+from src.services.cost_tracker import UsageSummary
+from src.services.usage_rollup import RollupPoint, UsageRollupStore
+
+
+T0 = int(dt.datetime(2026, 1, 5, 10, 0, tzinfo=dt.timezone.utc).timestamp())
+ADMIN_TOKEN = "usage-admin-token"
+
+
+@pytest.fixture(autouse=True)
+def admin_token(monkeypatch) -> None:
+    settings = MagicMock()
+    settings.profiling_admin_token = SecretStr(ADMIN_TOKEN)
+    monkeypatch.setattr("src.api.routes.profiles.get_settings", lambda: settings)
+
+
+def _client(store) -> TestClient:
+    app = FastAPI()
+    app.include_router(usage_router)
+    app.state.usage_rollup = store
+    return TestClient(app, headers={"X-Admin-Token": ADMIN_TOKEN})
+
+
+class TestUsageRouter:
+    """Tests for GET /v1/usage."""
+
+    def test_returns_grouped_usage(self) -> None:
+        store = UsageRollupStore(fakeredis.aioredis.FakeRedis(decode_responses=True))
+        client = _client(store)
+        delta = UsageSummary(total_tokens=42, request_count=1)
+        with client:
+            client.portal.call(store.write_batch, {RollupPoint(T0, "model", "gpt-4o"): delta})
+
+            response = client.get(
+                "/v1/usage",
+                params={
+                    "group_by": "model",
+                    "from": "2026-01-05T10:00:00Z",
+                    "to": "2026-01-05T11:00:00Z",
+                    "granularity": "hour",
+                },
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["granularity"] == "hour"
+        assert data["totals"]["gpt-4o"]["total_tokens"] == 42
+
+    def test_invalid_range_returns_400(self) -> None:
+        store = UsageRollupStore(fakeredis.aioredis.FakeRedis(decode_responses=True))
+
+        response = _client(store).get(
+            "/v1/usage",
+            params={
+                "from": "2026-01-01T00:00:00Z",
+                "to": "2026-03-01T00:00:00Z",
+                "granularity": "minute",
+            },
+        )
+
+        assert response.status_code == 400
+
+    def test_unavailable_without_redis(self) -> None:
+        response = _client(None).get("/v1/usage")
+
+        assert response.status_code == 503
+
+    def test_requires_admin_token(self) -> None:
+        store = UsageRollupStore(fakeredis.aioredis.FakeRedis(decode_responses=True))
+        client = _client(store)
+
+        missing = client.get("/v1/usage", headers={"X-Admin-Token": ""})
+        wrong = client.get("/v1/usage", headers={"X-Admin-Token": "wrong"})
+
+        assert missing.status_code == 403
+        assert wrong.status_code == 403
@@ -0,0 +1,109 @@
+"""
+Tests for the Gateway Benchmark Suite - WBS-PERF10
+
+Reference Documents:
+- GUIDELINES pp. 157: FakeRepository pattern (FakeProvider)
+- GUIDELINES pp. 2309-2319: Latency percentiles and throughput metrics
+
+WBS Items Covered:
+- WBS-PERF10: Percentile summaries use nearest rank
+- WBS-PERF10: Baseline comparison flags regressions
+- WBS-PERF10: Each scenario runs in process against FakeProvider
+"""
+
+import json
+
+import pytest
+
+from benchmarks.harness import RequestSample, compare_reports, percentiles
+
+
+def _report(p95: float, rps: float, cpu: float = 1.0) -> dict:
+    return {
+        "scenarios": {
+            "non_streaming": {
+                "overhead_ms": {"p95": p95},
+                "requests_per_second": rps,
+                "cpu_ms_per_request": cpu,
+            }
+        }
+    }
+
+
+# =============================================================================
+# WBS-PERF10: Harness
+# =============================================================================
+
+
+class TestHarness:
+    """Tests for summaries and regression comparison."""
+
+    def test_percentiles_nearest_rank(self) -> None:
+        summary = percentiles([i / 1000 for i in range(1, 101)])
+
+        assert summary["p50"] == pytest.approx(50.0)
+        assert summary["p95"] == pytest.approx(95.0)
+        assert summary["p99"] == pytest.approx(99.0)
+        assert percentiles([]) == {}
+
+    def test_overhead_excludes_upstream(self) -> None:
+        sample = RequestSample(latency=0.050, upstream=0.045, ttft=0.020, upstream_ttft=0.018)
+
+        assert sample.overhead == pytest.approx(0.005)
+        assert sample.ttft_overhead == pytest.approx(0.002)
+
+    def test_compare_flags_regressions_beyond_threshold(self) -> None:
+        baseline = _report(p95=10.0, rps=1000.0)
+
+        assert compare_reports(baseline, _report(p95=10.5, rps=980.0)) == []
+        regressions = compare_reports(baseline, _report(p95=15.0, rps=700.0))
+        assert len(regressions) == 2
+        assert regressions[0].startswith("non_streaming: p95 overhead ms")
+
+
+# =============================================================================
+# WBS-PERF10: Gateway Scenarios
+# =============================================================================
+
+
+class TestGatewayBench:
+    """Smoke tests running each scenario briefly."""
+
+    @pytest.fixture
+    def bench(self):
+        from benchmarks.gateway import GatewayBench
+
+        bench = GatewayBench()
+        yield bench
+        bench.close()
+
+    @pytest.mark.parametrize("scenario", ["non_streaming", "streaming", "tool_loop", "session"])
+    async def test_scenario_runs_without_errors(self, bench, scenario) -> None:
+        result = await bench.run(scenario, total=5, concurrency=2, warmup=1, alloc_samples=2)
+
+        assert result.requests == 5
+        assert result.errors == 0
+        assert result.overhead_ms["p50"] >= 0
+        assert result.alloc_peak_kib > 0
+        if scenario == "streaming":
+            assert result.ttft_overhead_ms
+
+    async def test_cli_writes_json(self, tmp_path) -> None:
+        from benchmarks.gateway import _parse_args, _run
+
+        output = tmp_path / "bench.json"
+
+        args = _parse_args(
+            [
+                "--scenario", "non_streaming",
+                "--requests", "5",
+                "--concurrency", "2",
+                "--warmup", "0",
+                "--alloc-samples", "0",
+                "--output", str(output),
+            ]
+        )
+
+        assert await _run(args) == 0
+        report = json.loads(output.read_text())
+        assert report["scenarios"]["non_streaming"]["requests"] == 5
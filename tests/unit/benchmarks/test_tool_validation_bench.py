@@ -0,0 +1,33 @@
+"""
+Tests for the Tool Argument Validation Benchmark - WBS-PERF18
+
+WBS Items Covered:
+- WBS-PERF18: Generated arguments are valid for every builtin schema
+- WBS-PERF18: CLI reports per-call cost for each validation mode
+"""
+
+import json
+
+import pytest
+
+from benchmarks.tool_validation import MODES, main, sample_arguments
+from src.api.routes.tools import BUILTIN_TOOLS
+from src.tools.validation import ArgumentValidator
+
+
+class TestToolValidationBench:
+    """Smoke tests for the validation benchmark."""
+
+    @pytest.mark.parametrize("name", sorted(BUILTIN_TOOLS))
+    def test_sample_arguments_are_valid(self, name: str) -> None:
+        schema = BUILTIN_TOOLS[name][0].parameters
+
+        ArgumentValidator(schema, reject_unknown=True).validate(sample_arguments(schema))
+
+    def test_cli_writes_json(self, tmp_path) -> None:
+        output = tmp_path / "validation.json"
+
+        assert main(["--tool", "enrich_metadata", "--iterations", "10", "--output", str(output)]) == 0
+        results = json.loads(output.read_text())
+        assert set(results["enrich_metadata"]) == set(MODES)
+        assert results["enrich_metadata"]["compiled"]["ns_per_call"] > 0
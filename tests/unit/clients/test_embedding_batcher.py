@@ -0,0 +1,194 @@
+"""
+Tests for embedding micro-batching - WBS-PERF21
+
+EmbeddingBatcher coalesces concurrent embed calls (per model) into one
+downstream request, sends when the batch is full or the wait window ends,
+and scatters vectors (or the failure) back to every caller.
+"""
+
+import asyncio
+import importlib
+import json
+from typing import Any, Optional
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.clients.embedding_batcher import EmbeddingBatcher, EmbeddingBatchError
+from src.clients.semantic_search import SemanticSearchClient, SemanticSearchError
+from src.observability.metrics import EMBED_BATCH_SIZE
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class FakeEmbedder:
+    """Records each downstream request; returns [len(text)] vectors."""
+
+    def __init__(self, fail: Optional[Exception] = None, drop: int = 0) -> None:
+        self.calls: list[tuple[list[str], Optional[str]]] = []
+        self.fail = fail
+        self.drop = drop
+
+    async def send(self, texts: list[str], model: Optional[str]) -> dict[str, Any]:
+        self.calls.append((list(texts), model))
+        await asyncio.sleep(0)
+        if self.fail is not None:
+            raise self.fail
+        vectors = [[float(len(text))] for text in texts]
+        return {"embeddings": vectors[self.drop :], "model": model or "default"}
+
+
+def _histogram_count(batcher: str) -> float:
+    for metric in EMBED_BATCH_SIZE.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_count") and sample.labels["batcher"] == batcher:
+                return sample.value
+    return 0.0
+
+
+# =============================================================================
+# EmbeddingBatcher
+# =============================================================================
+
+
+class TestEmbeddingBatcher:
+    """Coalescing, scatter and failure fan-out."""
+
+    async def test_concurrent_calls_share_one_request(self) -> None:
+        fake = FakeEmbedder()
+        batcher = EmbeddingBatcher("test-share", send=fake.send, max_wait_ms=20)
+        before = _histogram_count("test-share")
+
+        results = await asyncio.gather(
+            batcher.embed(["a", "bb"], model="m"),
+            batcher.embed(["ccc"], model="m"),
+            batcher.embed(["dddd", "e"], model="m"),
+        )
+
+        assert fake.calls == [(["a", "bb", "ccc", "dddd", "e"], "m")]
+        assert [r["embeddings"] for r in results] == [
+            [[1.0], [2.0]],
+            [[3.0]],
+            [[4.0], [1.0]],
+        ]
+        assert results[0]["model"] == "m"
+        assert _histogram_count("test-share") == before + 1
+
+    async def test_models_are_batched_separately(self) -> None:
+        fake = FakeEmbedder()
+        batcher = EmbeddingBatcher("test-models", send=fake.send, max_wait_ms=5)
+
+        await asyncio.gather(batcher.embed(["a"], model="m1"), batcher.embed(["b"], model="m2"))
+
+        assert sorted(fake.calls) == [(["a"], "m1"), (["b"], "m2")]
+
+    async def test_full_batch_is_sent_without_waiting(self) -> None:
+        fake = FakeEmbedder()
+        batcher = EmbeddingBatcher("test-full", send=fake.send, max_batch_size=3, max_wait_ms=10_000)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.embed(["a", "b"]), batcher.embed(["c"])),
+            timeout=1.0,
+        )
+
+        assert fake.calls == [(["a", "b", "c"], None)]
+        assert [len(r["embeddings"]) for r in results] == [2, 1]
+        assert batcher.pending == 0
+
+    async def test_failure_reaches_every_caller(self) -> None:
+        fake = FakeEmbedder(fail=httpx.ConnectError("down"))
+        batcher = EmbeddingBatcher("test-fail", send=fake.send, max_wait_ms=5)
+
+        results = await asyncio.gather(
+            batcher.embed(["a"]), batcher.embed(["b"]), return_exceptions=True
+        )
+
+        assert len(fake.calls) == 1
+        assert all(isinstance(r, httpx.ConnectError) for r in results)
+
+    async def test_vector_count_mismatch_is_an_error(self) -> None:
+        batcher = EmbeddingBatcher("test-mismatch", send=FakeEmbedder(drop=1).send, max_wait_ms=0)
+
+        with pytest.raises(EmbeddingBatchError):
+            await batcher.embed(["a", "b"])
+
+    async def test_cancelled_caller_does_not_affect_others(self) -> None:
+        fake = FakeEmbedder()
+        batcher = EmbeddingBatcher("test-cancel", send=fake.send, max_wait_ms=10)
+
+        cancelled = asyncio.create_task(batcher.embed(["a"]))
+        kept = asyncio.create_task(batcher.embed(["bb"]))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert (await kept)["embeddings"] == [[2.0]]
+        assert fake.calls == [(["a", "bb"], None)]
+
+
+# =============================================================================
+# Callers
+# =============================================================================
+
+
+class TestBatchedCallers:
+    """Builtin embed tool and SemanticSearchClient use the batcher."""
+
+    async def test_embed_tool_coalesces_concurrent_calls(self) -> None:
+        embed_module = importlib.import_module("src.tools.builtin.embed")
+        embed_module._embed_batcher = None
+        try:
+            with patch.object(embed_module, "_do_embed_request", new_callable=AsyncMock) as mock_req:
+                mock_req.return_value = {
+                    "embeddings": [[0.1], [0.2], [0.3]],
+                    "model": "all-MiniLM-L6-v2",
+                    "dimensions": 1,
+                }
+                results = await asyncio.gather(
+                    embed_module.embed({"texts": ["a"]}),
+                    embed_module.embed({"texts": ["b", "c"]}),
+                )
+        finally:
+            embed_module._embed_batcher = None
+
+        mock_req.assert_called_once()
+        assert mock_req.call_args[0][0]["texts"] == ["a", "b", "c"]
+        assert results[0]["embeddings"] == [[0.1]]
+        assert results[1]["embeddings"] == [[0.2], [0.3]]
+        assert results[1]["dimensions"] == 1
+
+    async def test_semantic_search_client_batches_when_enabled(self) -> None:
+        requests: list[list[str]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            texts = json.loads(request.content)["texts"]
+            requests.append(texts)
+            return httpx.Response(200, json={"embeddings": [[float(len(t))] for t in texts]})
+
+        http_client = httpx.AsyncClient(
+            base_url="http://search", transport=httpx.MockTransport(handler)
+        )
+        client = SemanticSearchClient(http_client=http_client, batch_embeddings=True)
+
+        first, second = await asyncio.gather(client.embed(["a"]), client.embed(["bb", "c"]))
+
+        assert requests == [["a", "bb", "c"]]
+        assert first == [[1.0]]
+        assert second == [[2.0], [1.0]]
+        await http_client.aclose()
+
+    async def test_semantic_search_client_maps_batch_errors(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(503)
+
+        http_client = httpx.AsyncClient(
+            base_url="http://search", transport=httpx.MockTransport(handler)
+        )
+        client = SemanticSearchClient(http_client=http_client, batch_embeddings=True)
+
+        with pytest.raises(SemanticSearchError):
+            await client.embed(["a"])
+        await http_client.aclose()
@@ -0,0 +1,208 @@
+"""
+Tests for the content-addressed embedding cache - WBS-PERF22
+
+EmbeddingCache stores vectors by (model, sha256(text)) as float16, in a
+bounded in-process LRU and optionally in Redis as raw bytes, and sends
+only uncached texts downstream.
+"""
+
+import importlib
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import fakeredis.aioredis
+import pytest
+
+from src.clients.embedding_cache import (
+    EmbeddingCache,
+    decode_vector,
+    encode_vector,
+    make_embedding_key,
+    reset_embedding_cache,
+    set_embedding_cache,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class Loader:
+    """Embeds each text as [len(text), 0.5]; records what was requested."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    async def __call__(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(text)), 0.5] for text in texts]
+
+
+@pytest.fixture
+def redis() -> Any:
+    return fakeredis.aioredis.FakeRedis()
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache():
+    reset_embedding_cache()
+    yield
+    reset_embedding_cache()
+
+
+# =============================================================================
+# Keys and Encoding
+# =============================================================================
+
+
+class TestEncoding:
+    """Keys are content-addressed; vectors round-trip through float16 bytes."""
+
+    def test_key_includes_model_and_text_digest(self) -> None:
+        key = make_embedding_key("m", "hello")
+
+        assert key.startswith("cache:embed:m:")
+        assert key == make_embedding_key("m", "hello")
+        assert key != make_embedding_key("other", "hello")
+
+    def test_float16_round_trip(self) -> None:
+        raw = encode_vector([0.25, -1.5, 0.1])
+
+        assert len(raw) == 6
+        assert decode_vector(raw)[:2] == [0.25, -1.5]
+        assert decode_vector(raw)[2] == pytest.approx(0.1, abs=1e-3)
+
+
+# =============================================================================
+# EmbeddingCache
+# =============================================================================
+
+
+class TestEmbeddingCache:
+    """Tiers, deduplication and eviction."""
+
+    async def test_only_missing_texts_are_loaded_once(self) -> None:
+        cache = EmbeddingCache()
+        loader = Loader()
+
+        first = await cache.get_or_load("m", ["a", "bb", "a"], loader)
+        second = await cache.get_or_load("m", ["bb", "ccc"], loader)
+
+        assert loader.calls == [["a", "bb"], ["ccc"]]
+        assert first == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]]
+        assert second == [[2.0, 0.5], [3.0, 0.5]]
+
+    async def test_misses_rounded_like_hits(self) -> None:
+        cache = EmbeddingCache()
+
+        async def precise(texts: list[str]) -> list[list[float]]:
+            return [[0.1, 1 / 3] for _ in texts]
+
+        miss = await cache.get_or_load("m", ["a"], precise)
+        hit = await cache.get_or_load("m", ["a"], precise)
+
+        assert miss == hit == [decode_vector(encode_vector([0.1, 1 / 3]))]
+
+    async def test_all_hit_response_keeps_downstream_fields(self) -> None:
+        cache = EmbeddingCache()
+
+        async def send(texts: list[str]) -> dict[str, Any]:
+            return {
+                "embeddings": [[0.5, 0.5] for _ in texts],
+                "model": "all-mpnet-base-v2",
+                "dimensions": 2,
+                "processing_time_ms": 40.0,
+            }
+
+        await cache.embed_response("code-orchestrator", ["a", "b"], send)
+        cached = await cache.embed_response("code-orchestrator", ["b"], send)
+
+        assert cached["model"] == "all-mpnet-base-v2"
+        assert cached["dimensions"] == 2
+        assert cached["embeddings"] == [[0.5, 0.5]]
+        assert cached["processing_time_ms"] < 40.0
+
+    async def test_models_do_not_share_vectors(self) -> None:
+        cache = EmbeddingCache()
+        loader = Loader()
+
+        await cache.get_or_load("m1", ["a"], loader)
+        await cache.get_or_load("m2", ["a"], loader)
+
+        assert loader.calls == [["a"], ["a"]]
+
+    async def test_redis_tier_stores_raw_bytes(self, redis: Any) -> None:
+        loader = Loader()
+        await EmbeddingCache(redis_client=redis).get_or_load("m", ["abc"], loader)
+
+        stored = await redis.get(make_embedding_key("m", "abc"))
+        assert stored == encode_vector([3.0, 0.5])
+        assert await redis.pttl(make_embedding_key("m", "abc")) > 0
+
+        replica = EmbeddingCache(redis_client=redis)
+        assert await replica.get_or_load("m", ["abc"], loader) == [[3.0, 0.5]]
+        assert loader.calls == [["abc"]]
+        assert len(replica) == 1
+
+    async def test_redis_errors_are_misses(self) -> None:
+        broken = AsyncMock()
+        broken.mget.side_effect = ConnectionError("down")
+        broken.pipeline.side_effect = ConnectionError("down")
+        loader = Loader()
+
+        vectors = await EmbeddingCache(redis_client=broken).get_or_load("m", ["a"], loader)
+
+        assert vectors == [[1.0, 0.5]]
+
+    async def test_lru_bounded_by_bytes(self) -> None:
+        cache = EmbeddingCache(max_bytes=8)
+        loader = Loader()
+
+        await cache.get_or_load("m", ["a", "b"], loader)
+        await cache.get_or_load("m", ["a"], loader)
+        await cache.get_or_load("m", ["c"], loader)
+
+        assert len(cache) == 2
+        assert cache.total_bytes == 8
+        await cache.get_or_load("m", ["a", "b"], loader)
+        assert loader.calls[-1] == ["b"]
+
+
+# =============================================================================
+# Embed Tool Integration
+# =============================================================================
+
+
+class TestEmbedToolCache:
+    """The embed tool sends only uncached texts downstream."""
+
+    async def test_embed_tool_uses_cache(self) -> None:
+        embed_module = importlib.import_module("src.tools.builtin.embed")
+        set_embedding_cache(EmbeddingCache())
+
+        async def respond(payload: dict[str, Any]) -> dict[str, Any]:
+            return {
+                "embeddings": [[0.5] * 4 for _ in payload["texts"]],
+                "model": payload["model"],
+                "dimensions": 4,
+            }
+
+        embed_module._embed_batcher = None
+        try:
+            with patch.object(embed_module, "_do_embed_request", side_effect=respond) as mock_req:
+                await embed_module.embed({"texts": ["a", "b"]})
+                result = await embed_module.embed({"texts": ["b", "c"]})
+        finally:
+            embed_module._embed_batcher = None
+
+        assert [c.args[0]["texts"] for c in mock_req.call_args_list] == [["a", "b"], ["c"]]
+        assert result["embeddings"] == [[0.5] * 4, [0.5] * 4]
+        assert result["dimensions"] == 4
+        assert result["model"] == "all-MiniLM-L6-v2"
+
+    def test_embed_tool_not_result_cached(self) -> None:
+        from src.tools.builtin.embed import EMBED_DEFINITION
+
+        # Per-text vector caching replaces the whole-call tool result cache
+        assert EMBED_DEFINITION.cacheable is False
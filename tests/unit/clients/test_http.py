@@ -16,11 +16,18 @@ WBS Items Covered:
 - 2.7.1.1.5: Set default timeouts
 - 2.7.1.1.6: Add retry middleware
 - 2.7.1.1.7: RED test: client created with config
+- WBS-PERF13: TracingTransport trace propagation and connection spans
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, MagicMock
 import httpx
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import StatusCode
 
 
 # =============================================================================
@@ -289,3 +296,151 @@ class TestClientHeaders:
             headers={"X-Custom-Header": "test-value"},
         )
         assert client.headers.get("X-Custom-Header") == "test-value"
+
+
+# =============================================================================
+# WBS-PERF13: TracingTransport Tests
+# =============================================================================
+
+
+@pytest.fixture
+def span_exporter():
+    """Route TracingTransport spans to an in-memory exporter."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with patch("src.clients.http.get_tracer", lambda name: provider.get_tracer(name)):
+        yield exporter
+
+
+@pytest.fixture
+async def http_server():
+    """Minimal HTTP/1.1 server recording request headers."""
+    received: list[dict[str, str]] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            lines = head.decode().split("\r\n")[1:]
+            received.append(
+                {k.strip().lower(): v.strip() for k, v in (l.split(":", 1) for l in lines if l)}
+            )
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+            if reader.at_eof():
+                break
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", received
+    server.close()
+
+
+class TestTracingTransport:
+    """Tests for outbound trace propagation and connection spans."""
+
+    def test_factory_uses_tracing_transport(self) -> None:
+        from src.clients.http import TracingTransport, create_http_client
+
+        client = create_http_client(base_url="http://semantic-search:8081")
+
+        assert isinstance(client._transport, TracingTransport)
+        assert client._transport.downstream == "semantic-search"
+
+    async def test_injects_traceparent_of_client_span(self, span_exporter, http_server) -> None:
+        from src.clients.http import create_http_client
+
+        base_url, received = http_server
+        async with create_http_client(base_url=base_url, downstream="svc") as client:
+            response = await client.get("/ping")
+
+        assert response.text == "ok"
+        (span,) = span_exporter.get_finished_spans()
+        _, trace_id, span_id, _ = received[0]["traceparent"].split("-")
+        assert trace_id == format(span.context.trace_id, "032x")
+        assert span_id == format(span.context.span_id, "016x")
+        assert span.attributes["peer.service"] == "svc"
+        assert span.attributes["http.status_code"] == 200
+
+    async def test_records_connection_phases(self, span_exporter, http_server) -> None:
+        from src.clients.http import create_http_client
+        from src.observability.metrics import HTTP_CLIENT_PHASE_SECONDS
+
+        connects = HTTP_CLIENT_PHASE_SECONDS.labels(downstream="phases", phase="connect")
+        before = connects._sum.get(), sum(b.get() for b in connects._buckets)
+        base_url, _ = http_server
+        async with create_http_client(base_url=base_url, downstream="phases") as client:
+            await client.get("/a")
+            await client.get("/b")
+
+        first, second = span_exporter.get_finished_spans()
+        assert first.attributes["http.connection.reused"] is False
+        assert "http.client.connect_ms" in first.attributes
+        assert "http.client.ttfb_ms" in first.attributes
+        assert second.attributes["http.connection.reused"] is True
+        assert "http.client.connect_ms" not in second.attributes
+        assert sum(b.get() for b in connects._buckets) == before[1] + 1
+
+    async def test_span_covers_streamed_body(self, span_exporter, http_server) -> None:
+        from src.clients.http import create_http_client
+
+        base_url, _ = http_server
+        async with create_http_client(base_url=base_url) as client:
+            async with client.stream("GET", "/stream") as response:
+                assert span_exporter.get_finished_spans() == ()
+                await response.aread()
+
+        assert len(span_exporter.get_finished_spans()) == 1
+
+    async def test_connection_error_ends_span_with_error(self, span_exporter) -> None:
+        from src.clients.http import create_http_client
+
+        async with create_http_client(base_url="http://127.0.0.1:1", retries=0) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("/")
+
+        (span,) = span_exporter.get_finished_spans()
+        assert span.status.status_code == StatusCode.ERROR
+
+
+# =============================================================================
+# WBS-PERF16: Shared Provider Connection Pools
+# =============================================================================
+
+
+class TestSharedProviderPools:
+    """Provider SDK clients and /v1/responses share one pool per provider."""
+
+    async def test_shared_transport_and_client_reused(self) -> None:
+        from src.clients.http import (
+            close_shared_clients,
+            get_shared_client,
+            get_shared_transport,
+        )
+        from src.providers.openai import OpenAIProvider
+
+        await close_shared_clients()
+        transport = get_shared_transport("openai")
+        client = get_shared_client("openai", timeout=httpx.Timeout(5.0))
+
+        assert get_shared_transport("openai") is transport
+        assert get_shared_client("openai", timeout=httpx.Timeout(5.0)) is client
+        assert client._transport is transport
+        assert OpenAIProvider(api_key="sk-test")._client._client._transport is transport
+        assert get_shared_transport("anthropic") is not transport
+
+        await close_shared_clients()
+        assert get_shared_transport("openai") is not transport
+        await close_shared_clients()
+
+    async def test_shared_clients_keep_their_own_timeouts(self) -> None:
+        from src.clients.http import close_shared_clients, get_shared_client
+
+        await close_shared_clients()
+        short = get_shared_client("openai", timeout=httpx.Timeout(60.0))
+        long = get_shared_client("openai", timeout=httpx.Timeout(600.0))
+
+        assert short is not long
+        assert long.timeout.read == 600.0
+        assert short._transport is long._transport
+        await close_shared_clients()
@@ -0,0 +1,190 @@
+"""
+Tests for Non-blocking Logging - WBS-PERF4
+
+Reference Documents:
+- GUIDELINES pp. 2309-2319: Prometheus for metrics collection and structured logging
+- Python logging cookbook: Dealing with handlers that block (QueueHandler)
+
+WBS Items Covered:
+- WBS-PERF4: DroppingQueueHandler snapshots records and applies drop policy
+- WBS-PERF4: configure_logging() routes sinks through a QueueListener
+- WBS-PERF4: JSONFormatter uses call-time timestamp and correlation ID
+- WBS-PERF4: LogSampler emits first and every Nth occurrence
+"""
+
+import io
+import json
+import logging
+import queue
+import sys
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _record(msg: str = "hello %s", args: tuple = ("world",), level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+@pytest.fixture
+def reset_logging_state(monkeypatch: pytest.MonkeyPatch):
+    """Reset module state and disable file logging around each test."""
+    from src.observability.logging import reset_logging
+
+    monkeypatch.setenv("LLM_GATEWAY_ENABLE_FILE_LOGGING", "false")
+    reset_logging()
+    yield
+    reset_logging()
+
+
+# =============================================================================
+# WBS-PERF4: JSONFormatter
+# =============================================================================
+
+
+class TestJSONFormatterRecordFields:
+    """Tests for JSONFormatter reading call-time values from the record."""
+
+    def test_uses_record_correlation_id_and_created_time(self) -> None:
+        from src.observability.logging import JSONFormatter
+
+        record = _record()
+        record.correlation_id = "req-123"
+        record.created = 0.0
+
+        data = json.loads(JSONFormatter().format(record))
+
+        assert data["correlation_id"] == "req-123"
+        assert data["message"] == "hello world"
+        assert data["timestamp"] == datetime.fromtimestamp(0, timezone.utc).isoformat()
+
+
+# =============================================================================
+# WBS-PERF4: DroppingQueueHandler
+# =============================================================================
+
+
+class TestDroppingQueueHandler:
+    """Tests for DroppingQueueHandler."""
+
+    def test_prepare_snapshots_message_and_correlation_id(self) -> None:
+        from src.observability.logging import DroppingQueueHandler, correlation_id_context
+
+        handler = DroppingQueueHandler(queue.Queue())
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = _record()
+            record.exc_info = sys.exc_info()
+
+        with correlation_id_context("req-456"):
+            prepared = handler.prepare(record)
+
+        assert prepared.msg == "hello world"
+        assert prepared.args is None
+        assert prepared.exc_info is None
+        assert "ValueError: boom" in prepared.exc_text
+        assert prepared.correlation_id == "req-456"
+
+    def test_full_queue_drops_info_records(self) -> None:
+        from src.observability.logging import DroppingQueueHandler
+        from src.observability.metrics import LOG_RECORDS_DROPPED_TOTAL
+
+        log_queue: queue.Queue = queue.Queue(maxsize=1)
+        handler = DroppingQueueHandler(log_queue)
+        dropped = LOG_RECORDS_DROPPED_TOTAL.labels(level="INFO")
+        before = dropped._value.get()
+
+        handler.emit(_record("first", ()))
+        handler.emit(_record("second", ()))
+
+        assert log_queue.get_nowait().msg == "first"
+        assert dropped._value.get() == before + 1
+
+    def test_full_queue_evicts_oldest_for_warnings(self) -> None:
+        from src.observability.logging import DroppingQueueHandler
+
+        log_queue: queue.Queue = queue.Queue(maxsize=1)
+        handler = DroppingQueueHandler(log_queue)
+
+        handler.emit(_record("noise", ()))
+        handler.emit(_record("important", (), level=logging.ERROR))
+
+        assert log_queue.get_nowait().msg == "important"
+
+
+# =============================================================================
+# WBS-PERF4: configure_logging() Queue Wiring
+# =============================================================================
+
+
+class TestQueueLoggingConfiguration:
+    """Tests for configure_logging() with async logging enabled."""
+
+    def test_root_logger_only_holds_queue_handler(
+        self, reset_logging_state, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src.observability.logging import (
+            DroppingQueueHandler,
+            configure_logging,
+            shutdown_logging,
+        )
+
+        monkeypatch.setenv("LLM_GATEWAY_ASYNC_LOGGING", "true")
+        # pytest's capture handlers would otherwise count as the console handler
+        monkeypatch.setattr(logging.getLogger(), "handlers", [])
+        stream = io.StringIO()
+
+        configure_logging(level="INFO", stream=stream, force=True)
+        logging.getLogger("perf4.test").info("queued %d", 42)
+        shutdown_logging()
+
+        root_handlers = logging.getLogger().handlers
+        assert not any(isinstance(h, DroppingQueueHandler) for h in root_handlers)
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert any(line["message"] == "queued 42" for line in lines)
+
+    def test_async_logging_can_be_disabled(
+        self, reset_logging_state, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from src.observability.logging import DroppingQueueHandler, configure_logging
+
+        monkeypatch.setenv("LLM_GATEWAY_ASYNC_LOGGING", "false")
+        monkeypatch.setattr(logging.getLogger(), "handlers", [])
+
+        configure_logging(level="INFO", stream=io.StringIO(), force=True)
+
+        assert not any(isinstance(h, DroppingQueueHandler) for h in logging.getLogger().handlers)
+
+
+# =============================================================================
+# WBS-PERF4: LogSampler
+# =============================================================================
+
+
+class TestLogSampler:
+    """Tests for LogSampler."""
+
+    def test_logs_first_and_every_nth(self) -> None:
+        from src.observability.logging import LogSampler
+
+        logger = MagicMock()
+        logger.isEnabledFor.return_value = True
+        sampler = LogSampler(rate=3)
+
+        for i in range(7):
+            sampler.log(logger, logging.INFO, "Routing %s", i)
+
+        assert [c.args[2] for c in logger.log.call_args_list] == [0, 3, 6]
+
+    def test_skips_disabled_levels(self) -> None:
+        from src.observability.logging import LogSampler
+
+        logger = MagicMock()
+        logger.isEnabledFor.return_value = False
+        sampler = LogSampler(rate=1)
+
+        sampler.log(logger, logging.DEBUG, "Routing %s", "x")
+
+        logger.log.assert_not_called()
@@ -0,0 +1,265 @@
+"""
+Tests for Request Profiling - WBS-PERF12 On-Demand Request Profiling
+
+Reference Documents:
+- GUIDELINES pp. 2309-2319: Latency breakdown and observability
+
+WBS Items Covered:
+- WBS-PERF12: profile_phase() is a no-op outside profiled requests
+- WBS-PERF12: Header (admin token) and sampled 1-in-N triggers
+- WBS-PERF12: Server-Timing / X-Gateway-Profile-Id response headers
+- WBS-PERF12: Optional cProfile statistics
+- WBS-PERF12: ChatService phase timeline
+- WBS-PERF12: GET /v1/admin/profiles
+"""
+
+from typing import Iterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from pydantic import SecretStr
+
+from src.observability.profiling import (
+    PROFILE_ID_HEADER,
+    ProfileStore,
+    ProfilingMiddleware,
+    RequestProfile,
+    _current_profile,
+    get_current_profile,
+    profile_phase,
+    reset_profile_store,
+)
+
+
+ADMIN_TOKEN = "s3cret"
+
+
+def _app(store: ProfileStore, sample_rate: int = 0) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/work")
+    async def work() -> dict:
+        with profile_phase("provider_call", model="m"):
+            pass
+        with profile_phase("serialize"):
+            return {"ok": True}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def body():
+            with profile_phase("provider_stream"):
+                yield b"a"
+                yield b"b"
+
+        return StreamingResponse(body())
+
+    app.add_middleware(
+        ProfilingMiddleware,
+        sample_rate=sample_rate,
+        admin_token=ADMIN_TOKEN,
+        sampled_cprofile=False,
+        store=store,
+    )
+    return app
+
+
+# =============================================================================
+# WBS-PERF12: Phase Recording
+# =============================================================================
+
+
+class TestProfilePhase:
+    """Tests for profile_phase()."""
+
+    def test_noop_without_active_profile(self) -> None:
+        assert get_current_profile() is None
+        with profile_phase("anything"):
+            pass
+        assert profile_phase("a") is profile_phase("b")
+
+    def test_records_into_active_profile(self) -> None:
+        profile = RequestProfile(profile_id="p1", method="GET", path="/", trigger="header")
+        token = _current_profile.set(profile)
+        try:
+            with profile_phase("tool:search", tool_call_id="call_1"):
+                pass
+        finally:
+            _current_profile.reset(token)
+
+        assert [p.name for p in profile.phases] == ["tool:search"]
+        assert profile.phases[0].attributes == {"tool_call_id": "call_1"}
+        assert profile.server_timing().startswith("tool_search;dur=")
+
+
+# =============================================================================
+# WBS-PERF12: ProfilingMiddleware
+# =============================================================================
+
+
+class TestProfilingMiddleware:
+    """Tests for ProfilingMiddleware triggers and headers."""
+
+    def test_admin_header_profiles_request(self) -> None:
+        store = ProfileStore()
+
+        response = TestClient(_app(store)).get("/work", headers={"X-Debug-Profile": ADMIN_TOKEN})
+
+        profile_id = response.headers[PROFILE_ID_HEADER]
+        assert "provider_call;dur=" in response.headers["server-timing"]
+        profile = store.get(profile_id)
+        assert profile.trigger == "header"
+        assert profile.status_code == 200
+        assert profile.total_ms is not None
+        assert [p.name for p in profile.phases] == ["provider_call", "serialize"]
+        assert profile.cprofile_stats is None
+
+    def test_wrong_token_is_not_profiled(self) -> None:
+        store = ProfileStore()
+
+        response = TestClient(_app(store)).get("/work", headers={"X-Debug-Profile": "guess"})
+
+        assert PROFILE_ID_HEADER not in response.headers
+        assert len(store) == 0
+
+    def test_samples_one_in_n(self) -> None:
+        store = ProfileStore()
+        client = TestClient(_app(store, sample_rate=3))
+
+        profiled = []
+        for _ in range(6):
+            response = client.get("/work")
+            profiled.append(len(store))
+            # Sampled clients did not opt in: no timings leak to them
+            assert PROFILE_ID_HEADER not in response.headers
+            assert "server-timing" not in response.headers
+
+        assert profiled == [0, 0, 1, 1, 1, 2]
+        assert {p.trigger for p in store.list()} == {"sampled"}
+        assert all(p.status_code == 200 for p in store.list())
+
+    def test_cprofile_mode(self) -> None:
+        store = ProfileStore()
+
+        response = TestClient(_app(store)).get(
+            "/work",
+            headers={"X-Debug-Profile": ADMIN_TOKEN, "X-Debug-Profile-Mode": "cprofile"},
+        )
+
+        stats = store.get(response.headers[PROFILE_ID_HEADER]).cprofile_stats
+        assert "function calls" in stats
+
+    def test_streaming_profile_completes_after_body(self) -> None:
+        store = ProfileStore()
+
+        response = TestClient(_app(store)).get(
+            "/stream", headers={"X-Debug-Profile": ADMIN_TOKEN}
+        )
+
+        assert response.content == b"ab"
+        profile = store.get(response.headers[PROFILE_ID_HEADER])
+        assert [p.name for p in profile.phases] == ["provider_stream"]
+
+    def test_store_evicts_oldest(self) -> None:
+        store = ProfileStore(max_size=2)
+        for i in range(3):
+            store.add(RequestProfile(profile_id=str(i), method="GET", path="/", trigger="sampled"))
+
+        assert [p.profile_id for p in store.list()] == ["2", "1"]
+        assert store.get("0") is None
+
+
+# =============================================================================
+# WBS-PERF12: ChatService Phases
+# =============================================================================
+
+
+class TestChatServicePhases:
+    """Tests for the phases recorded by ChatService.complete()."""
+
+    async def test_complete_records_phase_timeline(self) -> None:
+        from src.models.requests import ChatCompletionRequest
+        from src.providers.fake import FakeProvider
+        from src.providers.router import ProviderRouter
+        from src.providers.routing_table import ModelRoute
+        from src.services.chat import ChatService
+
+        router = MagicMock(spec=ProviderRouter)
+        router.resolve.return_value = ModelRoute(model="fake-model", provider="fake", source="test")
+        router.provider_for.return_value = FakeProvider()
+        service = ChatService(router=router, executor=MagicMock(), session_manager=AsyncMock())
+        request = ChatCompletionRequest(
+            model="fake-model", messages=[{"role": "user", "content": "Hi"}], session_id="s1"
+        )
+
+        profile = RequestProfile(profile_id="p", method="POST", path="/", trigger="header")
+        token = _current_profile.set(profile)
+        try:
+            await service.complete(request)
+        finally:
+            _current_profile.reset(token)
+
+        assert [p.name for p in profile.phases] == [
+            "build_messages_with_history",
+            "estimate_tokens",
+            "provider_call",
+            "save_to_session",
+        ]
+
+
+# =============================================================================
+# WBS-PERF12: Admin Endpoint
+# =============================================================================
+
+
+class TestProfilesRouter:
+    """Tests for GET /v1/admin/profiles."""
+
+    @pytest.fixture
+    def client(self, monkeypatch) -> Iterator[TestClient]:
+        from src.api.routes import profiles
+        from src.observability.profiling import get_profile_store
+
+        settings = MagicMock()
+        settings.profiling_admin_token = SecretStr(ADMIN_TOKEN)
+        settings.profiling_store_size = 10
+        monkeypatch.setattr(profiles, "get_settings", lambda: settings)
+        monkeypatch.setattr("src.core.config.get_settings", lambda: settings)
+        reset_profile_store()
+        get_profile_store().add(
+            RequestProfile(profile_id="abc", method="POST", path="/v1/chat", trigger="header")
+        )
+        app = FastAPI()
+        app.include_router(profiles.router)
+        yield TestClient(app)
+        reset_profile_store()
+
+    def test_list_and_get_with_token(self, client: TestClient) -> None:
+        headers = {"X-Admin-Token": ADMIN_TOKEN}
+
+        listing = client.get("/v1/admin/profiles", headers=headers)
+        detail = client.get("/v1/admin/profiles/abc", headers=headers)
+
+        assert listing.json()["profiles"][0]["profile_id"] == "abc"
+        assert detail.json()["path"] == "/v1/chat"
+        assert detail.json()["phases"] == []
+
+    def test_rejects_bad_token(self, client: TestClient) -> None:
+        assert client.get("/v1/admin/profiles", headers={"X-Admin-Token": "x"}).status_code == 403
+
+    def test_unknown_profile_is_404(self, client: TestClient) -> None:
+        response = client.get("/v1/admin/profiles/nope", headers={"X-Admin-Token": ADMIN_TOKEN})
+
+        assert response.status_code == 404
+
+    def test_disabled_without_admin_token(self) -> None:
+        from src.api.routes import profiles
+
+        app = FastAPI()
+        app.include_router(profiles.router)
+
+        response = TestClient(app).get("/v1/admin/profiles", headers={"X-Admin-Token": "x"})
+
+        assert response.status_code == 404
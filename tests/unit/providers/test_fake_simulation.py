@@ -0,0 +1,237 @@
+"""
+Tests for FakeProvider Simulation Profiles - WBS-PERF11
+
+Reference Documents:
+- GUIDELINES pp. 157: FakeRepository pattern
+- GUIDELINES pp. 242 (Newman): Mocks simulating varying response times,
+  occasional failures, and context-dependent outputs
+
+WBS Items Covered:
+- WBS-PERF11: Latency distributions (fixed, lognormal, bimodal)
+- WBS-PERF11: Profiles parsed from the registry's simulation section
+- WBS-PERF11: Error and 429 rates with Retry-After
+- WBS-PERF11: Tool-call responses, output size and streaming token rate
+- WBS-PERF11: simulate_upstream serves every provider with FakeProvider
+"""
+
+import random
+import statistics
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.exceptions import ProviderError, RateLimitError
+from src.models.requests import ChatCompletionRequest
+from src.providers.fake import (
+    FakeProvider,
+    LatencyDistribution,
+    SimulationConfigError,
+    SimulationProfile,
+    load_simulation_profiles,
+)
+
+
+SIMULATION_CONFIG = {
+    "default": "steady",
+    "profiles": {
+        "steady": {"latency_ms": 5, "tokens_per_second": 100, "response_tokens": 20},
+        "flaky": {
+            "latency_ms": {"distribution": "lognormal", "median_ms": 50, "sigma": 0.3},
+            "rate_limit_rate": 0.5,
+            "retry_after_seconds": 3,
+        },
+    },
+    "models": {"gpt-5-mini": "flaky"},
+}
+
+
+def _request(model: str = "fake-model", tools: bool = False) -> ChatCompletionRequest:
+    payload = {"model": model, "messages": [{"role": "user", "content": "Hello"}]}
+    if tools:
+        payload["tools"] = [
+            {
+                "type": "function",
+                "function": {"name": "lookup", "parameters": {"type": "object", "properties": {}}},
+            }
+        ]
+    return ChatCompletionRequest(**payload)
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """Record simulated sleeps instead of waiting."""
+    recorded: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        recorded.append(seconds)
+
+    monkeypatch.setattr("src.providers.fake.asyncio.sleep", fake_sleep)
+    return recorded
+
+
+# =============================================================================
+# WBS-PERF11: Profiles
+# =============================================================================
+
+
+class TestSimulationProfiles:
+    """Tests for latency distributions and profile parsing."""
+
+    def test_fixed_latency(self) -> None:
+        assert LatencyDistribution.from_config(250).sample(random.Random(0)) == 0.25
+
+    def test_lognormal_median(self) -> None:
+        dist = LatencyDistribution.from_config(
+            {"distribution": "lognormal", "median_ms": 400, "sigma": 0.5}
+        )
+        rng = random.Random(1)
+
+        median = statistics.median(dist.sample(rng) for _ in range(2000))
+
+        assert median == pytest.approx(0.4, rel=0.1)
+
+    def test_bimodal_slow_fraction(self) -> None:
+        dist = LatencyDistribution(kind="bimodal", fast_ms=100, slow_ms=5000, slow_fraction=0.2)
+        rng = random.Random(2)
+
+        slow = sum(dist.sample(rng) > 1.0 for _ in range(2000))
+
+        assert slow / 2000 == pytest.approx(0.2, abs=0.03)
+
+    def test_registry_section_maps_models_to_profiles(self) -> None:
+        by_model, default = load_simulation_profiles(SIMULATION_CONFIG)
+
+        assert by_model["gpt-5-mini"].rate_limit_rate == 0.5
+        assert default.response_tokens == 20
+
+    def test_invalid_profiles_are_rejected(self) -> None:
+        with pytest.raises(SimulationConfigError):
+            SimulationProfile.from_config({"error_rate": 1.5})
+        with pytest.raises(SimulationConfigError):
+            LatencyDistribution.from_config({"distribution": "pareto"})
+        with pytest.raises(SimulationConfigError):
+            load_simulation_profiles({"profiles": {}, "models": {"gpt-5.2": "missing"}})
+
+    def test_repository_registry_profiles_load(self) -> None:
+        from src.providers.router import _load_model_registry
+
+        by_model, default = load_simulation_profiles(_load_model_registry().get("simulation"))
+
+        assert default is not None
+        assert by_model
+
+
+# =============================================================================
+# WBS-PERF11: Simulated Behavior
+# =============================================================================
+
+
+class TestSimulatedFakeProvider:
+    """Tests for FakeProvider behavior under a profile."""
+
+    async def test_rate_limit_carries_retry_after(self, sleeps) -> None:
+        provider = FakeProvider(
+            default_profile=SimulationProfile(rate_limit_rate=1.0, retry_after_seconds=7)
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await provider.complete(_request())
+
+        assert exc_info.value.retry_after == 7
+
+    async def test_error_rate_raises_provider_error_after_latency(self, sleeps) -> None:
+        provider = FakeProvider(
+            default_profile=SimulationProfile(latency=LatencyDistribution(ms=30), error_rate=1.0)
+        )
+
+        with pytest.raises(ProviderError) as exc_info:
+            await provider.complete(_request())
+
+        assert exc_info.value.status_code == 503
+        assert sleeps == [0.03]
+
+    async def test_tool_call_response(self, sleeps) -> None:
+        provider = FakeProvider(default_profile=SimulationProfile(tool_call_rate=1.0))
+
+        response = await provider.complete(_request(tools=True))
+
+        assert response.choices[0].finish_reason == "tool_calls"
+        assert response.choices[0].message.tool_calls[0]["function"]["name"] == "lookup"
+
+    async def test_stream_tool_call_deltas(self, sleeps) -> None:
+        provider = FakeProvider(default_profile=SimulationProfile(tool_call_rate=1.0))
+
+        chunks = [chunk async for chunk in provider.stream(_request(tools=True))]
+
+        calls = [call for c in chunks for call in c.choices[0].delta.tool_calls or ()]
+        assert calls[0]["function"]["name"] == "lookup"
+        assert {call["index"] for call in calls} == {0}
+        assert "".join(call["function"]["arguments"] for call in calls) == "{}"
+        assert len(calls) > 2  # arguments arrive across several chunks
+        assert all(not c.choices[0].delta.content for c in chunks)
+        assert chunks[-1].choices[0].finish_reason == "tool_calls"
+
+    async def test_complete_output_size_and_generation_time(self, sleeps) -> None:
+        provider = FakeProvider(
+            default_profile=SimulationProfile(tokens_per_second=100, response_tokens=50)
+        )
+
+        response = await provider.complete(_request())
+
+        assert len(response.choices[0].message.content.split()) == 50
+        assert sleeps == [0.0, 0.5]
+
+    async def test_stream_paces_tokens(self, sleeps) -> None:
+        provider = FakeProvider(
+            default_profile=SimulationProfile(
+                latency=LatencyDistribution(ms=200), tokens_per_second=50, response_tokens=5
+            )
+        )
+
+        chunks = [c async for c in provider.stream(_request())]
+
+        assert len(chunks) == 7  # role + 5 tokens + finish
+        assert sleeps == [0.2, 0.02, 0.02, 0.02, 0.02]
+
+    async def test_per_model_profile_overrides_default(self, sleeps) -> None:
+        by_model, default = load_simulation_profiles(SIMULATION_CONFIG)
+        provider = FakeProvider(
+            supported_models=["gpt-5-mini", "fake-model"],
+            profiles=by_model,
+            default_profile=default,
+        )
+
+        assert provider.profile_for("gpt-5-mini").rate_limit_rate == 0.5
+        assert provider.profile_for("fake-model") is default
+
+    async def test_no_profile_is_instant(self, sleeps) -> None:
+        response = await FakeProvider().complete(_request())
+
+        assert response.choices[0].message.content.startswith("Fake response for testing")
+        assert sleeps == []
+
+
+# =============================================================================
+# WBS-PERF11: Router Wiring
+# =============================================================================
+
+
+class TestSimulateUpstream:
+    """Tests for create_provider_router() in simulation mode."""
+
+    def test_all_registry_providers_are_simulated(self) -> None:
+        from src.providers.registry_watcher import reset_registry_watcher
+        from src.providers.router import create_provider_router
+
+        settings = MagicMock()
+        settings.simulate_upstream = True
+        settings.simulation_seed = 3
+        settings.default_provider = None
+
+        router = create_provider_router(settings)
+        reset_registry_watcher()
+
+        provider = router.get_provider("gpt-5-mini")
+        assert isinstance(provider, FakeProvider)
+        assert provider.profile_for("gpt-5-mini") is not None
+        assert isinstance(router.get_provider("claude"), FakeProvider)
@@ -0,0 +1,154 @@
+"""
+Tests for provider batch APIs - WBS-PERF24 Native Batch Interface
+
+OpenAIProvider and AnthropicProvider implement NativeBatchProvider:
+requests are submitted in the provider's own batch format and results are
+read back as ChatCompletionResponse objects or error dicts.
+"""
+
+import json
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from anthropic.types.messages import MessageBatchIndividualResponse
+
+from src.models.requests import ChatCompletionRequest
+from src.providers.anthropic import AnthropicProvider
+from src.providers.batch import NATIVE_BATCH_ENDED, NATIVE_BATCH_IN_PROGRESS, NativeBatchProvider
+from src.providers.openai import OpenAIProvider
+
+
+def _request(model: str) -> ChatCompletionRequest:
+    return ChatCompletionRequest(
+        model=model,
+        messages=[
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": "Hi"},
+        ],
+        max_tokens=16,
+    )
+
+
+# =============================================================================
+# OpenAI Batch API
+# =============================================================================
+
+
+class TestOpenAIBatch:
+    """Files upload + batches.create; output and error files read back."""
+
+    async def test_submit_uploads_jsonl_and_creates_24h_batch(self) -> None:
+        provider = OpenAIProvider(api_key="k")
+        client = MagicMock()
+        client.files.create = AsyncMock(return_value=SimpleNamespace(id="file-1"))
+        client.batches.create = AsyncMock(return_value=SimpleNamespace(id="batch-1"))
+        provider._client = client
+
+        batch_id = await provider.submit_batch([("line-0", _request("gpt-5-mini"))])
+
+        _, content, _ = client.files.create.call_args.kwargs["file"]
+        line = json.loads(content)
+        assert batch_id == "batch-1"
+        assert isinstance(provider, NativeBatchProvider)
+        assert line["custom_id"] == "line-0"
+        assert line["body"]["max_completion_tokens"] == 16
+        assert client.batches.create.call_args.kwargs["completion_window"] == "24h"
+
+    def test_output_lines_become_responses_or_errors(self) -> None:
+        provider = OpenAIProvider(api_key="k")
+        body: dict[str, Any] = {
+            "id": "chatcmpl-1",
+            "object": "chat.completion",
+            "created": 1,
+            "model": "gpt-5-mini",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Hello"},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4},
+        }
+
+        ok = provider._transform_batch_line(
+            {"custom_id": "line-0", "response": {"status_code": 200, "body": body}, "error": None}
+        )
+        expired = provider._transform_batch_line(
+            {
+                "custom_id": "line-1",
+                "response": None,
+                "error": {"code": "batch_expired", "message": "expired"},
+            }
+        )
+
+        assert ok.response.choices[0].message.content == "Hello"
+        assert expired.response is None
+        assert expired.error == {"code": "batch_expired", "message": "expired"}
+
+
+# =============================================================================
+# Anthropic Message Batches
+# =============================================================================
+
+
+class TestAnthropicBatch:
+    """messages.batches requests use the provider's request conversion."""
+
+    async def test_submit_converts_requests(self) -> None:
+        provider = AnthropicProvider(api_key="k")
+        create = AsyncMock(return_value=SimpleNamespace(id="msgbatch_1"))
+        provider._client = MagicMock()
+        provider._client.messages.batches.create = create
+
+        batch_id = await provider.submit_batch([("line-3", _request("claude-opus-4.5"))])
+
+        params = create.call_args.kwargs["requests"][0]["params"]
+        assert batch_id == "msgbatch_1"
+        assert params["model"] == "claude-opus-4-20250514"
+        assert params["system"] == "Be brief."
+        assert params["messages"] == [{"role": "user", "content": "Hi"}]
+
+    async def test_status_maps_processing_status(self) -> None:
+        provider = AnthropicProvider(api_key="k")
+        provider._client = MagicMock()
+        provider._client.messages.batches.retrieve = AsyncMock(
+            side_effect=[
+                SimpleNamespace(processing_status="in_progress"),
+                SimpleNamespace(processing_status="ended"),
+            ]
+        )
+
+        assert await provider.get_batch_status("b") == NATIVE_BATCH_IN_PROGRESS
+        assert await provider.get_batch_status("b") == NATIVE_BATCH_ENDED
+
+    def test_results_become_responses_or_errors(self) -> None:
+        provider = AnthropicProvider(api_key="k")
+        succeeded = MessageBatchIndividualResponse.model_validate(
+            {
+                "custom_id": "line-0",
+                "result": {
+                    "type": "succeeded",
+                    "message": {
+                        "id": "msg_1",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": "claude-opus-4-20250514",
+                        "content": [{"type": "text", "text": "Hello"}],
+                        "stop_reason": "end_turn",
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": 3, "output_tokens": 1},
+                    },
+                },
+            }
+        )
+        expired = MessageBatchIndividualResponse.model_validate(
+            {"custom_id": "line-1", "result": {"type": "expired"}}
+        )
+
+        ok = provider._transform_batch_result(succeeded)
+        failed = provider._transform_batch_result(expired)
+
+        assert ok.response.choices[0].message.content == "Hello"
+        assert failed.error["code"] == "batch_expired"
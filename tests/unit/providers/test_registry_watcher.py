@@ -0,0 +1,141 @@
+"""
+Tests for Model Registry Hot Reload - WBS-PERF6
+
+Reference Documents:
+- Microservices Patterns Ch.27: API Gateway routing map
+- GUIDELINES pp. 2145: Graceful degradation (keep last good config)
+
+WBS Items Covered:
+- WBS-PERF6: RegistryWatcher swaps new snapshots into tracked routers
+- WBS-PERF6: Invalid YAML keeps the previous snapshot
+- WBS-PERF6: In-flight routes and provider instances survive a swap
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+
+REGISTRY_V1 = """
+providers:
+  openai:
+    category: external_owned
+    models:
+      - gpt-5.2
+routing_default: null
+aliases:
+  openai: gpt-5.2
+"""
+
+REGISTRY_V2 = """
+providers:
+  openai:
+    category: external_owned
+    models:
+      - gpt-5.2
+      - gpt-6
+routing_default: null
+aliases:
+  openai: gpt-6
+"""
+
+
+def _write(path: Path, content: str, mtime: float) -> None:
+    path.write_text(content)
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def registry_file(tmp_path: Path) -> Path:
+    path = tmp_path / "model_registry.yaml"
+    _write(path, REGISTRY_V1, 1_000_000.0)
+    return path
+
+
+@pytest.fixture
+def router(registry_file: Path):
+    from src.providers.router import ProviderRouter
+
+    return ProviderRouter(providers={"openai": MagicMock()}, registry_path=registry_file)
+
+
+@pytest.fixture
+def watcher(registry_file: Path, router):
+    from src.providers.registry_watcher import RegistryWatcher
+
+    watcher = RegistryWatcher(path=registry_file)
+    watcher.track(router)
+    return watcher
+
+
+# =============================================================================
+# WBS-PERF6: RegistryWatcher
+# =============================================================================
+
+
+class TestRegistryWatcher:
+    """Tests for RegistryWatcher.check()/reload()."""
+
+    async def test_unchanged_file_is_not_reloaded(self, watcher, router) -> None:
+        snapshot = router.snapshot
+
+        assert await watcher.check() is False
+        assert router.snapshot is snapshot
+
+    async def test_changed_file_swaps_snapshot(self, watcher, router, registry_file) -> None:
+        provider = router.providers["openai"]
+        in_flight = router.resolve("openai")
+
+        _write(registry_file, REGISTRY_V2, 1_000_010.0)
+
+        assert await watcher.check() is True
+        assert router.resolve("openai").model == "gpt-6"
+        assert "gpt-6" in router.REGISTERED_MODELS
+        assert router.get_provider("gpt-6") is provider
+        assert in_flight.model == "gpt-5.2"
+
+    async def test_invalid_yaml_keeps_previous_snapshot(
+        self, watcher, router, registry_file
+    ) -> None:
+        from src.observability.metrics import MODEL_REGISTRY_RELOADS_TOTAL
+
+        errors = MODEL_REGISTRY_RELOADS_TOTAL.labels(result="error")
+        before = errors._value.get()
+        snapshot = router.snapshot
+
+        _write(registry_file, "providers:\n  openai:\n    models: gpt-6\n", 1_000_020.0)
+
+        assert await watcher.check() is False
+        assert router.snapshot is snapshot
+        assert errors._value.get() == before + 1
+
+    async def test_start_and_stop(self, watcher) -> None:
+        await watcher.start(poll_interval=0.01)
+        assert watcher.running
+
+        await watcher.stop()
+        assert not watcher.running
+
+
+class TestCreateProviderRouterTracking:
+    """Tests for create_provider_router() registering with the watcher."""
+
+    def test_factory_router_is_tracked(self) -> None:
+        from src.providers.registry_watcher import get_registry_watcher, reset_registry_watcher
+        from src.providers.router import create_provider_router
+
+        reset_registry_watcher()
+        settings = MagicMock()
+        settings.openai_api_key = None
+        settings.anthropic_api_key = None
+        settings.deepseek_api_key = None
+        settings.gemini_api_key = None
+        settings.openrouter_api_key = None
+        settings.llamacpp_enabled = False
+
+        router = create_provider_router(settings)
+
+        assert router in get_registry_watcher()._routers
+        reset_registry_watcher()
@@ -0,0 +1,171 @@
+"""
+Tests for Compiled Routing Table - WBS-PERF5
+
+Reference Documents:
+- Microservices Patterns Ch.27: API Gateway routing map
+- config/model_registry.yaml: aliases, prefixes, registered models
+
+WBS Items Covered:
+- WBS-PERF5: RoutingTable resolves aliases, prefixes and registered models
+- WBS-PERF5: Prefix-routed names memoized in a bounded LRU
+- WBS-PERF5: ProviderRouter.resolve()/get_provider() use the compiled table
+- WBS-PERF5: ChatService resolves route once and reuses its context limit
+- WBS-PERF5: CostTracker pricing lookup memoized
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+REGISTERED = {"gpt-5.2": "openai", "claude-opus-4.5": "anthropic", "deepseek-chat": "deepseek"}
+PREFIXES = {"openrouter/": "openrouter", "deepseek-api/": "deepseek"}
+ALIASES = {"openai": "gpt-5.2", "claude": "claude-opus-4.5", "broken": "not-a-model"}
+PROVIDERS_CONFIG = {
+    "openai": {"category": "external_owned", "capabilities": ["tools", "streaming"]},
+}
+
+
+@pytest.fixture
+def table():
+    from src.providers.routing_table import RoutingTable
+
+    return RoutingTable(REGISTERED, PREFIXES, ALIASES, providers_config=PROVIDERS_CONFIG)
+
+
+# =============================================================================
+# WBS-PERF5: RoutingTable
+# =============================================================================
+
+
+class TestRoutingTable:
+    """Tests for RoutingTable.resolve()."""
+
+    def test_registered_model(self, table) -> None:
+        route = table.resolve("gpt-5.2")
+
+        assert route.model == "gpt-5.2"
+        assert route.provider == "openai"
+        assert route.source == "registered"
+        assert route.context_limit == 128000
+        assert route.category == "external_owned"
+        assert route.capabilities == frozenset({"tools", "streaming"})
+
+    def test_alias_is_case_insensitive_and_canonicalized(self, table) -> None:
+        route = table.resolve("Claude")
+
+        assert route.model == "claude-opus-4.5"
+        assert route.provider == "anthropic"
+        assert route.source == "alias"
+        assert route.context_limit == 200000
+
+    def test_registered_lookup_falls_back_to_lowercase(self, table) -> None:
+        assert table.resolve("GPT-5.2").provider == "openai"
+
+    def test_prefix_routes_are_memoized(self, table) -> None:
+        first = table.resolve("openrouter/mixtral-8x7b")
+        second = table.resolve("openrouter/mixtral-8x7b")
+
+        assert first.provider == "openrouter"
+        assert first.source == "prefix"
+        assert first.context_limit == 4096
+        assert second is first
+
+    def test_prefix_cache_is_bounded(self) -> None:
+        from src.providers.routing_table import RoutingTable
+
+        table = RoutingTable(REGISTERED, PREFIXES, ALIASES, prefix_cache_size=2)
+        first = table.resolve("openrouter/a")
+        table.resolve("openrouter/b")
+        table.resolve("openrouter/c")
+
+        assert table.resolve("openrouter/a") is not first
+
+    def test_unknown_model_and_dangling_alias(self, table) -> None:
+        assert table.resolve("mystery-model") is None
+        assert table.resolve("broken") is None
+
+
+# =============================================================================
+# WBS-PERF5: ProviderRouter Integration
+# =============================================================================
+
+
+class TestProviderRouterRoutes:
+    """Tests for ProviderRouter using the compiled routing table."""
+
+    @pytest.fixture
+    def router(self):
+        from src.providers.router import ProviderRouter
+
+        return ProviderRouter(providers={"openai": MagicMock(), "anthropic": MagicMock()})
+
+    def test_resolve_alias_from_registry(self, router) -> None:
+        route = router.resolve("openai")
+
+        assert route.model == "gpt-5.2"
+        assert router.resolve_model_alias("openai") == "gpt-5.2"
+        assert router.resolve_model_alias("gpt-5.2") == "gpt-5.2"
+
+    def test_get_provider_uses_route(self, router) -> None:
+        assert router.get_provider("chatgpt") is router.providers["openai"]
+
+    def test_unconfigured_provider_rejected(self, router) -> None:
+        from src.providers.router import NoProviderError
+
+        route = router.resolve("gemini-1.5-pro")
+
+        with pytest.raises(NoProviderError):
+            router.provider_for(route)
+
+
+# =============================================================================
+# WBS-PERF5: ChatService Integration
+# =============================================================================
+
+
+class TestChatServiceRouting:
+    """Tests for ChatService._route_request()."""
+
+    def test_alias_request_copied_with_canonical_model(self) -> None:
+        from src.models.requests import ChatCompletionRequest
+        from src.providers.router import ProviderRouter
+        from src.services.chat import ChatService
+
+        provider = AsyncMock()
+        router = ProviderRouter(providers={"openai": provider})
+        service = ChatService(router=router, executor=MagicMock())
+        request = ChatCompletionRequest(
+            model="openai", messages=[{"role": "user", "content": "hi"}], temperature=0.3
+        )
+
+        routed, routed_provider, route = service._route_request(request)
+
+        assert routed.model == "gpt-5.2"
+        assert routed.temperature == 0.3
+        assert routed_provider.wrapped is provider
+        assert route.context_limit == 128000
+
+
+# =============================================================================
+# WBS-PERF5: CostTracker Pricing Memoization
+# =============================================================================
+
+
+class TestCostTrackerPricingLookup:
+    """Tests for memoized CostTracker._get_model_pricing()."""
+
+    def test_prefix_pricing_memoized(self) -> None:
+        from src.services.cost_tracker import CostTracker
+
+        pricing = {
+            "gpt-4": {"input": Decimal("30"), "output": Decimal("60")},
+            "gpt-4-turbo": {"input": Decimal("10"), "output": Decimal("30")},
+            "_default": {"input": Decimal("1"), "output": Decimal("2")},
+        }
+        tracker = CostTracker(redis_client=MagicMock(), pricing=pricing)
+
+        assert tracker._get_model_pricing("gpt-4-turbo-preview") is pricing["gpt-4-turbo"]
+        assert tracker._pricing_table._cache["gpt-4-turbo-preview"] is pricing["gpt-4-turbo"]
+        assert tracker._get_model_pricing("unknown") is pricing["_default"]
@@ -0,0 +1,132 @@
+"""
+Tests for streamed usage reporting - WBS-PERF8
+
+OpenAI-compatible adapters request ``stream_options.include_usage`` and
+map the final chunk's usage; Gemini reports its last ``usageMetadata``
+on the final chunk. Streamed calls are then billed from real counts.
+"""
+
+import json
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+from src.models.requests import ChatCompletionRequest
+from src.providers.gemini import GeminiProvider
+from src.providers.openai import OpenAIProvider, openai_usage
+
+
+def _request(model: str) -> ChatCompletionRequest:
+    return ChatCompletionRequest(model=model, messages=[{"role": "user", "content": "Hi"}])
+
+
+async def _aiter(items: list[Any]):
+    for item in items:
+        yield item
+
+
+# =============================================================================
+# OpenAI
+# =============================================================================
+
+
+class TestOpenAIStreamUsage:
+    """include_usage is requested and the usage chunk is mapped."""
+
+    async def test_final_chunk_carries_usage(self) -> None:
+        provider = OpenAIProvider(api_key="k")
+        provider._client = MagicMock()
+        delta = SimpleNamespace(role="assistant", content="Hi", tool_calls=None)
+        provider._client.chat.completions.create = MagicMock(
+            return_value=_aiter(
+                [
+                    SimpleNamespace(
+                        id="c",
+                        created=1,
+                        model="gpt-5-mini",
+                        choices=[SimpleNamespace(index=0, delta=delta, finish_reason="stop")],
+                        usage=None,
+                    ),
+                    SimpleNamespace(
+                        id="c",
+                        created=1,
+                        model="gpt-5-mini",
+                        choices=[],
+                        usage=SimpleNamespace(
+                            prompt_tokens=12,
+                            completion_tokens=1,
+                            total_tokens=13,
+                            prompt_tokens_details=SimpleNamespace(cached_tokens=8),
+                        ),
+                    ),
+                ]
+            )
+        )
+
+        chunks = [c async for c in provider.stream(_request("gpt-5-mini"))]
+
+        kwargs = provider._client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream_options"] == {"include_usage": True}
+        assert chunks[0].usage is None
+        assert chunks[-1].usage.prompt_tokens == 12
+        assert chunks[-1].usage.cache_read_tokens == 8
+
+    def test_usage_without_cache_details(self) -> None:
+        usage = openai_usage(SimpleNamespace(prompt_tokens=3, completion_tokens=2, total_tokens=5))
+
+        assert usage.total_tokens == 5
+        assert usage.cache_read_tokens is None
+        assert openai_usage(None) is None
+
+
+# =============================================================================
+# Gemini
+# =============================================================================
+
+
+class _StreamResponse:
+    """httpx streaming response double yielding SSE lines."""
+
+    status_code = 200
+
+    def __init__(self, lines: list[str]) -> None:
+        self._lines = lines
+
+    async def __aenter__(self) -> "_StreamResponse":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    def aiter_lines(self):
+        return _aiter(self._lines)
+
+
+class TestGeminiStreamUsage:
+    """The last usageMetadata is reported on the final chunk."""
+
+    async def test_final_chunk_carries_usage(self) -> None:
+        provider = GeminiProvider(api_key="k")
+
+        def event(text: str, prompt: int, output: int) -> str:
+            return "data: " + json.dumps(
+                {
+                    "candidates": [{"content": {"parts": [{"text": text}], "role": "model"}}],
+                    "usageMetadata": {
+                        "promptTokenCount": prompt,
+                        "candidatesTokenCount": output,
+                        "totalTokenCount": prompt + output,
+                    },
+                }
+            )
+
+        provider._client = MagicMock()
+        provider._client.stream = MagicMock(
+            return_value=_StreamResponse([event("He", 7, 1), "", event("llo", 7, 2)])
+        )
+
+        chunks = [c async for c in provider.stream(_request("gemini-2.5-flash"))]
+
+        assert [c.choices[0].delta.content for c in chunks[:-1]] == ["He", "llo"]
+        assert chunks[-1].choices[0].finish_reason == "stop"
+        assert (chunks[-1].usage.prompt_tokens, chunks[-1].usage.completion_tokens) == (7, 2)
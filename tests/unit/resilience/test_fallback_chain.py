@@ -520,3 +520,75 @@ class TestFallbackChainFactory:
 
         assert chain.name == "search-fallback"
         assert any(b.name == "semantic-search" for b in chain.backends)
+
+
+# =============================================================================
+# WBS-PERF14: Bounded Cache and Stale-While-Revalidate Tests
+# =============================================================================
+
+
+class TestFallbackChainLocalCache:
+    """Tests for the bounded local cache and background refresh."""
+
+    def test_from_config_reads_cache_limits(self) -> None:
+        from src.resilience.fallback_chain import FallbackChain
+
+        chain = FallbackChain.from_config(
+            {"name": "c", "backends": [], "cache_max_entries": 1, "cache_ttl_seconds": 5}
+        )
+        chain._local_cache["a"] = {"n": 1}
+        chain._local_cache["b"] = {"n": 2}
+
+        assert len(chain._local_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_serves_cache_and_refreshes_while_primary_recovers(
+        self, fallback_chain
+    ) -> None:
+        cache_key = fallback_chain._get_cache_key("search", {"query": "test"})
+        fallback_chain._local_cache[cache_key] = {"cached": "result"}
+        cb = fallback_chain._circuit_breakers["semantic-search"]
+        for _ in range(cb.failure_threshold):
+            await cb.record_failure()
+
+        release = asyncio.Event()
+
+        async def slow_backend(backend, operation, payload):
+            await release.wait()
+            return {"result": f"from-{backend.name}"}
+
+        with patch.object(fallback_chain, "_call_backend", side_effect=slow_backend):
+            first = await fallback_chain.execute("search", {"query": "test"})
+            second = await fallback_chain.execute("search", {"query": "test"})
+
+            assert first == second == {"cached": "result"}
+            assert len(fallback_chain._refreshes) == 1
+
+            release.set()
+            await asyncio.gather(*fallback_chain._refreshes.values())
+
+        assert fallback_chain._local_cache.get(cache_key) == {
+            "result": "from-code-orchestrator"
+        }
+        assert fallback_chain._refreshes == {}
+
+    @pytest.mark.asyncio
+    async def test_records_cache_lookup_metrics(self, fallback_chain) -> None:
+        from src.resilience.metrics import FALLBACK_CACHE_LOOKUPS
+
+        hits = FALLBACK_CACHE_LOOKUPS.labels(chain_name="search-chain", result="hit")
+        misses = FALLBACK_CACHE_LOOKUPS.labels(chain_name="search-chain", result="miss")
+        hits_before, misses_before = hits._value.get(), misses._value.get()
+        cache_key = fallback_chain._get_cache_key("search", {"query": "cached"})
+        fallback_chain._local_cache[cache_key] = {"cached": "result"}
+
+        async def failing_backend(backend, operation, payload):
+            raise ConnectionError("Service unavailable")
+
+        with patch.object(fallback_chain, "_call_backend", side_effect=failing_backend):
+            await fallback_chain.execute("search", {"query": "cached"})
+            with pytest.raises(Exception):
+                await fallback_chain.execute("search", {"query": "uncached"})
+
+        assert hits._value.get() == hits_before + 1
+        assert misses._value.get() == misses_before + 1
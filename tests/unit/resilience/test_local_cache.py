@@ -0,0 +1,81 @@
+"""
+Tests for Bounded Local Cache - WBS-PERF14
+
+Reference Documents:
+- Building Microservices (Newman): Caching for resilience, serve stale data
+- RFC 5861: stale-while-revalidate semantics
+
+This module tests:
+- LRU eviction by entry count and by estimated bytes
+- Fresh / stale / expired entry ages
+- Eviction callbacks
+"""
+
+from src.resilience.local_cache import BoundedTTLCache, estimate_size
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestBoundedTTLCache:
+    """Tests for BoundedTTLCache."""
+
+    def test_evicts_least_recently_used_by_count(self) -> None:
+        evictions: list[str] = []
+        cache = BoundedTTLCache(max_entries=2, on_evict=evictions.append)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+
+        cache["c"] = 3
+
+        assert "b" not in cache
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert evictions == ["capacity"]
+
+    def test_evicts_to_fit_byte_budget(self) -> None:
+        value = {"text": "x" * 90}
+        cache = BoundedTTLCache(max_bytes=estimate_size(value) * 2)
+        for key in ("a", "b", "c"):
+            cache[key] = value
+
+        assert len(cache) == 2
+        assert "a" not in cache
+        assert cache.total_bytes == estimate_size(value) * 2
+
+    def test_oversized_value_is_not_stored(self) -> None:
+        cache = BoundedTTLCache(max_bytes=10)
+        cache["big"] = {"text": "x" * 100}
+
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
+
+    def test_replacing_a_key_updates_size(self) -> None:
+        cache = BoundedTTLCache()
+        cache["k"] = "x" * 100
+        cache["k"] = "y"
+
+        assert cache.total_bytes == estimate_size("y")
+
+    def test_fresh_stale_and_expired(self) -> None:
+        clock = FakeClock()
+        evictions: list[str] = []
+        cache = BoundedTTLCache(
+            ttl_seconds=10, stale_ttl_seconds=50, on_evict=evictions.append, clock=clock
+        )
+        cache["k"] = {"v": 1}
+
+        assert cache.lookup("k").stale is False
+        clock.now += 30
+        assert cache.lookup("k").stale is True
+        clock.now += 30
+        assert cache.lookup("k") is None
+        assert "k" not in cache
+        assert evictions == ["expired"]
@@ -0,0 +1,505 @@
+"""
+Tests for batch jobs - WBS-PERF24 Offline Batch Execution
+
+BatchManager streams an uploaded JSONL file to disk, runs its lines
+through ChatService (or a provider batch API for 24h-window jobs), appends
+results to output.jsonl, and resumes unfinished jobs from their output.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any, Optional
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes.batches import router as batches_router
+from src.core.exceptions import ProviderError
+from src.models.requests import ChatCompletionRequest
+from src.models.responses import ChatCompletionResponse, Choice, ChoiceMessage, Usage
+from src.providers.batch import (
+    NATIVE_BATCH_ENDED,
+    NATIVE_BATCH_IN_PROGRESS,
+    NativeBatchProvider,
+    NativeBatchResult,
+)
+from src.providers.router import NoProviderError
+from src.providers.routing_table import ModelRoute
+from src.services.batches import (
+    STATUS_CANCELLED,
+    STATUS_COMPLETED,
+    BatchError,
+    BatchJob,
+    BatchManager,
+    BatchStore,
+    BatchTooLargeError,
+    ProviderRateBudget,
+    reset_batch_manager,
+    set_batch_manager,
+)
+from src.services.cost_aggregator import (
+    ANONYMOUS_API_KEY_ID,
+    reset_cost_aggregator,
+    set_api_key_id,
+    set_cost_aggregator,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _response(content: str, model: str = "local-model") -> ChatCompletionResponse:
+    return ChatCompletionResponse(
+        id="chatcmpl-1",
+        created=0,
+        model=model,
+        choices=[Choice(index=0, message=ChoiceMessage(role="assistant", content=content), finish_reason="stop")],
+        usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+    )
+
+
+class FakeNativeProvider(NativeBatchProvider):
+    """Native batch API that ends after ``polls`` status checks."""
+
+    native_batch_max_requests = 1000
+
+    def __init__(self, polls: int = 1) -> None:
+        self.submitted: list[list[tuple[str, ChatCompletionRequest]]] = []
+        self.batches: dict[str, list[tuple[str, ChatCompletionRequest]]] = {}
+        self.polls = polls
+        self.cancelled: list[str] = []
+
+    async def submit_batch(self, requests: list[tuple[str, ChatCompletionRequest]]) -> str:
+        self.submitted.append(requests)
+        batch_id = f"remote-{len(self.submitted)}"
+        self.batches[batch_id] = requests
+        return batch_id
+
+    async def get_batch_status(self, batch_id: str) -> str:
+        self.polls -= 1
+        return NATIVE_BATCH_IN_PROGRESS if self.polls > 0 else NATIVE_BATCH_ENDED
+
+    async def iter_batch_results(self, batch_id: str) -> AsyncIterator[NativeBatchResult]:
+        for custom_id, request in self.batches[batch_id]:
+            yield NativeBatchResult(custom_id, response=_response("native", request.model))
+
+    async def cancel_batch(self, batch_id: str) -> None:
+        self.cancelled.append(batch_id)
+
+
+class FakeRouter:
+    """Routes ``claude-*`` to the native provider and everything else to ``local``."""
+
+    def __init__(self, native: Optional[FakeNativeProvider] = None) -> None:
+        self.providers: dict[str, Any] = {"local": object(), "anthropic": native or FakeNativeProvider()}
+
+    def resolve(self, model: str) -> ModelRoute:
+        if model == "unknown":
+            raise NoProviderError("unknown")
+        provider = "anthropic" if model.startswith("claude") else "local"
+        return ModelRoute(model=model, provider=provider, source="test", context_limit=8192)
+
+    def provider_for(self, route: ModelRoute) -> Any:
+        return self.providers[route.provider]
+
+
+class FakeChatService:
+    """Echoes the last message; ``fail`` contents raise a ProviderError."""
+
+    def __init__(self, router: FakeRouter, delay: float = 0.0) -> None:
+        self.router = router
+        self.delay = delay
+        self.calls: list[str] = []
+        self.tools = {"lookup"}
+
+    def executes_tool(self, name: str) -> bool:
+        return name in self.tools
+
+    async def complete(self, request: ChatCompletionRequest) -> ChatCompletionResponse:
+        content = request.messages[-1].content
+        self.calls.append(content)
+        await asyncio.sleep(self.delay)
+        if content == "fail":
+            raise ProviderError("upstream down", provider="local", status_code=503)
+        return _response(f"echo {content}", request.model)
+
+
+def _line(custom_id: str, content: str, model: str = "local-model") -> dict[str, Any]:
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {"model": model, "messages": [{"role": "user", "content": content}]},
+    }
+
+
+def _jsonl(lines: list[dict[str, Any]]) -> bytes:
+    return b"".join(json.dumps(line).encode() + b"\n" for line in lines)
+
+
+async def _chunks(data: bytes, size: int = 7) -> AsyncIterator[bytes]:
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+def _manager(tmp_path: Path, chat: FakeChatService, **kwargs: Any) -> BatchManager:
+    kwargs.setdefault("native_poll_seconds", 0.01)
+    return BatchManager(BatchStore(tmp_path), lambda: chat, **kwargs)
+
+
+def _output(tmp_path: Path, job_id: str) -> dict[str, dict[str, Any]]:
+    lines = (tmp_path / job_id / "output.jsonl").read_text().splitlines()
+    return {record["custom_id"]: record for record in map(json.loads, lines)}
+
+
+async def _wait(manager: BatchManager, job_id: str) -> BatchJob:
+    for _ in range(500):
+        job = manager.get_job(job_id)
+        if job.finished:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("batch did not finish")
+
+
+# =============================================================================
+# Gateway Execution
+# =============================================================================
+
+
+class TestGatewayExecution:
+    """Lines run through ChatService and results append to output.jsonl."""
+
+    async def test_all_lines_written_with_counts(self, tmp_path: Path) -> None:
+        chat = FakeChatService(FakeRouter())
+        manager = _manager(tmp_path, chat, default_concurrency=3)
+        data = _jsonl([_line(f"r{i}", str(i)) for i in range(10)] + [_line("bad", "fail")])
+
+        job = await manager.create_job(_chunks(data), completion_window="immediate")
+        job = await _wait(manager, job.id)
+
+        output = _output(tmp_path, job.id)
+        assert job.status == STATUS_COMPLETED
+        assert (job.total, job.completed, job.failed) == (11, 10, 1)
+        assert output["r3"]["response"]["body"]["choices"][0]["message"]["content"] == "echo 3"
+        assert output["bad"]["response"] is None
+        assert output["bad"]["error"]["code"] == "PROVIDER_ERROR"
+        assert BatchStore(tmp_path).load(job.id).completed == 10
+
+    async def test_invalid_body_and_unknown_model_are_failed_lines(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path, FakeChatService(FakeRouter()))
+        lines = [
+            {**_line("a", "x"), "body": {"model": "local-model"}},
+            _line("b", "x", model="unknown"),
+        ]
+
+        job = await _wait(manager, (await manager.create_job(_chunks(_jsonl(lines)))).id)
+
+        output = _output(tmp_path, job.id)
+        assert output["a"]["error"]["code"] == "invalid_request"
+        assert output["b"]["error"]["code"] == "model_not_found"
+        assert job.failed == 2
+
+    async def test_upload_rejects_duplicate_custom_id(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path, FakeChatService(FakeRouter()))
+        data = _jsonl([_line("a", "1"), _line("a", "2")])
+
+        with pytest.raises(BatchError, match="duplicate custom_id"):
+            await manager.create_job(_chunks(data))
+
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_upload_rejects_too_many_requests(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path, FakeChatService(FakeRouter()), max_requests=2)
+        data = _jsonl([_line(f"r{i}", "x") for i in range(3)])
+
+        with pytest.raises(BatchTooLargeError, match="2 requests"):
+            await manager.create_job(_chunks(data))
+
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_concurrency_is_bounded(self, tmp_path: Path) -> None:
+        active = peak = 0
+        chat = FakeChatService(FakeRouter())
+
+        async def complete(request: ChatCompletionRequest) -> ChatCompletionResponse:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _response("ok")
+
+        chat.complete = complete
+        manager = _manager(tmp_path, chat)
+        data = _jsonl([_line(f"r{i}", "x") for i in range(12)])
+
+        job = await manager.create_job(_chunks(data), concurrency=4)
+        await _wait(manager, job.id)
+
+        assert peak == 4
+
+    async def test_worker_failure_fails_job_instead_of_hanging(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        def broken_append(self, line: bytes) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr("src.services.batches._OutputWriter._append", broken_append)
+        manager = _manager(tmp_path, FakeChatService(FakeRouter()))
+        data = _jsonl([_line(f"r{i}", "x") for i in range(20)])
+
+        job = await manager.create_job(_chunks(data), concurrency=2)
+        job = await _wait(manager, job.id)
+
+        assert job.status == "failed"
+        assert job.error == "disk full"
+
+
+# =============================================================================
+# Resume
+# =============================================================================
+
+
+class TestResume:
+    """Unfinished jobs skip lines already in their output."""
+
+    async def test_resume_skips_done_lines_and_drops_partial_line(self, tmp_path: Path) -> None:
+        store = BatchStore(tmp_path)
+        job = BatchJob(id="batch_" + "a" * 32, created_at=1, completion_window="immediate", concurrency=2, total=3)
+        store.input_path(job.id).parent.mkdir(parents=True)
+        store.input_path(job.id).write_bytes(_jsonl([_line("r0", "0"), _line("r1", "1"), _line("r2", "2")]))
+        done = {"id": "batch_req_1", "custom_id": "r0", "response": {"status_code": 200, "body": {}}, "error": None}
+        store.output_path(job.id).write_bytes(json.dumps(done).encode() + b'\n{"custom_id": "r1", "resp')
+        store.save(job)
+
+        chat = FakeChatService(FakeRouter())
+        manager = _manager(tmp_path, chat)
+        assert manager.resume() == 1
+        job = await _wait(manager, job.id)
+
+        assert sorted(chat.calls) == ["1", "2"]
+        assert set(_output(tmp_path, job.id)) == {"r0", "r1", "r2"}
+        assert (job.completed, job.failed) == (3, 0)
+
+    async def test_stop_leaves_job_in_progress(self, tmp_path: Path) -> None:
+        chat = FakeChatService(FakeRouter(), delay=10)
+        manager = _manager(tmp_path, chat)
+        job = await manager.create_job(_chunks(_jsonl([_line("r0", "0")])))
+        await asyncio.sleep(0.01)
+
+        await manager.stop()
+
+        assert BatchStore(tmp_path).load(job.id).status == "in_progress"
+
+
+# =============================================================================
+# Native Batches
+# =============================================================================
+
+
+class TestNativeBatches:
+    """24h-window lines for native-capable providers use the provider batch API."""
+
+    async def test_native_group_submitted_and_results_written(self, tmp_path: Path) -> None:
+        native = FakeNativeProvider(polls=2)
+        chat = FakeChatService(FakeRouter(native))
+        manager = _manager(tmp_path, chat, native_min_requests=2)
+        lines = [_line("c0", "0", "claude-x"), _line("l0", "0"), _line("c1", "1", "claude-x")]
+
+        job = await _wait(manager, (await manager.create_job(_chunks(_jsonl(lines)))).id)
+
+        assert [[cid for cid, _ in batch] for batch in native.submitted] == [["line-0", "line-2"]]
+        assert chat.calls == ["0"]
+        output = _output(tmp_path, job.id)
+        assert output["c1"]["response"]["body"]["choices"][0]["message"]["content"] == "native"
+        assert job.native_batches == {"anthropic:0": "remote-1"}
+        assert job.completed == 3
+
+    async def test_native_usage_recorded_at_batch_price(self, tmp_path: Path) -> None:
+        aggregator = MagicMock()
+        set_cost_aggregator(aggregator)
+        try:
+            manager = _manager(tmp_path, FakeChatService(FakeRouter()), native_min_requests=1)
+            set_api_key_id("key-a")
+            job = await manager.create_job(_chunks(_jsonl([_line("c0", "0", "claude-x")])))
+            await _wait(manager, job.id)
+        finally:
+            set_api_key_id(ANONYMOUS_API_KEY_ID)
+            reset_cost_aggregator()
+
+        (call,) = aggregator.record.call_args_list
+        assert call.args[0] == "claude-x"
+        assert call.kwargs["price_multiplier"] == 0.5
+        assert job.api_key_id == "key-a"
+
+    async def test_lines_with_gateway_tools_run_through_gateway(self, tmp_path: Path) -> None:
+        native = FakeNativeProvider()
+        chat = FakeChatService(FakeRouter(native))
+        manager = _manager(tmp_path, chat, native_min_requests=1)
+        line = _line("c0", "0", "claude-x")
+        line["body"]["tools"] = [{"type": "function", "function": {"name": "lookup"}}]
+
+        await _wait(manager, (await manager.create_job(_chunks(_jsonl([line])))).id)
+
+        assert native.submitted == []
+        assert chat.calls == ["0"]
+
+    async def test_small_group_runs_through_gateway(self, tmp_path: Path) -> None:
+        native = FakeNativeProvider()
+        chat = FakeChatService(FakeRouter(native))
+        manager = _manager(tmp_path, chat, native_min_requests=5)
+
+        await _wait(manager, (await manager.create_job(_chunks(_jsonl([_line("c0", "0", "claude-x")])))).id)
+
+        assert native.submitted == []
+        assert chat.calls == ["0"]
+
+    async def test_resumed_job_polls_existing_native_batch(self, tmp_path: Path) -> None:
+        native = FakeNativeProvider()
+        native.batches["remote-9"] = [("line-0", ChatCompletionRequest.model_validate(_line("c0", "0", "claude-x")["body"]))]
+        store = BatchStore(tmp_path)
+        job = BatchJob(
+            id="batch_" + "b" * 32,
+            created_at=1,
+            completion_window="24h",
+            concurrency=1,
+            total=1,
+            native_batches={"anthropic:0": "remote-9"},
+        )
+        store.input_path(job.id).parent.mkdir(parents=True)
+        store.input_path(job.id).write_bytes(_jsonl([_line("c0", "0", "claude-x")]))
+        store.save(job)
+
+        manager = _manager(tmp_path, FakeChatService(FakeRouter(native)), native_min_requests=5)
+        manager.resume()
+        job = await _wait(manager, job.id)
+
+        assert native.submitted == []
+        assert job.completed == 1
+
+    async def test_cancel_cancels_native_batch(self, tmp_path: Path) -> None:
+        native = FakeNativeProvider(polls=10_000)
+        manager = _manager(tmp_path, FakeChatService(FakeRouter(native)), native_min_requests=1)
+        job = await manager.create_job(_chunks(_jsonl([_line("c0", "0", "claude-x")])))
+        while not native.submitted:
+            await asyncio.sleep(0.01)
+
+        job = await manager.cancel_job(job.id)
+
+        assert job.status == STATUS_CANCELLED
+        assert native.cancelled == ["remote-1"]
+
+
+# =============================================================================
+# ProviderRateBudget
+# =============================================================================
+
+
+class TestProviderRateBudget:
+    """Requests beyond the burst wait for the bucket to refill."""
+
+    async def test_rate_limits_after_burst(self) -> None:
+        budget = ProviderRateBudget(rate_per_second=20)
+        for _ in range(20):
+            await budget.acquire()
+
+        start = time.monotonic()
+        await budget.acquire()
+        await budget.acquire()
+
+        assert time.monotonic() - start >= 0.08
+
+
+# =============================================================================
+# Route
+# =============================================================================
+
+
+class TestBatchesRoute:
+    """/v1/batches endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        reset_batch_manager()
+        yield
+        reset_batch_manager()
+
+    def test_create_poll_and_download(self, tmp_path: Path) -> None:
+        app = FastAPI()
+        app.include_router(batches_router)
+        with TestClient(app) as client:
+            set_batch_manager(_manager(tmp_path, FakeChatService(FakeRouter())))
+            created = client.post(
+                "/v1/batches?completion_window=immediate",
+                content=_jsonl([_line("r0", "hi")]),
+                headers={"Content-Type": "application/jsonl"},
+            ).json()
+
+            for _ in range(200):
+                batch = client.get(f"/v1/batches/{created['id']}").json()
+                if batch["status"] == "completed":
+                    break
+                time.sleep(0.01)
+            output = client.get(f"/v1/batches/{created['id']}/output")
+
+        assert created["object"] == "batch"
+        assert batch["request_counts"] == {"total": 1, "completed": 1, "failed": 0}
+        assert json.loads(output.text)["custom_id"] == "r0"
+
+    def test_invalid_file_is_400_and_unknown_batch_404(self, tmp_path: Path) -> None:
+        app = FastAPI()
+        app.include_router(batches_router)
+        set_batch_manager(_manager(tmp_path, FakeChatService(FakeRouter())))
+        client = TestClient(app)
+
+        assert client.post("/v1/batches", content=b"not json\n").status_code == 400
+        assert client.get("/v1/batches/batch_" + "0" * 32).status_code == 404
+        assert client.get("/v1/batches/../etc").status_code == 404
+
+    def test_jobs_are_scoped_to_their_api_key(self, tmp_path: Path) -> None:
+        app = FastAPI()
+        app.include_router(batches_router)
+        set_batch_manager(_manager(tmp_path, FakeChatService(FakeRouter())))
+        owner = {"Authorization": "Bearer key-a"}
+        other = {"Authorization": "Bearer key-b"}
+        with TestClient(app) as client:
+            created = client.post(
+                "/v1/batches?completion_window=immediate",
+                content=_jsonl([_line("r0", "secret prompt")]),
+                headers=owner,
+            ).json()
+            batch_url = f"/v1/batches/{created['id']}"
+
+            assert client.get("/v1/batches", headers=other).json()["data"] == []
+            assert client.get(batch_url, headers=other).status_code == 404
+            assert client.get(f"{batch_url}/output", headers=other).status_code == 404
+            assert client.post(f"{batch_url}/cancel", headers=other).status_code == 404
+            assert client.get(batch_url).status_code == 404
+
+            listed = client.get("/v1/batches", headers=owner).json()["data"]
+            assert [job["id"] for job in listed] == [created["id"]]
+            assert client.get(batch_url, headers=owner).status_code == 200
+
+    def test_oversized_upload_is_413(self, tmp_path: Path) -> None:
+        app = FastAPI()
+        app.include_router(batches_router)
+        set_batch_manager(_manager(tmp_path, FakeChatService(FakeRouter()), max_input_bytes=64))
+        client = TestClient(app)
+
+        response = client.post("/v1/batches", content=_jsonl([_line(f"r{i}", "x") for i in range(5)]))
+
+        assert response.status_code == 413
+        assert list(tmp_path.iterdir()) == []
+
+    def test_disabled_is_503(self) -> None:
+        app = FastAPI()
+        app.include_router(batches_router)
+
+        assert TestClient(app).get("/v1/batches").status_code == 503
@@ -0,0 +1,201 @@
+"""
+Tests for CostAggregator - WBS-PERF8 Buffered, Batched Cost Tracking
+
+Reference Documents:
+- GUIDELINES pp. 2309: Cost tracking and token usage
+- GUIDELINES pp. 2153: Redis for external state stores
+
+WBS Items Covered:
+- WBS-PERF8: record() accumulates usage per (day, model, API key)
+- WBS-PERF8: flush() writes all buckets in one pipeline
+- WBS-PERF8: max_pending triggers an early flush
+- WBS-PERF8: stop() flushes buffered usage without cancelling a running flush
+- WBS-PERF8: Failed flushes keep the deltas for the next cycle
+- WBS-PERF8: API keys are hashed before attribution
+"""
+
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+import fakeredis.aioredis
+import pytest
+
+from src.models.responses import Usage
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def fake_redis():
+    """Create a fake Redis client for testing."""
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def cost_tracker(fake_redis):
+    """Create CostTracker with fake Redis."""
+    from src.services.cost_tracker import CostTracker
+
+    return CostTracker(redis_client=fake_redis)
+
+
+@pytest.fixture
+def usage() -> Usage:
+    """Create sample usage data."""
+    return Usage(prompt_tokens=100, completion_tokens=50, total_tokens=150)
+
+
+# =============================================================================
+# WBS-PERF8: CostAggregator
+# =============================================================================
+
+
+class TestCostAggregator:
+    """Tests for CostAggregator buffering and flushing."""
+
+    async def test_record_accumulates_until_flush(self, cost_tracker, usage) -> None:
+        from src.services.cost_aggregator import CostAggregator
+
+        aggregator = CostAggregator(cost_tracker)
+        aggregator.record("gpt-4o", usage, api_key_id="key-a")
+        aggregator.record("gpt-4o", usage, api_key_id="key-a")
+
+        assert (await cost_tracker.get_daily_usage()).request_count == 0
+        assert await aggregator.flush() == 2
+
+        summary = await cost_tracker.get_daily_usage()
+        assert summary.request_count == 2
+        assert summary.total_tokens == 300
+        assert summary.total_cost == pytest.approx(
+            2 * cost_tracker.calculate_cost("gpt-4o", 100, 50)
+        )
+        assert aggregator.pending == 0
+
+    async def test_flush_uses_single_pipeline(self, cost_tracker, fake_redis, usage) -> None:
+        from src.services.cost_aggregator import CostAggregator
+
+        aggregator = CostAggregator(cost_tracker)
+        for model in ("gpt-4o", "gpt-4o-mini", "claude-3-5-sonnet-20241022"):
+            aggregator.record(model, usage, api_key_id="key-a")
+
+        with patch.object(fake_redis, "pipeline", wraps=fake_redis.pipeline) as pipeline:
+            await aggregator.flush()
+
+        assert pipeline.call_count == 1
+        by_model = await cost_tracker.get_usage_by_model()
+        assert set(by_model) == {"gpt-4o", "gpt-4o-mini", "claude-3-5-sonnet-20241022"}
+
+    async def test_usage_is_attributed_per_api_key(self, cost_tracker, fake_redis, usage) -> None:
+        from src.services.cost_aggregator import CostAggregator
+
+        aggregator = CostAggregator(cost_tracker)
+        aggregator.record("gpt-4o", usage, api_key_id="key-a")
+        aggregator.record("gpt-4o", usage, api_key_id="key-b")
+        await aggregator.flush()
+
+        key = f"cost:key:{date.today().isoformat()}:key-a"
+        assert await fake_redis.hget(key, "request_count") == "1"
+
+    async def test_max_pending_triggers_early_flush(self, cost_tracker, usage) -> None:
+        from src.services.cost_aggregator import CostAggregator
+
+        aggregator = CostAggregator(cost_tracker, flush_interval_ms=60_000, max_pending=3)
+        await aggregator.start()
+        try:
+            for _ in range(3):
+                aggregator.record("gpt-4o", usage)
+            for _ in range(50):
+                if aggregator.pending == 0:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await aggregator.stop()
+
+        assert (await cost_tracker.get_daily_usage()).request_count == 3
+
+    async def test_stop_flushes_buffered_usage(self, cost_tracker, usage) -> None:
+        from src.services.cost_aggregator import CostAggregator
+
+        aggregator = CostAggregator(cost_tracker, flush_interval_ms=60_000)
+        await aggregator.start()
+        aggregator.record("gpt-4o", usage)
+
+        await aggregator.stop()
+
+        assert (await cost_tracker.get_daily_usage()).request_count == 1
+
+    async def test_failed_flush_keeps_deltas(self, cost_tracker, usage) -> None:
+        from src.services.cost_aggregator import CostAggregator
+        from src.services.cost_tracker import CostTrackerError
+
+        aggregator = CostAggregator(cost_tracker)
+        aggregator.record("gpt-4o", usage)
+
+        with patch.object(
+            cost_tracker, "record_usage_batch", side_effect=CostTrackerError("redis down")
+        ):
+            assert await aggregator.flush() == 0
+        aggregator.record("gpt-4o", usage)
+
+        assert aggregator.pending == 2
+        assert await aggregator.flush() == 2
+        assert (await cost_tracker.get_daily_usage()).total_tokens == 300
+
+    async def test_cancelled_flush_keeps_deltas(self, cost_tracker, usage) -> None:
+        from src.services.cost_aggregator import CostAggregator
+
+        aggregator = CostAggregator(cost_tracker)
+        aggregator.record("gpt-4o", usage)
+
+        with patch.object(
+            cost_tracker, "record_usage_batch", side_effect=asyncio.CancelledError
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await aggregator.flush()
+
+        assert aggregator.pending == 1
+        assert await aggregator.flush() == 1
+
+    async def test_stop_lets_running_flush_finish(self, cost_tracker, usage) -> None:
+        from src.services.cost_aggregator import CostAggregator
+
+        aggregator = CostAggregator(cost_tracker, flush_interval_ms=60_000, max_pending=1)
+        write = cost_tracker.record_usage_batch
+        started = asyncio.Event()
+
+        async def slow_write(deltas):
+            started.set()
+            await asyncio.sleep(0.05)
+            await write(deltas)
+
+        with patch.object(cost_tracker, "record_usage_batch", side_effect=slow_write):
+            await aggregator.start()
+            aggregator.record("gpt-4o", usage)
+            await started.wait()
+            aggregator.record("gpt-4o", usage)
+            await aggregator.stop()
+
+        assert (await cost_tracker.get_daily_usage()).request_count == 2
+        assert aggregator.pending == 0
+
+
+class TestApiKeyAttribution:
+    """Tests for API key identifiers."""
+
+    def test_bearer_and_x_api_key_are_hashed(self) -> None:
+        from src.services.cost_aggregator import api_key_id_from_headers
+
+        bearer = api_key_id_from_headers({"authorization": "Bearer sk-secret"})
+
+        assert bearer == api_key_id_from_headers({"x-api-key": "sk-secret"})
+        assert "sk-secret" not in bearer
+        assert len(bearer) == 16
+
+    def test_missing_key_is_anonymous(self) -> None:
+        from src.services.cost_aggregator import ANONYMOUS_API_KEY_ID, api_key_id_from_headers
+
+        assert api_key_id_from_headers({}) == ANONYMOUS_API_KEY_ID
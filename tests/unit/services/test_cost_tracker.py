@@ -113,6 +113,21 @@ class TestCostTrackerPricing:
         )
         assert cost > 0
 
+    def test_cache_tokens_priced_at_cache_rates(self, cost_tracker) -> None:
+        """
+        WBS-PERF3: Cached prompt tokens are included in prompt_tokens but
+        priced at 0.1x (read) and 1.25x (write) of the input rate.
+        """
+        # claude-sonnet-4.5: $3/M input; 1M prompt tokens = 0.4M plain, 0.5M read, 0.1M write
+        cost = cost_tracker.calculate_cost(
+            "claude-sonnet-4.5",
+            prompt_tokens=1_000_000,
+            completion_tokens=0,
+            cache_read_tokens=500_000,
+            cache_write_tokens=100_000,
+        )
+        assert cost == pytest.approx(0.4 * 3 + 0.5 * 0.3 + 0.1 * 3.75)
+
     def test_unknown_model_uses_default_pricing(self, cost_tracker) -> None:
         """
         Unknown models use default pricing.
@@ -0,0 +1,151 @@
+"""
+Tests for StreamCoalescer - WBS-PERF1 Adaptive SSE Frame Coalescing
+
+Reference Documents:
+- GUIDELINES p. 2149: Token generation and streaming patterns
+- GUIDELINES p. 2043: Reactive programming patterns (buffer/window operators)
+
+WBS Items Covered:
+- WBS-PERF1: First content delta flushed immediately
+- WBS-PERF1: Adjacent content deltas merged within window / byte limit
+- WBS-PERF1: Role changes, tool_calls and finish_reason chunks act as barriers
+- WBS-PERF1: Window of 0 disables coalescing
+"""
+
+import asyncio
+from typing import AsyncIterator, Optional
+
+from src.models.responses import ChatCompletionChunk, ChunkChoice, ChunkDelta
+
+
+# =============================================================================
+# Test Helpers
+# =============================================================================
+
+
+def _chunk(
+    content: Optional[str] = None,
+    role: Optional[str] = None,
+    finish_reason: Optional[str] = None,
+) -> ChatCompletionChunk:
+    """Build a single-choice chunk."""
+    return ChatCompletionChunk(
+        id="chatcmpl-test",
+        created=1234567890,
+        model="test-model",
+        choices=[
+            ChunkChoice(
+                index=0,
+                delta=ChunkDelta(role=role, content=content),
+                finish_reason=finish_reason,
+            )
+        ],
+    )
+
+
+async def _stream(
+    chunks: list[ChatCompletionChunk], delay: float = 0.0
+) -> AsyncIterator[ChatCompletionChunk]:
+    """Yield chunks with an optional delay between them."""
+    for chunk in chunks:
+        if delay:
+            await asyncio.sleep(delay)
+        yield chunk
+
+
+async def _collect(stream: AsyncIterator[ChatCompletionChunk]) -> list[ChatCompletionChunk]:
+    return [chunk async for chunk in stream]
+
+
+def _contents(chunks: list[ChatCompletionChunk]) -> list[Optional[str]]:
+    return [c.choices[0].delta.content for c in chunks]
+
+
+# =============================================================================
+# WBS-PERF1: StreamCoalescer Tests
+# =============================================================================
+
+
+class TestStreamCoalescer:
+    """Tests for StreamCoalescer.coalesce()."""
+
+    async def test_disabled_window_passes_chunks_through(self) -> None:
+        """Window of 0 forwards every chunk unchanged."""
+        from src.services.streaming import StreamCoalescer
+
+        chunks = [_chunk(role="assistant"), _chunk("a"), _chunk("b"), _chunk(finish_reason="stop")]
+        coalescer = StreamCoalescer(window_ms=0)
+
+        result = await _collect(coalescer.coalesce(_stream(chunks)))
+
+        assert not coalescer.enabled
+        assert result == chunks
+
+    async def test_first_content_delta_flushed_alone(self) -> None:
+        """First token is never delayed by the window."""
+        from src.services.streaming import StreamCoalescer
+
+        chunks = [_chunk(role="assistant"), _chunk("Hello"), _chunk(" big"), _chunk(" world")]
+        coalescer = StreamCoalescer(window_ms=1000)
+
+        result = await _collect(coalescer.coalesce(_stream(chunks)))
+
+        assert _contents(result) == [None, "Hello", " big world"]
+
+    async def test_finish_reason_is_a_barrier(self) -> None:
+        """Buffered content is flushed before the finish chunk."""
+        from src.services.streaming import StreamCoalescer
+
+        chunks = [_chunk("a"), _chunk("b"), _chunk("c"), _chunk(finish_reason="stop")]
+        coalescer = StreamCoalescer(window_ms=1000)
+
+        result = await _collect(coalescer.coalesce(_stream(chunks)))
+
+        assert _contents(result) == ["a", "bc", None]
+        assert result[-1].choices[0].finish_reason == "stop"
+
+    async def test_repeated_assistant_role_is_merged(self) -> None:
+        """Deltas that all carry role='assistant' (Anthropic) still merge."""
+        from src.services.streaming import StreamCoalescer
+
+        chunks = [_chunk("a", role="assistant"), _chunk("b", role="assistant"), _chunk("c", role="assistant")]
+        coalescer = StreamCoalescer(window_ms=1000)
+
+        result = await _collect(coalescer.coalesce(_stream(chunks)))
+
+        assert _contents(result) == ["a", "bc"]
+        assert result[1].choices[0].delta.role == "assistant"
+
+    async def test_max_bytes_forces_flush(self) -> None:
+        """Buffer is flushed as soon as it reaches max_bytes."""
+        from src.services.streaming import StreamCoalescer
+
+        chunks = [_chunk("x"), _chunk("aa"), _chunk("bb"), _chunk("cc")]
+        coalescer = StreamCoalescer(window_ms=1000, max_bytes=4)
+
+        result = await _collect(coalescer.coalesce(_stream(chunks)))
+
+        assert _contents(result) == ["x", "aabb", "cc"]
+
+    async def test_window_elapses_while_upstream_is_slow(self) -> None:
+        """A stalled upstream does not hold buffered content past the window."""
+        from src.services.streaming import StreamCoalescer
+
+        chunks = [_chunk("a"), _chunk("b"), _chunk("c")]
+        coalescer = StreamCoalescer(window_ms=10)
+
+        result = await _collect(coalescer.coalesce(_stream(chunks, delay=0.05)))
+
+        assert _contents(result) == ["a", "b", "c"]
+
+    async def test_merged_chunk_preserves_identity(self) -> None:
+        """Merged chunks keep the stream id and model."""
+        from src.services.streaming import StreamCoalescer
+
+        chunks = [_chunk("a"), _chunk("b"), _chunk("c")]
+        coalescer = StreamCoalescer(window_ms=1000)
+
+        result = await _collect(coalescer.coalesce(_stream(chunks)))
+
+        assert {c.id for c in result} == {"chatcmpl-test"}
+        assert {c.model for c in result} == {"test-model"}
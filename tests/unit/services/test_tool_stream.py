@@ -0,0 +1,281 @@
+"""
+Tests for eager tool dispatch while streaming - WBS-PERF20
+
+Tool calls are detected as soon as their streamed arguments close and are
+executed while the model is still generating the rest of the turn; the
+follow-up turn is streamed on the same response.
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.models.domain import RegisteredTool, ToolDefinition
+from src.models.requests import ChatCompletionRequest, FunctionDefinition, Message, Tool
+from src.models.responses import ChatCompletionChunk, ChunkChoice, ChunkDelta
+from src.services.chat import ChatService
+from src.services.tool_stream import JsonObjectScanner, ToolCallStreamAssembler
+from src.tools.executor import ToolExecutor
+from src.tools.registry import ToolRegistry
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _chunk(
+    content: str | None = None,
+    tool_calls: list[dict[str, Any]] | None = None,
+    finish_reason: str | None = None,
+) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id="chatcmpl-1",
+        created=0,
+        model="test-model",
+        choices=[
+            ChunkChoice(
+                index=0,
+                delta=ChunkDelta(content=content, tool_calls=tool_calls),
+                finish_reason=finish_reason,
+            )
+        ],
+    )
+
+
+def _delta(index: int, arguments: str, call_id: str = "", name: str = "") -> dict[str, Any]:
+    delta: dict[str, Any] = {"index": index, "function": {"arguments": arguments}}
+    if call_id:
+        delta["id"] = call_id
+        delta["type"] = "function"
+        delta["function"]["name"] = name
+    return delta
+
+
+class ScriptedProvider:
+    """Streams one scripted turn per call, recording when each chunk is sent."""
+
+    def __init__(self, turns: list[list[ChatCompletionChunk]], delay: float = 0.0) -> None:
+        self.turns = turns
+        self.delay = delay
+        self.requests: list[ChatCompletionRequest] = []
+        self.turn_ended: list[float] = []
+
+    async def stream(self, request: ChatCompletionRequest) -> AsyncIterator[ChatCompletionChunk]:
+        self.requests.append(request)
+        for chunk in self.turns[len(self.requests) - 1]:
+            await asyncio.sleep(self.delay)
+            yield chunk
+        self.turn_ended.append(time.perf_counter())
+
+
+def _service(provider: ScriptedProvider, registry: ToolRegistry) -> ChatService:
+    route = MagicMock(model="test-model", provider="fake", context_limit=8192)
+    router = MagicMock()
+    router.resolve.return_value = route
+    router.provider_for.return_value = provider
+    return ChatService(router=router, executor=ToolExecutor(registry))
+
+
+def _registry(started: list[float]) -> ToolRegistry:
+    async def lookup(arguments: dict[str, Any]) -> str:
+        started.append(time.perf_counter())
+        return f"result for {arguments['q']}"
+
+    registry = ToolRegistry()
+    registry.register(
+        "lookup",
+        RegisteredTool(
+            definition=ToolDefinition(
+                name="lookup",
+                parameters={"type": "object", "properties": {"q": {"type": "string"}}},
+            ),
+            handler=lookup,
+        ),
+    )
+    return registry
+
+
+def _request() -> ChatCompletionRequest:
+    return ChatCompletionRequest(
+        model="test-model", messages=[Message(role="user", content="hi")], stream=True
+    )
+
+
+# =============================================================================
+# Incremental Parsing
+# =============================================================================
+
+
+class TestIncrementalParsing:
+    """Scanner and assembler detect completion as text arrives."""
+
+    def test_scanner_tracks_strings_and_escapes(self) -> None:
+        scanner = JsonObjectScanner()
+
+        assert scanner.feed('{"q": "a}\\"') is False
+        assert scanner.feed(' {b}", "n": [1, {"x": 2}]') is False
+        assert scanner.feed("}") is True
+
+    def test_assembler_reports_each_call_when_its_arguments_close(self) -> None:
+        completed: list[str] = []
+        assembler = ToolCallStreamAssembler(on_complete=lambda call: completed.append(call.id))
+
+        assembler.feed(_chunk(tool_calls=[_delta(0, '{"q": ', "c0", "lookup")]))
+        assert completed == []
+        assembler.feed(_chunk(tool_calls=[_delta(0, '"x"}')]))
+        assert completed == ["c0"]
+        assembler.feed(_chunk(tool_calls=[_delta(1, '{"q": "y"', "c1", "lookup")]))
+        assembler.feed(_chunk(finish_reason="tool_calls"))
+        calls = assembler.finish()
+
+        assert completed == ["c0"]
+        assert [call.parsed for call in calls] == [{"q": "x"}, None]
+        assert calls[1].to_message_dict()["function"]["arguments"] == '{"q": "y"'
+        assert assembler.finish_reason == "tool_calls"
+
+    def test_non_object_arguments_complete_when_next_call_starts(self) -> None:
+        completed: list[str] = []
+        assembler = ToolCallStreamAssembler(on_complete=lambda call: completed.append(call.name))
+
+        assembler.feed(_chunk(tool_calls=[_delta(0, "", "c0", "first")]))
+        assembler.feed(_chunk(tool_calls=[_delta(1, "{}", "c1", "second")]))
+
+        assert completed == ["first", "second"]
+
+
+# =============================================================================
+# Streaming Tool Loop
+# =============================================================================
+
+
+class TestStreamingToolLoop:
+    """ChatService.stream_completion executes tools during the stream."""
+
+    @pytest.fixture(autouse=True)
+    def tool_loop_enabled(self, monkeypatch) -> MagicMock:
+        settings = MagicMock(stream_tool_loop_enabled=True)
+        monkeypatch.setattr("src.core.config.get_settings", lambda: settings)
+        return settings
+
+    async def test_tool_starts_before_turn_ends_and_follow_up_is_streamed(self) -> None:
+        started: list[float] = []
+        provider = ScriptedProvider(
+            [
+                [
+                    _chunk(tool_calls=[_delta(0, '{"q": "a"}', "c0", "lookup")]),
+                    _chunk(content="still generating"),
+                    _chunk(content="..."),
+                    _chunk(finish_reason="tool_calls"),
+                ],
+                [_chunk(content="done"), _chunk(finish_reason="stop")],
+            ],
+            delay=0.01,
+        )
+        service = _service(provider, _registry(started))
+
+        chunks = [chunk async for chunk in service.stream_completion(_request())]
+
+        assert started[0] < provider.turn_ended[0]
+        assert chunks[-2].choices[0].delta.content == "done"
+        assert chunks[-1].choices[0].finish_reason == "stop"
+        follow_up = provider.requests[1].messages
+        assert follow_up[-2].role == "assistant"
+        assert follow_up[-2].tool_calls[0]["function"]["arguments"] == '{"q": "a"}'
+        assert follow_up[-1].role == "tool"
+        assert follow_up[-1].content == "result for a"
+        assert follow_up[-1].tool_call_id == "c0"
+
+    async def test_gateway_tool_turn_is_hidden_from_client(self) -> None:
+        provider = ScriptedProvider(
+            [
+                [
+                    _chunk(tool_calls=[_delta(0, '{"q": "a"}', "c0", "lookup")]),
+                    _chunk(finish_reason="tool_calls"),
+                ],
+                [_chunk(content="done"), _chunk(finish_reason="stop")],
+            ]
+        )
+        service = _service(provider, _registry([]))
+
+        chunks = [chunk async for chunk in service.stream_completion(_request())]
+
+        assert not any(chunk.choices[0].delta.tool_calls for chunk in chunks)
+        assert [chunk.choices[0].finish_reason for chunk in chunks] == [None, "stop"]
+
+    async def test_unknown_tool_ends_stream_for_client(self) -> None:
+        started: list[float] = []
+        provider = ScriptedProvider(
+            [
+                [
+                    _chunk(tool_calls=[_delta(0, '{"q": "a"}', "c0", "lookup")]),
+                    _chunk(tool_calls=[_delta(1, "{}", "c1", "client_side")]),
+                    _chunk(finish_reason="tool_calls"),
+                ]
+            ]
+        )
+        service = _service(provider, _registry(started))
+
+        chunks = [chunk async for chunk in service.stream_completion(_request())]
+
+        assert [chunk.choices[0].delta.tool_calls[0]["id"] for chunk in chunks[:2]] == ["c0", "c1"]
+        assert chunks[-1].choices[0].finish_reason == "tool_calls"
+        assert len(provider.requests) == 1
+
+    async def test_client_declared_tools_disable_eager_dispatch(self) -> None:
+        started: list[float] = []
+        provider = ScriptedProvider(
+            [
+                [
+                    _chunk(tool_calls=[_delta(0, '{"q": "a"}', "c0", "lookup")]),
+                    _chunk(tool_calls=[_delta(1, "{}", "c1", "client_side")]),
+                    _chunk(finish_reason="tool_calls"),
+                ]
+            ]
+        )
+        service = _service(provider, _registry(started))
+        request = _request().model_copy(
+            update={
+                "tools": [
+                    Tool(function=FunctionDefinition(name=name)) for name in ("lookup", "client_side")
+                ]
+            }
+        )
+
+        _ = [chunk async for chunk in service.stream_completion(request)]
+
+        assert started == []
+
+    async def test_disabled_loop_forwards_only(self, tool_loop_enabled) -> None:
+        tool_loop_enabled.stream_tool_loop_enabled = False
+        started: list[float] = []
+        provider = ScriptedProvider(
+            [
+                [
+                    _chunk(tool_calls=[_delta(0, '{"q": "a"}', "c0", "lookup")]),
+                    _chunk(finish_reason="tool_calls"),
+                ]
+            ]
+        )
+        service = _service(provider, _registry(started))
+
+        chunks = [chunk async for chunk in service.stream_completion(_request())]
+
+        assert len(chunks) == 2
+        assert started == []
+
+    async def test_iteration_limit(self) -> None:
+        turn = [
+            _chunk(tool_calls=[_delta(0, '{"q": "a"}', "c0", "lookup")]),
+            _chunk(finish_reason="tool_calls"),
+        ]
+        provider = ScriptedProvider([turn, turn, turn])
+        service = _service(provider, _registry([]))
+        service._max_tool_iterations = 1
+
+        _ = [chunk async for chunk in service.stream_completion(_request())]
+
+        assert len(provider.requests) == 2
@@ -0,0 +1,152 @@
+"""
+Tests for UsageRollupStore - WBS-PERF9 Time-Bucketed Usage Analytics
+
+Reference Documents:
+- GUIDELINES pp. 2309: Cost tracking and token usage
+- GUIDELINES pp. 2153: Redis for external state stores
+
+WBS Items Covered:
+- WBS-PERF9: write_batch() downsamples minute deltas into every granularity
+- WBS-PERF9: Bucket hashes expire per granularity retention
+- WBS-PERF9: query() groups by dimension from pre-aggregated buckets
+- WBS-PERF9: Granularity is chosen to fit range and retention
+- WBS-PERF9: CostAggregator feeds rollups on flush
+"""
+
+import datetime as dt
+
+import fakeredis.aioredis
+import pytest
+
+from src.models.responses import Usage
+from src.services.cost_tracker import UsageSummary
+
+
+# 2026-01-05 10:00:00 UTC
+T0 = int(dt.datetime(2026, 1, 5, 10, 0, tzinfo=dt.timezone.utc).timestamp())
+
+
+def _utc(epoch: int) -> dt.datetime:
+    return dt.datetime.fromtimestamp(epoch, dt.timezone.utc)
+
+
+def _delta(tokens: int, cost: float = 0.5) -> UsageSummary:
+    return UsageSummary(
+        prompt_tokens=tokens,
+        completion_tokens=0,
+        total_tokens=tokens,
+        total_cost=cost,
+        request_count=1,
+    )
+
+
+@pytest.fixture
+def fake_redis():
+    """Create a fake Redis client for testing."""
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def store(fake_redis):
+    from src.services.usage_rollup import UsageRollupStore
+
+    return UsageRollupStore(fake_redis)
+
+
+@pytest.fixture
+async def populated(store):
+    from src.services.usage_rollup import RollupPoint
+
+    await store.write_batch(
+        {
+            RollupPoint(T0, "model", "gpt-4o"): _delta(100),
+            RollupPoint(T0 + 60, "model", "gpt-4o"): _delta(50),
+            RollupPoint(T0 + 3600, "model", "claude-opus-4.5"): _delta(10),
+            RollupPoint(T0, "provider", "openai"): _delta(100),
+        }
+    )
+    return store
+
+
+# =============================================================================
+# WBS-PERF9: UsageRollupStore
+# =============================================================================
+
+
+class TestUsageRollupStore:
+    """Tests for rollup writes and queries."""
+
+    async def test_query_by_minute(self, populated) -> None:
+        result = await populated.query(
+            "model", _utc(T0), _utc(T0 + 120), granularity="minute"
+        )
+
+        assert [b.start for b in result.buckets] == [_utc(T0), _utc(T0 + 60)]
+        assert result.totals["gpt-4o"].total_tokens == 150
+        assert result.totals["gpt-4o"].request_count == 2
+        assert "openai" not in result.totals
+
+    async def test_hour_and_day_buckets_are_downsampled(self, populated) -> None:
+        hourly = await populated.query("model", _utc(T0), _utc(T0 + 3600), granularity="hour")
+        daily = await populated.query("model", _utc(T0), _utc(T0), granularity="day")
+
+        assert hourly.buckets[0].groups["gpt-4o"].total_tokens == 150
+        assert hourly.buckets[1].groups["claude-opus-4.5"].total_tokens == 10
+        assert daily.totals["gpt-4o"].total_cost == pytest.approx(1.0)
+        assert daily.totals["claude-opus-4.5"].request_count == 1
+
+    async def test_group_by_provider(self, populated) -> None:
+        result = await populated.query("provider", _utc(T0), _utc(T0 + 60), granularity="minute")
+
+        assert set(result.totals) == {"openai"}
+
+    async def test_bucket_keys_expire_per_granularity(self, populated, fake_redis) -> None:
+        minute_ttl = await fake_redis.ttl(f"usage:minute:{T0}")
+        day_ttl = await fake_redis.ttl(f"usage:day:{T0 - T0 % 86400}")
+
+        assert 0 < minute_ttl <= 48 * 3600
+        assert 31 * 86400 < day_ttl <= 400 * 86400
+
+    async def test_granularity_auto_selection(self, store) -> None:
+        now = dt.datetime.now(dt.timezone.utc)
+
+        recent = await store.query("model", now - dt.timedelta(hours=1), now)
+        month = await store.query("model", now - dt.timedelta(days=30), now)
+        year = await store.query("model", now - dt.timedelta(days=365), now)
+
+        assert recent.granularity == "minute"
+        assert month.granularity == "hour"
+        assert year.granularity == "day"
+
+    async def test_invalid_queries_are_rejected(self, store) -> None:
+        from src.services.usage_rollup import UsageQueryError
+
+        with pytest.raises(UsageQueryError):
+            await store.query("region", _utc(T0), _utc(T0 + 60))
+        with pytest.raises(UsageQueryError):
+            await store.query("model", _utc(T0), _utc(T0 + 86400 * 30), granularity="minute")
+
+
+class TestCostAggregatorRollups:
+    """Tests for CostAggregator writing rollups."""
+
+    async def test_flush_writes_rollups_per_dimension(self, store, fake_redis) -> None:
+        from src.services.cost_aggregator import CostAggregator, hash_identifier
+        from src.services.cost_tracker import CostTracker
+
+        aggregator = CostAggregator(CostTracker(redis_client=fake_redis), rollup=store)
+        usage = Usage(prompt_tokens=100, completion_tokens=50, total_tokens=150)
+        aggregator.record("gpt-4o", usage, api_key_id="key-a", provider="openai", session_id="s1")
+        aggregator.record("gpt-4o", usage, api_key_id="key-b", provider="openai")
+        await aggregator.flush()
+
+        now = dt.datetime.now(dt.timezone.utc)
+        start = now - dt.timedelta(minutes=5)
+        by_key = await store.query("api_key", start, now)
+        by_session = await store.query("session", start, now)
+        by_provider = await store.query("provider", start, now)
+
+        assert set(by_key.totals) == {"key-a", "key-b"}
+        # Session ids are stored hashed, like API keys
+        assert set(by_session.totals) == {hash_identifier("s1")}
+        assert by_provider.totals["openai"].total_tokens == 300
@@ -0,0 +1,202 @@
+"""
+Tests for per-downstream tool bulkheads - WBS-PERF19
+
+ToolBulkhead limits concurrent tool calls per downstream service, queues
+the rest FIFO with a wait timeout, and publishes in-flight/queued gauges.
+ToolExecutor runs every non-cached handler inside its tool's compartment.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+import pytest
+
+from src.models.domain import RegisteredTool, ToolCall, ToolDefinition
+from src.observability.metrics import TOOL_CALLS_IN_FLIGHT, TOOL_CALLS_QUEUED
+from src.tools.bulkhead import (
+    BulkheadFullError,
+    ToolBulkhead,
+    get_tool_bulkhead,
+    reset_tool_bulkhead,
+    set_tool_bulkhead,
+)
+from src.tools.executor import ToolExecutor
+from src.tools.registry import ToolRegistry
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class Probe:
+    """Handler that records peak concurrency and can be held open."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.release = asyncio.Event()
+
+    async def handle(self, arguments: dict[str, Any]) -> str:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await self.release.wait()
+        finally:
+            self.active -= 1
+        return "ok"
+
+
+def _register(registry: ToolRegistry, name: str, downstream: Optional[str], probe: Probe) -> None:
+    registry.register(
+        name,
+        RegisteredTool(
+            definition=ToolDefinition(
+                name=name,
+                parameters={"type": "object"},
+                downstream=downstream,
+            ),
+            handler=probe.handle,
+        ),
+    )
+
+
+def _gauge(gauge: Any, service: str) -> float:
+    return gauge.labels(service=service)._value.get()
+
+
+@pytest.fixture(autouse=True)
+def _reset_bulkhead():
+    reset_tool_bulkhead()
+    yield
+    reset_tool_bulkhead()
+
+
+# =============================================================================
+# ToolBulkhead
+# =============================================================================
+
+
+class TestToolBulkhead:
+    """Slot accounting, FIFO hand-off and queue timeout."""
+
+    async def test_limits_per_service_and_publishes_gauges(self) -> None:
+        bulkhead = ToolBulkhead(default_limit=2, limits={"svc-b": 1})
+        entered: list[str] = []
+        gate = asyncio.Event()
+
+        async def call(service: str, tag: str) -> None:
+            async with bulkhead.acquire(service):
+                entered.append(tag)
+                await gate.wait()
+
+        tasks = [asyncio.create_task(call("svc-a", f"a{i}")) for i in range(3)]
+        tasks.append(asyncio.create_task(call("svc-b", "b0")))
+        await asyncio.sleep(0)
+
+        assert sorted(entered) == ["a0", "a1", "b0"]
+        assert bulkhead.snapshot()["svc-a"] == {"limit": 2, "in_flight": 2, "queued": 1}
+        assert bulkhead.snapshot()["svc-b"]["limit"] == 1
+        assert _gauge(TOOL_CALLS_IN_FLIGHT, "svc-a") == 2
+        assert _gauge(TOOL_CALLS_QUEUED, "svc-a") == 1
+
+        gate.set()
+        await asyncio.gather(*tasks)
+
+        assert entered[-1] == "a2"
+        assert bulkhead.snapshot()["svc-a"] == {"limit": 2, "in_flight": 0, "queued": 0}
+        assert _gauge(TOOL_CALLS_QUEUED, "svc-a") == 0
+
+    async def test_queue_timeout_rejects(self) -> None:
+        bulkhead = ToolBulkhead(default_limit=1, queue_timeout_seconds=0.02)
+        gate = asyncio.Event()
+
+        async def hold() -> None:
+            async with bulkhead.acquire("svc"):
+                await gate.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        with pytest.raises(BulkheadFullError) as excinfo:
+            async with bulkhead.acquire("svc"):
+                pass
+
+        assert excinfo.value.service == "svc"
+        assert bulkhead.snapshot()["svc"]["queued"] == 0
+        gate.set()
+        await holder
+        assert bulkhead.snapshot()["svc"]["in_flight"] == 0
+
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        bulkhead = ToolBulkhead(default_limit=1, queue_timeout_seconds=None)
+        gate = asyncio.Event()
+
+        async def hold() -> None:
+            async with bulkhead.acquire("svc"):
+                await gate.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        gate.set()
+        await holder
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert bulkhead.snapshot()["svc"] == {"limit": 1, "in_flight": 0, "queued": 0}
+
+
+# =============================================================================
+# ToolExecutor Integration
+# =============================================================================
+
+
+class TestExecutorBulkhead:
+    """execute_batch is bounded per downstream service."""
+
+    async def test_batch_limited_per_downstream(self) -> None:
+        registry = ToolRegistry()
+        search, agents = Probe(), Probe()
+        _register(registry, "search", "semantic-search", search)
+        _register(registry, "review", "ai-agents", agents)
+        set_tool_bulkhead(ToolBulkhead(default_limit=2))
+        executor = ToolExecutor(registry)
+
+        calls = [ToolCall(id=f"s{i}", name="search", arguments={}) for i in range(6)]
+        calls.append(ToolCall(id="r0", name="review", arguments={}))
+        batch = asyncio.create_task(executor.execute_batch(calls))
+        await asyncio.sleep(0.01)
+
+        assert search.active == 2
+        assert agents.active == 1
+        assert get_tool_bulkhead().snapshot()["semantic-search"]["queued"] == 4
+
+        search.release.set()
+        agents.release.set()
+        results = await batch
+
+        assert [r.is_error for r in results] == [False] * 7
+        assert search.peak == 2
+
+    async def test_rejected_call_returns_error_result(self) -> None:
+        registry = ToolRegistry()
+        probe = Probe()
+        _register(registry, "search", "semantic-search", probe)
+        executor = ToolExecutor(
+            registry, bulkhead=ToolBulkhead(default_limit=1, queue_timeout_seconds=0.02)
+        )
+
+        first = asyncio.create_task(
+            executor.execute(ToolCall(id="a", name="search", arguments={}))
+        )
+        await asyncio.sleep(0)
+        rejected = await executor.execute(ToolCall(id="b", name="search", arguments={}))
+        probe.release.set()
+
+        assert rejected.is_error is True
+        assert "Tool execution rejected" in rejected.content
+        assert "semantic-search" in rejected.content
+        assert (await first).is_error is False
@@ -0,0 +1,257 @@
+"""
+Tests for the tool result cache - WBS-PERF15
+
+Covers argument canonicalization, in-process and Redis tiers, TTL expiry,
+single-flight coalescing of concurrent identical calls, and executor
+integration for tools marked cacheable.
+"""
+
+import asyncio
+
+import fakeredis.aioredis
+
+from src.models.domain import RegisteredTool, ToolCall, ToolDefinition, ToolResult
+from src.tools.builtin import SEARCH_CORPUS_DEFINITION
+from src.tools.executor import ToolExecutor
+from src.tools.registry import ToolRegistry
+from src.tools.result_cache import (
+    ToolResultCache,
+    canonicalize_arguments,
+    make_cache_key,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string"},
+        "top_k": {"type": "integer", "default": 10},
+    },
+    "required": ["query"],
+}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingHandler:
+    """Async tool handler that counts calls and can be held open."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def handle(self, args: dict) -> str:
+        self.calls += 1
+        await self.release.wait()
+        return f"results for {args['query']}"
+
+
+def _call(call_id: str, **arguments) -> ToolCall:
+    return ToolCall(id=call_id, name="search", arguments=arguments)
+
+
+def _executor(handler, cacheable: bool = True, cache=None) -> ToolExecutor:
+    registry = ToolRegistry()
+    registry.register(
+        "search",
+        RegisteredTool(
+            definition=ToolDefinition(
+                name="search",
+                parameters=PARAMETERS,
+                cacheable=cacheable,
+                cache_ttl_seconds=60.0,
+            ),
+            handler=getattr(handler, "handle", handler),
+        ),
+    )
+    return ToolExecutor(registry=registry, result_cache=cache or ToolResultCache())
+
+
+# =============================================================================
+# Key Canonicalization
+# =============================================================================
+
+
+class TestCacheKey:
+    """Equivalent arguments map to the same key."""
+
+    def test_key_order_and_defaults_do_not_matter(self) -> None:
+        a = make_cache_key("search", {"query": "x", "top_k": 10}, PARAMETERS)
+        b = make_cache_key("search", {"top_k": 10, "query": "x"}, PARAMETERS)
+        c = make_cache_key("search", {"query": "x"}, PARAMETERS)
+        assert a == b == c
+
+    def test_different_arguments_and_tools_differ(self) -> None:
+        assert make_cache_key("search", {"query": "x"}) != make_cache_key(
+            "search", {"query": "y"}
+        )
+        assert make_cache_key("search", {"query": "x"}) != make_cache_key(
+            "other", {"query": "x"}
+        )
+        assert canonicalize_arguments({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+
+
+# =============================================================================
+# Executor Integration
+# =============================================================================
+
+
+class TestExecutorCaching:
+    """ToolExecutor consults the cache for cacheable tools only."""
+
+    async def test_repeat_call_served_from_cache(self) -> None:
+        handler = CountingHandler()
+        executor = _executor(handler)
+
+        first = await executor.execute(_call("call_1", query="python"))
+        second = await executor.execute(_call("call_2", query="python", top_k=10))
+
+        assert handler.calls == 1
+        assert second.content == first.content
+        assert second.tool_call_id == "call_2"
+        assert second.is_error is False
+
+    async def test_non_cacheable_tool_always_runs(self) -> None:
+        handler = CountingHandler()
+        executor = _executor(handler, cacheable=False)
+
+        await executor.execute(_call("call_1", query="python"))
+        await executor.execute(_call("call_2", query="python"))
+
+        assert handler.calls == 2
+
+    async def test_errors_are_not_cached(self) -> None:
+        calls = []
+
+        async def failing(args: dict) -> str:
+            calls.append(args)
+            raise RuntimeError("downstream unavailable")
+
+        executor = _executor(failing)
+        first = await executor.execute(_call("call_1", query="python"))
+        await executor.execute(_call("call_2", query="python"))
+
+        assert first.is_error is True
+        assert len(calls) == 2
+
+    async def test_concurrent_identical_calls_are_coalesced(self) -> None:
+        handler = CountingHandler()
+        handler.release.clear()
+        executor = _executor(handler)
+
+        tasks = [
+            asyncio.ensure_future(executor.execute(_call(f"call_{i}", query="python")))
+            for i in range(5)
+        ]
+        await asyncio.sleep(0)
+        handler.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert handler.calls == 1
+        assert [r.tool_call_id for r in results] == [f"call_{i}" for i in range(5)]
+        assert len({r.content for r in results}) == 1
+
+    async def test_cancelled_caller_does_not_cancel_shared_load(self) -> None:
+        handler = CountingHandler()
+        handler.release.clear()
+        executor = _executor(handler)
+
+        leader = asyncio.ensure_future(executor.execute(_call("call_1", query="python")))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(executor.execute(_call("call_2", query="python")))
+        await asyncio.sleep(0)
+        leader.cancel()
+        handler.release.set()
+
+        result = await follower
+        assert result.content == "results for python"
+        assert handler.calls == 1
+
+
+# =============================================================================
+# Tiers and Expiry
+# =============================================================================
+
+
+class TestCacheTiers:
+    """In-process expiry and the shared Redis tier."""
+
+    async def test_entry_expires_after_ttl(self) -> None:
+        clock = FakeClock()
+        cache = ToolResultCache(clock=clock)
+        loads = []
+
+        async def loader() -> tuple[ToolResult, str]:
+            loads.append(1)
+            return ToolResult(tool_call_id="call_1", content="value"), "success"
+
+        call = _call("call_1", query="x")
+        await cache.get_or_load(call, loader, ttl_seconds=30.0)
+        clock.now += 29.0
+        _, status = await cache.get_or_load(call, loader, ttl_seconds=30.0)
+        assert status == "cache_hit"
+
+        clock.now += 2.0
+        await cache.get_or_load(call, loader, ttl_seconds=30.0)
+        assert len(loads) == 2
+
+    async def test_redis_shared_between_instances(self) -> None:
+        redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        loads = []
+
+        async def loader() -> tuple[ToolResult, str]:
+            loads.append(1)
+            return ToolResult(tool_call_id="call_1", content="shared"), "success"
+
+        replica_a = ToolResultCache(redis_client=redis)
+        replica_b = ToolResultCache(redis_client=redis)
+
+        await replica_a.get_or_load(_call("call_1", query="x"), loader, ttl_seconds=30.0)
+        result, status = await replica_b.get_or_load(
+            _call("call_2", query="x"), loader, ttl_seconds=30.0
+        )
+
+        assert len(loads) == 1
+        assert status == "cache_hit"
+        assert result.content == "shared"
+        assert result.tool_call_id == "call_2"
+        assert 0 < await redis.pttl(make_cache_key("search", {"query": "x"})) <= 30000
+
+    async def test_redis_errors_fall_back_to_loader(self) -> None:
+        class BrokenRedis:
+            async def get(self, key):
+                raise ConnectionError("redis down")
+
+            async def set(self, key, value, px=None):
+                raise ConnectionError("redis down")
+
+        async def loader() -> tuple[ToolResult, str]:
+            return ToolResult(tool_call_id="call_1", content="value"), "success"
+
+        cache = ToolResultCache(redis_client=BrokenRedis())
+        result, status = await cache.get_or_load(_call("call_1", query="x"), loader)
+
+        assert status == "success"
+        assert result.content == "value"
+
+
+class TestBuiltinDefinitions:
+    """Read-only builtin tools declare cacheability."""
+
+    def test_search_corpus_is_cacheable(self) -> None:
+        assert SEARCH_CORPUS_DEFINITION.cacheable is True
+        assert SEARCH_CORPUS_DEFINITION.cache_ttl_seconds == 300.0
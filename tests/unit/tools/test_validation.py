@@ -0,0 +1,174 @@
+"""
+Tests for compiled tool argument validation - WBS-PERF18
+
+ArgumentValidator compiles a parameter schema once; RegisteredTool caches
+it at registration and both ToolExecutor and ToolExecutorService use it.
+"""
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from src.api.routes.tools import ToolExecutorService
+from src.models.domain import RegisteredTool, ToolCall, ToolDefinition
+from src.models.tools import ToolDefinition as ApiToolDefinition
+from src.tools.executor import ToolExecutor, ToolValidationError
+from src.tools.registry import ToolRegistry
+from src.tools.validation import ArgumentValidator, SchemaValidationError
+
+
+SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "minLength": 1},
+        "top_k": {"type": "integer", "minimum": 1, "maximum": 50},
+        "mode": {"type": "string", "enum": ["fast", "deep"]},
+        "filters": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"field": {"type": "string"}, "weight": {"type": "number"}},
+                "required": ["field"],
+            },
+        },
+    },
+    "required": ["query"],
+}
+
+
+def _error(arguments: Any, reject_unknown: bool = False) -> SchemaValidationError:
+    with pytest.raises(SchemaValidationError) as excinfo:
+        ArgumentValidator(SCHEMA, reject_unknown=reject_unknown).validate(arguments)
+    return excinfo.value
+
+
+# =============================================================================
+# ArgumentValidator
+# =============================================================================
+
+
+class TestArgumentValidator:
+    """Keyword coverage and error messages."""
+
+    def test_valid_arguments_pass(self) -> None:
+        validator = ArgumentValidator(SCHEMA)
+
+        validator.validate(
+            {"query": "q", "top_k": 5, "mode": "deep", "filters": [{"field": "a", "weight": 1}]}
+        )
+        assert validator.is_valid({"query": "q", "extra": True})
+
+    def test_missing_required(self) -> None:
+        error = _error({"top_k": 3})
+
+        assert str(error) == "Missing required argument: query"
+        assert error.field == "query"
+
+    def test_type_mismatch_reports_path(self) -> None:
+        error = _error({"query": "q", "filters": [{"field": "a"}, {"field": "b", "weight": "x"}]})
+
+        assert str(error) == "Invalid type for 'filters[1].weight': expected number, got str"
+        assert error.field == "filters[1].weight"
+
+    def test_nested_required(self) -> None:
+        assert _error({"query": "q", "filters": [{}]}).field == "filters[0].field"
+
+    def test_bool_is_not_integer(self) -> None:
+        assert "expected integer, got bool" in str(_error({"query": "q", "top_k": True}))
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [{"query": ""}, {"query": "q", "top_k": 0}, {"query": "q", "top_k": 51}],
+    )
+    def test_bounds(self, arguments: dict[str, Any]) -> None:
+        assert str(_error(arguments)).startswith("Invalid value for ")
+
+    def test_enum(self) -> None:
+        assert "must be one of ['fast', 'deep']" in str(_error({"query": "q", "mode": "slow"}))
+
+    def test_reject_unknown_is_top_level_only(self) -> None:
+        assert str(_error({"query": "q", "extra": 1}, reject_unknown=True)) == (
+            "Unknown argument: extra"
+        )
+        ArgumentValidator(SCHEMA, reject_unknown=True).validate(
+            {"query": "q", "filters": [{"field": "a", "note": "kept"}]}
+        )
+
+    def test_additional_properties_false_applies_when_nested(self) -> None:
+        validator = ArgumentValidator(
+            {
+                "type": "object",
+                "properties": {
+                    "config": {
+                        "type": "object",
+                        "properties": {"a": {"type": "string"}},
+                        "additionalProperties": False,
+                    }
+                },
+            }
+        )
+
+        with pytest.raises(SchemaValidationError, match="Unknown argument: config.b"):
+            validator.validate({"config": {"b": 1}})
+
+    def test_unknown_keywords_and_types_are_permissive(self) -> None:
+        validator = ArgumentValidator(
+            {"type": "object", "properties": {"x": {"type": "custom", "format": "uri"}}}
+        )
+
+        validator.validate({"x": object()})
+
+
+# =============================================================================
+# Shared by Both Executors
+# =============================================================================
+
+
+class TestValidatorSharing:
+    """Compiled once per tool and used by both executors."""
+
+    def _tool(self) -> RegisteredTool:
+        async def handler(arguments: dict[str, Any]) -> str:
+            return "ok"
+
+        return RegisteredTool(
+            definition=ToolDefinition(name="search", description="", parameters=SCHEMA),
+            handler=handler,
+        )
+
+    def test_registry_compiles_once_at_registration(self) -> None:
+        registry = ToolRegistry()
+        tool = self._tool()
+
+        with patch(
+            "src.tools.validation.ArgumentValidator", wraps=ArgumentValidator
+        ) as compile_spy:
+            registry.register("search", tool)
+            assert tool.validator is registry.get("search").validator
+            compiled_calls = compile_spy.call_count
+
+        assert compiled_calls == 1
+
+    async def test_tool_executor_uses_compiled_validator(self) -> None:
+        registry = ToolRegistry()
+        registry.register("search", self._tool())
+        executor = ToolExecutor(registry)
+
+        with pytest.raises(ToolValidationError) as excinfo:
+            await executor.execute(
+                ToolCall(id="c1", name="search", arguments={"query": "q", "top_k": 99})
+            )
+
+        assert excinfo.value.field == "top_k"
+        assert excinfo.value.tool_name == "search"
+
+    def test_tool_executor_service_caches_per_schema(self) -> None:
+        service = ToolExecutorService()
+        definition = ApiToolDefinition(name="search", description="", parameters=SCHEMA)
+
+        assert service.validate_arguments(definition, {"query": "q", "mode": "x"})[0] is False
+        validator = service._validators["search"]
+        assert service.validate_arguments(definition, {"query": "q"}) == (True, None)
+        assert service._validators["search"] is validator
+        service.close()